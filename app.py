@@ -10,6 +10,8 @@ Usage: Commands and REPL
     - Run - Core/BASE command AND ANCHORED command.
         - Clear             - SUB COMMAND, nested under Run:
                               to clear REPL/screen.
+        - Next, Prev, Goto  - SUB COMMANDS, nested under Run:
+                              to page through the last large view.
         - Load              - TOP INTENT, nested under Run
             - Views         - SUB COMMAND, nested under Load
                               Switches between sub-views of the data
@@ -19,6 +21,13 @@ Usage: Commands and REPL
             - Locate        - SUB COMMAND, nested under Find
                               Locate a record by ID (row)
                               Future by column value, or row search term
+            - Search        - SUB COMMAND, nested under Find
+                              Search Criteria & Topics by text, typos allowed
+                              The chosen match is the default index for
+                              Locate and Edit
+            - Tagged        - SUB COMMAND, nested under Find
+                              List the rows tagged with all/any of the
+                              topics and/or groups
         - Edit              - TOP INTENT, nested under Run
                               Core activity/action of the app for user
             - Note          - SUB COMMAND, under Edit: Edits a note
@@ -58,7 +67,7 @@ LO6.1.1 Implement the use of external Python libraries
       where appropriate to provide the functionality that the project requires.
 -------------------------
 Standard Libraries
-:imports: typing.Literal
+:imports: pathlib, re, time, typing.Literal
 
 3rd Paty Imports
 :imports: rich
@@ -69,9 +78,15 @@ Standard Libraries
 :imports: pandas
 
 Local Imports
+:imports: caches
 :imports: commands
+:imports: exports
 :imports: controller
+:imports: indexes
+:imports: pages
 :imports: sidecar
+:imports: telemetry
+:imports: terminal
 
 
 Classes
@@ -98,6 +113,9 @@ Global Variables:,
 
 """
 # 1. Std Lib
+import pathlib
+import re
+import time
 from typing import Literal
 
 import click  # type: ignore
@@ -105,15 +123,23 @@ import click  # type: ignore
 from click_repl import register_repl  # type: ignore
 from pandas import pandas as pd  # type: ignore
 from rich import inspect as inspector, print as rprint  # type: ignore
-from rich.console import Console  # type: ignore
+from rich.console import Console, Group  # type: ignore
 from rich.panel import Panel  # type: ignore
 
 # 3. Local: Note the controller * intentionally imports all from the module
 from controller import (Controller as Actions, DataController,
                         Display, Results, WebConsole,
-                        configuration, gspread, Record, Editor,
+                        configuration, gspread, Record, Editor, Change,
                         RICHStyler as rstyle, )
-from modelview import (Views, Head, )  # type: ignore
+from caches import Projection, RenderCache, StatsCube, ViewCache
+from connections import limiter
+from exports import Exporter
+from indexes import CategoryIndex, FuzzyIndex, RecordIndex
+from modelview import (ColumnSchema, Views, Head, )  # type: ignore
+from pages import Pager
+from telemetry import (CallProfiler, Metrics, MeteredGroup, Tracer,
+                       callprofiler, metrics, profiler, tracer)
+from terminal import Screen
 from sidecar import (AppValues as Val, ProgramUtils as utils,
                      CliStyles as styles, )
 
@@ -220,6 +246,62 @@ class Valid:
         return True if 1 <= index <= App.get_range else False
 
 
+class IndexRanges(click.ParamType):
+    """Index Ranges: A list of row indexes and ranges, e.g. 3,5,10-14.
+    
+    Converts to the rows' indexes, in order, without repeats: each
+    within 1 to the data's range, else the value is rejected.
+    A dotted part is a record's CriteriaRef, e.g. 1.1.0: kept as text,
+    for the RecordIndex to look up.
+    
+    :property: REFERENCE: re.Pattern: A CriteriaRef, e.g. 1.1.0, LO2.1.1
+    """
+    
+    name: str = 'indexes'
+    REFERENCE: re.Pattern = re.compile(r'[A-Za-z]*\d+(?:\.\d+)+')
+    
+    def convert(self, value, param, ctx) -> list[int | str]:
+        """Convert the option's value to the rows' indexes, or references.
+        
+        :param value: str | int | list - e.g. '3,5,10-14', 3, '1.1.0,4'
+        :param param: click.Parameter - Click Parameter
+        :param ctx: click.Context - Click Context
+        :return: list[int | str] - The rows' indexes, e.g. [3, 10, ..., 14],
+                 and CriteriaRefs, e.g. ['1.1.0']
+        """
+        if isinstance(value, list):
+            return value
+        if value is None or str(value).strip() == '':
+            self.fail('Try again, enter a numerical value.', param, ctx)
+        indexes: dict[int | str, None] = {}
+        for part in str(value).split(','):
+            if self.REFERENCE.fullmatch(part.strip()):
+                indexes[part.strip()] = None
+                continue
+            first, dash, last = part.strip().partition('-')
+            if not first.strip().isdigit() \
+                or (dash and not last.strip().isdigit()):  # noqa # Pep8 E125
+                self.fail(f'{part.strip()!r} is not an index, a range or '
+                          'a CriteriaRef, e.g. 3, 10-14 or 1.1.0.',
+                          param, ctx)
+            start: int = self.within(int(first), param, ctx)
+            stop: int = self.within(int(last), param, ctx) if dash \
+                else start
+            if stop < start:
+                self.fail(f'{part.strip()!r}: a range goes up, '
+                          'e.g. 10-14.', param, ctx)
+            indexes.update(dict.fromkeys(range(start, stop + 1)))
+        return list(indexes)
+    
+    def within(self, index: int, param, ctx) -> int:
+        """Check an index is within 1 to the data's range: else fail."""
+        if not App.values.Find.Index.min <= index <= App.get_range:
+            self.fail(f'{index} is out of range: rows are '
+                      f'{App.values.Find.Index.min} to {App.get_range}.',
+                      param, ctx)
+        return index
+
+
 class Window:
     """Window: Arrange Terminal Layouts, Panels, Cards.
 
@@ -248,11 +330,14 @@ class Window:
         return value if switch else None
     
     @staticmethod
+    @tracer.traced(category=Tracer.RENDER)
+    @metrics.timed(phase=Metrics.RENDER)
     def showrecord(data: pd.Series | pd.DataFrame,
                    sendtolayout: bool = True,
                    command: str = '',
                    displayon: bool = True,
-                   debug: bool = False) -> Record | None:
+                   debug: bool = False,
+                   cache: bool = False) -> Record | None:
         """Display Record.
         
         :param data: pd.Series | pd.DataFrame - Individual Record to display
@@ -262,6 +347,7 @@ class Window:
         :param command: str - Command to send to the Editor.
         :param displayon: bool - Switch to display or not.
         :param debug: bool - Switch to debug mode or not.
+        :param cache: bool - Reuse the record's rendered panels, if kept.
         :return: Record | None - Individual Record to display or None
         """
         # Data is not empty
@@ -283,7 +369,7 @@ class Window:
                 if individual.card(consolecard=Webconsole.console,
                                    sendtoterminal=sendtolayout) is not None:
                     # Print Panels
-                    window.printpanels(record=individual)
+                    window.printpanels(record=individual, cached=cache)
                 else:
                     # Print Simple Card of all values
                     click.echo("Displaying Simple Card")
@@ -334,74 +420,121 @@ class Window:
             border_style=border, )
     
     @staticmethod
-    def printpane(panel: str, printer: Console, text: str | None = '') -> None:
-        """Print Pane.
+    def pane(panel: str, text: str | None = '') -> Panel | None:
+        """Build Pane.
         
-        :param panel: str - Panel to print
-        :param printer: Console - Console to print to
+        :param panel: str - Panel to build
         :param text: str - Text to display
-        :return: None
+        :return: Panel | None - The pane, or None for no such pane
         """
         if panel == 'banner':
-            pane = window.configpanel(
+            return window.configpanel(
                 render="",
                 title="📝 PyCriteria 📝",
                 sub=f"📝 You are in {text} Mode  📝",
                 padsize='medium',
                 ht=2,
-                pstyle=rstyle.panel(grey=11),
+                pstyle=rstyle.panel(grey=11, tostring=False),
                 border='bright_white')
-            printer.print(pane)
-        elif panel == 'foot' and text is None:
-            pane = window.configpanel(
+        if panel == 'foot' and text is None:
+            return window.configpanel(
                 render="",
                 padsize='medium',
                 ht=1,
-                pstyle=rstyle.panel(grey=11),
+                pstyle=rstyle.panel(grey=11, tostring=False),
                 border='bright_white')
+        return None
+    
+    @staticmethod
+    def printpane(panel: str, printer: Console, text: str | None = '') -> None:
+        """Print Pane.
+        
+        :param panel: str - Panel to print
+        :param printer: Console - Console to print to
+        :param text: str - Text to display
+        :return: None
+        """
+        pane: Panel | None = window.pane(panel=panel, text=text)
+        if pane is not None:
             printer.print(pane)
     
     @staticmethod
-    def printpanels(record: Record) -> None:
+    def recordpanels(record: Record) -> Group:
+        """Build the Record's Banner, Header and Current Data panels.
+        
+        :param record: Record - Individual Record to display
+        :return: Group - The panels, as a Group of Renderables
+        """
+        # Record builds the data views: Header, Card
+        header = \
+            record.header(
+                consolehead=Webconsole.console,
+                sendtolayout=True,
+                gridfit=True)
+        current = \
+            record.editable(
+                consoleedit=Webconsole.console,
+                sendtolayout=True)
+        # noinspection PyArgumentEqualDefault
+        return Group(
+            window.pane(panel='banner', text=record.modedisplay()),
+            record.panel(consolepane=Webconsole.console,
+                         renderable=header,
+                         fits=True,
+                         sendtolayout=True),
+            record.panel(consolepane=Webconsole.console,
+                         renderable=current,
+                         fits=True,
+                         align='center',
+                         sendtolayout=True))
+    
+    @staticmethod
+    def printpanels(record: Record, cached: bool = False) -> None:
         """Print Panels.
         
+        Cached: the Banner, Header and Current Data are rendered once per
+        record, mode, data revision and console width, then reused.
+        The Footer, with its Viewed time, is always printed afresh.
+        Pinned: the whole card is drawn on its region: changed lines only.
+        
         :param record: Record - Individual Record to display
+        :param cached: bool - Reuse the record's rendered panels, if kept.
         :return: None
         """
         # Record is the data loader for single record.
-        if record is not None:
-            # Print: the Banner at top of the Record's Display
-            window.printpane(panel='banner',
-                             printer=Webconsole.console,
-                             text=record.modedisplay())
+        if record is not None and App.screen.ispinned(Screen.RECORD):
+            # Draw: the card's changed lines, e.g. only the Viewed time
+            footer = record.footer(consolefoot=Webconsole.console,
+                                   sendtolayout=True)
+            App.screen.update(
+                name=Screen.RECORD,
+                text=Webconsole.render(Group(
+                    window.recordpanels(record=record),
+                    record.panel(consolepane=Webconsole.console,
+                                 renderable=footer,
+                                 fits=True,
+                                 sendtolayout=True))))
+        elif record is not None:
+            # Print: the Banner, Header and Current Data: rendered or kept
+            if cached:
+                click.echo(
+                    message=App.renders.rendered(
+                        key=('record', record.recordid, record.modedisplay(),
+                             App.appdata.revision,
+                             Webconsole.console.width),
+                        render=lambda: Webconsole.render(
+                            window.recordpanels(record=record))),
+                    nl=False)
+            else:
+                Webconsole.console.print(window.recordpanels(record=record))
             # Switch to Rich/Terminal display
-            # Record builds the data views: Header, Card, Footer
-            header = \
-                record.header(
-                    consolehead=Webconsole.console,
-                    sendtolayout=True,
-                    gridfit=True)
-            current = \
-                record.editable(
-                    consoleedit=Webconsole.console,
-                    sendtolayout=True)
+            # Record builds the data views: Footer
             footer = \
                 record.footer(
                     consolefoot=Webconsole.console,
                     sendtolayout=True)
             # Print: the Panel as a Group of Renderables
             # noinspection PyArgumentEqualDefault
-            record.panel(consolepane=Webconsole.console,
-                         renderable=header,
-                         fits=True,
-                         sendtolayout=False)
-            # noinspection PyArgumentEqualDefault
-            record.panel(consolepane=Webconsole.console,
-                         renderable=current,
-                         fits=True,
-                         align='center',
-                         sendtolayout=False)
-            # noinspection PyArgumentEqualDefault
             record.panel(consolepane=Webconsole.console,
                          renderable=footer,
                          fits=True,
@@ -437,10 +570,13 @@ class Window:
         return None
     
     @staticmethod
+    @tracer.traced(category=Tracer.RENDER)
+    @metrics.timed(phase=Metrics.RENDER)
     def showmodified(editeddata: pd.Series,
                      editor: Editor,
                      commandtype: str,
-                     dataview: Literal['show', 'compare'] = 'show',
+                     dataview: Literal['show', 'compare',
+                                       'changes'] = 'show',
                      debug=False) -> None:
         """Display Modified Record.
         
@@ -448,7 +584,8 @@ class Window:
         :param editor: Editor - Editor to use
         :param commandtype: str
                 - Command type to use
-        :param dataview: Literal['show', 'compare'] - Data view to use
+        :param dataview: Literal['show', 'compare', 'changes']
+                - Data view to use: changes: only the changed fields
         :param debug: bool - Switch to debug mode or not.
         :return: None
         """
@@ -476,6 +613,9 @@ class Window:
                     window.comparedata(editeddata=editeddata,
                                        editor=editor,
                                        debugdisplay=False)  # noqa
+                elif dataview == 'changes':  # changes
+                    window.comparechanges(editeddata=editeddata,
+                                          editor=editor)
                 #  [DEBUG]
                 if debug is True:
                     click.echo(message="=== [DEBUG] Saving: "
@@ -544,6 +684,18 @@ class Window:
                     sendtolayout=App.values.Display.TOLAYOUT,
                     fit=True,
                     debug=debugdisplay)
+                # Pinned: draw the comparison's changed lines only
+                if App.screen.ispinned(Screen.RECORD):
+                    App.screen.update(
+                        name=Screen.RECORD,
+                        text=Webconsole.render(Group(*[
+                            newrecord.panel(
+                                consolepane=Webconsole.console,
+                                renderable=renderable,
+                                fits=True,
+                                sendtolayout=App.values.Display.TOLAYOUT)
+                            for renderable in (header, sidebyside)])))
+                    return
                 newrecord.panel(
                     consolepane=Webconsole.console,
                     renderable=header,
@@ -556,6 +708,48 @@ class Window:
                     sendtolayout=App.values.Display.TOTERMINAL)
             else:
                 window.showedited(editeddata=editeddata, debug=debug)
+    
+    @staticmethod
+    def comparechanges(editeddata: pd.Series,
+                       editor: Editor,
+                       debug=False) -> None:
+        """Compare Old and New: only the changed fields, and their context.
+        
+        The changes are computed once, by the editor, and long values,
+        e.g. Notes, cut to their change: the same rendering, whatever the
+        record's width, or its notes' length.
+        
+        :param editeddata: pd.Series - Individual Record to display
+        :param editor: Editor - Editor, with the old & new series
+        :param debug: bool - Switch to debug mode or not.
+        :return: None
+        """
+        if debug is True:
+            inspector(editeddata)
+        
+        changes: list[Change] = editor.changes()
+        if editeddata.empty is False and editor.ismodified and changes:
+            newrecord: Record = Record(series=editor.newresultseries)
+            newrecord.editmode = editor.editmode
+            newrecord.modified = editor.lastmodified
+            newrecord.command = editor.command
+            changed = newrecord.diffgrid(
+                consolediff=Webconsole.console,
+                changes=changes,
+                fit=True,
+                sendtolayout=App.values.Display.TOLAYOUT)
+            pane = newrecord.panel(consolepane=Webconsole.console,
+                                   renderable=changed,
+                                   fits=True,
+                                   sendtolayout=App.values.Display.TOLAYOUT)
+            # Pinned: draw the changes' changed lines only
+            if App.screen.ispinned(Screen.RECORD):
+                App.screen.update(name=Screen.RECORD,
+                                  text=Webconsole.render(pane))
+            else:
+                Webconsole.console.print(pane)
+        else:
+            window.showedited(editeddata=editeddata, debug=debug)
 
 
 class CriteriaApp:
@@ -577,6 +771,18 @@ class CriteriaApp:
     :method: index -
     :method: value
     :method: get_results
+    :method: searchindex - the fuzzy search index for the app data
+    :method: chosen - the last chosen search match, as a default index
+    :method: categoryindex - the topics & groups index for the app data
+    :method: command_counts - display the rows per topic & group
+    :method: recordindex - the Position & CriteriaRef to row index
+    :method: update_record - patch an edited record into the app data
+    :property: cache: ViewCache - the app data's views, ready to render
+    :property: pager: Pager - the pages of the last large view
+    :property: renders: RenderCache - rendered views & records, recently used
+    :property: screen: Screen - the pinned regions, e.g. the record card
+    :method: statscube - the counts of the app data's categorical columns
+    :method: command_stats - display the counts & cross tabs
     """
     
     values: Val
@@ -585,6 +791,15 @@ class CriteriaApp:
     data: pd.DataFrame
     range: int
     editmode: list[str] = ['none', 'add', 'update', 'delete']
+    fuzzy: FuzzyIndex | None = None
+    categories: CategoryIndex | None = None
+    records: RecordIndex | None = None
+    cache: ViewCache
+    pager: Pager
+    renders: RenderCache
+    screen: Screen
+    stats: StatsCube | None = None
+    selected: int | None = None
     
     def __init__(self, applicationdata: DataController) -> None:
         """Initialize."""
@@ -593,16 +808,31 @@ class CriteriaApp:
         self.appdata = applicationdata
         self.data = applicationdata.dataframe
         self.range = len(self.data)
+        self.cache = ViewCache()
+        self.renders = RenderCache(size=configuration.Cache.RENDERS)
+        self.screen = Screen(height=Webconsole.console.height)
+        self.pager = Pager(webconsole=Webconsole,
+                           size=configuration.Console.PAGE,
+                           renders=self.renders)
     
     @staticmethod
-    def get_data() -> pd.DataFrame:
-        """Get the dataframe from the context.
+    def get_data(reuse: bool = False) -> pd.DataFrame:
+        """Get the dataframe from the context: rehydrated from the remote.
         
+        Views may reuse the last fetched data, within its time to live:
+        configuration.Cache.DATA_TTL, without a remote fetch. Edits do not:
+        they always start from freshly fetched data.
+        
+        :param reuse: bool - True: a render only command, e.g. views
         :return: pd.DataFrame - Dataframe
         """
+        if reuse and DataControl.isfresh(ttl=configuration.Cache.DATA_TTL):
+            return DataControl.dataframe
         wsheet: gspread.Worksheet = Actions.load_wsheet()
         dataframe: pd.DataFrame = \
             DataControl.load_dataframe_wsheet(wsheet=wsheet)
+        if dataframe is not None:
+            DataControl.fetched = time.monotonic()
         return dataframe
     
     @property
@@ -618,12 +848,14 @@ class CriteriaApp:
     # Depends on ToDo command
     def command_todo(self, dataframe: pd.DataFrame,
                      todoview: str = 'All',
-                     label: str = "Progress") -> None:
+                     label: str = "Progress",
+                     form: str = Exporter.TABLE) -> None:
         """Display the dataframe by view option/choice.
         
         :param dataframe: pd.DataFrame - Dataframe to display
         :param todoview: str - View option
         :param label: str - Label to display
+        :param form: str - Output format: table, csv, tsv, jsonl
         :return: None
         """
         
@@ -653,44 +885,90 @@ class CriteriaApp:
             return headers
         
         # Configure the bulk ouput as Table
-        self.output(data=dataframe, cols=vues(todoview), title=label)
+        self.output(data=dataframe, cols=vues(todoview), title=label,
+                    form=form)
     
     #
     def command_view(self, dataframe: pd.DataFrame,
                      viewer: list[str] | None = None,
-                     label: str = 'Overview') -> None:
+                     label: str = 'Overview',
+                     form: str = Exporter.TABLE) -> None:
         """Display the dataframe.
 
         :param dataframe: pd.DataFrame - Dataframe to display
         :param viewer: list[str] - List of views to display
         :param label: str - Label to display
+        :param form: str - Output format: table, csv, tsv, jsonl
         :return: None
         """
         # Select the view's header
         headers: list[str] = Head.OverviewViews if viewer is None else viewer
         # Configure the bulk ouput as Table
-        self.output(data=dataframe, cols=headers, title=label)
+        self.output(data=dataframe, cols=headers, title=label, form=form)
     
     #
-    @staticmethod
-    def output(data: pd.DataFrame,
+    @tracer.traced(category=Tracer.RENDER)
+    @metrics.timed(phase=Metrics.RENDER)
+    def output(self, data: pd.DataFrame,
                cols: list[str],
-               title: str) -> None:
+               title: str,
+               form: str = Exporter.TABLE) -> None:
         """Command Output flow. Shared by common commands
         
+        The app data's views are from the view cache: projected only once
+        per change to the view's columns. Other data is projected as is.
+        Views longer than a page are paged: only the page is rendered.
+        The app data's rendered views, and pages, are kept in the render
+        cache: by view, columns, data stamp and console width.
+        Machine formats, csv, tsv, jsonl, stream to stdout: not rich.
+        Tables are fitted to the console's width, up to Console.WIDTH:
+        the columns' widths are budgeted, and long cells truncated.
+        
         :param data: pd.DataFrame - Dataframe to display
         :param cols: list[str] - List of columns to display
         :param title: str - Title to display
+        :param form: str - Output format: table, csv, tsv, jsonl
         :return: None
         """
-        # Configure the bulk ouput as Table with headers
-        Webconsole.table = Webconsole.configure_table(headers=cols)
-        # Display the sub frame dataview
-        Display.display_subframe(dataframe=data,
+        # Stream a machine format: no table, no completion signal
+        if Exporter.ismachine(form):
+            Exporter.stream(frame=data, headers=cols, form=form)
+            return
+        # Project the sub frame dataview: fitted to the console's width
+        width: int = min(Webconsole.console.width,
+                         configuration.Console.WIDTH)
+        key: tuple | None = None
+        if data is self.data:
+            view: Projection = self.cache.view(frame=data, headers=cols,
+                                               stamp=self.appdata.stamp,
+                                               width=width)
+            rows, widths = view.rows, view.widths
+            key = ('view', tuple(view.headers), view.stamp)
+        else:
+            rows, widths = Display.fit(dataframe=data, headers=cols,
+                                       width=width)
+        # Page a large view: Type next, prev, goto for the other pages
+        if len(rows) > self.pager.size:
+            self.pager.open(title=title, headers=cols, rows=rows, key=key,
+                            widths=widths)
+        elif key is not None:
+            # Print the kept view, else render it and keep it
+            click.echo(
+                message=self.renders.rendered(
+                    key=key + (title, Webconsole.console.width),
+                    render=lambda: Webconsole.render(
+                        Display.fill_rows(
+                            rows=rows,
+                            consoletable=Webconsole.configure_table(
+                                headers=cols, widths=widths)))),
+                nl=False)
+        else:
+            # Configure the bulk ouput as Table with headers
+            Webconsole.table = Webconsole.configure_table(headers=cols,
+                                                          widths=widths)
+            Display.display_rows(rows=rows,
                                  consoleholder=Webconsole.console,
-                                 consoletable=Webconsole.table,
-                                 headerview=cols,
-                                 viewfilter=title)
+                                 consoletable=Webconsole.table)
         # Signal from completion of command
         click.echo(message='Your data is refreshed/rehydrated')
     
@@ -702,12 +980,144 @@ class CriteriaApp:
         :param dataframe: pd.DataFrame - Dataframe to update
         :return: None
         """
+        # Update the appdata: only changed columns are swapped, and stamped
+        with metrics.phase(name=Metrics.PARSE):
+            self.data = self.appdata.refresh(dataframe=dataframe)
         # Update the context
-        context.obj = dataframe
-        # Update the appdata
-        DataControl.dataframe = dataframe
-        self.appdata.dataframe = dataframe
-        self.data = dataframe
+        context.obj = self.data
+    
+    #
+    def update_record(self, edited: pd.Series | None) -> list[str]:
+        """Patch an edited record into the app data, by its Position.
+        
+        Replaces only the record's changed values, not the app data.
+        
+        :param edited: pd.Series | None - The edited record, if any
+        :return: list[str] - The changed columns
+        """
+        if edited is None:
+            return []
+        offset: int | None = \
+            self.recordindex().offset(key=edited.get(ColumnSchema.Position))
+        if offset is None:
+            return []
+        # Stats, if current, are patched for the edit: not recounted
+        current: bool = self.stats is not None and self.stats.stamp == \
+            self.appdata.stamp(columns=StatsCube.DIMENSIONS)
+        changed: list[str] = self.appdata.patch(offset=offset,
+                                                values=edited.to_dict())
+        if current and set(changed) & set(StatsCube.DIMENSIONS):
+            self.stats.patch(
+                offset=offset,
+                values={column: edited[column] for column in changed},
+                stamp=self.appdata.stamp(columns=StatsCube.DIMENSIONS))
+        return changed
+    
+    #
+    def searchindex(self) -> FuzzyIndex:
+        """Get the fuzzy search index: Rebuilt only when its columns change.
+        
+        :return: FuzzyIndex - Index over the Criteria and CriteriaTopic
+        """
+        stamp: int = self.appdata.stamp(columns=FuzzyIndex.COLUMNS)
+        if self.fuzzy is None or self.fuzzy.stamp != stamp:
+            self.fuzzy = FuzzyIndex(frame=self.data, stamp=stamp)
+        return self.fuzzy
+    
+    def chosen(self) -> int | None:
+        """Get the last chosen search match: the default --index to prompt.
+        
+        :return: int | None - The match's Position, or None if no search
+        """
+        return self.selected
+    
+    def categoryindex(self) -> CategoryIndex:
+        """Get the topics & groups index: Rebuilt only when its columns change.
+        
+        :return: CategoryIndex - Bitmaps for CriteriaTopic and CriteriaGroup
+        """
+        stamp: int = self.appdata.stamp(columns=CategoryIndex.COLUMNS)
+        if self.categories is None or self.categories.stamp != stamp:
+            self.categories = CategoryIndex(frame=self.data, stamp=stamp)
+        return self.categories
+    
+    def statscube(self) -> StatsCube:
+        """Get the stats: Recounted only when the counted columns change.
+        
+        :return: StatsCube - Progress x DoD x Performance x CriteriaGroup
+        """
+        stamp: int = self.appdata.stamp(columns=StatsCube.DIMENSIONS)
+        if self.stats is None or self.stats.stamp != stamp:
+            self.stats = StatsCube(frame=self.data, stamp=stamp)
+        return self.stats
+    
+    def command_stats(self, label: str = 'Stats',
+                      form: str = Exporter.TABLE) -> None:
+        """Display the records per Progress, DoD, Performance, Group:
+        
+        And the cross tabs of Progress by DoD, Performance, and of
+        CriteriaGroup, as rows, by Progress and by Performance.
+        
+        :param label: str - Label to display
+        :param form: str - Output format: table, csv, tsv, jsonl
+        :return: None
+        """
+        cube: StatsCube = self.statscube()
+        tables: list[tuple[str, pd.DataFrame]] = [
+            (f'{label}: {column}', cube.totals(column=column))
+            for column in StatsCube.DIMENSIONS]
+        for rows, columns in [(ColumnSchema.Progress, ColumnSchema.DoD),
+                              (ColumnSchema.Progress, ColumnSchema.Performance),
+                              (ColumnSchema.Group, ColumnSchema.Progress),
+                              (ColumnSchema.Group, ColumnSchema.Performance)]:
+            tables.append((f'{label}: {rows} x {columns}',
+                           cube.crosstab(rows=rows, columns=columns)))
+        self.outputs(tables=tables, form=form)
+    
+    def outputs(self, tables: list[tuple[str, pd.DataFrame]],
+                form: str = Exporter.TABLE) -> None:
+        """Output several titled tables: a machine format as one table.
+        
+        A table each, as rich tables: or one long table, Table, Row,
+        Column, Value, streamed: one header, one schema, for csv, tsv,
+        jsonl: not a stream per table.
+        
+        :param tables: list[tuple[str, pd.DataFrame]] - Title, and table
+        :param form: str - Output format: table, csv, tsv, jsonl
+        :return: None
+        """
+        if Exporter.ismachine(form):
+            Exporter.stream(frame=Exporter.longform(tables=tables),
+                            headers=Exporter.LONGFORM, form=form)
+            return
+        for title, table in tables:
+            self.output(data=table, cols=list(table.columns), title=title,
+                        form=form)
+    
+    def recordindex(self) -> RecordIndex:
+        """Get the record index: Rebuilt only when the key columns change.
+        
+        :return: RecordIndex - Position & CriteriaRef to row offsets
+        """
+        stamp: int = self.appdata.stamp(columns=RecordIndex.COLUMNS)
+        if self.records is None or self.records.stamp != stamp:
+            self.records = RecordIndex(frame=self.data, stamp=stamp)
+        return self.records
+    
+    def command_counts(self, label: str = 'Topics',
+                       form: str = Exporter.TABLE) -> None:
+        """Display the rows per topic, and per group: from the category index.
+        
+        :param label: str - Label to display
+        :param form: str - Output format: table, csv, tsv, jsonl
+        :return: None
+        """
+        index: CategoryIndex = self.categoryindex()
+        self.outputs(tables=[(f'{label}: {column}',
+                              index.counts(column=column))
+                             for column in [ColumnSchema.Topic,
+                                            ColumnSchema.Group]],
+                     form=form)
 
 
 App: CriteriaApp = CriteriaApp(applicationdata=DataControl)
@@ -717,13 +1127,25 @@ window: Window = Window()
 # ########################################################################### #
 # App Commands
 # - Run
+#   - next, prev    page through the last large view
+#   - goto          --page: page number
+#   - pin           --rows: pin the record card to the top rows
+#   - unpin         the whole terminal scrolls again
+#   - stats         --log | --nolog: the last commands' timings, by phase
+#   - memory        on | off | show --budget --top: memory per command
 #   - load
 #       - todo      -s | --select: Choose a sub view
 #       - views     -s | --select: Choose a sub view
 #   - find
 #       - locate    -i -a | --index --axis
-#                   index: input range
+#                   index: indexes & ranges, e.g. 3,5,10-14
 #                   axis: index search focus
+#       - search    --text --limit
+#                   text: criteria/topic text, typos allowed
+#                   limit: most matches to list
+#       - tagged    --topics --groups --match
+#                   topics, groups: ; separated categories
+#                   match: all of, any of
 #   - edit
 #       - note      -m -i -n -a | --mode --index --note --axis
 #                   mode: editmode: add, update, delete
@@ -740,7 +1162,8 @@ window: Window = Window()
 
 # 0. Run: Base Command: Anchors all Intent and Actions
 # Does not to anything but command achitecture/infrastructure and --help
-@click.group(name=App.values.Run.cmd, short_help='Type: --help')
+@click.group(name=App.values.Run.cmd, short_help='Type: --help',
+             cls=MeteredGroup)
 @click.pass_context
 def run(ctx: click.Context) -> None:  # noqa
     """Level: Run. Type: about to learn to use this CLI.
@@ -762,6 +1185,289 @@ def clear(ctx: click.Context) -> None:  # noqa
     click.clear()
 
 
+# 0.2 Run: Base Commands: Paging: the last view longer than a page.
+# Only the shown page is rendered, the next page is prefetched.
+@run.command(App.values.Page.next, help=App.values.Page.nexthelp,
+             short_help=App.values.Page.nexthelp)
+def nextpage() -> None:
+    """Show the next page."""
+    if App.pager.isopen:
+        App.pager.next()
+    else:
+        click.secho(message=App.values.Page.closed,
+                    fg=styles.warnfg, bold=styles.warnbold)
+
+
+@run.command(App.values.Page.prev, help=App.values.Page.prevhelp,
+             short_help=App.values.Page.prevhelp)
+def prevpage() -> None:
+    """Show the previous page."""
+    if App.pager.isopen:
+        App.pager.prev()
+    else:
+        click.secho(message=App.values.Page.closed,
+                    fg=styles.warnfg, bold=styles.warnbold)
+
+
+@run.command(App.values.Page.goto, help=App.values.Page.gotohelp,
+             short_help=App.values.Page.gotohelp)
+@click.option('--page', 'page', type=click.IntRange(min=1),
+              prompt=App.values.Page.prompt,
+              help=App.values.Page.gotohelp)
+def gotopage(page: int) -> None:
+    """Show a page, by number: clamped to the last page.
+    
+    \f
+    :param page: int: The page number, from 1
+    :return: None
+    """
+    if App.pager.isopen:
+        App.pager.goto(page=page)
+    else:
+        click.secho(message=App.values.Page.closed,
+                    fg=styles.warnfg, bold=styles.warnbold)
+
+
+# 0.3 Run: Base Commands: Pinning: the record card to the top rows.
+# Edits then redraw only the card's changed lines, not the whole card.
+@run.command(App.values.Pin.pin, help=App.values.Pin.pinhelp,
+             short_help=App.values.Pin.pinhelp)
+@click.option('--rows', 'rows', type=click.IntRange(min=1),
+              default=configuration.Console.PINNED,
+              show_default=App.values.shown,
+              help=App.values.Pin.rowshelp)
+def pin(rows: int) -> None:
+    """Pin the record card: to the top rows of the terminal.
+    
+    \f
+    :param rows: int: The rows pinned, at most two thirds of the screen
+    :return: None
+    """
+    # Guard Clause: cursor addressing needs a terminal, e.g. xterm.js
+    if not Webconsole.console.is_terminal:
+        click.secho(message=App.values.Pin.noterminal,
+                    fg=styles.warnfg, bold=styles.warnbold)
+        return
+    App.screen.height = Webconsole.console.height
+    region = App.screen.pin(name=Screen.RECORD, rows=rows)
+    click.secho(message=App.values.Pin.pinned.format(region.rows),
+                fg=styles.infofg, bold=styles.infobold)
+
+
+@run.command(App.values.Pin.unpin, help=App.values.Pin.unpinhelp,
+             short_help=App.values.Pin.unpinhelp)
+def unpin() -> None:
+    """Unpin the record card: the whole terminal scrolls again."""
+    App.screen.unpin()
+    click.secho(message=App.values.Pin.unpinned.format(App.screen.sent,
+                                                       App.screen.full),
+                fg=styles.infofg, bold=styles.infobold)
+
+
+# 0.4 Run: Base Commands: Stats: the last commands' timings, by phase.
+# auth, fetch, parse, render, save: and the remote API calls, and bytes.
+@run.command(App.values.Stats.stats, help=App.values.Stats.statshelp,
+             short_help=App.values.Stats.statshelp)
+@click.option('--log', 'log',
+              type=click.Path(dir_okay=False, writable=True),
+              default=None,
+              help=App.values.Stats.loghelp)
+@click.option('--nolog', 'nolog', is_flag=True, default=False,
+              help=App.values.Stats.nologhelp)
+def stats(log: str | None, nolog: bool) -> None:
+    """Stats: the last commands' timings, by phase, and API calls.
+    
+    \f
+    :param log: str | None: Also log each command, a JSON line, to the file
+    :param nolog: bool: Stop logging
+    :return: None
+    """
+    if nolog:
+        metrics.log = ''
+    elif log:
+        metrics.log = log
+    timings: pd.DataFrame = metrics.frame()
+    if timings.empty:
+        click.secho(message=App.values.Stats.none,
+                    fg=styles.infofg, bold=styles.infobold)
+    else:
+        App.output(data=timings,
+                   cols=list(timings.columns),
+                   title=App.values.Stats.title)
+    if metrics.log:
+        click.secho(message=App.values.Stats.logging.format(metrics.log),
+                    fg=styles.infofg, bold=styles.infobold)
+
+
+# 0.5 Run: Base Commands: Memory: tracemalloc snapshot diffs per command.
+# The top allocation sites by growth, the peak RSS, and a memory budget.
+@run.command(App.values.Memory.memory, help=App.values.Memory.memoryhelp,
+             short_help=App.values.Memory.memoryhelp)
+@click.argument('action', type=click.Choice(['on', 'off', 'show'],
+                                            case_sensitive=False),
+                default='show')
+@click.option('--budget', 'budget', type=click.IntRange(min=0),
+              default=None,
+              help=App.values.Memory.budgethelp)
+@click.option('--top', 'top', type=click.IntRange(min=1),
+              default=None,
+              help=App.values.Memory.tophelp)
+def memory(action: str, budget: int | None, top: int | None) -> None:
+    """Memory: profile each command: on, off; show the frames held.
+    
+    \f
+    :param action: str: on: report each command; off; show: frames held
+    :param budget: int | None: The peak RSS, in MiB, to warn over: 0: none
+    :param top: int | None: The allocation sites reported, by growth
+    :return: None
+    """
+    if budget is not None:
+        profiler.budget = budget
+        profiler.warned = False
+    if top is not None:
+        profiler.top = top
+    if action.lower() == 'on':
+        profiler.start()
+        click.secho(message=App.values.Memory.on,
+                    fg=styles.infofg, bold=styles.infobold)
+    elif action.lower() == 'off':
+        profiler.stop()
+        click.secho(message=App.values.Memory.off,
+                    fg=styles.infofg, bold=styles.infobold)
+    else:
+        held: pd.DataFrame = profiler.held(
+            frames={'App.data': App.data,
+                    'DataControl.dataframe': DataControl.dataframe,
+                    'DataControl.gsdframe': DataControl.gsdframe})
+        App.output(data=held, cols=list(held.columns),
+                   title=App.values.Memory.title)
+        if profiler.last is not None:
+            profiler.report(use=profiler.last)
+    click.secho(message=App.values.Memory.budget.format(
+        profiler.budget, round(profiler.peakrss() / profiler.MIB, 1)),
+        fg=styles.infofg, bold=styles.infobold)
+    profiler.check()
+
+
+# 0.6 Run: Base Commands: Profile: cProfile, or a sampler, per command.
+# A profile dumped per command, its top cumulative functions printed.
+@run.command(App.values.Profile.profile, help=App.values.Profile.profilehelp,
+             short_help=App.values.Profile.profilehelp)
+@click.argument('action', type=click.Choice(['on', 'off', 'show'],
+                                            case_sensitive=False),
+                default='show')
+@click.option('--dir', 'directory',
+              type=click.Path(file_okay=False, writable=True),
+              default=None,
+              help=App.values.Profile.dirhelp)
+@click.option('--top', 'top', type=click.IntRange(min=1),
+              default=None,
+              help=App.values.Profile.tophelp)
+@click.option('--engine', 'engine',
+              type=click.Choice([CallProfiler.SAMPLING,
+                                 CallProfiler.CPROFILE],
+                                case_sensitive=False),
+              default=None,
+              help=App.values.Profile.enginehelp)
+def profile(action: str, directory: str | None, top: int | None,
+            engine: str | None) -> None:
+    """Profile: each command's calls: on, off; show the last profile.
+    
+    \f
+    :param action: str: on: profile each command; off; show: the last
+    :param directory: str | None: The directory the profiles are dumped to
+    :param top: int | None: The functions printed, by cumulative time
+    :param engine: str | None: sampling, if installed; or cprofile
+    :return: None
+    """
+    if directory is not None:
+        callprofiler.directory = pathlib.Path(directory)
+    if top is not None:
+        callprofiler.top = top
+    if engine is not None:
+        callprofiler.sampling = engine.lower() == CallProfiler.SAMPLING
+    if action.lower() == 'on':
+        if callprofiler.sampling and \
+                callprofiler.engine != CallProfiler.SAMPLING:
+            click.secho(message=App.values.Profile.nosampler,
+                        fg=styles.infofg, bold=styles.infobold)
+        callprofiler.start()
+        click.secho(message=App.values.Profile.on.format(
+            callprofiler.engine, callprofiler.directory),
+            fg=styles.infofg, bold=styles.infobold)
+    elif action.lower() == 'off':
+        callprofiler.stop()
+        click.secho(message=App.values.Profile.off,
+                    fg=styles.infofg, bold=styles.infobold)
+    elif callprofiler.last is None:
+        click.secho(message=App.values.Profile.none,
+                    fg=styles.infofg, bold=styles.infobold)
+    else:
+        click.secho(message=App.values.Profile.last.format(
+            callprofiler.last),
+            fg=styles.infofg, bold=styles.infobold)
+
+
+# 0.7 Run: Base Commands: Trace: spans per command, as a Chrome trace.
+# The connector, loads, lookups, edits, renders: parent and child spans.
+@run.command(App.values.Trace.trace, help=App.values.Trace.tracehelp,
+             short_help=App.values.Trace.tracehelp)
+@click.argument('action', type=click.Choice(['on', 'off', 'show'],
+                                            case_sensitive=False),
+                default='show')
+@click.option('--out', 'out',
+              type=click.Path(dir_okay=False, writable=True),
+              default=None,
+              help=App.values.Trace.outhelp)
+def trace(action: str, out: str | None) -> None:
+    """Trace: each command's spans: on, off; show the last command's.
+    
+    \f
+    :param action: str: on: trace each command; off; show: the last
+    :param out: str | None: The trace file: Chrome trace event JSON
+    :return: None
+    """
+    if action.lower() == 'on':
+        tracer.start(path=out)
+        click.secho(message=App.values.Trace.on.format(tracer.path),
+                    fg=styles.infofg, bold=styles.infobold)
+    elif action.lower() == 'off':
+        tracer.stop()
+        click.secho(message=App.values.Trace.off.format(tracer.path),
+                    fg=styles.infofg, bold=styles.infobold)
+    elif not tracer.last:
+        click.secho(message=App.values.Trace.none,
+                    fg=styles.infofg, bold=styles.infobold)
+    else:
+        spans: pd.DataFrame = tracer.breakdown()
+        App.output(data=spans, cols=list(spans.columns),
+                   title=App.values.Trace.title.format(tracer.path))
+
+
+# 0.8 Run: Base Commands: Quota: the API's read, and write, quotas' usage.
+# Requests queued, coalesced, throttled: sent through the shared limiter.
+@run.command(App.values.Quota.quota, help=App.values.Quota.quotahelp,
+             short_help=App.values.Quota.quotahelp)
+@click.option('--reads', 'reads', type=click.IntRange(min=0),
+              default=None,
+              help=App.values.Quota.readshelp)
+@click.option('--writes', 'writes', type=click.IntRange(min=0),
+              default=None,
+              help=App.values.Quota.writeshelp)
+def quota(reads: int | None, writes: int | None) -> None:
+    """Quota: the API's quotas' usage: set the requests per minute.
+    
+    \f
+    :param reads: int | None: Read requests per minute: 0 is unlimited
+    :param writes: int | None: Write requests per minute: 0 is unlimited
+    :return: None
+    """
+    limiter.resize(reads=reads, writes=writes)
+    usage: pd.DataFrame = pd.DataFrame(limiter.usage())
+    App.output(data=usage, cols=list(usage.columns),
+               title=App.values.Quota.title)
+
+
 # 1. Load Data: Have the user load the data:
 # READ of CRUD Ops (Create, _READ_, Update, Delete)
 # Load intents/actions does the bulk data loading
@@ -788,7 +1494,9 @@ def load(ctx: click.Context) -> None:  # noqa
     - todo
     ....'-s' selects | default: All.
     - views
-    ....'-s' selects | default: Overview \n
+    ....'-s' selects | default: Overview
+    - todo, views
+    ....'--format' format (default: table) | csv, tsv, jsonl \n
     === === === === === === === === === === === === ===\n
     \f
     a) Get the dataframe from remote
@@ -799,18 +1507,19 @@ def load(ctx: click.Context) -> None:  # noqa
     :param ctx: click.Context
     :return: None: Produces stdout --help text
     """
+    # Intro to stderr: stdout is only the data, e.g. to pipe --format csv
     click.secho(
         message="====================LOADING MODE=======================\n",
-        fg='magenta', bg='white', bold=True)
+        fg='magenta', bg='white', bold=True, err=True)
     click.secho(
         message="========Load & Show All/Bulk Records (Table)===========\n",
-        fg='magenta', bold=True)
+        fg='magenta', bold=True, err=True)
     click.secho(
         message="==========Select Views: Show Selected Tasks============\n",
-        fg='magenta', bold=True)
+        fg='magenta', bold=True, err=True)
     click.secho(
         message="Entering loading & reading mode for all records.",
-        fg='magenta', bg='white', bold=True)
+        fg='magenta', bg='white', bold=True, err=True)
     click.secho(
         message="Steps: \n"
                 "  1. Enter an load mode:                               \n"
@@ -829,17 +1538,19 @@ def load(ctx: click.Context) -> None:  # noqa
                 "     4.3 Choose Criteria: A view of criteria.          \n"
                 "     4.4 Choose ToDos: A view of ToDos.                \n"
                 "     4.5 Choose References: An index of references.    \n"
+                "     4.6 Choose Topics: Records per topic & group.     \n"
+                "     4.7 Choose Stats: Progress counts & cross tabs.   \n"
                 "  5. Exits mode automatically.                         \n",
-        fg='magenta', bold=styles.infobold, underline=True)
+        fg='magenta', bold=styles.infobold, underline=True, err=True)
     click.secho(
-        message="Prompts are available for each input. Hit: 'Enter'")
-    App.update_appdata(context=ctx, dataframe=App.get_data())
+        message="Prompts are available for each input. Hit: 'Enter'", err=True)
+    App.update_appdata(context=ctx, dataframe=App.get_data(reuse=True))
     click.secho(
         message="Working data is now ... rehydrated.",
-        blink=True)
+        blink=True, err=True)
     click.secho(
         message=f"You have rows 1 to {App.get_range} to work with",
-        bold=styles.infobold)
+        bold=styles.infobold, err=True)
 
 
 # 2.1 Load Data: ToDo (Sub) Views
@@ -855,16 +1566,24 @@ def load(ctx: click.Context) -> None:  # noqa
               show_default=App.values.shown,
               prompt=App.values.Todo.Selects.prompt,
               help=App.values.Todo.Selects.help)
-def todo(ctx, selects: str) -> None:
+@click.option('--format', 'form',
+              type=click.Choice(choices=Exporter.FORMATS,
+                                case_sensitive=App.values.case),
+              default=Exporter.TABLE,
+              show_default=App.values.shown,
+              help=App.values.Format.help)
+def todo(ctx, selects: str, form: str) -> None:
     """Load todos, and display different filters/views.
     
     \f
     :param ctx: click.Context
     :param selects: str: Views options to select by choice
+    :param form: str: Output format: table, or csv, tsv, jsonl to pipe
     :return: None: Produces stdout --help text
     """
-    # Get Data
-    dataframe: pd.DataFrame = App.get_data()
+    # Get Data: Update Global Data, so the view is of the app data
+    App.update_appdata(context=ctx, dataframe=App.get_data(reuse=True))
+    dataframe: pd.DataFrame = App.data
     
     # Guard Clause Checks Choice
     def checkchoice(choice: str) -> str | None:
@@ -883,11 +1602,10 @@ def todo(ctx, selects: str) -> None:
     # Display
     try:
         App.command_todo(dataframe=dataframe,
-                         todoview=checkchoice(choice=selects))
+                         todoview=checkchoice(choice=selects),
+                         form=form)
     except TypeError:
-        App.command_todo(dataframe=dataframe)
-    finally:
-        App.update_appdata(context=ctx, dataframe=dataframe)
+        App.command_todo(dataframe=dataframe, form=form)
 
 
 # 2.2 Load Data: Views (Sub) Views - These are assignments levels views
@@ -903,17 +1621,26 @@ def todo(ctx, selects: str) -> None:
               show_default=App.values.shown,
               prompt=App.values.Views.Selects.prompt,
               help=App.values.Views.Selects.help)
+@click.option('--format', 'form',
+              type=click.Choice(choices=Exporter.FORMATS,
+                                case_sensitive=App.values.case),
+              default=Exporter.TABLE,
+              show_default=App.values.shown,
+              help=App.values.Format.help)
 @click.pass_context
-def views(ctx, selects) -> None:
+def views(ctx, selects, form: str) -> None:
     """Load Reference/Index.
     
     \f
     :param ctx: click.Context
     :param selects: str: Select views options by choice options input
+    :param form: str: Output format: table, or csv, tsv, jsonl to pipe
     :return: None: Produces stdout --help text
     """
-    # Get Data
-    dataframe: pd.DataFrame = App.get_data()
+    # Get Data: Update Global Data: before the view, so the view is of the
+    # app data, and Topics counts the fresh data
+    App.update_appdata(context=ctx, dataframe=App.get_data(reuse=True))
+    dataframe: pd.DataFrame = App.data
     
     # Guard Clause Checks Choice
     def checks(choice: str) -> str | None:
@@ -929,7 +1656,7 @@ def views(ctx, selects) -> None:
                                 "Try the commanď with one of these options: \n"
                                 "Help: --help\n"
                                 "Choices: All, Project, Criteria, "
-                                "ToDo, Reference",
+                                "ToDo, Reference, Topics, Stats",
                         fg=styles.invalidfg,
                         bg=styles.invalidbg)  # noqa
             return None
@@ -945,23 +1672,32 @@ def views(ctx, selects) -> None:
         if checks(choice) == App.views.Overviews:
             App.command_view(dataframe=data,
                              viewer=Head.OverviewViews,
-                             label="Overview")  # noqa
+                             label="Overview",
+                             form=form)  # noqa
         elif checks(choice) == App.views.Project:
             App.command_view(dataframe=data,
                              viewer=Head.ProjectView,
-                             label="Project")
+                             label="Project",
+                             form=form)
         elif checks(choice) == App.views.Criteria:
             App.command_view(dataframe=data,
                              viewer=Head.CriteriaView,
-                             label="Criteria")
+                             label="Criteria",
+                             form=form)
         elif checks(choice) == App.views.ToDos:
             App.command_view(dataframe=data,
                              viewer=Head.ToDoAllView,
-                             label="Todos")
+                             label="Todos",
+                             form=form)
         elif checks(choice) == App.views.Reference:
             App.command_view(dataframe=data,
                              viewer=Head.ReferenceView,
-                             label="Reference/Index")
+                             label="Reference/Index",
+                             form=form)
+        elif checks(choice) == App.views.Topics:
+            App.command_counts(label="Topics", form=form)
+        elif checks(choice) == App.views.Stats:
+            App.command_stats(label="Stats", form=form)
         else:
             click.secho(message="No data viewable "
                                 f"for the chosen option: {selects}",
@@ -970,8 +1706,6 @@ def views(ctx, selects) -> None:
     
     # Display The View Choice
     chooseviews(data=dataframe, choice=selects)
-    # Update Global Data
-    App.update_appdata(context=ctx, dataframe=dataframe)
 
 
 # 3.0 Find: Locate: individual records from the bulk data
@@ -996,8 +1730,17 @@ def find(ctx: click.Context) -> None:  # noqa
     \b
     ACTIONS/Commands:
     - locate
-    ....'-i' index (range: 1 to last) | number only
+    ....'-i' index (range: 1 to last) | numbers, e.g. 3,5,10-14
     ....'-a' axis (default: index) | choose
+    - search
+    ....'--text' text (criteria, topics) | typos allowed
+    ....'--limit' limit (default: 10) | number only
+    - tagged
+    ....'--topics' topics (; separated) | text
+    ....'--groups' groups (; separated) | text
+    ....'--match' match (default: all) | choose
+    - locate, search, tagged
+    ....'--format' format (default: table) | csv, tsv, jsonl
     ===\n
     \b
     FUTURE: text search by 'column', 'row'.\n
@@ -1006,15 +1749,16 @@ def find(ctx: click.Context) -> None:  # noqa
     :param ctx: click.Context
     :return: None: Produces stdout --help text
     """
+    # Intro to stderr: stdout is only the data, e.g. to pipe --format csv
     click.secho(
         message="=====================FINDING MODE======================\n",
-        fg='cyan', bg='white', bold=True)
+        fg='cyan', bg='white', bold=True, err=True)
     click.secho(
         message="===========Locate & Show Individual Records============\n",
-        fg='cyan', bold=True)
+        fg='cyan', bold=True, err=True)
     click.secho(
         message="Entering finding & reading mode for records.",
-        fg='cyan', bg='white', bold=True)
+        fg='cyan', bg='white', bold=True, err=True)
     click.secho(message="Steps: \n"
                         "  1. Enter an find mode:                           \n"
                         "  2. Find a record:                                \n"
@@ -1023,15 +1767,15 @@ def find(ctx: click.Context) -> None:  # noqa
                         "     Use Load -> ToDo or Load -> Views to id a row \n"
                         "  4. View an individual record, in a card format   \n"
                         "  5. Exits automatically.                         \n",
-                fg='cyan', bold=styles.infobold, underline=True)
+                fg='cyan', bold=styles.infobold, underline=True, err=True)
     click.secho(
-        message="Prompts are available for each input.")
-    App.update_appdata(context=ctx, dataframe=App.get_data())
+        message="Prompts are available for each input.", err=True)
+    App.update_appdata(context=ctx, dataframe=App.get_data(reuse=True))
     click.secho(
         message="Working data is now ... rehydrated.",
-        blink=True)
+        blink=True, err=True)
     click.secho(message=f"You have rows 1 to {App.get_range} "
-                        "to work with", bold=styles.infobold)
+                        "to work with", bold=styles.infobold, err=True)
 
 
 # 3.1 Find: Locate: Index locations of an individual record
@@ -1041,71 +1785,230 @@ def find(ctx: click.Context) -> None:  # noqa
 # noinspection PyUnusedFunction
 @find.command(name='locate')
 @click.option('--index', 'index',
-              type=click.IntRange(
-                  min=1,
-                  max=App.get_range,
-                  clamp=App.values.Find.Index.clamp),
-              callback=Valid.index,
-              help=f'By Row 1 to {App.get_range}: ',
-              prompt='Enter an Index: ')
+              type=IndexRanges(),
+              default=App.chosen,
+              help=f'{App.values.Find.Locate.indexhelp}{App.get_range}',
+              prompt=App.values.Find.Locate.prompt)
 @click.option('--axis', 'axis',
               type=click.Choice(choices=['index'],
                                 case_sensitive=False),
               default='index',
               prompt=True)
+@click.option('--format', 'form',
+              type=click.Choice(choices=Exporter.FORMATS,
+                                case_sensitive=App.values.case),
+              default=Exporter.TABLE,
+              show_default=App.values.shown,
+              help=App.values.Format.help)
 @click.pass_context
-def locate(ctx: click.Context, index: int,
-           axis: str) -> None:
-    """Locate: a row: by index or searches term via index, column or row.
+def locate(ctx: click.Context, index: list[int | str],
+           axis: str, form: str) -> None:
+    """Locate: rows: by indexes, e.g. 3,5,10-14, or CriteriaRefs, e.g. 1.1.0.
     
     \f
     :param ctx: click.Context
-    :param index: int: The index of the row to locate
+    :param index: list[int | str]: The rows' indexes, or CriteriaRefs
     :param axis: str: The axis to search in: Default: index
+    :param form: str: Output format: table, or csv, tsv, jsonl to pipe
     :return: None: Display as stdout or stderr
     """
-    validindex = 1
-    if not Valid.isinrange(index):
-        click.secho(message="Index out of range",
-                    fg=styles.warnfg,
-                    bold=styles.warnbg)
-        return
-    else:
-        validindex = index
-    
-    # Get the dataframe
-    dataframe: pd.DataFrame = App.get_data()
+    # Get the dataframe: rehydrated, the record index is only rebuilt
+    # when the Position or CriteriaRef columns change.
+    App.update_appdata(context=ctx, dataframe=App.get_data(reuse=True))
+    dataframe: pd.DataFrame = App.data
     # If the axis is index, -a, --axis, then search the index
-    if axis.lower() == 'index' and Valid.isinrange(index):
-        # Get the result source
-        resultframe = \
-            Results.getrowdata(data=dataframe,
-                               ix=validindex)
-        
-        # Check if the result is a single record
-        if Record.checksingle(resultframe):
-            # Individual record holds the singular record, handles displays
-            # Selecting different calls on the individual record yields
-            # different displays/outputs.
-            # Only displays a pd.Series, implicitly.
-            # Not designed for results >1, unless part of a loop. # noqa
-            
-            # Shows a result
-            window.showrecord(data=resultframe,
-                              sendtolayout=App.values.Display.TOLAYOUT,
-                              debug=App.values.NOTRACING)
-        else:
-            click.secho(message="The result is not a single record",
+    if axis.lower() == 'index' and index:
+        # Get the result source: all the rows, in one lookup, by their
+        # Positions or CriteriaRefs: from the cached frame.
+        resultframe: pd.DataFrame | None = \
+            Results.getrowsdata(data=dataframe,
+                                ixs=index,
+                                records=App.recordindex())
+        if resultframe is None:
+            click.secho(message="No records found",
                         fg=styles.warnfg,
-                        bold=styles.warnbold)  # noqa
+                        bold=styles.warnbold)
+        # Stream a machine format: the records' rows, all of their columns
+        elif Exporter.ismachine(form):
+            Exporter.stream(frame=resultframe,
+                            headers=list(dataframe.columns),
+                            form=form)
+        # A few records: stacked cards, each record's own display
+        elif len(resultframe) < App.values.Find.Locate.cards:
+            for _, record in resultframe.iterrows():
+                # Shows a result
+                window.showrecord(data=record,
+                                  sendtolayout=App.values.Display.TOLAYOUT,
+                                  debug=App.values.NOTRACING,
+                                  cache=True)
+        # Many records: one compact table, paged when long
+        else:
+            App.output(data=resultframe,
+                       cols=Head.LocateView,
+                       title=App.values.Find.Locate.title)
     else:
         click.secho(message="Try again, and use: \n"
-                            "-i/--index and a number value between"
-                            f" 1 and {App.get_range}\n"
+                            "-i/--index and number values between"
+                            f" 1 and {App.get_range}, e.g. 3,5,10-14,\n"
+                            "or CriteriaRefs, e.g. 1.1.0\n"
                             "and axes: index",
                     fg='bright_yellow', bold=True)
-    # Update appdata data
-    App.update_appdata(context=ctx, dataframe=dataframe)
+
+
+# 3.2 Find: Search: Typo tolerant text lookup of records
+# Over the Criteria and CriteriaTopic columns: a fuzzy index of trigrams.
+# The chosen match becomes the default index for locate, edit note/progress.
+# noinspection PyUnusedFunction
+@find.command(name=App.values.Find.Search.cmd,
+              help=App.values.Find.Search.help,
+              short_help='Find Mode: Search by text')
+@click.option('--text', 'text', type=str,
+              help=App.values.Find.Search.help,
+              prompt=App.values.Find.Search.prompt)
+@click.option('--limit', 'limit',
+              type=click.IntRange(min=1, max=50, clamp=True),
+              default=App.values.Find.Search.limit,
+              show_default=App.values.shown,
+              help=App.values.Find.Search.limithelp)
+@click.option('--format', 'form',
+              type=click.Choice(choices=Exporter.FORMATS,
+                                case_sensitive=App.values.case),
+              default=Exporter.TABLE,
+              show_default=App.values.shown,
+              help=App.values.Format.help)
+@click.pass_context
+def search(ctx: click.Context, text: str, limit: int, form: str) -> None:
+    """Search: rows by their criteria or topic text, allowing typos.
+    
+    \f
+    :param ctx: click.Context
+    :param text: str: The text to search for
+    :param limit: int: The most matches to list
+    :param form: str: Output format: table, or csv, tsv, jsonl to pipe
+    :return: None: Display as stdout or stderr
+    """
+    matches = App.searchindex().search(query=text, limit=limit)
+    if not matches:
+        click.secho(message=f"No matches for: {text}. Try other words.",
+                    fg=styles.warnfg,
+                    bold=styles.warnbold)
+        return
+    # Stream a machine format: the matches, best first, not chosen from
+    if Exporter.ismachine(form):
+        found: pd.DataFrame = \
+            App.data.iloc[[match.offset for match in matches]].loc[
+                :, [ColumnSchema.Position, ColumnSchema.Topic,
+                    ColumnSchema.Criteria]]
+        found.insert(0, 'Rank', range(1, len(matches) + 1))
+        found.insert(2, 'Score', [round(match.score, 4) for match in matches])
+        Exporter.stream(frame=found, headers=list(found.columns), form=form)
+        return
+    # List the matches, best first, by rank
+    Webconsole.table = Webconsole.configure_table(
+        headers=['Rank', ColumnSchema.Position, 'Score',
+                 ColumnSchema.Topic, ColumnSchema.Criteria])
+    for rank, match in enumerate(matches, start=1):
+        row: pd.Series = App.data.iloc[match.offset]
+        Webconsole.table.add_row(str(rank),
+                                 str(match.position),
+                                 f'{match.score:.0%}',
+                                 str(row[ColumnSchema.Topic]),
+                                 str(row[ColumnSchema.Criteria]))
+    Webconsole.console.print(Webconsole.table)
+    # Choose a match: to show and to use as the default index
+    rank: int = click.prompt(text=App.values.Find.Search.choose,
+                             type=click.IntRange(min=0, max=len(matches)),
+                             default=1)
+    if rank:
+        chosen = matches[rank - 1]
+        App.selected = chosen.position
+        window.showrecord(data=App.data.iloc[chosen.offset],
+                          sendtolayout=App.values.Display.TOLAYOUT,
+                          command=App.values.Find.Locate.cmd,
+                          debug=App.values.NOTRACING,
+                          cache=True)
+        click.secho(message=f"Position {chosen.position} is the default "
+                            "index for: locate, note, progress",
+                    fg=styles.infofg, bold=styles.infobold)
+
+
+# 3.3 Find: Tagged: Rows by their CriteriaTopic and/or CriteriaGroup tags
+# Multi-valued topics are exploded once, per loaded data, into row bitmaps:
+# all of: bitmaps intersection (&), any of: bitmaps union (|).
+# noinspection PyUnusedFunction
+@find.command(name=App.values.Find.Tagged.cmd,
+              help=App.values.Find.Tagged.help,
+              short_help='Find Mode: Tagged by topics')
+@click.option('--topics', 'topics', type=str,
+              default='',
+              show_default=False,
+              help=App.values.Find.Tagged.topicshelp,
+              prompt=App.values.Find.Tagged.topicsprompt)
+@click.option('--groups', 'groups', type=str,
+              default='',
+              show_default=False,
+              help=App.values.Find.Tagged.groupshelp,
+              prompt=App.values.Find.Tagged.groupsprompt)
+@click.option('--match', 'match',
+              type=click.Choice(choices=[App.values.Find.Tagged.ALL,
+                                         App.values.Find.Tagged.ANY],
+                                case_sensitive=App.values.case),
+              default=App.values.Find.Tagged.ALL,
+              show_default=App.values.shown,
+              help=App.values.Find.Tagged.matchhelp)
+@click.option('--format', 'form',
+              type=click.Choice(choices=Exporter.FORMATS,
+                                case_sensitive=App.values.case),
+              default=Exporter.TABLE,
+              show_default=App.values.shown,
+              help=App.values.Format.help)
+@click.pass_context
+def tagged(ctx: click.Context, topics: str, groups: str, match: str,
+           form: str) -> None:
+    """Tagged: rows by their topics and/or groups, all of or any of these.
+    
+    \f
+    :param ctx: click.Context
+    :param topics: str: The topics, ; separated
+    :param groups: str: The groups, ; separated
+    :param match: str: all: tagged with every one, any: with at least one
+    :param form: str: Output format: table, or csv, tsv, jsonl to pipe
+    :return: None: Display as stdout or stderr
+    """
+    index: CategoryIndex = App.categoryindex()
+    every: bool = match.lower() == App.values.Find.Tagged.ALL
+    chosen: dict[str, list[str]] = {
+        ColumnSchema.Topic: CategoryIndex.split(topics),
+        ColumnSchema.Group: CategoryIndex.split(groups)}
+    # Guard Clause: Unknown tags, list the known ones
+    for column, labels in chosen.items():
+        unknown: list[str] = index.unknown(column=column, labels=labels)
+        if unknown:
+            click.secho(message=f"Unknown {column}: {'; '.join(unknown)}\n"
+                                f"Choices: {'; '.join(index.labels[column])}",
+                        fg=styles.warnfg,
+                        bold=styles.warnbold)
+            return
+    if not any(chosen.values()):
+        click.secho(message="Enter at least one topic or group",
+                    fg=styles.warnfg,
+                    bold=styles.warnbold)
+        return
+    # Bitmaps: per column, then across columns, by the same match
+    masks = [index.match(column=column, labels=labels, every=every)
+             for column, labels in chosen.items() if labels]
+    rows = masks[0]
+    for mask in masks[1:]:
+        rows = rows & mask if every else rows | mask
+    if not rows.any():
+        click.secho(message=f"No rows are tagged with {match} of these",
+                    fg=styles.warnfg,
+                    bold=styles.warnbold)
+        return
+    App.command_view(dataframe=App.data[rows],
+                     viewer=Head.OverviewViews,
+                     label=f"Tagged: {int(rows.sum())} rows",
+                     form=form)
 
 
 # 4. Edit: CUD Ops: Create, Read, Update, Delete.
@@ -1192,6 +2095,7 @@ def edit(ctx: click.Context) -> None:  # noqa: ANN101
                   max=App.get_range,
                   clamp=App.values.Find.Index.clamp),
               callback=Valid.index,
+              default=App.chosen,
               help=f'{App.values.Find.Index.help}{App.get_range}',
               prompt=f'BY ROW: ☑️ Select: 1 to {App.get_range}')
 # Edit Mode: Note to link/append/clear to Row recorď on edit
@@ -1229,8 +2133,10 @@ def notepad(ctx,
     :return: None: Display as stdout or stderr
     """
     # Debugging Flags
-    # Rehydrtate dataframe from remote
-    dataframe: pd.DataFrame = App.get_data()
+    # Rehydrtate dataframe from remote: the record index is only rebuilt
+    # when the Position or CriteriaRef columns change.
+    App.update_appdata(context=ctx, dataframe=App.get_data())
+    dataframe: pd.DataFrame = App.data
     
     validindex = 1
     if not Valid.isinrange(index):
@@ -1248,6 +2154,7 @@ def notepad(ctx,
         # - Get the record
         resultframe = Results.getrowdata(data=dataframe,
                                          ix=validindex,
+                                         records=App.recordindex(),
                                          debug=App.values.NOTRACING)
         if Record.checksingle(resultframe) and note is not None:
             # - Display the found result and - send to the editor
@@ -1293,11 +2200,10 @@ def notepad(ctx,
                 window.showmodified(editeddata=editor.newresultseries,
                                     editor=editor,
                                     commandtype=Valid.checkcommand(mode),
-                                    dataview='compare',
+                                    dataview='changes',
                                     debug=App.values.NOTRACING)
-                # - Update the local app data
-                App.update_appdata(context=ctx,
-                                   dataframe=editor.newresultframe)
+                # - Update the local app data: patch the edited record
+                App.update_record(edited=editor.newresultseries)
         else:
             click.secho(message="Exiting: editing mode: Adding a Note",
                         fg='bright_yellow',
@@ -1327,6 +2233,7 @@ def notepad(ctx,
                   max=App.get_range,
                   clamp=App.values.Find.Index.clamp),
               callback=Valid.index,
+              default=App.chosen,
               help=f'{App.values.Edit.ToDo.indexhelp}{App.get_range}: ',
               prompt=f'{App.values.Edit.ToDo.indexhelp}{App.get_range}: ')
 @click.option('-status', 'status',
@@ -1359,7 +2266,8 @@ def progress(ctx: click.Context,
     :return: None
     """
     # Debugging Flags
-    dataframe: pd.DataFrame = App.get_data()
+    App.update_appdata(context=ctx, dataframe=App.get_data())
+    dataframe: pd.DataFrame = App.data
     editmode = App.values.Edit.ToDo.SELECT
     
     validindex = 1
@@ -1379,6 +2287,7 @@ def progress(ctx: click.Context,
         resultframe = Results.getrowdata(data=dataframe,
                                          ix=validindex,
                                          single=App.values.SINGLE,
+                                         records=App.recordindex(),
                                          debug=App.values.NOTRACING)
         if Record.checksingle(resultframe) \
             and Valid.checkstatus(status) is not None:  # noqa # Pep8 E125
@@ -1430,11 +2339,10 @@ def progress(ctx: click.Context,
                 window.showmodified(editeddata=editor.newresultseries,
                                     editor=editor,
                                     commandtype=editmode,
-                                    dataview='compare',
+                                    dataview='changes',
                                     debug=App.values.NOTRACING)
-                # - Update the local app data
-                App.update_appdata(context=ctx,
-                                   dataframe=editor.newresultframe)
+                # - Update the local app data: patch the edited record
+                App.update_record(edited=editor.newresultseries)
         else:
             click.secho(message="Exiting: editing mode: Adding a Note",
                         fg='bright_yellow',
@@ -1459,7 +2367,16 @@ def progress(ctx: click.Context,
 # This is a core architectural entry point of the application level REPL
 register_repl(run)
 
-if __name__ == "__main__":
+def main() -> None:
+    """Main: the introduction, then the command: e.g. app.py repl.
+    
+    The introduction is on stderr: a command's piped stdout, e.g.
+    --format csv, carries only its data.
+    
+    Also the prefork server's children's entry point: see prefork.py.
+    
+    :return: None
+    """
     utils.warn()
     # Opening Introduction
     click.echo(
@@ -1495,6 +2412,9 @@ if __name__ == "__main__":
                 "Google Sheets (the remote).\n"
                 "NB: Each command rehydrates/refreshes "
                 "local data from the remote.\n"
+                "  - Views reuse data fetched in the last "
+                f"{configuration.Cache.DATA_TTL:g} seconds: "
+                "edits always refetch.\n"
                 "  - This rehydration pattern is more"
                 " expensive per command.\n"
                 "  - It does ensure most recent data "
@@ -1548,9 +2468,14 @@ if __name__ == "__main__":
                 " letters for autocomplete\n"
                 "\n"
                 "Then press 'space' to show the "
-                "subcommands sub-menus\n")  # noqa
+                "subcommands sub-menus\n",
+        err=True)  # noqa: stdout carries only the command's output
     run()
 
+
+if __name__ == "__main__":
+    main()
+
 # End of App Module
 # Ruff Checked, Pep6CI Checked - All Passing
 # Timestamp: 2022-06-02T18:35, copywrite (c) 2022-2025, Charles J Fowler
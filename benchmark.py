@@ -0,0 +1,755 @@
+#!/user/bin/env python3
+# pylint: disable=trailing-whitespace
+# ruff: noqa: ANN101, I001, T201
+# noqa: W293 blank line contains whitespace
+"""Module: Benchmark: Timings of the app's hot paths, offline.
+
+Usage:
+-------------------------
+- python benchmark.py --rows 10000
+- Each Case times a baseline, the former code path, against the candidate,
+  the current code path, on the dataset replicated to --rows rows.
+  A case passes when the speedup is at least its threshold.
+- No Google Sheets access: the dataset is the .docs/assets CSV copy.
+- python benchmark.py --suite scaling --sizes 1000,10000 --save base.json
+- python benchmark.py --suite scaling --baseline base.json
+- The scaling suite runs the app's commands, as typed, on synthetic datasets
+  of each size, from datagen, on the offline backend: a process per size.
+  A step passes when its seconds are within the baseline's, plus the
+  tolerance: --save keeps the run as the next baseline.
+- --backend standin: the datasets are served by the Sheets API stand-in:
+  the app's gspread requests, and their latency, are timed too.
+
+Cases:
+-------------------------
+- render: Display rows into a rich Table, by iterrows() then str() per cell,
+          against the vectorised Display.project & Display.display_rows.
+          Console printing is excluded: it costs the same for both.
+- styles: The record card's style calls, by format & Style.parse per call,
+          against the RICHStyler registry of pre-parsed styles.
+- card: Record cards, Header & Current Data panels, rendered to text, with
+        the former per call styler, against the RICHStyler registry.
+        Rendering dominates: the case guards against a regression, within
+        timing noise, rather than expecting a speedup.
+- layout: The Criteria view rendered to text, at the console's width, with
+          rich measuring every cell, against Display.fit's width budgets
+          and truncated cells: rich measures no cells.
+- search: Typo tolerant text searches, by the edit distance of every row,
+          against FuzzyIndex's trigram candidates: the index is built
+          once per dataset, on the first run, as the app keeps it.
+
+Scaling:
+-------------------------
+- startup: The app's import: its first load of the dataset.
+- load: load todo -selects All: a fetch, as the cached data is stale.
+- todo:<view>, views:<view>: Every view, rendered: the data is cached.
+  todo:All is the load step's command: it is not timed twice, as a
+  render cache hit.
+  A step printing the app's no data, or not possible, message fails.
+- locate, locate:many: find locate, one record, then a list and a range.
+- note, progress: The edits, not saved.
+- save: A note edit, saved: the worksheet refetched, the record integrated.
+
+Linting:
+-------------------------
+- pylint: disable=trailing-whitespace
+- ruff: noqa:
+      I001:     unsorted-imports
+                Import block is unsorted or unformatted
+      ANN101:   missing-type-self
+                Missing type annotation for {name} in method
+      T201:     print found
+- noqa: W293
+
+Critieria:
+LO2.2: Clearly separate and identify code written for the application and
+       the code from external sources (e.g. libraries or tutorials)
+LO2.2.3: Clearly separate code from external sources
+LO2.2.4: Clearly identify code from external sources
+LO6: Use library software for building a graphical user interface,
+or command-line interface, or web application, or mathematical software
+LO6.1 Implement the use of external Python libraries
+LO6.1.1 Implement the use of external Python libraries
+      where appropriate to provide the functionality that the project requires.
+-------------------------
+Standard Libraries
+:imports: contextlib, dataclasses, gc, io, json, os, pathlib
+:imports: subprocess, sys
+:imports: tempfile, time, typing
+
+3rd Paty Imports
+:imports: click, pandas, rich
+
+Custom Authored Libraries
+:imports: controller, controller.Display, controller.Record
+:imports: controller.WebConsole
+:imports: datagen.Generator
+:imports: indexes.FuzzyIndex, indexes.Match
+:imports: modelview.ColumnSchema, modelview.Head, modelview.Views
+:imports: settings.Settings
+:imports: standin.SheetsStandIn
+:imports: telemetry.MemoryProfiler
+
+:class: Case: A named baseline against candidate timing, with a threshold.
+:class: Step: A scaling step: a command, as typed, and its answers.
+:class: ParsingStyler: The former RICHStyler: formats & parses per call.
+:class: Benchmarks: The dataset, the timer, and the cases.
+:class: Scaling: The steps, timed per dataset size, against a baseline.
+"""
+# 0.1 Standard Library Imports
+import contextlib
+import dataclasses
+import gc
+import io
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable
+
+# 0.2 Third Party Modules
+import click  # type: ignore
+import pandas as pd  # type: ignore
+from rich.console import Console  # type: ignore
+from rich.style import Style  # type: ignore
+from rich.table import Table  # type: ignore
+
+# 0.3 Local imports
+import controller
+from controller import Display, Record, WebConsole
+from datagen import Generator
+from indexes import FuzzyIndex, Match
+from modelview import ColumnSchema, Head, Views
+from settings import Settings
+from standin import SheetsStandIn
+from telemetry import MemoryProfiler
+
+
+@dataclasses.dataclass(frozen=True)
+class Case:
+    """A benchmark case: the baseline and the candidate, same workload.
+    
+    :property: name: str: The case's name.
+    :property: baseline: Callable: The former code path, on the dataset.
+    :property: candidate: Callable: The current code path, on the dataset.
+    :property: threshold: float: The least speedup to pass.
+    """
+    name: str
+    baseline: Callable[[pd.DataFrame], object]
+    candidate: Callable[[pd.DataFrame], object]
+    threshold: float
+
+
+@dataclasses.dataclass(frozen=True)
+class Step:
+    """A scaling step: an app command, as typed, with its prompts' answers.
+    
+    :property: name: str: The step's name.
+    :property: args: tuple[str, ...]: The command's words.
+    :property: answers: str | None: The prompts' answers, a line each.
+    :property: fetch: bool: True: the cached data is stale, it is fetched.
+    """
+    name: str
+    args: tuple[str, ...]
+    answers: str | None = None
+    fetch: bool = False
+
+
+class ParsingStyler:
+    """The former RICHStyler: each call formats, then parses, its style.
+    
+    Only the styles a record card uses: the baseline of the style cases.
+    """
+    style = Style()
+    
+    @staticmethod
+    def panel(grey: int, tostring: bool = True) -> Style | str:
+        """The panel's style: bold white on the grey level."""
+        emp: str = "bold"
+        co: str = "white"
+        bg: str = f"grey{grey}"
+        styled: str = f'{emp} {co} on {bg}'
+        return styled if tostring else ParsingStyler.style.parse(styled)
+    
+    @staticmethod
+    def label() -> Style:
+        """The label's style."""
+        emp: str = "bold"
+        co: str = "purple4"
+        bg: str = "grey93"
+        styled: str = f'{emp} {co} on {bg}'
+        return ParsingStyler.style.parse(styled)
+    
+    @staticmethod
+    def value() -> Style:
+        """The value's style."""
+        emp: str = "italic"
+        co: str = "dark_turquoise"
+        bg: str = "black"
+        styled: str = f'{emp} {co} on {bg}'
+        return ParsingStyler.style.parse(styled)
+    
+    @staticmethod
+    def border(stylestr: bool = True) -> Style | str:
+        """The border's style."""
+        emp: str = "bold"
+        bg: str = "grey93"
+        styled: str = f'{emp} {bg}'
+        return styled if stylestr else ParsingStyler.style.parse(styled)
+
+
+class Benchmarks:
+    """Benchmarks: Times each case's baseline and candidate.
+    
+    :property: DATASET: pathlib.Path: The dataset's CSV copy.
+    :property: ROWS: int: The default rows to replicate the dataset to.
+    :property: REPEATS: int: Runs per timing: the best run is kept.
+    :property: UNPRINTED: Unprinted: Console printing is not timed.
+    :property: CARDS: int: The records rendered as cards, per run.
+    :property: LOOKUPS: int: The card's style calls, per run.
+    :property: LAYOUTROWS: int: The rows rendered, per layout run.
+    :property: WIDTH: int: The console's width, for the layout case.
+    :property: SEARCHES: tuple[str, ...]: The search case's queries, typos
+               and all: the last matches no row.
+    :property: INDEXES: dict[int, FuzzyIndex]: The search index per
+               dataset: built on its first run.
+    """
+    
+    DATASET: pathlib.Path = \
+        pathlib.Path(__file__).parent / '.docs' / 'assets' / \
+        'PyCriteria - DataSet.csv'
+    ROWS: int = 10_000
+    REPEATS: int = 5
+    CARDS: int = 200
+    LOOKUPS: int = 50_000
+    LAYOUTROWS: int = 1_000
+    WIDTH: int = 120
+    SEARCHES: tuple[str, ...] = ('implment algoritm', 'pyhton code',
+                                 'data valdation', 'qzxv wkjy')
+    INDEXES: dict[int, FuzzyIndex] = {}
+    
+    class Unprinted:
+        """A console stand-in: display_rows' print is not timed."""
+        
+        @staticmethod
+        def print(*_renderables: object) -> None:
+            """Prints nothing."""
+    
+    UNPRINTED: Unprinted = Unprinted()
+    
+    @staticmethod
+    def dataset(rows: int) -> pd.DataFrame:
+        """The dataset, replicated to the rows, Position renumbered.
+        
+        :param rows: int: The rows wanted.
+        :return: pd.DataFrame: Same schema as the remote worksheet.
+        """
+        source: pd.DataFrame = pd.read_csv(Benchmarks.DATASET,
+                                           keep_default_na=False)
+        source = source.rename(columns={'TieirDepth': 'TierDepth'})
+        copies: int = -(-rows // len(source))
+        frame: pd.DataFrame = pd.concat([source] * copies,
+                                        ignore_index=True).head(rows)
+        frame['Position'] = range(1, len(frame) + 1)
+        return frame
+    
+    @staticmethod
+    def timeit(func: Callable[[pd.DataFrame], object],
+               frame: pd.DataFrame,
+               repeats: int) -> float:
+        """The best of the repeated runs' seconds: gc off, as in timeit.
+        
+        :param func: Callable: The code path to time.
+        :param frame: pd.DataFrame: Its input.
+        :param repeats: int: The runs.
+        :return: float: Seconds.
+        """
+        best: float = float('inf')
+        collecting: bool = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(repeats):
+                start: float = time.perf_counter()
+                func(frame)
+                best = min(best, time.perf_counter() - start)
+        finally:
+            if collecting:
+                gc.enable()
+        return best
+    
+    # Case: render
+    @staticmethod
+    def table() -> Table:
+        """An Overview table, as configured by the app.
+        
+        :return: Table: With the Overview's columns.
+        """
+        table = Table()
+        for header in Head.OverviewViews:
+            table.add_column(header)
+        return table
+    
+    @staticmethod
+    def renderiterrows(frame: pd.DataFrame) -> Table:
+        """Baseline: the former Display.display_subframe rows loop."""
+        table: Table = Benchmarks.table()
+        headers: list[str] = Head.OverviewViews
+        filteredcolumns: pd.DataFrame = \
+            frame.loc[:, frame.columns.isin(values=headers)]
+        for _index, row in filteredcolumns.iterrows():
+            table.add_row(*[str(row[column]) for column in headers])
+        return table
+    
+    @staticmethod
+    def rendervectorised(frame: pd.DataFrame) -> Table:
+        """Candidate: Display.project, then Display.display_rows."""
+        table: Table = Benchmarks.table()
+        Display.display_rows(rows=Display.project(dataframe=frame,
+                                                  headers=Head.OverviewViews),
+                             consoleholder=Benchmarks.UNPRINTED,
+                             consoletable=table)
+        return table
+    
+    # Case: styles
+    @staticmethod
+    def lookups(styler: type) -> list[Style | str]:
+        """A card's style calls: labels, values, panel and border.
+        
+        :param styler: type: RICHStyler, or the ParsingStyler baseline
+        :return: list[Style | str]: The last card's styles
+        """
+        styles: list[Style | str] = []
+        for _ in range(Benchmarks.LOOKUPS):
+            styles = [styler.label(), styler.value(),
+                      styler.panel(grey=23, tostring=False),
+                      styler.border(stylestr=False)]
+        return styles
+    
+    @staticmethod
+    def stylesparsed(_frame: pd.DataFrame) -> list[Style | str]:
+        """Baseline: the former styler, format & parse per call."""
+        return Benchmarks.lookups(styler=ParsingStyler)
+    
+    @staticmethod
+    def stylesregistry(_frame: pd.DataFrame) -> list[Style | str]:
+        """Candidate: RICHStyler's registry of pre-parsed styles."""
+        return Benchmarks.lookups(styler=controller.RICHStyler)
+    
+    # Case: card
+    @staticmethod
+    def cards(frame: pd.DataFrame, styler: type) -> str:
+        """Renders records as cards: the Header & Current Data panels.
+        
+        :param frame: pd.DataFrame: The records: the first CARDS rows.
+        :param styler: type: RICHStyler, or the ParsingStyler baseline
+        :return: str: The rendered text
+        """
+        printer: Console = Console(file=io.StringIO(), width=100)
+        kept: type = controller.styld
+        controller.styld = styler
+        try:
+            for _index, row in frame.head(Benchmarks.CARDS).iterrows():
+                record: Record = Record(series=row, source=row)
+                for renderable in (
+                        record.header(consolehead=printer,
+                                      sendtolayout=True, gridfit=True),
+                        record.editable(consoleedit=printer,
+                                        sendtolayout=True)):
+                    printer.print(Record.panel(consolepane=printer,
+                                               renderable=renderable,
+                                               fits=True,
+                                               sendtolayout=True))
+        finally:
+            controller.styld = kept
+        return printer.file.getvalue()
+    
+    @staticmethod
+    def cardsparsed(frame: pd.DataFrame) -> str:
+        """Baseline: cards styled by the former styler."""
+        return Benchmarks.cards(frame=frame, styler=ParsingStyler)
+    
+    @staticmethod
+    def cardsregistry(frame: pd.DataFrame) -> str:
+        """Candidate: cards styled from RICHStyler's registry."""
+        return Benchmarks.cards(frame=frame, styler=controller.RICHStyler)
+    
+    # Case: layout
+    @staticmethod
+    def rendered(table: Table) -> str:
+        """Renders the table to text, at the layout case's width.
+        
+        :param table: Table: The filled table
+        :return: str: The rendered text
+        """
+        printer: Console = Console(file=io.StringIO(),
+                                   width=Benchmarks.WIDTH)
+        printer.print(table)
+        return printer.file.getvalue()
+    
+    @staticmethod
+    def layoutmeasured(frame: pd.DataFrame) -> str:
+        """Baseline: rich measures every cell, to size the columns."""
+        headers: list[str] = Head.CriteriaView
+        return Benchmarks.rendered(Display.fill_rows(
+            rows=Display.project(
+                dataframe=frame.head(Benchmarks.LAYOUTROWS),
+                headers=headers),
+            consoletable=WebConsole.configure_table(headers=headers)))
+    
+    @staticmethod
+    def layoutfitted(frame: pd.DataFrame) -> str:
+        """Candidate: Display.fit's widths, rich measures no cells."""
+        headers: list[str] = Head.CriteriaView
+        rows, widths = Display.fit(
+            dataframe=frame.head(Benchmarks.LAYOUTROWS),
+            headers=headers,
+            width=Benchmarks.WIDTH)
+        return Benchmarks.rendered(Display.fill_rows(
+            rows=rows,
+            consoletable=WebConsole.configure_table(headers=headers,
+                                                    widths=widths)))
+    
+    # Case: search
+    @staticmethod
+    def searchscanned(frame: pd.DataFrame) -> list[list[Match]]:
+        """Baseline: every row's text scored by edit distance."""
+        texts: list[str] = FuzzyIndex.normalise(
+            frame=frame, columns=[ColumnSchema.Topic, ColumnSchema.Criteria])
+        found: list[list[Match]] = []
+        for query in Benchmarks.SEARCHES:
+            matches: list[Match] = []
+            for row, text in enumerate(texts):
+                edits: int = FuzzyIndex.distance(pattern=query, text=text)
+                if edits < len(query):
+                    matches.append(Match(offset=row, position=row + 1,
+                                         distance=edits,
+                                         score=1 - edits / len(query)))
+            matches.sort(key=lambda match: (match.distance, match.offset))
+            found.append(matches[:10])
+        return found
+    
+    @staticmethod
+    def searchindexed(frame: pd.DataFrame) -> list[list[Match]]:
+        """Candidate: FuzzyIndex.search, on the dataset's index."""
+        index: FuzzyIndex | None = Benchmarks.INDEXES.get(id(frame))
+        if index is None:
+            index = Benchmarks.INDEXES[id(frame)] = FuzzyIndex(frame=frame)
+        return [index.search(query=query, limit=10)
+                for query in Benchmarks.SEARCHES]
+    
+    @staticmethod
+    def cases() -> list[Case]:
+        """The benchmark cases, in run order.
+        
+        :return: list[Case]
+        """
+        return [Case(name='render',
+                     baseline=Benchmarks.renderiterrows,
+                     candidate=Benchmarks.rendervectorised,
+                     threshold=10.0),
+                Case(name='styles',
+                     baseline=Benchmarks.stylesparsed,
+                     candidate=Benchmarks.stylesregistry,
+                     threshold=1.5),
+                Case(name='card',
+                     baseline=Benchmarks.cardsparsed,
+                     candidate=Benchmarks.cardsregistry,
+                     threshold=0.9),
+                Case(name='layout',
+                     baseline=Benchmarks.layoutmeasured,
+                     candidate=Benchmarks.layoutfitted,
+                     threshold=1.2),
+                Case(name='search',
+                     baseline=Benchmarks.searchscanned,
+                     candidate=Benchmarks.searchindexed,
+                     threshold=10.0)]
+
+
+class Scaling:
+    """Scaling: Times the app's commands per dataset size, offline.
+    
+    Each size runs in its own process: the app's data, caches and memory
+    start empty, and the peak RSS is the size's own.
+    
+    :property: TOLERANCE: float: The slowdown, over the baseline, allowed.
+    :property: SLACK: float: Seconds of timing noise, allowed on any step.
+    :property: TIMEOUT: int: Seconds a size's process may run for.
+    :property: RSS: str: The results' peak RSS entry, in MiB.
+    :property: REJECTED: tuple[str, ...]: The app's messages for a choice
+        it renders nothing for: a step printing one has timed a no-op.
+    """
+    
+    TOLERANCE: float = 0.25
+    SLACK: float = 0.02
+    TIMEOUT: int = 3600
+    RSS: str = 'peak MiB'
+    REJECTED: tuple[str, ...] = ('No data viewable',
+                                 'Your selected option is not possible')
+    
+    @staticmethod
+    def steps() -> list[Step]:
+        """The steps, in run order: the edits last, the save at the end.
+        
+        :return: list[Step]
+        """
+        return [
+            Step(name='load', args=('load', 'todo', '-selects', Views.All),
+                 fetch=True),
+            *[Step(name=f'todo:{view}',
+                   args=('load', 'todo', '-selects', view))
+              for view in Views.Todo if view != Views.All],
+            *[Step(name=f'views:{view}',
+                   args=('load', 'views', '-selects', view))
+              for view in Views.Load],
+            Step(name='locate',
+                 args=('find', 'locate', '--index', '3', '--axis', 'index')),
+            Step(name='locate:many',
+                 args=('find', 'locate', '--index', '3,5,10-14',
+                       '--axis', 'index')),
+            Step(name='note',
+                 args=('edit', 'note', '--mode', 'add', '--index', '3',
+                       '--note', 'Benchmark', '--axis', 'index'),
+                 answers='y\nn\n'),
+            Step(name='progress',
+                 args=('edit', 'progress', '--index', '3', '-status', 'WIP',
+                       '--axis', 'index'),
+                 answers='y\nn\n'),
+            Step(name='save',
+                 args=('edit', 'note', '--mode', 'add', '--index', '4',
+                       '--note', 'Benchmark', '--axis', 'index'),
+                 answers='y\ny\ny\n')]
+    
+    @staticmethod
+    def measure() -> dict[str, float]:
+        """Runs the steps: in this process, on the backend it is given.
+        
+        :return: dict[str, float]: Seconds per step, and the peak RSS
+        """
+        # The app loads its data as it is imported: timed as the startup
+        # pylint: disable=import-outside-toplevel
+        start: float = time.perf_counter()
+        import app  # noqa: E402
+        from click.testing import CliRunner  # type: ignore
+        results: dict[str, float] = {
+            'startup': time.perf_counter() - start}
+        runner: CliRunner = CliRunner()
+        for step in Scaling.steps():
+            # Stale, to fetch: else fresh, as a view reuses the cached data
+            app.DataControl.fetched = float('-inf') if step.fetch \
+                else time.monotonic()
+            start = time.perf_counter()
+            outcome = runner.invoke(app.run, list(step.args),
+                                    input=step.answers)
+            results[step.name] = time.perf_counter() - start
+            if outcome.exit_code != 0:
+                raise SystemExit(f'{step.name}: {outcome.exception!r}')
+            rejected: list[str] = [message for message in Scaling.REJECTED
+                                   if message in outcome.output]
+            if rejected:
+                raise SystemExit(f'{step.name}: {rejected[0]}')
+        results[Scaling.RSS] = MemoryProfiler.peakrss() / MemoryProfiler.MIB
+        return results
+    
+    @staticmethod
+    def size(rows: int, seed: int, directory: pathlib.Path,
+             backend: str) -> dict[str, float]:
+        """Generates a size's dataset, then measures it in a new process.
+        
+        :param rows: int: The dataset's rows
+        :param seed: int: The dataset's seed
+        :param directory: pathlib.Path: For the dataset and its results
+        :param backend: str: local: the CSV file; standin: the CSV file,
+            served by the API stand-in, with Settings.StandIn's faults
+        :return: dict[str, float]: Seconds per step, and the peak RSS
+        """
+        data: pathlib.Path = Generator(rows=rows, seed=seed).write(
+            path=directory / f'{rows}.csv')
+        results: pathlib.Path = directory / f'{rows}.json'
+        with contextlib.ExitStack() as stack:
+            environment: dict[str, str] = {
+                Settings.Backend.SOURCE: Settings.Backend.LOCAL,
+                Settings.Backend.DATA: str(data)}
+            if backend == Settings.Backend.STANDIN:
+                server: SheetsStandIn = SheetsStandIn(port=0)
+                server.add(path=str(data))
+                stack.enter_context(server.running())
+                environment = {
+                    Settings.Backend.SOURCE: Settings.Backend.STANDIN,
+                    Settings.Backend.API: server.url}
+            subprocess.run(
+                [sys.executable, __file__, '--measure', str(results)],
+                env={**os.environ, **environment},
+                cwd=pathlib.Path(__file__).parent,
+                stdout=subprocess.DEVNULL,
+                timeout=Scaling.TIMEOUT,
+                check=True)
+        return json.loads(results.read_text(encoding=Settings.ENCODE))
+    
+    @staticmethod
+    def run(sizes: list[int], seed: int,
+            backend: str) -> dict[str, dict[str, float]]:
+        """Measures each size: its dataset, and results, are temporary.
+        
+        :param sizes: list[int]: The datasets' rows
+        :param seed: int: The datasets' seed
+        :param backend: str: local, or standin
+        :return: dict[str, dict[str, float]]: Rows, as text, to results
+        """
+        measured: dict[str, dict[str, float]] = {}
+        with tempfile.TemporaryDirectory(prefix='pycriteria') as directory:
+            for rows in sizes:
+                print(f'Measuring {rows} rows ...', file=sys.stderr)
+                measured[str(rows)] = Scaling.size(
+                    rows=rows, seed=seed, directory=pathlib.Path(directory),
+                    backend=backend)
+        return measured
+    
+    @staticmethod
+    def limit(baseline: float | None, tolerance: float) -> float | None:
+        """A step's most seconds: the baseline's, plus tolerance & slack.
+        
+        :param baseline: float | None: The baseline's seconds, if any
+        :param tolerance: float: The slowdown allowed, e.g. 0.25
+        :return: float | None: None: no baseline, nothing to regress
+        """
+        if baseline is None:
+            return None
+        return baseline * (1 + tolerance) + Scaling.SLACK
+    
+    @staticmethod
+    def report(measured: dict[str, dict[str, float]],
+               baseline: dict[str, dict[str, float]],
+               tolerance: float) -> int:
+        """Prints the table: step, rows, seconds, baseline, limit, result.
+        
+        :param measured: dict: Rows to the steps' seconds
+        :param baseline: dict: Rows to the baseline's seconds: may be empty
+        :param tolerance: float: The slowdown allowed
+        :return: int: The regressed steps
+        """
+        failed: int = 0
+        print(f'{"step":<18}{"rows":>9}{"seconds":>11}'
+              f'{"baseline":>11}{"limit":>9}  result')
+        for rows, results in measured.items():
+            for step, seconds in results.items():
+                if step == Scaling.RSS:
+                    continue
+                base: float | None = baseline.get(rows, {}).get(step)
+                limit: float | None = Scaling.limit(baseline=base,
+                                                    tolerance=tolerance)
+                passed: bool = limit is None or seconds <= limit
+                failed += not passed
+                result: str = 'NEW' if limit is None else \
+                    'PASS' if passed else 'FAIL'
+                print(f'{step:<18}{rows:>9}{seconds:>11.4f}'
+                      f'{"-" if base is None else f"{base:.4f}":>11}'
+                      f'{"-" if limit is None else f"{limit:.4f}":>9}  '
+                      f'{result}')
+            print(f'{Scaling.RSS:<18}{rows:>9}{results[Scaling.RSS]:>11.1f}')
+        return failed
+
+
+def cases(rows: int, repeats: int) -> int:
+    """Times the cases, baseline against candidate: prints the table.
+    
+    :param rows: int: Rows to replicate the dataset to
+    :param repeats: int: Runs per timing
+    :return: int: The failed cases
+    """
+    frame: pd.DataFrame = Benchmarks.dataset(rows=rows)
+    failed: int = 0
+    print(f'{"case":<12}{"rows":>9}{"baseline s":>13}'
+          f'{"candidate s":>13}{"speedup":>10}{"min":>7}  result')
+    for case in Benchmarks.cases():
+        baseline: float = Benchmarks.timeit(case.baseline, frame, repeats)
+        candidate: float = Benchmarks.timeit(case.candidate, frame, repeats)
+        speedup: float = baseline / candidate if candidate else float('inf')
+        passed: bool = speedup >= case.threshold
+        failed += not passed
+        print(f'{case.name:<12}{rows:>9}{baseline:>13.4f}{candidate:>13.4f}'
+              f'{speedup:>9.1f}x{case.threshold:>6.1f}x  '
+              f'{"PASS" if passed else "FAIL"}')
+    return failed
+
+
+def scaling(sizes: str, seed: int, backend: str, baseline: str | None,
+            save: str | None, tolerance: float) -> int:
+    """Times the commands per size, against the baseline: prints the table.
+    
+    :param sizes: str: The datasets' rows, comma separated
+    :param seed: int: The datasets' seed
+    :param backend: str: local, or standin
+    :param baseline: str | None: The baseline's JSON file, if any
+    :param save: str | None: The JSON file to keep the results in
+    :param tolerance: float: The slowdown allowed
+    :return: int: The regressed steps
+    """
+    measured: dict[str, dict[str, float]] = Scaling.run(
+        sizes=[int(size) for size in sizes.split(',') if size.strip()],
+        seed=seed, backend=backend)
+    failed: int = Scaling.report(
+        measured=measured,
+        baseline=json.loads(pathlib.Path(baseline).read_text(
+            encoding=Settings.ENCODE)) if baseline else {},
+        tolerance=tolerance)
+    if save:
+        pathlib.Path(save).write_text(json.dumps(measured, indent=2),
+                                      encoding=Settings.ENCODE)
+    return failed
+
+
+@click.command(name='benchmark')
+@click.option('--suite', 'suite', type=click.Choice(['cases', 'scaling']),
+              default='cases', show_default=True,
+              help='cases: hot paths, baseline against candidate. '
+                   'scaling: the commands, per dataset size.')
+@click.option('--rows', 'rows', type=click.IntRange(min=1),
+              default=Benchmarks.ROWS, show_default=True,
+              help='Rows to replicate the dataset to.')
+@click.option('--repeats', 'repeats', type=click.IntRange(min=1),
+              default=Benchmarks.REPEATS, show_default=True,
+              help='Runs per timing, the best is kept.')
+@click.option('--sizes', 'sizes', type=str,
+              default=','.join(str(size) for size in Generator.SIZES),
+              show_default=True,
+              help='Scaling: the datasets\' rows, comma separated.')
+@click.option('--seed', 'seed', type=int, default=0, show_default=True,
+              help='Scaling: the datasets\' seed.')
+@click.option('--backend', 'backend',
+              type=click.Choice([Settings.Backend.LOCAL,
+                                 Settings.Backend.STANDIN]),
+              default=Settings.Backend.LOCAL, show_default=True,
+              help='Scaling: the CSV file, or the Sheets API stand-in: '
+                   'gspread\'s own requests, to a local server.')
+@click.option('--baseline', 'baseline',
+              type=click.Path(exists=True, dir_okay=False),
+              help='Scaling: a saved run\'s JSON, to check regressions.')
+@click.option('--save', 'save', type=click.Path(dir_okay=False),
+              help='Scaling: the JSON file to keep this run in.')
+@click.option('--tolerance', 'tolerance', type=click.FloatRange(min=0),
+              default=Scaling.TOLERANCE, show_default=True,
+              help='Scaling: the slowdown allowed, e.g. 0.25 is 25%.')
+@click.option('--measure', 'measure', type=click.Path(dir_okay=False),
+              hidden=True,
+              help='Runs the scaling steps, here: writes their JSON.')
+def main(suite: str, rows: int, repeats: int, sizes: str, seed: int,
+         backend: str, baseline: str | None, save: str | None,
+         tolerance: float, measure: str | None) -> None:
+    """Benchmark: time the app's hot paths, or its commands' scaling."""
+    if measure:
+        pathlib.Path(measure).write_text(json.dumps(Scaling.measure()),
+                                         encoding=Settings.ENCODE)
+        return
+    failed: int = cases(rows=rows, repeats=repeats) if suite == 'cases' \
+        else scaling(sizes=sizes, seed=seed, backend=backend,
+                     baseline=baseline, save=save, tolerance=tolerance)
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
+
+# End of Benchmark Module
@@ -0,0 +1,384 @@
+#!/user/bin/env python3
+# pylint: disable=trailing-whitespace
+# ruff: noqa: ANN101, I001
+# noqa: W293 blank line contains whitespace
+"""Module: Caches: Materialised, ready to render, views of the dataset.
+
+Usage:
+-------------------------
+- ViewCache: The Headers' projections of the app data, stringified rows
+             ready for rendering, per view. Keyed by the view and by the
+             data stamp (DataController.stamp) of only the view's columns:
+             an edit to Notes invalidates only the views with Notes.
+- StatsCube: Counts, and cross tabs, of Progress x DoD x Performance x
+             CriteriaGroup. From categorical codes, counted by np.bincount
+             into one 4D tensor; totals & cross tabs are its marginal sums.
+             Patched incrementally for an edited record: -1 old, +1 new.
+- RenderCache: LRU of rendered output, text with ANSI styles, keyed by
+             e.g. (view or record, data revision/stamp, console width):
+             a repeated display is a string write, not a layout pass.
+
+Linting:
+-------------------------
+- pylint: disable=trailing-whitespace
+- ruff: noqa:
+      I001:     unsorted-imports
+                Import block is unsorted or unformatted
+      ANN101:   missing-type-self
+                Missing type annotation for {name} in method
+- noqa: W293
+
+Critieria:
+LO2.2: Clearly separate and identify code written for the application and
+       the code from external sources (e.g. libraries or tutorials)
+LO2.2.3: Clearly separate code from external sources
+LO2.2.4: Clearly identify code from external sources
+LO6: Use library software for building a graphical user interface,
+or command-line interface, or web application, or mathematical software
+LO6.1 Implement the use of external Python libraries
+LO6.1.1 Implement the use of external Python libraries
+      where appropriate to provide the functionality that the project requires.
+-------------------------
+Standard Libraries
+:imports: collections, dataclasses, threading, typing
+
+3rd Paty Imports
+:imports: numpy, pandas
+
+Custom Authored Libraries
+:imports: controller.Display
+:imports: modelview.ColumnSchema
+
+:class: Projection: A view's stringified rows, at a data stamp.
+:class: ViewCache: The projections, per view, rebuilt on column changes.
+:class: StatsCube: The count tensor of the categorical columns.
+:class: RenderCache: Least recently used rendered outputs.
+"""
+# 0.1 Standard Library Imports
+import dataclasses
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable
+
+# 0.2 Third Party Modules
+import numpy as np
+import pandas as pd  # type: ignore
+
+# 0.3 Local imports
+from controller import Display
+from modelview import ColumnSchema
+
+
+@dataclasses.dataclass(frozen=True)
+class Projection:
+    """A view's projection: its stringified rows at a data stamp.
+    
+    :property: headers: tuple[str, ...]: The view's columns, in order.
+    :property: stamp: int: The data stamp of the view's columns.
+    :property: rows: tuple[tuple[str, ...], ...]: The rows, ready to render.
+    :property: widths: tuple[int, ...]: The columns' fitted widths, if any.
+    """
+    headers: tuple[str, ...]
+    stamp: int
+    rows: tuple[tuple[str, ...], ...]
+    widths: tuple[int, ...] = ()
+
+
+class ViewCache:
+    """View Cache: The app data's views, projected and stringified once.
+    
+    A view is keyed by its headers, e.g. Head.CriteriaView, and the width
+    it is fitted to, if any, and holds the data stamp of its columns only.
+    Switching between cached views does no pandas work: the rows are
+    handed to the table as they are.
+    
+    :property: views: dict[tuple, Projection]: Per view, and width.
+    :property: hits: int: Views served from the cache.
+    :property: misses: int: Views projected from the data.
+    """
+    
+    views: dict[tuple, Projection]
+    hits: int
+    misses: int
+    
+    def __init__(self) -> None:
+        """Starts empty: views are projected on first use."""
+        self.views = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        """The number of views cached."""
+        return len(self.views)
+    
+    def view(self,
+             frame: pd.DataFrame,
+             headers: list[str],
+             stamp: Callable[[list[str]], int],
+             width: int | None = None) -> Projection:
+        """Get a view's projection: cached, unless its columns changed.
+        
+        :param frame: pd.DataFrame: The app data.
+        :param headers: list[str]: The view's columns.
+        :param stamp: Callable: The data stamp of columns,
+               e.g. DataController.stamp
+        :param width: int | None: Fit the columns to the console's width,
+               by Display.fit. None: as is, by Display.project.
+        :return: Projection: The view's rows, ready to render.
+        """
+        columns: tuple[str, ...] = tuple(headers)
+        key: tuple = (columns, width)
+        current: int = stamp(list(columns))
+        cached: Projection | None = self.views.get(key)
+        if cached is not None and cached.stamp == current:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        widths: list[int] = []
+        if width is None:
+            rows = Display.project(dataframe=frame, headers=list(columns))
+        else:
+            rows, widths = Display.fit(dataframe=frame,
+                                       headers=list(columns),
+                                       width=width)
+        projection = Projection(
+            headers=columns,
+            stamp=current,
+            rows=tuple(tuple(row) for row in rows),
+            widths=tuple(widths))
+        self.views[key] = projection
+        return projection
+    
+    def clear(self) -> None:
+        """Drops all the views."""
+        self.views.clear()
+
+
+class StatsCube:
+    """Stats Cube: Counts of records by their categorical columns.
+    
+    Each column is factorised once into integer codes. The codes combine
+    into one cell number per row, and np.bincount counts all the rows into
+    a tensor, shape: (Progress, DoD, Performance, CriteriaGroup) labels.
+    A column's totals, and a cross tab of two columns, sum out the others.
+    An edit moves one record between cells: patch() decrements its old
+    cell, increments its new one, with no recount.
+    
+    :property: DIMENSIONS: list[str]: The counted columns, in tensor order.
+    :property: TOTAL: str: The cross tabs' totals label: starred, when a
+               category is spelt the same.
+    :property: stamp: int: The data stamp the counts are current at.
+    :property: labels: list[list[str]]: Per dimension, the label per code.
+    :property: codes: np.ndarray: The codes per row, shape: (rows, dims).
+    :property: counts: np.ndarray: The count tensor.
+    """
+    
+    DIMENSIONS: list[str] = [ColumnSchema.Progress, ColumnSchema.DoD,
+                             ColumnSchema.Performance, ColumnSchema.Group]
+    TOTAL: str = 'Total'
+    stamp: int
+    labels: list[list[str]]
+    codes: np.ndarray
+    counts: np.ndarray
+    
+    def __init__(self, frame: pd.DataFrame, stamp: int = 0) -> None:
+        """Counts the frame's rows, by their categorical codes.
+        
+        :param frame: pd.DataFrame: The dataset to count.
+        :param stamp: int: The data stamp of the counted columns.
+        """
+        self.stamp = stamp
+        self.labels = []
+        codes: list[np.ndarray] = []
+        for column in self.DIMENSIONS:
+            values: pd.Series = frame[column] if column in frame.columns \
+                else pd.Series([''] * len(frame))
+            coded, uniques = pd.factorize(self.fold(values), sort=True)
+            codes.append(coded)
+            self.labels.append(uniques.tolist())
+        self.codes = np.stack(codes, axis=1) if codes \
+            else np.zeros((len(frame), 0), dtype=np.intp)
+        shape: tuple[int, ...] = self.shape
+        cells: np.ndarray = np.ravel_multi_index(self.codes.T, shape) \
+            if len(frame) else np.zeros(0, dtype=np.intp)
+        self.counts = np.bincount(cells, minlength=int(np.prod(shape))) \
+            .reshape(shape)
+    
+    def __len__(self) -> int:
+        """The number of records counted."""
+        return int(self.counts.sum())
+    
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """The tensor's shape: the labels per dimension, at least one."""
+        return tuple(max(len(labels), 1) for labels in self.labels)
+    
+    @staticmethod
+    def fold(values: pd.Series) -> pd.Series:
+        """Folds the values to labels: stripped strings, blanks as '-'.
+        
+        :param values: pd.Series: A categorical column.
+        :return: pd.Series: The labels.
+        """
+        labels: pd.Series = values.fillna('').astype(str).str.strip()
+        return labels.mask(labels == '', '-')
+    
+    def code(self, axis: int, value: object) -> int:
+        """The code of a dimension's value: a new label grows the tensor.
+        
+        :param axis: int: The dimension.
+        :param value: object: The record's value.
+        :return: int: The label's code.
+        """
+        label: str = self.fold(pd.Series([value])).iloc[0]
+        labels: list[str] = self.labels[axis]
+        if label in labels:
+            return labels.index(label)
+        labels.append(label)
+        if len(labels) > self.counts.shape[axis]:
+            padding = [(0, 0)] * self.counts.ndim
+            padding[axis] = (0, 1)
+            self.counts = np.pad(self.counts, padding)
+        return len(labels) - 1
+    
+    def patch(self, offset: int, values: dict, stamp: int) -> None:
+        """Moves an edited record to its new cell: -1 old, +1 new.
+        
+        :param offset: int: The record's row offset.
+        :param values: dict: The record's new values, by column.
+        :param stamp: int: The data stamp, after the edit.
+        :return: None
+        """
+        old: tuple[int, ...] = tuple(self.codes[offset])
+        new: list[int] = list(old)
+        for axis, column in enumerate(self.DIMENSIONS):
+            if column in values:
+                new[axis] = self.code(axis=axis, value=values[column])
+        self.counts[old] -= 1
+        self.counts[tuple(new)] += 1
+        self.codes[offset] = new
+        self.stamp = stamp
+    
+    def totals(self, column: str) -> pd.DataFrame:
+        """The records per label of a column, most first.
+        
+        :param column: str: One of the DIMENSIONS.
+        :return: pd.DataFrame: Columns: the column's name, Records.
+        """
+        axis: int = self.DIMENSIONS.index(column)
+        others: tuple[int, ...] = tuple(other
+                                        for other in range(self.counts.ndim)
+                                        if other != axis)
+        counted: np.ndarray = self.counts.sum(axis=others)
+        totals = pd.DataFrame({column: self.labels[axis],
+                               'Records': counted[:len(self.labels[axis])]})
+        totals = totals[totals['Records'] > 0]
+        return totals.sort_values(by=['Records', column],
+                                  ascending=[False, True],
+                                  ignore_index=True)
+    
+    def totalled(self, taken: Iterable[str]) -> str:
+        """The totals' label: TOTAL, starred until no category is it.
+        
+        :param taken: Iterable[str]: The categories of the cross tab.
+        :return: str: e.g. 'Total', or 'Total*' by a category 'Total'.
+        """
+        taken = set(taken)
+        total: str = self.TOTAL
+        while total in taken:
+            total = f'{total}*'
+        return total
+    
+    def crosstab(self, rows: str, columns: str) -> pd.DataFrame:
+        """The records per label pair of two columns, with totals.
+        
+        :param rows: str: The row labels' column, one of the DIMENSIONS.
+        :param columns: str: The column labels' column.
+        :return: pd.DataFrame: One row per label of rows, a Total column,
+                 a Total row, and only the labels with records.
+        """
+        first: int = self.DIMENSIONS.index(rows)
+        second: int = self.DIMENSIONS.index(columns)
+        others: tuple[int, ...] = tuple(
+            other for other in range(self.counts.ndim)
+            if other not in (first, second))
+        counted: np.ndarray = self.counts.sum(axis=others)
+        if first > second:
+            counted = counted.T
+        counted = counted[:len(self.labels[first]), :len(self.labels[second])]
+        table = pd.DataFrame(counted,
+                             index=pd.Index(self.labels[first], name=rows),
+                             columns=self.labels[second])
+        table = table.loc[table.sum(axis=1) > 0, table.sum(axis=0) > 0]
+        table = table.sort_index().sort_index(axis=1)
+        total: str = self.totalled(taken=[*table.index, *table.columns])
+        table[total] = table.sum(axis=1)
+        table.loc[total] = table.sum(axis=0)
+        return table.reset_index().rename(
+            columns={rows: f'{rows} x {columns}'})
+
+
+class RenderCache:
+    """Render Cache: Least recently used, rendered, outputs.
+    
+    The key holds all that the output depends on, e.g.
+    ('record', Position, mode, data revision, console width). A hit moves
+    the output to most recent, a miss renders, stores, and evicts the
+    least recent past the size. Thread safe: pages prefetch in background.
+    
+    :property: size: int: The most outputs kept.
+    :property: outputs: OrderedDict[Hashable, str]: Least recent first.
+    :property: hits: int: Outputs served from the cache.
+    :property: misses: int: Outputs rendered.
+    :property: lock: threading.Lock: Guards the outputs.
+    """
+    
+    size: int
+    outputs: OrderedDict
+    hits: int
+    misses: int
+    lock: threading.Lock
+    
+    def __init__(self, size: int) -> None:
+        """Starts empty.
+        
+        :param size: int: The most outputs kept.
+        """
+        self.size = max(size, 1)
+        self.outputs = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        """The number of outputs kept."""
+        return len(self.outputs)
+    
+    def rendered(self, key: Hashable, render: Callable[[], str]) -> str:
+        """Get the rendered output: cached, else rendered and kept.
+        
+        :param key: Hashable: All the output depends on.
+        :param render: Callable[[], str]: Renders the output, on a miss.
+        :return: str: The output, text with ANSI styles.
+        """
+        with self.lock:
+            output: str | None = self.outputs.get(key)
+            if output is not None:
+                self.outputs.move_to_end(key)
+                self.hits += 1
+                return output
+        output = render()
+        with self.lock:
+            self.misses += 1
+            self.outputs[key] = output
+            self.outputs.move_to_end(key)
+            while len(self.outputs) > self.size:
+                self.outputs.popitem(last=False)
+        return output
+    
+    def clear(self) -> None:
+        """Drops all the outputs."""
+        with self.lock:
+            self.outputs.clear()
+
+# End of Caches Module
@@ -5,8 +5,19 @@
 
 Usage:
 -------------------------
-- GoogleConnector: Connects to a Google Sheet.
+- GoogleConnector: Connects to a Google Sheet: or to the API stand-in.
 - ConnectExceptions: Static Class for Exception Objects.
+- StandInSession: Sends gspread's requests to the API stand-in.
+- RateLimiter: The client side quotas: a read, and a write, token bucket,
+               shared by every request. Queues requests under pressure,
+               coalesces identical reads, backs off, with jitter, on 429s.
+               run quota: the usage; run quota --reads 60 --writes 60.
+               Per process: with the data server, its one connection
+               sends every session's requests, within one quota. Else,
+               each session has its own buckets: PYCRITERIA_SESSIONS,
+               the sessions sharing the user's quota, divides them.
+- LocalConnector: Opens the offline backend: a CSV file, no Google access.
+- LocalWorksheet: The worksheet calls the app makes, over the CSV's cells.
 
 Linting:
 -------------------------
@@ -34,29 +45,52 @@ LO6.1.1 Implement the use of external Python libraries
       where appropriate to provide the functionality that the project requires.
 
 Standard Libraries
-:imports: dataclasses, typing
+:imports: collections, copy, csv, dataclasses, http, os, pathlib, random,
+          threading, time, typing
 
 3rd Party Imports
 :imports: gspread, google.oauth2.service_account.Credentials
+:imports: requests, requests.adapters.HTTPAdapter
 
 Custom Authored Libraries
 :imports: exceptions.ManagingExceptions, settings.Settings
+:imports: telemetry.Tracer, telemetry.tracer
 
 :class: ConnectionExceptions: Static Class for Exception Objects.
 :class: GoogleConnector: Connects to a Google Sheet.
+:class: StandInSession: A session: Google's API URLs, to the stand-in's.
+:class: TokenBucket: A per minute quota: refilled continuously.
+:class: RateLimiter: The read, write, quotas: queues, coalesces, backs off.
+:class: LimitedAdapter: Sends a session's requests through the limiter.
+:var: limiter: RateLimiter: The app's limiter: this process' share.
+:class: LocalSpreadsheet: The local worksheet's spreadsheet: values_get.
+:class: LocalWorksheet: An offline worksheet: a CSV file's cells.
+:class: LocalConnector: Selects, and opens, the offline backend.
 """
 
 # 0.1 Core Imports
+import collections
+import copy
+import csv
 import dataclasses
-from typing import Tuple
+import os
+import pathlib
+import random
+import threading
+import time
+from http import HTTPStatus
+from typing import Any, Callable, Tuple
 
 # 0.2 Core Modules
 import gspread  # type: ignore
+import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
 from google.oauth2.service_account import Credentials  # type: ignore
 
 # 0.3 Project
 from exceptions import ManagingExceptions as Graceful
 from settings import Settings
+from telemetry import Tracer, tracer
 
 
 # pylint: disable=C0103
@@ -81,6 +115,458 @@ class ConnectExceptions:
         gspread.exceptions.SpreadsheetNotFound  # pylint: disable=C0103
 
 
+class StandInSession(requests.Session):
+    """A session to the API stand-in: Google's API URLs, to the stand-in's.
+    
+    gspread's real code paths run: only the origin of each URL changes.
+    
+    :property: ORIGINS: tuple[str, ...]: The Sheets, and Drive, origins.
+    :property: url: str: The stand-in's base URL.
+    """
+    
+    ORIGINS: tuple[str, ...] = ('https://sheets.googleapis.com',
+                                'https://www.googleapis.com')
+    
+    def __init__(self, url: str) -> None:
+        """A session to the stand-in at the URL.
+        
+        :param url: str: e.g. http://127.0.0.1:8765
+        """
+        super().__init__()
+        self.url = url.rstrip('/')
+    
+    def request(self, method: str, url: str,  # type: ignore[override]
+                *args: Any, **kwargs: Any) -> requests.Response:
+        """Sends the request to the stand-in: if it is to Google's APIs.
+        
+        :param method: str: e.g. get
+        :param url: str: The Google API's URL
+        :return: requests.Response
+        """
+        for origin in self.ORIGINS:
+            if url.startswith(origin):
+                url = self.url + url[len(origin):]
+                break
+        return super().request(method, url, *args, **kwargs)
+
+
+class TokenBucket:
+    """A token bucket: a per minute quota, refilled continuously.
+    
+    Full, it allows a minute's burst: then a request per 60/quota seconds.
+    
+    :property: quota: int: Requests per minute: 0 is unlimited.
+    :property: tokens: float: The requests allowed now.
+    :property: updated: float: When the tokens were last refilled.
+    :property: lock: threading.Lock: Guards the tokens.
+    """
+    
+    quota: int
+    tokens: float
+    updated: float
+    lock: threading.Lock
+    
+    def __init__(self, quota: int) -> None:
+        """Starts full.
+        
+        :param quota: int: Requests per minute: 0 is unlimited
+        """
+        self.quota = quota
+        self.tokens = float(quota)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def refill(self) -> float:
+        """Refills the tokens, at quota per minute: up to the quota.
+        
+        :return: float: The tokens now
+        """
+        now: float = time.monotonic()
+        self.tokens = min(float(self.quota), self.tokens +
+                          (now - self.updated) * self.quota / 60)
+        self.updated = now
+        return self.tokens
+    
+    def available(self) -> bool:
+        """Checks if a request is allowed now: without taking it.
+        
+        :return: bool: True: unlimited, or a token is left
+        """
+        if not self.quota:
+            return True
+        with self.lock:
+            return self.refill() >= 1
+    
+    def acquire(self) -> float:
+        """Takes a token: waits, queued, until one is refilled.
+        
+        :return: float: The seconds waited
+        """
+        waited: float = 0.0
+        while self.quota:
+            with self.lock:
+                if self.refill() >= 1:
+                    self.tokens -= 1
+                    break
+                wait: float = (1 - self.tokens) * 60 / self.quota
+            time.sleep(wait)
+            waited += wait
+        return waited
+    
+    def drain(self) -> None:
+        """Empties the bucket: the remote's quota is spent, on a 429.
+        
+        :return: None
+        """
+        with self.lock:
+            self.refill()
+            self.tokens = min(self.tokens, 0.0)
+    
+    def resize(self, quota: int) -> None:
+        """Changes the quota: the tokens kept, up to it: full, if unlimited.
+        
+        :param quota: int: Requests per minute: 0 is unlimited
+        :return: None
+        """
+        with self.lock:
+            self.refill()
+            self.tokens = min(self.tokens if self.quota else float(quota),
+                              float(quota))
+            self.quota = quota
+
+
+class RateLimiter:
+    """RateLimiter: Shared read and write quotas for the API's requests.
+    
+    Google's Sheets API has per minute read, and write, quotas: every
+    command sends several requests. Each request takes a token from its
+    bucket: queued, if none is left. Reads are coalesced: an identical
+    read in flight is shared; under pressure, a recent one is reused,
+    until a write. A 429 empties the bucket, then the request is retried
+    after an exponential backoff, with jitter, or the Retry-After header.
+    
+    The buckets are this process': see configured, for the sessions
+    sharing the user's quota.
+    
+    :property: READ: str: GETs, and batchGet's POSTs.
+    :property: WRITE: str: The rest: updates, appends, clears.
+    :property: WINDOW: float: The usage shown: the last minute's.
+    :property: READS: tuple[str, ...]: The POSTs that are reads.
+    :property: buckets: dict[str, TokenBucket]: The read, write, buckets.
+    :property: sent: dict[str, collections.deque]: When each was sent.
+    :property: counts: collections.Counter: Per kind: requests, queued,
+               coalesced, throttled, retried, failed.
+    :property: waited: collections.Counter: Per kind: seconds queued.
+    :property: retries: int: The retries on a 429: then it fails.
+    :property: backoff: float: The first retry's delay, in seconds.
+    :property: cap: float: The longest delay, in seconds.
+    :property: coalesce: float: Seconds a read is reused, under pressure.
+    :property: inflight: dict[tuple, threading.Event]: Reads being sent.
+    :property: recent: dict[tuple, tuple[float, requests.Response]]:
+               The reads sent: when, and their responses.
+    :property: chance: random.Random: The backoffs' jitter.
+    :property: lock: threading.Lock: Guards the counts and reads.
+    """
+    
+    READ: str = 'read'
+    WRITE: str = 'write'
+    WINDOW: float = 60.0
+    READS: tuple[str, ...] = (':batchGet', ':batchGetByDataFilter',
+                              ':getByDataFilter')
+    
+    buckets: dict[str, TokenBucket]
+    sent: dict[str, collections.deque]
+    counts: collections.Counter
+    waited: collections.Counter
+    retries: int
+    backoff: float
+    cap: float
+    coalesce: float
+    inflight: dict[tuple, threading.Event]
+    recent: dict[tuple, tuple[float, requests.Response]]
+    chance: random.Random
+    lock: threading.Lock
+    
+    def __init__(self, reads: int, writes: int, retries: int,
+                 backoff: float, cap: float, coalesce: float) -> None:
+        """Starts with full buckets: nothing sent.
+        
+        :param reads: int: Read requests per minute: 0 is unlimited
+        :param writes: int: Write requests per minute: 0 is unlimited
+        :param retries: int: The retries on a 429
+        :param backoff: float: The first retry's delay, in seconds
+        :param cap: float: The longest delay, in seconds
+        :param coalesce: float: Seconds a read is reused, under pressure
+        """
+        self.buckets = {self.READ: TokenBucket(quota=reads),
+                        self.WRITE: TokenBucket(quota=writes)}
+        self.sent = {self.READ: collections.deque(),
+                     self.WRITE: collections.deque()}
+        self.counts = collections.Counter()
+        self.waited = collections.Counter()
+        self.retries = retries
+        self.backoff = backoff
+        self.cap = cap
+        self.coalesce = coalesce
+        self.inflight = {}
+        self.recent = {}
+        self.chance = random.Random()
+        self.lock = threading.Lock()
+    
+    @classmethod
+    def configured(cls) -> 'RateLimiter':
+        """The app's limiter: Settings.Quota's, per session sharing it.
+        
+        PYCRITERIA_SESSIONS: the sessions, each a process, sharing the
+        user's quota: each session's quota is its share, at least one.
+        Unset, or invalid: one session, the whole quota.
+        
+        :return: RateLimiter: The quotas, per minute, this process'
+        """
+        try:
+            sessions: int = max(int(os.environ.get(
+                Settings.Quota.SESSIONS, '') or 1), 1)
+        except ValueError:
+            sessions = 1
+        
+        def share(quota: int) -> int:
+            """A session's share of a quota: 0, unlimited, stays so."""
+            return max(quota // sessions, 1) if quota else 0
+        
+        return cls(reads=share(Settings.Quota.READS),
+                   writes=share(Settings.Quota.WRITES),
+                   retries=Settings.Quota.RETRIES,
+                   backoff=Settings.Quota.BACKOFF,
+                   cap=Settings.Quota.CAP,
+                   coalesce=Settings.Quota.COALESCE)
+    
+    def mount(self, session: requests.Session) -> bool:
+        """Limits the session's requests: its adapter, for both schemes.
+        
+        :param session: requests.Session: e.g. gspread's HTTPClient's
+        :return: bool: True if mounted, or already mounted
+        """
+        if isinstance(session.get_adapter('https://'), LimitedAdapter):
+            return True
+        adapter: LimitedAdapter = LimitedAdapter(limiter=self)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return True
+    
+    def kind(self, request: requests.PreparedRequest) -> str:
+        """The request's quota: read, or write.
+        
+        :param request: requests.PreparedRequest: The request to send
+        :return: str: READ, or WRITE
+        """
+        if request.method in ('GET', 'HEAD'):
+            return self.READ
+        path: str = (request.path_url or '').split('?', 1)[0]
+        return self.READ if path.endswith(self.READS) else self.WRITE
+    
+    def send(self, send: Callable[..., requests.Response],
+             request: requests.PreparedRequest,
+             **kwargs: Any) -> requests.Response:
+        """Sends a request: queued for its quota, coalesced, if a read.
+        
+        :param send: Callable: The adapter's send
+        :param request: requests.PreparedRequest: The request to send
+        :return: requests.Response: The response: maybe a shared read's
+        """
+        kind: str = self.kind(request=request)
+        if kind == self.WRITE:
+            with self.lock:
+                self.recent.clear()
+            return self.attempt(send, request, kind, **kwargs)
+        key: tuple = (request.method, request.url, request.body)
+        with self.lock:
+            reused: tuple[float, requests.Response] | None = \
+                self.recent.get(key)
+            pending: threading.Event | None = self.inflight.get(key)
+            if pending is None:
+                self.inflight[key] = threading.Event()
+        if reused is not None and \
+                time.monotonic() - reused[0] <= self.coalesce and \
+                not self.buckets[kind].available():
+            if pending is None:
+                self.release(key=key, response=None)
+            self.count(kind=kind, name='coalesced')
+            return copy.copy(reused[1])
+        if pending is not None:
+            pending.wait()
+            with self.lock:
+                shared: tuple[float, requests.Response] | None = \
+                    self.recent.get(key)
+            if shared is not None:
+                self.count(kind=kind, name='coalesced')
+                return copy.copy(shared[1])
+            return self.send(send, request, **kwargs)
+        response: requests.Response | None = None
+        try:
+            response = self.attempt(send, request, kind, **kwargs)
+            return response
+        finally:
+            self.release(key=key, response=response)
+    
+    def release(self, key: tuple,
+                response: requests.Response | None) -> None:
+        """Ends a read in flight: kept, if ok, for the reads waiting on it.
+        
+        Its body is read now: the reads sharing it get copies, not its
+        stream.
+        
+        :param key: tuple: The read: method, URL, body
+        :param response: requests.Response | None: None: it failed
+        :return: None
+        """
+        shared: bool = response is not None and response.ok
+        if shared:
+            try:
+                _ = response.content
+            except requests.RequestException:
+                shared = False
+        with self.lock:
+            if shared:
+                self.recent[key] = (time.monotonic(), response)
+            event: threading.Event | None = self.inflight.pop(key, None)
+        if event is not None:
+            event.set()
+    
+    def attempt(self, send: Callable[..., requests.Response],
+                request: requests.PreparedRequest, kind: str,
+                **kwargs: Any) -> requests.Response:
+        """Sends a request, once a token is taken: retried on a 429.
+        
+        :param send: Callable: The adapter's send
+        :param request: requests.PreparedRequest: The request to send
+        :param kind: str: READ, or WRITE
+        :return: requests.Response: The response: the last, if throttled
+        """
+        bucket: TokenBucket = self.buckets[kind]
+        for retry in range(self.retries + 1):
+            waited: float = bucket.acquire()
+            with self.lock:
+                self.counts[(kind, 'requests')] += 1
+                self.counts[(kind, 'queued')] += int(waited > 0)
+                self.waited[kind] += waited
+                self.sent[kind].append(time.monotonic())
+            response: requests.Response = send(request, **kwargs)
+            if response.status_code != HTTPStatus.TOO_MANY_REQUESTS:
+                return response
+            self.count(kind=kind, name='throttled')
+            bucket.drain()
+            if retry == self.retries:
+                break
+            self.count(kind=kind, name='retried')
+            delay: float = self.delay(retry=retry, response=response)
+            response.close()
+            time.sleep(delay)
+        self.count(kind=kind, name='failed')
+        return response
+    
+    def delay(self, retry: int, response: requests.Response) -> float:
+        """A retry's delay: the Retry-After header, else a backoff.
+        
+        Exponential, capped, with jitter: half fixed, half random, so the
+        clients throttled together do not retry together.
+        
+        :param retry: int: The retry, from 0
+        :param response: requests.Response: The 429
+        :return: float: Seconds
+        """
+        after: str = response.headers.get('Retry-After', '')
+        if after.isdigit():
+            return min(float(after), self.cap)
+        ceiling: float = min(self.cap, self.backoff * 2 ** retry)
+        return ceiling / 2 + self.chance.uniform(0, ceiling / 2)
+    
+    def count(self, kind: str, name: str) -> None:
+        """Counts an event of the kind's requests.
+        
+        :param kind: str: READ, or WRITE
+        :param name: str: e.g. throttled
+        :return: None
+        """
+        with self.lock:
+            self.counts[(kind, name)] += 1
+    
+    def resize(self, reads: int | None = None,
+               writes: int | None = None) -> None:
+        """Changes the quotas: per minute: 0 is unlimited.
+        
+        :param reads: int | None: Read requests: None: unchanged
+        :param writes: int | None: Write requests: None: unchanged
+        :return: None
+        """
+        if reads is not None:
+            self.buckets[self.READ].resize(quota=reads)
+        if writes is not None:
+            self.buckets[self.WRITE].resize(quota=writes)
+    
+    def usage(self) -> list[dict[str, Any]]:
+        """The quotas' usage: the last minute's, and the session's.
+        
+        :return: list[dict[str, Any]]: A row per kind: read, write
+        """
+        now: float = time.monotonic()
+        rows: list[dict[str, Any]] = []
+        with self.lock:
+            for kind, bucket in self.buckets.items():
+                sent: collections.deque = self.sent[kind]
+                while sent and now - sent[0] > self.WINDOW:
+                    sent.popleft()
+                with bucket.lock:
+                    tokens: float = bucket.refill()
+                rows.append({
+                    'Quota': kind,
+                    'Per Minute': bucket.quota or 'unlimited',
+                    'Last Minute': len(sent),
+                    'Left': int(tokens) if bucket.quota else '-',
+                    'Requests': self.counts[(kind, 'requests')],
+                    'Queued': self.counts[(kind, 'queued')],
+                    'Waited s': round(float(self.waited[kind]), 2),
+                    'Coalesced': self.counts[(kind, 'coalesced')],
+                    '429s': self.counts[(kind, 'throttled')],
+                    'Retried': self.counts[(kind, 'retried')],
+                    'Failed': self.counts[(kind, 'failed')]})
+        return rows
+
+
+class LimitedAdapter(HTTPAdapter):
+    """An adapter: sends each request through the shared rate limiter.
+    
+    Mounted on gspread's session: the client's own retries, and hooks,
+    are unchanged: a coalesced read's response is shared.
+    
+    :property: limiter: RateLimiter: The quotas.
+    """
+    
+    limiter: RateLimiter
+    
+    def __init__(self, limiter: RateLimiter) -> None:
+        """An adapter, limited by the limiter.
+        
+        :param limiter: RateLimiter: The shared quotas
+        """
+        super().__init__()
+        self.limiter = limiter
+    
+    def send(self, request: requests.PreparedRequest,  # type: ignore
+             *args: Any, **kwargs: Any) -> requests.Response:
+        """Sends the request: queued, coalesced, retried, by the limiter.
+        
+        :param request: requests.PreparedRequest: The request to send
+        :return: requests.Response
+        """
+        return self.limiter.send(
+            lambda prepared, **options: super(LimitedAdapter, self).send(
+                prepared, *args, **options),
+            request, **kwargs)
+
+
+limiter: RateLimiter = RateLimiter.configured()
+
+
 # noinspection Style,Annotator
 class GoogleConnector:
     # noinspection Style
@@ -89,6 +575,8 @@ class GoogleConnector:
     Method
     ----------
         :Method: connect_to_remote: @staticmethod
+        :Method: isstandin: @staticmethod
+        :Method: connect_to_standin: @staticmethod
         :Method: get_source: @staticmethod
         :Method: open_sheet: @staticmethod
         :Method: fetch_data: @staticmethod
@@ -97,6 +585,7 @@ class GoogleConnector:
     
     # noinspection SpellCheckingInspection
     @staticmethod
+    @tracer.traced(category=Tracer.GOOGLE)
     def connect_to_remote(credential_file,
                           file_type: str = "json") \
         -> gspread.client.Client:  # noqa: ANN205, ANN001
@@ -149,6 +638,31 @@ class GoogleConnector:
         return _creds.with_scopes(Settings.SCOPE)
     
     @staticmethod
+    def isstandin() -> bool:
+        """Checks if the backend is the API stand-in: PYCRITERIA_BACKEND.
+        
+        :return: bool: True: Google's APIs are served by the stand-in
+        """
+        return os.environ.get(Settings.Backend.SOURCE,
+                              Settings.Backend.SHEETS).lower() == \
+            Settings.Backend.STANDIN
+    
+    @staticmethod
+    @tracer.traced(category=Tracer.GOOGLE)
+    def connect_to_standin(url: str | None = None) -> gspread.Client:
+        """Connects to the API stand-in: no credentials, no network.
+        
+        :param url: str | None: The stand-in's URL: None: PYCRITERIA_API,
+            else Settings.StandIn.URL
+        :return: gspread.Client: Its session sends to the stand-in
+        """
+        return gspread.authorize(
+            None, session=StandInSession(
+                url=url or os.environ.get(Settings.Backend.API,
+                                          Settings.StandIn.URL)))
+    
+    @staticmethod
+    @tracer.traced(category=Tracer.GOOGLE)
     def get_source(credentials,
                    file_name: str) \
         -> gspread.Spreadsheet:  # noqa: ANN205, ANN001
@@ -156,7 +670,8 @@ class GoogleConnector:
         
         Parameters
         ----------
-            :param credentials: Google sheet scoped credentials
+            :param credentials: Google sheet scoped credentials,
+                or a connected client, e.g. the stand-in's
             :param file_name: Google sheet file name
             :type: str
         Returns
@@ -169,7 +684,11 @@ class GoogleConnector:
         """
         # Authorise current client
         kind: str = "file"
-        _gsheet: gspread.Client = gspread.authorize(credentials)
+        _gsheet: gspread.Client = credentials \
+            if isinstance(credentials, gspread.Client) \
+            else gspread.authorize(credentials)
+        # Every request is limited by the shared read, and write, quotas
+        limiter.mount(session=_gsheet.http_client.session)
         try:
             # Tests if existing sheet is the same aśa the configured filename
             return _gsheet.open(file_name)
@@ -183,6 +702,7 @@ class GoogleConnector:
             return _gsheet.open(newtitle)
     
     @staticmethod
+    @tracer.traced(category=Tracer.GOOGLE)
     def open_sheet(file: gspread.Spreadsheet, tab: str) -> gspread.Worksheet:
         """Opens a given Google spreadsheet's tab by tab name.
         
@@ -268,6 +788,168 @@ class GoogleConnector:
         
         return output
 
+
+
+class LocalSpreadsheet:
+    """The local worksheet's spreadsheet: as gspread_dataframe reads it.
+    
+    :property: worksheet: LocalWorksheet: Its only worksheet.
+    """
+    
+    def __init__(self, worksheet: 'LocalWorksheet') -> None:
+        """The spreadsheet of the worksheet."""
+        self.worksheet = worksheet
+    
+    def values_get(self, _range: str, params: dict | None = None) -> dict:
+        """The worksheet's values, as the Sheets API returns them.
+        
+        :param _range: str: The worksheet's title: it is the whole sheet
+        :param params: dict | None: Render options: unused, all are text
+        :return: dict: {'values': rows of cells}
+        """
+        return {'values': self.worksheet.values}
+
+
+class LocalWorksheet:
+    """LocalWorksheet: An offline worksheet: a CSV file's cells, as text.
+    
+    Only the worksheet calls the app makes, and gspread_dataframe's:
+    reads by get_all_records, get_all_values, values_get; writes by
+    update_cells, resize, insert_row. Writes are saved to the file.
+    
+    :property: path: pathlib.Path: The CSV file.
+    :property: values: list[list[str]]: The cells: the header row first.
+    :property: title: str: The tab's name.
+    :property: id: int: The tab's id.
+    :property: client: None: No remote client.
+    :property: spreadsheet: LocalSpreadsheet: values_get's source.
+    """
+    
+    path: pathlib.Path
+    values: list[list[str]]
+    title: str
+    id: int
+    client: None
+    spreadsheet: LocalSpreadsheet
+    
+    def __init__(self, path: str | pathlib.Path, title: str = '') -> None:
+        """Reads the CSV file's cells.
+        
+        :param path: str | pathlib.Path: The CSV file
+        :param title: str: The tab's name
+        """
+        self.path = pathlib.Path(path)
+        self.title = title or Settings.TAB_NAME
+        self.id = 0
+        self.client = None
+        self.spreadsheet = LocalSpreadsheet(worksheet=self)
+        with open(self.path, newline='', encoding=Settings.ENCODE) as file:
+            self.values = list(csv.reader(file))
+    
+    @property
+    def row_count(self) -> int:
+        """The rows, with the header row."""
+        return len(self.values)
+    
+    @property
+    def col_count(self) -> int:
+        """The columns: of the widest row."""
+        return max((len(row) for row in self.values), default=0)
+    
+    def get_all_values(self) -> list[list[str]]:
+        """The cells, as text: the header row first."""
+        return [list(row) for row in self.values]
+    
+    def get_all_records(self) -> list[dict[str, Any]]:
+        """The rows as records, by header: numbers numericised, as gspread.
+        
+        :return: list[dict[str, Any]]: A record per row, after the header
+        """
+        if not self.values:
+            return []
+        headers: list[str] = self.values[0]
+        return [dict(zip(headers, gspread.utils.numericise_all(row)))
+                for row in self.values[1:]]
+    
+    def resize(self, rows: int | None = None,
+               cols: int | None = None) -> None:
+        """Resizes the cells: pads with, or drops, rows and columns.
+        
+        :param rows: int | None: The rows wanted: None: unchanged
+        :param cols: int | None: The columns wanted: None: unchanged
+        :return: None
+        """
+        if rows is not None:
+            self.values = self.values[:rows] + \
+                [[] for _ in range(rows - len(self.values))]
+        if cols is not None:
+            self.values = [(row + [''] * cols)[:cols] for row in self.values]
+        self.save()
+    
+    def update_cells(self, cell_list: list[gspread.cell.Cell],
+                     value_input_option: str = 'RAW') -> dict:
+        """Updates the cells, then saves the file.
+        
+        :param cell_list: list[Cell]: 1 based rows and columns
+        :param value_input_option: str: Unused: the values are text
+        :return: dict: The updated cells' count, as the Sheets API
+        """
+        for cell in cell_list:
+            while len(self.values) < cell.row:
+                self.values.append([])
+            row: list[str] = self.values[cell.row - 1]
+            row.extend([''] * (cell.col - len(row)))
+            row[cell.col - 1] = '' if cell.value is None else str(cell.value)
+        self.save()
+        return {'updatedCells': len(cell_list)}
+    
+    def insert_row(self, values: list[Any], index: int = 1) -> None:
+        """Inserts a row, before the 1 based row index, then saves.
+        
+        :param values: list[Any]: The row's values
+        :param index: int: The 1 based row to insert before
+        :return: None
+        """
+        self.values.insert(index - 1, ['' if value is None else str(value)
+                                       for value in values])
+        self.save()
+    
+    def save(self) -> None:
+        """Writes the cells to the CSV file: replaced whole, not partly.
+        
+        :return: None
+        """
+        written: pathlib.Path = self.path.with_suffix('.saving')
+        with open(written, 'w', newline='', encoding=Settings.ENCODE) as file:
+            csv.writer(file).writerows(self.values)
+        os.replace(written, self.path)
+
+
+class LocalConnector:
+    """LocalConnector: Selects the backend, and opens the offline one."""
+    
+    @staticmethod
+    def islocal() -> bool:
+        """Checks if the backend is local: PYCRITERIA_BACKEND=local.
+        
+        :return: bool: True: the data is a CSV file, not the remote
+        """
+        return os.environ.get(Settings.Backend.SOURCE,
+                              Settings.Backend.SHEETS).lower() == \
+            Settings.Backend.LOCAL
+    
+    @staticmethod
+    @tracer.traced(category=Tracer.DATA)
+    def open_sheet(path: str | None = None) -> LocalWorksheet:
+        """Opens the local worksheet: PYCRITERIA_DATA, else the dataset.
+        
+        :param path: str | None: The CSV file: None: from the environment
+        :return: LocalWorksheet: The offline worksheet
+        """
+        return LocalWorksheet(
+            path=path or os.environ.get(Settings.Backend.DATA,
+                                        Settings.Backend.DATASET))
+
 # End of Connections for the Terminal App.
 # Ruff Checked, Pep6CI Checked - Some Passing
 # Timestamp: 2022-06-02T19:00, copywrite (c) 2022-2025, Charles J Fowler
@@ -57,6 +57,7 @@ Standard Libraries
         Refactor candidates.
         Evoling design artefact
 :class: Record: Individual Records, and Records Display/Controller/Model:
+:class: Change: A field of an edited record: its old & new values.
 :class: Editor: C(R)UD Operations, and Editor Controller/Model:
 
 Global Variables:,
@@ -69,8 +70,15 @@ Global Variables:,
 """
 
 # 0.1 Standard Library Imports
+import dataclasses
 import datetime
+import errno
+import io
+import math
+import os
+import time
 import typing
+from types import MappingProxyType
 from typing import NoReturn, Literal
 
 #
@@ -86,17 +94,21 @@ from gspread_dataframe import (set_with_dataframe as set_remote,
                                get_as_dataframe as get_gsdf,  # type: ignore
                                )
 from rich import print as rprint, box  # type: ignore
+from rich.color import ANSI_COLOR_NAMES  # type: ignore
 from rich.console import (Console, ConsoleDimensions,
-                          ConsoleOptions, )  # type: ignore
+                          ConsoleOptions, RenderableType, )  # type: ignore
 from rich.layout import Layout  # type: ignore
 from rich.panel import Panel  # type: ignore
 from rich.style import Style  # type: ignore
-from rich.table import Table  # type: ignore
+from rich.table import Column, Row, Table  # type: ignore
 
 #
 # 0.3 Local imports
 import connections
+import dataserver
 import settings
+from indexes import RecordIndex
+from telemetry import Metrics, Tracer, metrics, tracer
 from modelview import ColumnSchema, Headers
 
 #
@@ -113,34 +125,55 @@ class Controller:
 
     Methods:
     -------
-    :method: load_wsheet: Loads the worksheet.
+    :method: load_wsheet: Loads the worksheet: the stand-in's, or local.
     :method: load_data: Loads the worksheet.
     """
     
     @staticmethod
+    @tracer.traced(category=Tracer.DATA)
     def load_wsheet() -> gspread.Worksheet:
         """Loads a worksheet.
 
         :return: gspread.Worksheet:
             The current worksheet to extract the data.
         """
-        # 1.1: Connect to the sheet
-        # -> Move to Instance once the data is loaded
-        # is tested and working on heroku
-        creds: gspread.Client = \
-            connector.connect_to_remote(
-                configuration.CRED_FILE)
-        # 1.2: Read the data from the sheet
-        # -> Move to Instance once the data is
-        # loaded is tested and working on heroku
-        spread: gspread.Spreadsheet = \
-            connector.get_source(creds,
-                                 configuration.SHEET_NAME)
-        # 1.3: Return the data from the sheet
-        # -> Move to Instance once the data is
-        # loaded is tested and working on
-        # heroku
-        return connector.open_sheet(spread, configuration.TAB_NAME)
+        # 1.0: Shared: the data server's dataset: one sheet, every session
+        # A stale socket, no server listening: the backend, as before
+        if dataserver.SharedConnector.isshared():
+            try:
+                with metrics.phase(name=Metrics.FETCH):
+                    return dataserver.SharedConnector.open_sheet()
+            except OSError as error:
+                if error.errno not in (errno.ENOENT, errno.ECONNREFUSED):
+                    raise
+        # 1.0.1: Offline: the local backend, a CSV file: read, as a fetch
+        if connections.LocalConnector.islocal():
+            with metrics.phase(name=Metrics.FETCH):
+                return connections.LocalConnector.open_sheet()
+        with metrics.phase(name=Metrics.AUTH):
+            # 1.1: Connect to the sheet: or to the API stand-in
+            # -> Move to Instance once the data is loaded
+            # is tested and working on heroku
+            creds: gspread.Client = \
+                connector.connect_to_standin() \
+                if connector.isstandin() else \
+                connector.connect_to_remote(
+                    configuration.CRED_FILE)
+            # 1.1.1: Trace the API calls: from the first, opening the sheet
+            tracer.hook(client=getattr(creds, 'http_client', creds))
+            # 1.2: Read the data from the sheet
+            # -> Move to Instance once the data is
+            # loaded is tested and working on heroku
+            spread: gspread.Spreadsheet = \
+                connector.get_source(creds,
+                                     configuration.SHEET_NAME)
+            # 1.4: Count the API calls, and bytes, per command
+            metrics.hook(client=spread.client)
+            # 1.3: Return the data from the sheet
+            # -> Move to Instance once the data is
+            # loaded is tested and working on
+            # heroku
+            return connector.open_sheet(spread, configuration.TAB_NAME)
     
     @staticmethod
     def delete(creds: gspread.Client) -> None:
@@ -169,7 +202,14 @@ class Controller:
 
 
 class DataController:
-    """DataController."""
+    """DataController.
+    
+    :property: revision: int: Bumped on every change to the dataframe.
+    :property: base: int: The revision of the last whole dataframe change.
+    :property: stamps: dict[str, int]: Column to the revision of its last
+               change, since the base. Indexes, caches are keyed by stamps.
+    :property: fetched: float: The monotonic time of the last data fetch.
+    """
     
     # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html
     ###
@@ -177,14 +217,125 @@ class DataController:
     dataframe: pd.DataFrame
     wsheet: gspread.Worksheet
     gsdframe: gspread_dataframe
+    revision: int
+    base: int
+    stamps: dict[str, int]
+    fetched: float
     
     def __init__(self, wsheet: gspread.Worksheet) -> None:
         """Initialies the DataController."""
         # Load the data into a panda dataframe
         self.wsheet = wsheet
-        self.dataframe = pd.DataFrame(wsheet.get_all_records())
-        self.gsdframe = get_gsdf(self.wsheet,
-                                 parse_dates=True, header=1)
+        if isinstance(wsheet, dataserver.SharedWorksheet):
+            # The data server's mapped dataset: parsed once, not copied
+            self.dataframe = wsheet.frame
+            self.gsdframe = wsheet.frame
+        else:
+            self.dataframe = pd.DataFrame(wsheet.get_all_records())
+            self.gsdframe = get_gsdf(self.wsheet,
+                                     parse_dates=True, header=1)
+        self.revision = 0
+        self.base = 0
+        self.stamps = {}
+        self.fetched = time.monotonic()
+    
+    def isfresh(self, ttl: float) -> bool:
+        """Checks if the last fetched data is within its time to live.
+        
+        The data server's dataset is fresh until it notifies a change.
+        
+        :param ttl: float: The seconds to reuse the last fetched data for
+        :return: bool: True if it is reusable, without a fetch
+        """
+        if isinstance(self.wsheet, dataserver.SharedWorksheet):
+            return self.wsheet.server.isfresh()
+        return time.monotonic() - self.fetched < ttl
+    
+    def touch(self, columns: list[str] | None = None) -> None:
+        """Bumps the revision: for the changed columns, or for all.
+        
+        :param columns: list[str] | None: The changed columns, None: all
+        :return: None
+        """
+        self.revision += 1
+        if columns is None:
+            self.base = self.revision
+            self.stamps = {}
+        else:
+            self.stamps.update(dict.fromkeys(columns, self.revision))
+    
+    def stamp(self, columns: list[str]) -> int:
+        """The revision of the last change to any of these columns.
+        
+        :param columns: list[str]: The columns, e.g. a view's headers
+        :return: int: Unchanged stamps mean unchanged columns' data
+        """
+        return max([self.base] + [self.stamps.get(column, self.base)
+                                  for column in columns])
+    
+    @tracer.traced(category=Tracer.DATA)
+    def refresh(self, dataframe: pd.DataFrame | None) -> pd.DataFrame:
+        """Swaps in newly loaded data: only the columns that changed.
+        
+        Same shape and columns: changed columns are replaced in place,
+        and only they are touched. Else the whole dataframe is replaced.
+        
+        :param dataframe: pd.DataFrame | None: The newly loaded data
+        :return: pd.DataFrame: The current dataframe
+        """
+        if dataframe is None or dataframe is self.dataframe:
+            return self.dataframe
+        if dataframe.shape == self.dataframe.shape \
+            and dataframe.columns.equals(self.dataframe.columns) \
+            and dataframe.index.equals(self.dataframe.index):  # noqa # Pep8 E125
+            changed: list[str] = [
+                column for column in dataframe.columns
+                if not dataframe[column].equals(self.dataframe[column])]
+            if changed:
+                self.dataframe[changed] = dataframe[changed]
+                self.touch(columns=changed)
+            return self.dataframe
+        self.dataframe = dataframe
+        self.touch()
+        return self.dataframe
+    
+    @staticmethod
+    def differs(old: typing.Any, new: typing.Any) -> bool:
+        """Checks if a cell's value changed: two missing values are equal.
+        
+        :param old: Any: The cell's value, e.g. NaN for an empty number
+        :param new: Any: The value patched in
+        :return: bool: True if it changed
+        """
+        missing: tuple[bool, bool] = (
+            pd.api.types.is_scalar(old) and bool(pd.isna(old)),
+            pd.api.types.is_scalar(new) and bool(pd.isna(new)))
+        if any(missing):
+            return missing[0] != missing[1]
+        return bool(old != new)
+    
+    @tracer.traced(category=Tracer.DATA)
+    def patch(self, offset: int, values: dict[str, typing.Any]) -> list[str]:
+        """Patches one row's values in place, and touches those columns.
+        
+        :param offset: int: The row's offset, e.g. from the RecordIndex
+        :param values: dict[str, Any]: Column to its new value
+        :return: list[str]: The columns that changed
+        """
+        row: pd.Series = self.dataframe.iloc[offset]
+        changed: list[str] = [
+            column for column, value in values.items()
+            if column in row.index and self.differs(row[column], value)]
+        for column in changed:
+            dataserver.Segment.assign(frame=self.dataframe, offset=offset,
+                                      column=column, value=values[column])
+        if changed:
+            self.touch(columns=changed)
+        if changed and isinstance(self.wsheet, dataserver.SharedWorksheet):
+            self.wsheet.server.patch(
+                offset=offset,
+                values={column: values[column] for column in changed})
+        return changed
     
     # https://www.w3schools.com/python/pandas/pandas_dataframes.asp
     
@@ -197,6 +348,7 @@ class DataController:
     # https://gspread-dataframe.readthedocs.io/en/latest/
     
     @classmethod
+    @tracer.traced(category=Tracer.DATA)
     def load_dataframe_wsheet(cls, wsheet: gspread.Worksheet) \
         -> pd.DataFrame | None:  # noqa ANN102
         """Loads the worksheet into a dataframe.
@@ -204,15 +356,20 @@ class DataController:
         :param wsheet: gspread.Worksheet: The worksheet to load
         :return: pd.DataFrame | None: The dataframe or None
         """
-        if wsheet.get_all_records():
-            dataframe: pd.DataFrame = \
-                pd.DataFrame(wsheet.get_all_records())
+        if isinstance(wsheet, dataserver.SharedWorksheet):
+            return wsheet.frame
+        with metrics.phase(name=Metrics.FETCH):
+            records: list[dict] = wsheet.get_all_records()
+        if records:
+            with metrics.phase(name=Metrics.PARSE):
+                dataframe: pd.DataFrame = pd.DataFrame(records)
             return dataframe
         
         rprint("No data loaded from Google Sheets.")
         return None
     
     @classmethod
+    @tracer.traced(category=Tracer.DATA)
     def send_dataframe_wsheet(cls, dataframe: pd.DataFrame,
                               sheet: gspread.Worksheet) -> None:  # noqa ANN102
         """Sends the dataframe to the worksheet.
@@ -226,8 +383,35 @@ class DataController:
 
 
 class RICHStyler:
-    """Rich Styler for Rich.console Style."""
+    """Rich Styler for Rich.console Style.
+    
+    The styles are parsed once, at import, into immutable registries:
+    the methods look up a Style, not format and parse its definition.
+    
+    :property: SPECS: MappingProxyType[str, str]: Definitions, by name.
+    :property: STYLES: MappingProxyType[str, Style]: Parsed, by name.
+    :property: GREYS: tuple[int, ...]: rich's named grey levels.
+    :property: PANELSPECS: MappingProxyType[int, str]: Panel definitions.
+    :property: PANELS: MappingProxyType[int, Style]: Parsed, by grey level.
+    """
     style = Style()
+    SPECS: MappingProxyType = MappingProxyType({
+        'label': 'bold purple4 on grey93',
+        'property': 'bold purple4 on grey93',
+        'value': 'italic dark_turquoise on black',
+        'modified': 'italic deep_pink3 on black',
+        'heading': 'bold italic underline2 purple4 on grey93',
+        'border': 'bold grey93',
+        })
+    STYLES: MappingProxyType = MappingProxyType(
+        {name: Style.parse(spec) for name, spec in SPECS.items()})
+    GREYS: tuple[int, ...] = tuple(sorted(
+        {int(name[4:]) for name in ANSI_COLOR_NAMES
+         if name.startswith('grey')}))
+    PANELSPECS: MappingProxyType = MappingProxyType(
+        {grey: f'bold white on grey{grey}' for grey in GREYS})
+    PANELS: MappingProxyType = MappingProxyType(
+        {grey: Style.parse(spec) for grey, spec in PANELSPECS.items()})
     
     def __init__(self) -> None:
         """Initialises the TUI Styler."""
@@ -237,15 +421,15 @@ class RICHStyler:
     def panel(grey: int, tostring: bool = True) -> Style | str:
         """Returns the Style for the property.
         
-        :param grey: int: The grey level
+        :param grey: int: The grey level: a named one is pre-parsed
           https://rich.readthedocs.io/en/stable/appendix/colors.html
         :param tostring: bool: Whether to return a string or Style
         """
-        emp: str = "bold"
-        co: str = "white"
-        bg: str = f"grey{grey}"
-        styled: str = f'{emp} {co} on {bg}'
-        return styled if tostring else RICHStyler.style.parse(styled)
+        styled: str | None = RICHStyler.PANELSPECS.get(grey)
+        if styled is None:
+            styled = f'bold white on grey{grey}'
+            return styled if tostring else RICHStyler.style.parse(styled)
+        return styled if tostring else RICHStyler.PANELS[grey]
     
     @staticmethod
     def label() -> Style:
@@ -253,11 +437,7 @@ class RICHStyler:
         
         :return: Style: The style
         """
-        emp: str = "bold"
-        co: str = "purple4"
-        bg: str = "grey93"
-        styled: str = f'{emp} {co} on {bg}'
-        return RICHStyler.style.parse(styled)
+        return RICHStyler.STYLES['label']
     
     @staticmethod
     def property() -> Style:
@@ -265,11 +445,7 @@ class RICHStyler:
         
         :return: Style: The style
         """
-        emp: str = "bold"
-        co: str = "purple4"
-        bg: str = "grey93"
-        styled: str = f'{emp} {co} on {bg}'
-        return RICHStyler.style.parse(styled)
+        return RICHStyler.STYLES['property']
     
     @staticmethod
     def value() -> Style:
@@ -277,11 +453,7 @@ class RICHStyler:
         
         :return: Style: The style
         """
-        emp: str = "italic"
-        co: str = "dark_turquoise"
-        bg: str = "black"
-        styled: str = f'{emp} {co} on {bg}'
-        return RICHStyler.style.parse(styled)
+        return RICHStyler.STYLES['value']
     
     @staticmethod
     def modified() -> Style:
@@ -289,11 +461,7 @@ class RICHStyler:
         
         :return: Style: The style
         """
-        emp: str = "italic"
-        co: str = "deep_pink3"
-        bg: str = "black"
-        styled: str = f'{emp} {co} on {bg}'
-        return RICHStyler.style.parse(styled)
+        return RICHStyler.STYLES['modified']
     
     @staticmethod
     def heading() -> Style:
@@ -301,11 +469,7 @@ class RICHStyler:
         
         :return: Style: The style
         """
-        emp: str = "bold italic underline2"
-        co: str = "purple4"
-        bg: str = "grey93"
-        styled: str = f'{emp} {co} on {bg}'
-        return RICHStyler.style.parse(styled)
+        return RICHStyler.STYLES['heading']
     
     @staticmethod
     def border(stylestr: bool = True) -> Style | str:
@@ -314,10 +478,8 @@ class RICHStyler:
         :param stylestr: bool: Whether to return a string or Style
         :return: Style | str: The style or style string
         """
-        emp: str = "bold"
-        bg: str = "grey93"
-        styled: str = f'{emp} {bg}'
-        return styled if stylestr else RICHStyler.style.parse(styled)
+        return RICHStyler.SPECS['border'] if stylestr \
+            else RICHStyler.STYLES['border']
 
 
 styld = RICHStyler
@@ -381,6 +543,24 @@ class WebConsole:
                                     markup=_on)
         return _console
     
+    def render(self, renderable: RenderableType) -> str:
+        """Renders to text, with ANSI styles, as the console would print it.
+        
+        A private console, same width and colours, per call: safe to call
+        from a background thread, while the app console is printing.
+        
+        :param renderable: RenderableType: e.g. a Table, Panel
+        :return: str: The rendered text, ready to write to the terminal
+        """
+        printer: Console = Console(file=io.StringIO(),
+                                   width=self.console.width,
+                                   color_system=self.console.color_system,
+                                   force_terminal=self.console.is_terminal,
+                                   soft_wrap=self.console.soft_wrap,
+                                   tab_size=self.console.tab_size)
+        printer.print(renderable)
+        return printer.file.getvalue()
+    
     @staticmethod  #
     def page_data(dataset: list[str]) -> None | NoReturn:
         """Displays the data.
@@ -392,11 +572,15 @@ class WebConsole:
             rprint(dataset)
     
     @staticmethod
-    def configure_table(headers: typing.Optional[list[str]]) \
+    def configure_table(headers: typing.Optional[list[str]],
+                        widths: typing.Sequence[int] = ()) \
         -> rich.table.Table:  # noqa # Pep8 E125
         """Configures Rich Console table.
         
         :param headers: list[str]: The headers for the table.
+        :param widths: Sequence[int]: Fixed column widths, e.g. from
+               Display.fit: rich then does not measure the cells.
+               Empty: rich measures every cell, as before.
         :return: rich.table.Table
         """
         consoletable: rich.table.Table = Table()
@@ -404,9 +588,11 @@ class WebConsole:
         def configure_columns(headings: list[str]) -> None:
             """Configures the headers."""
             if isinstance(headings, list):
-                for header in headings:
+                fixed: list[int | None] = list(widths) or \
+                    [None] * len(headings)
+                for header, width in zip(headings, fixed):
                     # Check if the header is the predefined headers by values
-                    consoletable.add_column(header)
+                    consoletable.add_column(header, width=width)
             
             else:
                 click.echo("No Headers. Text only", err=True)
@@ -416,7 +602,17 @@ class WebConsole:
 
 
 class Display:
-    """Displays the data."""
+    """Displays the data.
+    
+    :property: BULKCELLS: bool: rich's Column keeps its cells in _cells:
+               rows are then added column-wise, in bulk.
+    :property: CHROME: int: A column's cell padding and its divider.
+    :property: ELLIPSIS: str: Marks a truncated cell.
+    """
+    
+    BULKCELLS: bool = '_cells' in getattr(Column, '__dataclass_fields__', {})
+    CHROME: int = 3
+    ELLIPSIS: str = '…'
     
     # The following is an AI Refactor from orginal authored code
     # https://www.perplexity.ai/search/c8250a15-6f8c-4180-b277-349f9ccf83c8?s=c
@@ -436,13 +632,147 @@ class Display:
         else:
             headers: list = [headerview]
         
-        filteredcolumns: pd.DataFrame = \
-            dataframe.loc[:, dataframe.columns.isin(values=headers)]
-        # for column in headerview:
-        for _index, row in filteredcolumns.iterrows():
-            consoletable.add_row(*[str(row[column])
-                                   for column in headers])
+        Display.display_rows(rows=Display.project(dataframe=dataframe,
+                                                  headers=headers),
+                             consoleholder=consoleholder,
+                             consoletable=consoletable)
+    
+    @staticmethod
+    def project(dataframe: pd.DataFrame,
+                headers: list[str]) -> list[list[str]]:
+        """Projects the data to the headers' columns, as stringified rows.
+        
+        Vectorised: the columns are stringified column-wise, in one step,
+        not per cell by iterrows(), the slowest pandas iteration.
+        
+        :param dataframe: pd.DataFrame: The data to project
+        :param headers: list[str]: The columns, in display order
+        :return: list[list[str]]: The rows, ready to render
+        """
+        filteredcolumns: pd.DataFrame = dataframe.loc[:, headers]
+        return Display.stringify(filteredcolumns).to_numpy().tolist()
+    
+    @staticmethod
+    def stringify(dataframe: pd.DataFrame | pd.Series) \
+        -> pd.DataFrame | pd.Series:  # noqa # Pep8 E125
+        """Stringifies every cell, as str() does: missing cells too.
+        
+        astype(str) keeps missing cells as float NaN, under pandas 3:
+        they are filled with 'nan' first, as str(cell) printed them.
+        
+        :param dataframe: pd.DataFrame | pd.Series: The data, or a record
+        :return: pd.DataFrame | pd.Series: The same shape: every cell a str
+        """
+        return dataframe.astype(object).fillna('nan').astype(str)
+    
+    @staticmethod
+    def budgets(lengths: pd.DataFrame,
+                width: int,
+                quantile: float = configuration.Console.QUANTILE) \
+        -> list[int]:  # noqa # Pep8 E125
+        """Budgets each column's width, within the console's width.
+        
+        A column wants its header, or its cells' length at the quantile,
+        e.g. 90% of Criteria fit on one line. If the wants overrun the
+        width, the widest columns are capped, to an equal share, first.
+        
+        :param lengths: pd.DataFrame: The cells' lengths, by str.len()
+        :param width: int: The console's width, in characters
+        :param quantile: float: The share of cells not wrapped
+        :return: list[int]: The columns' widths, in the lengths' order
+        """
+        headers: list[str] = list(lengths.columns)
+        quantiles: pd.Series = lengths.quantile(quantile).fillna(0) \
+            if len(lengths) else pd.Series(0, index=headers)
+        wants: list[int] = [max(len(str(header)),
+                                math.ceil(quantiles[header]), 1)
+                            for header in headers]
+        available: int = max(width - Display.CHROME * len(headers) - 1,
+                             len(headers))
+        if sum(wants) <= available:
+            return wants
+        # Cap the widest: the narrow columns keep their wants
+        remaining: int = available
+        cap: int = available
+        for place, want in enumerate(sorted(wants)):
+            share: int = remaining // (len(wants) - place)
+            if want > share:
+                cap = share
+                break
+            remaining -= want
+        return [max(min(want, cap), 1) for want in wants]
+    
+    @staticmethod
+    def fit(dataframe: pd.DataFrame,
+            headers: list[str],
+            width: int,
+            lines: int = configuration.Console.LINES) \
+        -> tuple[list[list[str]], list[int]]:  # noqa # Pep8 E125
+        """Projects the data to the headers' columns, fitted to the width.
+        
+        Each column's width is budgeted from its cells' lengths, then a
+        cell longer than its width's lines is truncated, with an ellipsis.
+        Given the widths, rich does not measure the cells: rendering is
+        in proportion to the visible characters, not to the text's length.
+        
+        :param dataframe: pd.DataFrame: The data to project
+        :param headers: list[str]: The columns, in display order
+        :param width: int: The console's width, in characters
+        :param lines: int: The most wrapped lines per cell
+        :return: tuple[list[list[str]], list[int]]: The rows, the widths
+        """
+        strings: pd.DataFrame = Display.stringify(dataframe.loc[:, headers])
+        lengths: pd.DataFrame = strings.apply(lambda column: column.str.len())
+        widths: list[int] = Display.budgets(lengths=lengths, width=width)
+        for place, budget in enumerate(widths):
+            limit: int = budget * max(lines, 1)
+            long: pd.Series = lengths.iloc[:, place] > limit
+            if long.any():
+                strings.iloc[long.to_numpy(), place] = \
+                    strings.iloc[long.to_numpy(), place].str.slice(
+                        0, limit - 1) + Display.ELLIPSIS
+        return strings.to_numpy().tolist(), widths
+    
+    @staticmethod
+    def display_rows(rows: typing.Iterable[typing.Sequence[str]],
+                     consoleholder: Console | WebConsole,
+                     consoletable: Table) -> None:
+        """Displays the stringified rows in a table.
+        
+        :param rows: Iterable[Sequence[str]]: e.g. from Display.project
+        :param consoleholder: Console | WebConsole: To print to
+        :param consoletable: Table: The table, with its columns configured
+        :return: None
+        """
+        Display.fill_rows(rows=rows, consoletable=consoletable)
         consoleholder.print(consoletable)
+    
+    @staticmethod
+    def fill_rows(rows: typing.Iterable[typing.Sequence[str]],
+                  consoletable: Table) -> Table:
+        """Adds the stringified rows to a table, without printing it.
+        
+        :param rows: Iterable[Sequence[str]]: e.g. from Display.project
+        :param consoletable: Table: The table, with its columns configured
+        :return: Table: The filled table
+        """
+        rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        columns: list[Column] = consoletable.columns
+        # rich has no bulk add_row(): the cells are extended column-wise,
+        # as add_row() appends them per row, for the same table. Else,
+        # e.g. ragged rows, add_row() pads/adds columns per row.
+        # _cells is private: rich is pinned in requirements.txt, and
+        # tests/test_display.py renders both paths to the same text.
+        if Display.BULKCELLS and \
+            all(len(row) == len(columns) for row in rows):  # noqa # Pep8 E125
+            for column, cells in zip(columns, zip(*rows)):
+                column._cells.extend(cells)  # noqa: SLF001
+            consoletable.rows.extend(Row() for _ in rows)
+        else:
+            addrow = consoletable.add_row
+            for row in rows:
+                addrow(*row)
+        return consoletable
 
 
 class Results:
@@ -452,6 +782,7 @@ class Results:
 
     :meth: getrowframe: Get a row from a dataframe
      by an index or a search term.
+    :meth: getrowsdata: Get many rows, by the record index.
     """
     
     def __init__(self):
@@ -459,6 +790,7 @@ class Results:
         pass
     
     @staticmethod
+    @tracer.traced(category=Tracer.RESULTS)
     def index(frame: pd.DataFrame,
               index: int,
               zero: bool = True) \
@@ -475,6 +807,7 @@ class Results:
         return None
     
     @staticmethod
+    @tracer.traced(category=Tracer.RESULTS)
     def rows(frame: pd.DataFrame,
              index: int = None,
              zero: bool = True,
@@ -497,7 +830,7 @@ class Results:
         return pd.DataFrame | None: - Expect a result or None
         """
         result: pd.DataFrame | pd.Series | None
-        if index:
+        if index is not None:
             result = Results.index(frame=frame, index=index, zero=zero)  # noqa
         else:
             click.echo("Please provide an index "
@@ -510,20 +843,30 @@ class Results:
         return result
     
     @staticmethod
+    @tracer.traced(category=Tracer.RESULTS)
     def getrowdata(data: pd.DataFrame,
-                   ix: int,
+                   ix: int | str,
                    single: bool = False,
+                   records: RecordIndex | None = None,
                    debug: bool = False) \
         -> pd.Series | pd.DataFrame | None:  # noqa # Pep8 E125
         """Get a row from a dataframe by index or searches term.
 
         :param data: pd.DataFrame - Dataframe
-        :param ix: int - Index
+        :param ix: int | str - Index, or by records: Position | CriteriaRef
         :param single: bool - Single row
+        :param records: RecordIndex | None - Lookup by the record's keys,
+               not by the row's place: same result after sorts, filters.
         :param debug: bool - Debug
         :return: pd.Series | pd.DataFrame | None - Row or rows
         """
-        if ix:
+        if records is not None:
+            offset: int | None = records.offset(key=ix)
+            if offset is None:
+                click.echo(f"No Data for row: {ix}")
+                return None
+            return data.iloc[offset]
+        if ix is not None:
             result = Results.rows(frame=data, index=ix,
                                   squeeze=single)
         else:
@@ -541,6 +884,27 @@ class Results:
         if debug is True:
             rich.inspect(result)
         return None
+    
+    @staticmethod
+    @tracer.traced(category=Tracer.RESULTS)
+    def getrowsdata(data: pd.DataFrame,
+                    ixs: list[int | str],
+                    records: RecordIndex) \
+        -> pd.DataFrame | None:  # noqa # Pep8 E125
+        """Get many rows from a dataframe, in one take, by the record index.
+        
+        :param data: pd.DataFrame - Dataframe
+        :param ixs: list[int | str] - Positions | CriteriaRefs, in order
+        :param records: RecordIndex - Lookup by the records' keys
+        :return: pd.DataFrame | None - The rows found, or None if none
+        """
+        offsets, missing = records.offsets(keys=ixs)
+        if missing:
+            click.echo(f"No Data for rows: "
+                       f"{', '.join(str(ix) for ix in missing)}")
+        if not offsets:
+            return None
+        return data.iloc[offsets]
 
 
 class Record:
@@ -775,6 +1139,7 @@ class Record:
                    err=True)
         return False
     
+    @tracer.traced(category=Tracer.RENDER)
     def card(self,
              consolecard: Console,
              source: pd.Series | None = None,
@@ -827,7 +1192,7 @@ class Record:
         """Frames the renderable as a panel."""
         
         def config(dimensions: tuple[int, int],
-                   styler: str,
+                   styler: str | Style,
                    safe: bool = False) -> Panel:
             """Frames the renderable as a panel."""
             width, height = dimensions
@@ -837,7 +1202,7 @@ class Record:
                                  box=outline,
                                  style=styler,
                                  safe_box=safe,
-                                 border_style=styld.border(),
+                                 border_style=styld.border(stylestr=False),
                                  title_align=align,
                                  highlight=True)
                 return p
@@ -849,13 +1214,13 @@ class Record:
                              style=styler,
                              box=outline,
                              safe_box=safe,
-                             border_style=styld.border(),
+                             border_style=styld.border(stylestr=False),
                              title_align=align,
                              highlight=True)
             return p
         
         panel: Panel = config(dimensions=card,
-                              styler=styld.panel(grey=23),
+                              styler=styld.panel(grey=23, tostring=False),
                               safe=True)
         
         if debug is True:
@@ -1079,6 +1444,42 @@ class Record:
         """Renders the footnote for the record."""
         return f'{self.cmdnote(self.editmode)} at: {self.modified}'
     
+    def diffgrid(self,
+                 consolediff: Console,
+                 changes: list['Change'],
+                 fit: bool = False,
+                 sendtolayout: bool = False,
+                 debug: bool = False) -> Table | None:
+        """Display only the changed fields, and their context, old & new.
+        
+        :param consolediff: Console: To print to, if not sent to layout
+        :param changes: list[Change]: e.g. from Editor.changes
+        :param fit: bool: Expand to the console's width
+        :param sendtolayout: bool: Return it, else print it
+        :param debug: bool: Inspect the grid
+        :return: Table | None: The grid, if sent to layout
+        """
+        main: Table = Table(expand=fit, show_footer=True)
+        main.title = f'{self.command}: {self.type}.' \
+                     f'{self.prefix}.{self.reference}: ' \
+                     f'{sum(change.changed for change in changes)} changed'
+        main.add_column(header="Field", footer='', style=styld.label())
+        main.add_column(header="Existing", footer='-----------------',
+                        ratio=1)
+        main.add_column(header="Modified", footer=f'{self.footnote()}',
+                        ratio=1)
+        for change in changes:
+            old, new = change.excerpts()
+            main.add_row(change.field, old, new,
+                         style=styld.modified() if change.changed else 'dim')
+        
+        if debug is True:
+            rich.inspect(main)
+        
+        return Record.switch(main,
+                             printer=consolediff,
+                             switch=sendtolayout)
+    
     def comparegrid(self,
                     container: Table,
                     left: Table,
@@ -1131,6 +1532,61 @@ class Record:
         return None
 
 
+@dataclasses.dataclass(frozen=True)
+class Change:
+    """A field of an edited record: its old & new values, as text.
+    
+    :property: field: str: The field's column name.
+    :property: old: str: The existing value.
+    :property: new: str: The modified value.
+    :property: changed: bool: False: shown only as a changed field's context.
+    :property: CONTEXT: int: The unchanged characters kept around a change.
+    :property: LIMIT: int: The most characters of a change shown.
+    """
+    field: str
+    old: str
+    new: str
+    changed: bool
+    CONTEXT: typing.ClassVar[int] = 24
+    LIMIT: typing.ClassVar[int] = 160
+    
+    def excerpts(self) -> tuple[str, str]:
+        """The old & new values, only where they differ, with context.
+        
+        The common start and end, e.g. a note appended to long notes, are
+        cut to CONTEXT characters, and the differing middles to LIMIT:
+        the cells are of bounded length, however long the values.
+        
+        :return: tuple[str, str]: The old & the new excerpts
+        """
+        if not self.changed:
+            return Change.clip(self.old), Change.clip(self.new)
+        start: int = len(os.path.commonprefix([self.old, self.new]))
+        end: int = len(os.path.commonprefix(
+            [self.old[start:][::-1], self.new[start:][::-1]]))
+        
+        def excerpt(value: str) -> str:
+            """Cuts the value to its differing middle, with context."""
+            head: str = value[max(start - Change.CONTEXT, 0):start]
+            middle: str = value[start:len(value) - end]
+            tail: str = value[len(value) - end:][:Change.CONTEXT]
+            return ''.join(['…' if start > Change.CONTEXT else '', head,
+                            Change.clip(middle), tail,
+                            '…' if end > Change.CONTEXT else ''])
+        
+        return excerpt(self.old), excerpt(self.new)
+    
+    @staticmethod
+    def clip(value: str) -> str:
+        """Cuts the value to LIMIT characters, with an ellipsis.
+        
+        :param value: str: The value
+        :return: str: At most LIMIT characters
+        """
+        return value if len(value) <= Change.LIMIT \
+            else f'{value[:Change.LIMIT - 1]}…'
+
+
 class Editor:
     """The Editor is a CRUD Controller for editing records.
     
@@ -1156,6 +1612,8 @@ class Editor:
     :property lastcommand: The last command.
     :property editmode: The current edit mode.
     :property command: The current command.
+    :property changeset: The changed fields, per edit, and context.
+    :property edits: The edits counted: each modified series set is one.
     """
     
     record: Record
@@ -1180,6 +1638,9 @@ class Editor:
     CLEAREDIT: str = 'clear'
     SELECTEDIT: str = 'select'
     lastcommand: str | None = None
+    changeset: tuple[tuple[int, int], list[Change]] | None = None
+    modifiedseries: pd.Series | None = None
+    edits: int = 0
     
     def __init__(self,
                  currentrecord: Record = None,
@@ -1212,6 +1673,18 @@ class Editor:
         self.lastmodified = None
         self.modified = None
         self.lasteditmode: str = ''
+        self.changeset = None
+    
+    @property
+    def newresultseries(self) -> pd.Series | None:
+        """The modified record as a Pandas Series."""
+        return self.modifiedseries
+    
+    @newresultseries.setter
+    def newresultseries(self, series: pd.Series | None) -> None:
+        """Set the modified record: counted as an edit, even in place."""
+        self.modifiedseries = series
+        self.edits += 1
     
     @property
     def command(self) -> str:
@@ -1223,6 +1696,40 @@ class Editor:
         """Set the last command."""
         self.lastcommand = value
     
+    def changes(self, context: int = 1) -> list[Change]:
+        """The changed fields, old & new, and their neighbouring fields.
+        
+        Compared once per edit, all fields in one vectorised step: the
+        changes are then rendered, not the whole record.
+        
+        :param context: int: The unchanged fields shown, either side
+        :return: list[Change]: In the record's field order
+        """
+        if self.newresultseries is None or self.oldresultseries is None:
+            return []
+        if self.changeset is not None \
+            and self.changeset[0] == (self.edits, context):  # noqa # Pep8 E125
+            return self.changeset[1]
+        old: pd.Series = Display.stringify(self.oldresultseries)
+        new: pd.Series = Display.stringify(self.newresultseries) \
+            .reindex(old.index, fill_value='')
+        changed: list[bool] = (old != new).tolist()
+        shown: set[int] = {near
+                           for place, ischanged in enumerate(changed)
+                           if ischanged
+                           for near in range(place - context,
+                                             place + context + 1)
+                           if 0 <= near < len(changed)}
+        changeset: list[Change] = [
+            Change(field=str(old.index[place]),
+                   old=old.iloc[place],
+                   new=new.iloc[place],
+                   changed=changed[place])
+            for place in sorted(shown)]
+        self.changeset = ((self.edits, context), changeset)
+        return changeset
+    
+    @tracer.traced(category=Tracer.EDITOR)
     def editnote(self,
                  edits: str,
                  index: int,
@@ -1262,6 +1769,7 @@ class Editor:
         """Set the last edit mode."""
         self.lasteditmode = value
     
+    @tracer.traced(category=Tracer.EDITOR)
     def editprogress(self,
                      edits: str,
                      index: int,
@@ -1297,6 +1805,7 @@ class Editor:
     # 3) Tasks: Given these are descrtuctive tasks:
     #   a) appendnotes(): Linked within UpdatingNotes()
     #   b) deletenotes(): Linked within DeletingNotes()
+    @tracer.traced(category=Tracer.EDITOR)
     def addingnotes(self, notes: str,
                     location: int | None = None,
                     debug: bool = False) -> None:
@@ -1408,6 +1917,7 @@ class Editor:
                 # User does not want to add a note to an existing note
                 click.echo("Exit editing mode")
     
+    @tracer.traced(category=Tracer.EDITOR)
     def updatingnotes(self, notes: str,
                       location: int | None = None,
                       debug: bool = False) -> None:
@@ -1471,6 +1981,7 @@ class Editor:
                     click.echo("Exiting editing mode:"
                                f" Update {self.editmode}")
     
+    @tracer.traced(category=Tracer.EDITOR)
     def deletingnotes(self,
                       notes: str,
                       location: int | None = None,
@@ -1520,6 +2031,7 @@ class Editor:
                                f"Delete: {self.editmode}")
     
     # Check if the editing series needs to be type annotated or left magic
+    @tracer.traced(category=Tracer.EDITOR)
     def modifynotes(self,
                     editingseries: pd.Series,
                     record: Record,
@@ -1706,6 +2218,7 @@ class Editor:
     # 3) Tasks: Given these are descrtuctive tasks:
     #   a) appendnotes(): Linked within UpdatingNotes()
     #   b) deletenotes(): Linked within DeletingNotes()
+    @tracer.traced(category=Tracer.EDITOR)
     def togglestatus(self,
                      status: str = Literal['todo', 'wip', 'done', 'missed'],
                      location: int | None = None,
@@ -1785,6 +2298,7 @@ class Editor:
     
     # Refactor: controller.py:1976:9: PLR0915 Too many statements (51 > 50)
     # Check if the editing series needs to be type annotated or left magic
+    @tracer.traced(category=Tracer.EDITOR)
     def modifyprogress(self,
                        editingseries: pd.Series,
                        record: Record,
@@ -1970,6 +2484,7 @@ class Editor:
     # https://docs.gspread.org/en/v5.7.1/user-guide.html#using-gspread-with-pandas
     # I used this method to save the updated DataFrame to the remote source
     
+    @tracer.traced(category=Tracer.EDITOR)
     def save(self,
              saved: pd.DataFrame,
              series: pd.Series,
@@ -1987,38 +2502,44 @@ class Editor:
         """
         # 1. Prompt the user to save the updated DataFrame
         if click.confirm("Are you ready to commit changes?"):
-            sheet: gspread.Worksheet = Controller.load_wsheet()
-            # 2. Check for Validation Client and Worksheet ID presence
-            if sheet.client is not None and \
-                isinstance(sheet.client, gspread.Client) and \
-                sheet.id is not None and sheet.get_all_records():  # noqa
+            # Timed as the save phase: not the prompt, the user's answer
+            with metrics.phase(name=Metrics.SAVE):
+                sheet: gspread.Worksheet = Controller.load_wsheet()
+                # 2. Check for Validation Client and Worksheet ID presence
+                if (isinstance(sheet, connections.LocalWorksheet) or
+                    sheet.client is not None and
+                    isinstance(sheet.client, gspread.Client)) and \
+                    sheet.id is not None and sheet.get_all_records():  # noqa
                 
-                # 3. Convert sheet to a target DataFrame
-                target: pd.DataFrame = \
-                    DataController.load_dataframe_wsheet(sheet)
-                # 4. SAVE ATTEMPT 1: INTEGRATE a single record into the target
-                integratedframe: pd.DataFrame = self.integrate(
-                    single=saved,
-                    source=target,
-                    index=index)
-                saving = integratedframe.astype(str)
-                # 4. SAVE ATTEMPT 1b: switch based on TEST Saving mode
-                # s1 = Use integratedframe &
-                # Tried gspread_dataframe & set_with_dataframe => set_remote
-                # This is not commment out code, it is an annotation
-                if action == 'overwrite:bulk' and debug is False:
-                    set_remote(worksheet=sheet,
-                               dataframe=saving,
-                               allow_formulas=False)
+                    # 3. Convert sheet to a target DataFrame
+                    target: pd.DataFrame = \
+                        DataController.load_dataframe_wsheet(sheet)
+                    # 4. SAVE ATTEMPT 1: INTEGRATE a single record
+                    # into the target
+                    integratedframe: pd.DataFrame = self.integrate(
+                        single=saved,
+                        source=target,
+                        index=index)
+                    saving = integratedframe.astype(str)
+                    # 4. SAVE ATTEMPT 1b: switch based on TEST Saving mode
+                    # s1 = Use integratedframe &
+                    # Tried gspread_dataframe & set_with_dataframe
+                    # => set_remote
+                    # This is not commment out code, it is an annotation
+                    if action == 'overwrite:bulk' and debug is False:
+                        set_remote(worksheet=sheet,
+                                   dataframe=saving,
+                                   allow_formulas=False)
                 
-                # 6. SAVE ATTEMPT 3: Inject the updated series into the remote
-                # source, via the series row and index parameters.
-                # BY matching on the Position column, primary key
-                elif action == 'inject:row' and debug is True:
-                    self.injection(series=series,
-                                   sheet=sheet,
-                                   row=index,
-                                   debug=debug)
+                    # 6. SAVE ATTEMPT 3: Inject the updated series into
+                    # the remote source, via the series row and index
+                    # parameters.
+                    # BY matching on the Position column, primary key
+                    elif action == 'inject:row' and debug is True:
+                        self.injection(series=series,
+                                       sheet=sheet,
+                                       row=index,
+                                       debug=debug)
         else:
             click.echo("Exit editing mode. "
                        "No Changed saved to remote")
@@ -2026,6 +2547,7 @@ class Editor:
     # This code was adapted from the PerplexityAI as a generated code
     # https://www.perplexity.ai/search/33fb1a34-54aa-49d4-84aa-45b5d846eba8?s=c
     @staticmethod
+    @tracer.traced(category=Tracer.EDITOR)
     def injection(series: pd.Series,
                   sheet: gspread.Worksheet,
                   row: int,
@@ -2054,6 +2576,7 @@ class Editor:
                         sheet.insert_row(values, record['Position'])
     
     @staticmethod
+    @tracer.traced(category=Tracer.EDITOR)
     def integrate(single: pd.DataFrame,
                   source: pd.DataFrame,
                   index: int,
@@ -2074,6 +2597,7 @@ class Editor:
                           source.iloc[index:]]).reset_index(drop=reset)
     
     @staticmethod
+    @tracer.traced(category=Tracer.EDITOR)
     def insert(record: Record,
                value: str,
                updatedata: pd.DataFrame | None = None,
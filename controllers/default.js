@@ -1,5 +1,18 @@
 const Pty = require('node-pty');
 const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { spawn } = require('child_process');
+
+// Prefork: a warm Python parent forks a ready REPL per websocket.
+// PYCRITERIA_PREFORK: its Unix socket's path; 'off': a fresh app.py repl.
+const PREFORK = process.env.PYCRITERIA_PREFORK ||
+    path.join(os.tmpdir(), 'pycriteria-prefork.sock');
+
+// Data server: one dataset, one sheet connection, for every session.
+// PYCRITERIA_DATASERVER: its Unix socket's path; 'off': each loads its own.
+const DATASERVER = process.env.PYCRITERIA_DATASERVER ||
+    path.join(os.tmpdir(), 'pycriteria-data.sock');
 
 exports.install = function () {
 
@@ -8,6 +21,58 @@ exports.install = function () {
 
 };
 
+function prefork() {
+
+    if (PREFORK === 'off') {
+        return;
+    }
+
+    // Imports the app, and loads the data, once: then listens
+    const server = spawn('python3', ['prefork.py', 'serve',
+        '--socket', PREFORK], {
+        cwd: process.env.PWD,
+        env: process.env,
+        stdio: 'inherit'
+    });
+
+    server.on('exit', function (code, signal) {
+        console.log("Prefork server exited: " + (signal || code));
+    });
+}
+
+function dataserver() {
+
+    if (DATASERVER === 'off') {
+        delete process.env.PYCRITERIA_DATASERVER;
+        prefork();
+        return;
+    }
+
+    // Loads the sheet once, then polls it: the sessions query the server
+    fs.rmSync(DATASERVER, { force: true });
+    process.env.PYCRITERIA_DATASERVER = DATASERVER;
+    const server = spawn('python3', ['dataserver.py',
+        '--socket', DATASERVER], {
+        cwd: process.env.PWD,
+        env: process.env,
+        stdio: 'inherit'
+    });
+
+    server.on('exit', function (code, signal) {
+        console.log("Data server exited: " + (signal || code));
+    });
+
+    // The prefork server loads its data from the data server: once it listens
+    let waited = 0;
+    const listening = setInterval(function () {
+        waited += 250;
+        if (fs.existsSync(DATASERVER) || waited >= 30000) {
+            clearInterval(listening);
+            prefork();
+        }
+    }, 250);
+}
+
 function socket() {
 
     this.encodedecode = false;
@@ -15,8 +80,12 @@ function socket() {
 
     this.on('open', function (client) {
 
-        // Spawn terminal
-        client.tty = Pty.spawn('python3', ['app.py', 'repl'], {
+        // Spawn terminal: a forked REPL, once the prefork server listens
+        const warm = PREFORK !== 'off' && fs.existsSync(PREFORK);
+        const args = warm ?
+            ['-S', 'prefork.py', 'connect', '--socket', PREFORK] :
+            ['app.py', 'repl'];
+        client.tty = Pty.spawn('python3', args, {
             name: 'xterm-color',
             cols: 110,
             rows: 50,
@@ -56,5 +125,9 @@ if (process.env.CREDS != null) {
             console.log('Error writing file: ', err);
             socket.emit("console_output", "Error saving credentials: " + err);
         }
+        // The servers parse the credentials: once they are written
+        dataserver();
     });
+} else {
+    dataserver();
 }
@@ -0,0 +1,276 @@
+#!/user/bin/env python3
+# pylint: disable=trailing-whitespace
+# ruff: noqa: ANN101, I001
+# noqa: W293 blank line contains whitespace
+"""Module: Datagen: Synthetic, schema faithful, datasets at any scale.
+
+Usage:
+-------------------------
+- Generator: Generates a dataset of the worksheet's ColumnSchema columns,
+             e.g. for benchmarks, or the offline backend, at 1k to 1M rows:
+             - CriteriaRef: hierarchical: outcome.criterion.subcriterion,
+               Tier, TierPrefix and TierDepth follow the hierarchy.
+             - LinkedRef: a graph: parents, siblings and other outcomes.
+             - CriteriaTopic: multi valued: 1 to 3 topics, ; separated.
+             - Notes: mostly empty, else long: up to hundreds of characters.
+             Seeded: the same rows and seed, the same dataset.
+- python datagen.py --rows 100000 --out data.csv
+- PYCRITERIA_BACKEND=local PYCRITERIA_DATA=data.csv python app.py repl
+
+Linting:
+-------------------------
+- pylint: disable=trailing-whitespace
+- ruff: noqa:
+      I001:     unsorted-imports
+                Import block is unsorted or unformatted
+      ANN101:   missing-type-self
+                Missing type annotation for {name} in method
+- noqa: W293
+
+Critieria:
+LO2.2: Clearly separate and identify code written for the application and
+       the code from external sources (e.g. libraries or tutorials)
+LO2.2.3: Clearly separate code from external sources
+LO2.2.4: Clearly identify code from external sources
+LO6: Use library software for building a graphical user interface,
+or command-line interface, or web application, or mathematical software
+LO6.1 Implement the use of external Python libraries
+LO6.1.1 Implement the use of external Python libraries
+      where appropriate to provide the functionality that the project requires.
+-------------------------
+Standard Libraries
+:imports: pathlib
+
+3rd Paty Imports
+:imports: click, numpy, pandas
+
+Custom Authored Libraries
+:imports: modelview.ColumnSchema
+:imports: settings.Settings
+
+:class: Generator: Generates a dataset, column by column, vectorised.
+"""
+# 0.1 Standard Library Imports
+import pathlib
+
+# 0.2 Third Party Modules
+import click  # type: ignore
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+# 0.3 Local imports
+from modelview import ColumnSchema
+from settings import Settings
+
+
+class Generator:
+    """Generator: A dataset of the worksheet's columns, hierarchy and graph.
+    
+    Each outcome is a block of rows: the outcome, then its criteria, each
+    followed by its subcriteria: e.g. 1.0.0, 1.1.0, 1.1.1, ..., 1.2.0.
+    
+    :property: SIZES: list[int]: The benchmark's dataset sizes.
+    :property: CRITERIA: int: Criteria per outcome.
+    :property: SUBCRITERIA: int: Subcriteria per criterion.
+    :property: GROUPS: int: The CriteriaGroup labels: LO1 to LO11.
+    :property: TOPICS: list[str]: The CriteriaTopic labels: a prime count,
+               so a row's stepped picks are distinct.
+    :property: PROGRESS: list[str]: The Progress statuses.
+    :property: WORDS: list[str]: The Criteria's and Notes' words.
+    :property: TEXTS: int: The distinct Criteria, and Notes, texts.
+    :property: rows: int: The rows to generate.
+    :property: rng: np.random.Generator: Seeded.
+    """
+    
+    SIZES: list[int] = [1_000, 10_000, 100_000, 1_000_000]
+    CRITERIA: int = 5
+    SUBCRITERIA: int = 4
+    GROUPS: int = 11
+    TOPICS: list[str] = [
+        'Program Design', 'Program Build', 'Programming Constructs',
+        'Code Style Standards', 'Quality Standards', 'Data Validation',
+        'Code Attribution', 'Code Organisation', 'Error Control',
+        'Issue Handling', 'Library Software', 'Syntax', 'Documentation',
+        'Domain Architecture', 'Requirements', 'Version Control Systems',
+        'Cloud Based Deployments']
+    PROGRESS: list[str] = ['ToDo', 'WIP', 'Done', 'Missed']
+    WORDS: list[str] = [
+        'write', 'code', 'that', 'handles', 'empty', 'invalid', 'input',
+        'data', 'implement', 'a', 'given', 'algorithm', 'as', 'computer',
+        'program', 'with', 'no', 'significant', 'issues', 'ensure', 'all',
+        'intended', 'functionality', 'works', 'per', 'the', 'critical',
+        'project', 'objectives', 'readability', 'comments', 'indentation',
+        'consistent', 'meaningful', 'naming', 'conventions', 'clearly',
+        'separate', 'identify', 'external', 'sources', 'libraries',
+        'tutorials', 'deploy', 'cloud', 'platform', 'document', 'testing',
+        'version', 'control', 'commit', 'messages', 'robust', 'errors']
+    TEXTS: int = 512
+    
+    rows: int
+    rng: np.random.Generator
+    
+    def __init__(self, rows: int, seed: int = 0) -> None:
+        """Seeds the generator.
+        
+        :param rows: int: The rows to generate
+        :param seed: int: The random seed
+        """
+        self.rows = max(rows, 1)
+        self.rng = np.random.default_rng(seed)
+    
+    @property
+    def block(self) -> int:
+        """The rows per outcome: the outcome, criteria, and subcriteria."""
+        return 1 + self.CRITERIA * (1 + self.SUBCRITERIA)
+    
+    def texts(self, least: int, most: int) -> np.ndarray:
+        """Distinct texts, of least to most words: picked per row.
+        
+        :param least: int: The fewest words
+        :param most: int: The most words
+        :return: np.ndarray: TEXTS texts
+        """
+        words: np.ndarray = np.array(self.WORDS, dtype=object)
+        counts: np.ndarray = self.rng.integers(least, most + 1,
+                                               size=self.TEXTS)
+        return np.array([' '.join(self.rng.choice(words, size=count))
+                         .capitalize() + '.' for count in counts],
+                        dtype=object)
+    
+    @staticmethod
+    def joined(columns: list[np.ndarray], separator: str) -> np.ndarray:
+        """Joins the columns' non empty values, per row, by the separator.
+        
+        :param columns: list[np.ndarray]: The values, '' for none
+        :param separator: str: e.g. ;
+        :return: np.ndarray: The joined values
+        """
+        joined: np.ndarray = columns[0]
+        for column in columns[1:]:
+            joined = joined + np.where((joined != '') & (column != ''),
+                                       separator, '') + column
+        return joined
+    
+    def hierarchy(self) -> pd.DataFrame:
+        """The rows' places: outcome, criterion, subcriterion, and depth.
+        
+        :return: pd.DataFrame: outcome, criterion, sub, depth, per row
+        """
+        offset: np.ndarray = np.arange(self.rows)
+        place: np.ndarray = offset % self.block
+        criterion: np.ndarray = np.where(
+            place == 0, 0, (place - 1) // (1 + self.SUBCRITERIA) + 1)
+        sub: np.ndarray = np.where(
+            place == 0, 0, (place - 1) % (1 + self.SUBCRITERIA))
+        return pd.DataFrame({
+            'outcome': offset // self.block + 1,
+            'criterion': criterion,
+            'sub': sub,
+            'depth': np.select([place == 0, sub == 0], [1, 2], 3)})
+    
+    def linked(self, references: np.ndarray,
+               places: pd.DataFrame) -> np.ndarray:
+        """The LinkedRef graph: a parent, siblings, and other outcomes.
+        
+        :param references: np.ndarray: The rows' CriteriaRef
+        :param places: pd.DataFrame: The rows' hierarchy
+        :return: np.ndarray: 0 to 4 references, ; separated
+        """
+        offset: np.ndarray = np.arange(self.rows)
+        start: np.ndarray = offset - offset % self.block
+        parent: np.ndarray = np.where(
+            places['depth'].to_numpy() == 3,
+            start + 1 + (places['criterion'].to_numpy() - 1) *
+            (1 + self.SUBCRITERIA), start)
+        sibling: np.ndarray = np.minimum(
+            start + self.rng.integers(0, self.block, size=self.rows),
+            self.rows - 1)
+        other: np.ndarray = self.rng.integers(0, self.rows, size=self.rows)
+        links: np.ndarray = self.rng.choice(
+            5, size=self.rows, p=[0.3, 0.25, 0.2, 0.15, 0.1])
+        columns: list[np.ndarray] = []
+        for rank, targets in enumerate([parent, sibling, other, sibling - 1]):
+            targets = np.clip(targets, 0, self.rows - 1)
+            keep: np.ndarray = (links > rank) & (targets != offset)
+            columns.append(np.where(keep, references[targets], '')
+                           .astype(object))
+        return self.joined(columns=columns, separator=';')
+    
+    def frame(self) -> pd.DataFrame:
+        """Generates the dataset: the ColumnSchema's columns, in order.
+        
+        :return: pd.DataFrame: The rows, Position from 1
+        """
+        c: ColumnSchema = ColumnSchema()
+        places: pd.DataFrame = self.hierarchy()
+        depth: np.ndarray = places['depth'].to_numpy()
+        references: np.ndarray = (
+            places['outcome'].astype(str) + '.' +
+            places['criterion'].astype(str) + '.' +
+            places['sub'].astype(str)).to_numpy(dtype=object)
+        topics: np.ndarray = np.array(self.TOPICS, dtype=object)
+        counts: np.ndarray = self.rng.choice(3, size=self.rows,
+                                             p=[0.6, 0.3, 0.1]) + 1
+        first: np.ndarray = self.rng.integers(0, len(topics), size=self.rows)
+        step: np.ndarray = self.rng.integers(1, len(topics), size=self.rows)
+        picked: list[np.ndarray] = [
+            np.where(counts > rank,
+                     topics[(first + rank * step) % len(topics)],
+                     '').astype(object)
+            for rank in range(3)]
+        criteria: np.ndarray = self.texts(least=4, most=36)
+        notes: np.ndarray = self.texts(least=8, most=120)
+        return pd.DataFrame({
+            c.Position: np.arange(1, self.rows + 1),
+            c.Tier: np.where(depth == 1, 'Outcome', 'Criterion'),
+            c.Prefix: np.where(depth == 1, 'LO', 'LC'),
+            c.Depth: depth,
+            c.DoD: np.where(self.rng.random(self.rows) < 0.8,
+                            'Planned', ''),
+            c.Performance: self.rng.choice(
+                ['Pass', 'Merit', 'Distinction'], size=self.rows,
+                p=[0.6, 0.3, 0.1]),
+            c.Group: 'LO' + ((places['outcome'] - 1) % self.GROUPS + 1)
+            .astype(str),
+            c.Topic: self.joined(columns=picked, separator='; '),
+            c.Reference: references,
+            c.Criteria: 'LO' + references + ': ' +
+            criteria[self.rng.integers(0, self.TEXTS, size=self.rows)],
+            c.Progress: self.rng.choice(self.PROGRESS, size=self.rows,
+                                        p=[0.55, 0.2, 0.2, 0.05]),
+            c.Notes: np.where(self.rng.random(self.rows) < 0.3,
+                              notes[self.rng.integers(0, self.TEXTS,
+                                                      size=self.rows)], ''),
+            c.Related: self.linked(references=references, places=places)})
+    
+    def write(self, path: str | pathlib.Path) -> pathlib.Path:
+        """Writes the dataset as a CSV file: as the offline backend reads.
+        
+        :param path: str | pathlib.Path: The CSV file
+        :return: pathlib.Path: The file written
+        """
+        written: pathlib.Path = pathlib.Path(path)
+        self.frame().to_csv(written, index=False,
+                            encoding=Settings.ENCODE)
+        return written
+
+
+@click.command(name='datagen')
+@click.option('--rows', 'rows', type=click.IntRange(min=1),
+              default=Generator.SIZES[0], show_default=True,
+              help='Rows to generate, e.g. 1000, 10000, 100000, 1000000.')
+@click.option('--seed', 'seed', type=int, default=0, show_default=True,
+              help='The random seed: the same seed, the same dataset.')
+@click.option('--out', 'out', type=click.Path(dir_okay=False),
+              default='dataset.csv', show_default=True,
+              help='The CSV file to write.')
+def main(rows: int, seed: int, out: str) -> None:
+    """Datagen: write a synthetic dataset, for benchmarks, or offline use."""
+    written: pathlib.Path = Generator(rows=rows, seed=seed).write(path=out)
+    click.echo(f'{rows} rows written to {written}')
+
+
+if __name__ == '__main__':
+    main()
+
+# End of Datagen Module
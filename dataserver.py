@@ -0,0 +1,1199 @@
+#!/user/bin/env python3
+# pylint: disable=trailing-whitespace
+# ruff: noqa: ANN101, I001
+# noqa: W293 blank line contains whitespace
+"""Module: DataServer: One dataset, one connection, for every session.
+
+Usage:
+-------------------------
+- DataServer: A local daemon: owns the DataController, and the sheet's
+              connection. Downloads the sheet once, and polls it once per
+              time to live, for every session: not once per session.
+              Serves the dataset over a Unix socket, encoded once per
+              revision. After an edit, a session's patch, or a write, it
+              pushes a change notification to every other session.
+              A patch, unsaved, is kept across its reloads of the sheet:
+              until a write saves its cells.
+- DataClient: A session's connection: requests, and the notifications,
+              read by a background thread. The dataset is refetched only
+              once a notification says it changed.
+- SharedWorksheet: The worksheet calls the app makes: the server's
+                   dataset's cells; its writes are sent to the server.
+- Codec: The protocol: a binary header per frame: op, status, revision,
+         length. The dataset is columnar: ints, floats, bools as raw
+         little endian arrays; strings as offsets, and one UTF-8 blob.
+         Patches, and notifications, are small: JSON.
+- Segment: The dataset, published by the server: a read-only file in
+           shared memory, /dev/shm, one per revision. The sessions map
+           it: the numeric columns are the mapped pages, not copies;
+           the text columns too, with pyarrow. One dataset in memory,
+           for every session: a session copies only the columns it edits.
+- python dataserver.py --socket /tmp/pycriteria-data.sock
+- PYCRITERIA_DATASERVER=/tmp/pycriteria-data.sock python app.py repl
+
+Linting:
+-------------------------
+- pylint: disable=trailing-whitespace
+- ruff: noqa:
+      I001:     unsorted-imports
+                Import block is unsorted or unformatted
+      ANN101:   missing-type-self
+                Missing type annotation for {name} in method
+- noqa: W293
+
+Critieria:
+LO2.2: Clearly separate and identify code written for the application and
+       the code from external sources (e.g. libraries or tutorials)
+LO2.2.3: Clearly separate code from external sources
+LO2.2.4: Clearly identify code from external sources
+LO6: Use library software for building a graphical user interface,
+or command-line interface, or web application, or mathematical software
+LO6.1 Implement the use of external Python libraries
+LO6.1.1 Implement the use of external Python libraries
+      where appropriate to provide the functionality that the project requires.
+-------------------------
+Standard Libraries
+:imports: io, json, mmap, os, pathlib, queue, selectors, signal, socket,
+          struct, sys, tempfile, threading, time, typing
+
+3rd Paty Imports
+:imports: click, gspread, numpy, pandas
+:imports: pyarrow: optional: text columns mapped, else decoded per session
+
+Custom Authored Libraries
+:imports: connections.LocalSpreadsheet, connections.LocalWorksheet
+:imports: settings.Settings
+:imports: controller: by the server, once, in DataServer.warm
+
+:class: Codec: The binary frames, and the columnar dataset.
+:class: Segment: The published dataset: mapped, read-only, by sessions.
+:class: DataClient: A session's connection: requests, notifications.
+:class: SharedWorksheet: The server's dataset, as a worksheet.
+:class: SharedConnector: Selects, and opens, the shared dataset.
+:class: DataServer: The daemon: the dataset, polled once, pushed changes.
+"""
+# 0.1 Standard Library Imports
+import io
+import json
+import mmap
+import os
+import pathlib
+import queue
+import selectors
+import signal
+import socket
+import struct
+import sys
+import tempfile
+import threading
+import time
+from typing import Any
+
+# 0.2 Third Party Modules
+import click  # type: ignore
+import gspread  # type: ignore
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+try:
+    import pyarrow  # type: ignore
+except ImportError:  # Optional: text columns decoded, else mapped
+    pyarrow = None
+
+# 0.3 Local imports
+from connections import LocalSpreadsheet, LocalWorksheet
+from settings import Settings
+
+
+class Codec:
+    """Codec: The protocol's frames, and the dataset's columnar encoding.
+    
+    A frame: op, status, revision, payload length: then the payload.
+    
+    :property: HEADER: struct.Struct: op, status, revision, length.
+    :property: FETCH: int: Get the dataset: unless the revision is current.
+    :property: PATCH: int: A session's edit: a row's changed values.
+    :property: WRITE: int: A worksheet write: sent to the sheet.
+    :property: REFRESH: int: Reload the sheet now.
+    :property: NOTIFY: int: Pushed: the dataset changed.
+    :property: OK: int: Done: the payload, if any, is the reply.
+    :property: UNCHANGED: int: The session's revision is current.
+    :property: ERROR: int: Failed: the payload is the message.
+    :property: MAPPED: int: The payload is the published segment's path.
+    :property: NONE: int: No revision: the session has no dataset.
+    :property: KINDS: dict[str, str]: A column's kind: its numpy dtype.
+    :property: COUNTS: struct.Struct: The dataset's columns, and rows.
+    :property: COLUMN: struct.Struct: A column's kind, and data's length.
+    """
+    
+    HEADER: struct.Struct = struct.Struct('<BBQQ')
+    FETCH: int = 1
+    PATCH: int = 2
+    WRITE: int = 3
+    REFRESH: int = 4
+    NOTIFY: int = 5
+    OK: int = 0
+    UNCHANGED: int = 1
+    ERROR: int = 2
+    MAPPED: int = 3
+    NONE: int = 2 ** 64 - 1
+    KINDS: dict[str, str] = {'i': '<i8', 'f': '<f8', 'b': '|b1'}
+    COUNTS: struct.Struct = struct.Struct('<IQ')
+    COLUMN: struct.Struct = struct.Struct('<cQ')
+    
+    @classmethod
+    def frame(cls, op: int, status: int = 0, revision: int = 0,
+              payload: bytes = b'') -> bytes:
+        """A frame: its header, then its payload.
+        
+        :param op: int: e.g. Codec.FETCH
+        :param status: int: e.g. Codec.OK
+        :param revision: int: The dataset's revision
+        :param payload: bytes: The request's, or reply's, body
+        :return: bytes: The frame
+        """
+        return cls.HEADER.pack(op, status, revision, len(payload)) + payload
+    
+    @staticmethod
+    def exactly(connection: socket.socket, size: int) -> bytes:
+        """Reads exactly size bytes: or raises, if the peer closed.
+        
+        :param connection: socket.socket: The connection
+        :param size: int: The bytes to read
+        :return: bytes: The bytes read
+        """
+        buffer: bytearray = bytearray(size)
+        view: memoryview = memoryview(buffer)
+        read: int = 0
+        while read < size:
+            got: int = connection.recv_into(view[read:], size - read)
+            if not got:
+                raise ConnectionError('The peer closed the connection.')
+            read += got
+        return bytes(buffer)
+    
+    @classmethod
+    def read(cls, connection: socket.socket) -> tuple[int, int, int, bytes]:
+        """Reads a frame.
+        
+        :param connection: socket.socket: The connection
+        :return: tuple[int, int, int, bytes]: op, status, revision, payload
+        """
+        op, status, revision, length = cls.HEADER.unpack(
+            cls.exactly(connection=connection, size=cls.HEADER.size))
+        return op, status, revision, \
+            cls.exactly(connection=connection, size=length)
+    
+    @staticmethod
+    def jsonable(value: Any) -> Any:
+        """A numpy scalar as its Python value: for JSON.
+        
+        :param value: Any: e.g. np.int64
+        :return: Any: e.g. int
+        """
+        return value.item() if hasattr(value, 'item') else str(value)
+    
+    @classmethod
+    def dumps(cls, value: Any) -> bytes:
+        """A small payload, as JSON: patches, notifications, writes.
+        
+        :param value: Any: JSON serialisable: numpy scalars converted
+        :return: bytes: UTF-8 JSON
+        """
+        return json.dumps(value, default=cls.jsonable).encode()
+    
+    @classmethod
+    def encode(cls, frame: pd.DataFrame) -> bytes:
+        """Encodes the dataset: column by column.
+        
+        :param frame: pd.DataFrame: The dataset
+        :return: bytes: counts, then per column: name, kind, data
+        """
+        out: io.BytesIO = io.BytesIO()
+        out.write(cls.COUNTS.pack(len(frame.columns), len(frame)))
+        for name in frame.columns:
+            kind, data = cls.column(series=frame[name])
+            label: bytes = str(name).encode()
+            out.write(struct.pack('<H', len(label)) + label)
+            out.write(cls.COLUMN.pack(kind.encode(), len(data)))
+            out.write(data)
+        return out.getvalue()
+    
+    @classmethod
+    def column(cls, series: pd.Series) -> tuple[str, bytes]:
+        """Encodes a column: raw, if numeric; offsets and a blob, if text.
+        
+        Repetitive text, e.g. a status, is a dictionary: its distinct
+        values, then a code per row: a session decodes each value once.
+        
+        :param series: pd.Series: The column
+        :return: tuple[str, bytes]: Its kind, and its data
+        """
+        kind: str = series.dtype.kind
+        if kind in ('i', 'u') and series.dtype.itemsize <= 8:
+            return 'i', series.to_numpy(dtype=cls.KINDS['i']).tobytes()
+        if kind in cls.KINDS:
+            return kind, series.to_numpy(dtype=cls.KINDS[kind]).tobytes()
+        values: list[Any] = series.tolist()
+        if not all(isinstance(value, str) for value in values):
+            return 'j', cls.dumps(values)
+        codes, distinct = pd.factorize(pd.Series(values, dtype=object))
+        if len(distinct) * 2 <= len(values):
+            return 'd', struct.pack('<Q', len(distinct)) + \
+                codes.astype('<u4').tobytes() + cls.strings(list(distinct))
+        return 's', cls.strings(values=values)
+    
+    @staticmethod
+    def strings(values: list[str]) -> bytes:
+        """Encodes text: the end offsets, then one UTF-8 blob.
+        
+        :param values: list[str]: The values
+        :return: bytes: The offsets, from 0, and the blob
+        """
+        encoded: list[bytes] = [value.encode() for value in values]
+        offsets: np.ndarray = np.zeros(len(encoded) + 1, dtype='<u8')
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return offsets.tobytes() + b''.join(encoded)
+    
+    @classmethod
+    def decode(cls, payload: bytes | memoryview) -> pd.DataFrame:
+        """Decodes the dataset: the numbers are the payload's buffer's.
+        
+        The columns are not copied, nor consolidated: a mapped segment's
+        numeric columns are its pages, read-only.
+        
+        :param payload: bytes | memoryview: As encode wrote it
+        :return: pd.DataFrame: The dataset
+        """
+        view: memoryview = memoryview(payload)
+        columns, rows = cls.COUNTS.unpack_from(view, 0)
+        at: int = cls.COUNTS.size
+        data: dict[str, Any] = {}
+        for _ in range(columns):
+            (size,) = struct.unpack_from('<H', view, at)
+            name: str = bytes(view[at + 2:at + 2 + size]).decode()
+            at += 2 + size
+            kind, length = cls.COLUMN.unpack_from(view, at)
+            at += cls.COLUMN.size
+            data[name] = cls.values(kind=kind.decode(), rows=rows,
+                                    data=view[at:at + length])
+            at += length
+        return pd.DataFrame(data, copy=False)
+    
+    @classmethod
+    def values(cls, kind: str, rows: int, data: memoryview) -> Any:
+        """Decodes a column's values.
+        
+        :param kind: str: i, f, b: raw; s: offsets and blob;
+               d: distinct values, and codes; j: JSON
+        :param rows: int: The rows
+        :param data: memoryview: The column's data
+        :return: Any: An array, or a list
+        """
+        if kind in cls.KINDS:
+            return np.frombuffer(data, dtype=cls.KINDS[kind], count=rows)
+        if kind == 'j':
+            return json.loads(bytes(data))
+        if kind == 'd':  # A code per row: to each distinct value, decoded once
+            (count,) = struct.unpack_from('<Q', data, 0)
+            codes: np.ndarray = np.frombuffer(data, dtype='<u4', count=rows,
+                                              offset=8)
+            distinct: np.ndarray = np.empty(count, dtype=object)
+            distinct[:] = cls.texts(count=count, data=data[8 + rows * 4:])
+            return distinct[codes]
+        if pyarrow is not None:  # The offsets, and blob: not copied
+            return pd.arrays.ArrowExtensionArray(
+                pyarrow.LargeStringArray.from_buffers(
+                    rows, pyarrow.py_buffer(data[:(rows + 1) * 8]),
+                    pyarrow.py_buffer(data[(rows + 1) * 8:])))
+        return cls.texts(count=rows, data=data)
+    
+    @staticmethod
+    def texts(count: int, data: memoryview) -> list[str]:
+        """Decodes text: as strings encoded it.
+        
+        :param count: int: The values
+        :param data: memoryview: The offsets, and the blob
+        :return: list[str]: The values
+        """
+        offsets: list[int] = np.frombuffer(data, dtype='<u8',
+                                           count=count + 1).tolist()
+        blob: bytes = bytes(data[(count + 1) * 8:])
+        text: str = blob.decode()
+        if len(text) == len(blob):  # ASCII: the byte offsets index the text
+            return [text[start:end]
+                    for start, end in zip(offsets, offsets[1:])]
+        return [blob[start:end].decode()
+                for start, end in zip(offsets, offsets[1:])]
+
+
+class Segment:
+    """Segment: The published dataset: a read-only file, mapped by sessions.
+    
+    One file per revision, replaced whole: a session's mapping of an
+    older revision stays valid, until its frame is dropped.
+    
+    :property: HEADER: struct.Struct: magic, revision, payload length.
+    :property: MAGIC: bytes: A segment's first bytes.
+    """
+    
+    HEADER: struct.Struct = struct.Struct('<8sQQ')
+    MAGIC: bytes = b'PYCRSEG1'
+    
+    @staticmethod
+    def directory() -> str:
+        """Shared memory: /dev/shm, if there is one: else the temp dir.
+        
+        :return: str: The segments' directory
+        """
+        shared: str = '/dev/shm'
+        return shared if os.path.isdir(shared) else tempfile.gettempdir()
+    
+    @classmethod
+    def publish(cls, path: str, revision: int, payload: bytes) -> None:
+        """Publishes a revision: written aside, then renamed into place.
+        
+        :param path: str: The segment's path
+        :param revision: int: The dataset's revision
+        :param payload: bytes: The encoded dataset
+        :return: None
+        """
+        written: str = f'{path}.{revision}.publishing'
+        with open(written, 'wb') as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, revision, len(payload)))
+            file.write(payload)
+        os.chmod(written, 0o400)
+        os.replace(written, path)
+    
+    @classmethod
+    def map(cls, path: str) -> tuple[int, memoryview]:
+        """Maps the published revision: read-only, not copied.
+        
+        The mapping is held by the arrays decoded from it: it is closed
+        once they are dropped.
+        
+        :param path: str: The segment's path
+        :return: tuple[int, memoryview]: Its revision, and its payload
+        """
+        descriptor: int = os.open(path, os.O_RDONLY)
+        try:
+            pages: mmap.mmap = mmap.mmap(descriptor, 0,
+                                         access=mmap.ACCESS_READ)
+        finally:
+            os.close(descriptor)
+        magic, revision, length = cls.HEADER.unpack_from(pages, 0)
+        if magic != cls.MAGIC:
+            raise ValueError(f'Not a dataset segment: {path}')
+        start: int = cls.HEADER.size
+        return revision, memoryview(pages)[start:start + length]
+    
+    @staticmethod
+    def assign(frame: pd.DataFrame, offset: int, column: str,
+               value: Any) -> None:
+        """Sets a cell: a mapped, read-only, column is copied first.
+        
+        Only the column edited is copied: and only by this process.
+        
+        :param frame: pd.DataFrame: e.g. a mapped dataset
+        :param offset: int: The row's offset
+        :param column: str: The column
+        :param value: Any: The new value
+        :return: None
+        """
+        place: int = frame.columns.get_loc(column)
+        try:
+            frame.iat[offset, place] = value
+        except ValueError:  # Read-only: the segment's pages
+            frame[column] = frame[column].copy()
+            frame.iat[offset, place] = value
+    
+    @staticmethod
+    def remove(path: str) -> None:
+        """Removes the published segment: mapped ones stay valid.
+        
+        :param path: str: The segment's path
+        :return: None
+        """
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+class DataClient:
+    """DataClient: A session's connection to the server: and its pushes.
+    
+    One request at a time: a background thread reads the frames, the
+    replies queued, the notifications recorded. Once disconnected, or
+    a reply is not in time, the client is dead: its requests fail.
+    
+    :property: TIMEOUT: float: Seconds a reply is waited for.
+    :property: connection: socket.socket: To the server.
+    :property: pid: int: The process that connected: a fork reconnects.
+    :property: revision: int: The cached dataset's revision.
+    :property: latest: int: The server's revision, as last notified.
+    :property: dataset: pd.DataFrame | None: The cached dataset.
+    :property: changes: list[dict[str, Any]]: The notifications, unread.
+    :property: replies: queue.Queue: The replies, for the requests.
+    :property: lock: threading.Lock: One request at a time.
+    :property: reader: threading.Thread: Reads the frames.
+    :property: dead: bool: Disconnected: the next connect reconnects.
+    """
+    
+    TIMEOUT: float = 120.0
+    
+    connection: socket.socket
+    pid: int
+    revision: int
+    latest: int
+    dataset: pd.DataFrame | None
+    changes: list[dict[str, Any]]
+    replies: queue.Queue
+    lock: threading.Lock
+    reader: threading.Thread
+    dead: bool
+    
+    def __init__(self, path: str) -> None:
+        """Connects: then reads the server's frames, in the background.
+        
+        :param path: str: The server's socket
+        """
+        self.connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.connection.connect(path)
+        self.pid = os.getpid()
+        self.revision = Codec.NONE
+        self.latest = Codec.NONE
+        self.dataset = None
+        self.changes = []
+        self.replies = queue.Queue()
+        self.lock = threading.Lock()
+        self.dead = False
+        self.reader = threading.Thread(target=self.read, daemon=True,
+                                       name='dataserver-reader')
+        self.reader.start()
+    
+    def read(self) -> None:
+        """Reads the frames: notifications recorded, replies queued.
+        
+        :return: None
+        """
+        try:
+            while True:
+                op, status, revision, payload = Codec.read(self.connection)
+                if op == Codec.NOTIFY:
+                    self.latest = revision
+                    self.changes.append(json.loads(payload or b'{}'))
+                else:
+                    self.replies.put((op, status, revision, payload))
+        except (ConnectionError, OSError) as error:
+            self.dead = True
+            self.replies.put((0, Codec.ERROR, 0, str(error).encode()))
+    
+    def request(self, op: int, revision: int = 0,
+                payload: bytes = b'') -> tuple[int, int, bytes]:
+        """Sends a request: waits for its reply.
+        
+        A reply's revision never rewinds latest: a newer revision may
+        have been notified, by the reader, while the reply was queued.
+        
+        :param op: int: e.g. Codec.FETCH
+        :param revision: int: The session's revision, if it matters
+        :param payload: bytes: The request's body
+        :return: tuple[int, int, bytes]: The reply's status, revision,
+                 and payload
+        """
+        with self.lock:
+            if self.dead:
+                raise ConnectionError('Data server: disconnected')
+            self.connection.sendall(Codec.frame(op=op, revision=revision,
+                                                payload=payload))
+            try:
+                _, status, replied, body = self.replies.get(
+                    timeout=self.TIMEOUT)
+            except queue.Empty:
+                self.dead = True
+                self.close()
+                raise ConnectionError(
+                    f'Data server: no reply in {self.TIMEOUT:g}s') from None
+        if status == Codec.ERROR:
+            raise ConnectionError(f'Data server: {body.decode()}')
+        self.latest = max(self.latest, replied)
+        return status, replied, body
+    
+    def isfresh(self) -> bool:
+        """Checks if the cached dataset is the server's latest.
+        
+        :return: bool: True: no change was notified since it was fetched
+        """
+        return self.dataset is not None and self.revision == self.latest
+    
+    def fetch(self) -> pd.DataFrame:
+        """The dataset: the cached one, unless the server's has changed.
+        
+        A changed dataset is mapped from the server's published segment:
+        its revision is the segment's, which may be newer than the reply.
+        
+        :return: pd.DataFrame: The server's dataset
+        """
+        status, revision, payload = self.request(op=Codec.FETCH,
+                                                 revision=self.revision)
+        if status == Codec.MAPPED:
+            revision, view = Segment.map(path=payload.decode())
+            self.dataset = Codec.decode(payload=view)
+        elif status == Codec.OK:
+            self.dataset = Codec.decode(payload=payload)
+        self.revision = revision
+        self.latest = max(self.latest, revision)
+        self.changes = []
+        return self.dataset
+    
+    def patch(self, offset: int, values: dict[str, Any]) -> int:
+        """Sends a session's edit: the server notifies the others.
+        
+        The cached dataset is patched too, if it was the server's latest:
+        the session's own edit is not fetched back.
+        
+        :param offset: int: The row's offset
+        :param values: dict[str, Any]: Column to its new value
+        :return: int: The server's revision
+        """
+        current: bool = self.isfresh()
+        _, revision, _ = self.request(op=Codec.PATCH, payload=Codec.dumps(
+            {'offset': offset, 'values': values}))
+        if current and revision == self.revision + 1 \
+                and self.dataset is not None:
+            for column, value in values.items():
+                if column in self.dataset.columns:
+                    Segment.assign(frame=self.dataset, offset=offset,
+                                   column=column, value=value)
+            self.revision = revision
+        return revision
+    
+    def write(self, method: str, **args: Any) -> int:
+        """Sends a worksheet write: the server writes it to the sheet.
+        
+        :param method: str: update_cells, insert_row, or resize
+        :param args: Any: The method's arguments: as JSON
+        :return: int: The server's revision
+        """
+        _, revision, _ = self.request(op=Codec.WRITE, payload=Codec.dumps(
+            {'method': method, 'args': args}))
+        return revision
+    
+    def refresh(self) -> int:
+        """Asks the server to reload the sheet now.
+        
+        :return: int: The server's revision
+        """
+        _, revision, _ = self.request(op=Codec.REFRESH)
+        return revision
+    
+    def close(self) -> None:
+        """Closes the connection: the reader thread ends.
+        
+        :return: None
+        """
+        try:
+            self.connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.connection.close()
+        self.reader.join(timeout=1.0)
+
+
+class SharedWorksheet(LocalWorksheet):
+    """SharedWorksheet: The server's dataset, as the worksheet calls.
+    
+    Reads are the fetched dataset's; writes are sent to the server, which
+    writes them to the sheet, then notifies every session.
+    
+    :property: frame: pd.DataFrame: The fetched dataset: mapped.
+    :property: cells: list[list[str]] | None: The cells, as text: only
+               once asked for, e.g. by values_get, or a write.
+    """
+    
+    frame: pd.DataFrame
+    cells: list[list[str]] | None
+    
+    def __init__(self, title: str = '') -> None:  # pylint: disable=W0231
+        """Fetches the dataset: the cells, as text, are not copied yet.
+        
+        :param title: str: The tab's name
+        """
+        self.frame = self.server.fetch()
+        self.cells = None
+        self.path = pathlib.Path(SharedConnector.path())
+        self.title = title or Settings.TAB_NAME
+        self.id = 0
+        self.client = None
+        self.spreadsheet = LocalSpreadsheet(worksheet=self)
+    
+    @property
+    def values(self) -> list[list[str]]:  # type: ignore[override]
+        """The cells, as text: the header row first."""
+        if self.cells is None:
+            self.cells = [[str(name) for name in self.frame.columns]] + \
+                self.frame.astype(str).to_numpy().tolist()
+        return self.cells
+    
+    @values.setter
+    def values(self, cells: list[list[str]]) -> None:
+        """Sets the cells, e.g. resized."""
+        self.cells = cells
+    
+    @property
+    def server(self) -> 'DataClient':
+        """The process' connection: a forked process' own."""
+        return SharedConnector.connect()
+    
+    def get_all_records(self) -> list[dict[str, Any]]:
+        """The rows as records: the dataset's, already typed.
+        
+        :return: list[dict[str, Any]]: A record per row
+        """
+        return self.frame.to_dict(orient='records')
+    
+    def resize(self, rows: int | None = None,
+               cols: int | None = None) -> None:
+        """Resizes the sheet: by the server.
+        
+        :param rows: int | None: The rows wanted: None: unchanged
+        :param cols: int | None: The columns wanted: None: unchanged
+        :return: None
+        """
+        super().resize(rows=rows, cols=cols)
+        self.server.write(method='resize', rows=rows, cols=cols)
+    
+    def update_cells(self, cell_list: list[gspread.cell.Cell],
+                     value_input_option: str = 'RAW') -> dict:
+        """Updates the cells: by the server.
+        
+        :param cell_list: list[Cell]: 1 based rows and columns
+        :param value_input_option: str: e.g. RAW
+        :return: dict: The updated cells' count, as the Sheets API
+        """
+        updated: dict = super().update_cells(
+            cell_list=cell_list, value_input_option=value_input_option)
+        self.server.write(method='update_cells',
+                          cells=[[cell.row, cell.col, cell.value]
+                                 for cell in cell_list],
+                          value_input_option=value_input_option)
+        return updated
+    
+    def insert_row(self, values: list[Any], index: int = 1) -> None:
+        """Inserts a row, before the 1 based row index: by the server.
+        
+        :param values: list[Any]: The row's values
+        :param index: int: The 1 based row to insert before
+        :return: None
+        """
+        super().insert_row(values=values, index=index)
+        self.server.write(method='insert_row', values=values, index=index)
+    
+    def save(self) -> None:
+        """No file: the writes are the server's.
+        
+        :return: None
+        """
+
+
+class SharedConnector:
+    """SharedConnector: Selects, and opens, the server's shared dataset.
+    
+    :property: client: DataClient | None: This process' connection.
+    :property: closed: DataClient | None: The last connection closed: its
+               dataset, and revision, seed the next connection's.
+    """
+    
+    client: DataClient | None = None
+    closed: DataClient | None = None
+    
+    @staticmethod
+    def path() -> str:
+        """The server's socket: PYCRITERIA_DATASERVER, else ''.
+        
+        :return: str: The path: '' is no server
+        """
+        return os.environ.get(Settings.Backend.SHARED, '')
+    
+    @classmethod
+    def isshared(cls) -> bool:
+        """Checks if the data server is selected: its socket is there.
+        
+        A stale socket, no server listening, is found by connecting:
+        Controller.load_wsheet then loads the backend, as before.
+        
+        :return: bool: True: the dataset is the server's
+        """
+        path: str = cls.path()
+        return bool(path) and os.path.exists(path)
+    
+    @classmethod
+    def connect(cls) -> DataClient:
+        """This process' connection: a forked process connects anew.
+        
+        A fork keeps its parent's dataset, and its revision: the first
+        fetch is then unchanged, if the parent's was the latest. So does
+        a process reconnecting, after close, or once its client is dead.
+        
+        :return: DataClient: The connection
+        """
+        if cls.client is not None and cls.client.pid == os.getpid() \
+                and not cls.client.dead:
+            return cls.client
+        parent: DataClient | None = cls.client or cls.closed
+        cls.client = DataClient(path=cls.path())
+        cls.closed = None
+        if parent is not None:
+            parent.connection.close()  # The parent's: not shut down
+            cls.client.dataset = parent.dataset
+            cls.client.revision = parent.revision
+        return cls.client
+    
+    @classmethod
+    def open_sheet(cls) -> SharedWorksheet:
+        """Opens the shared worksheet: the server's dataset.
+        
+        :return: SharedWorksheet: Fetched, unless cached and current
+        """
+        return SharedWorksheet()
+    
+    @classmethod
+    def close(cls) -> None:
+        """Closes this process' connection: e.g. before a fork.
+        
+        Its reader thread ends: its dataset is kept, for the next.
+        
+        :return: None
+        """
+        if cls.client is not None and cls.client.pid == os.getpid():
+            cls.client.close()
+            cls.closed = cls.client
+        cls.client = None
+
+
+class DataServer:
+    """DataServer: The daemon: one dataset, one connection, every session.
+    
+    :property: IDLE: float: Seconds between polls of the sheet.
+    :property: ALL: int: A notification's offset: the whole dataset.
+    :property: FIRST: int: The sheet's 1 based row of the dataset's first
+               row, offset 0: below the header.
+    :property: path: str: The socket's path.
+    :property: listener: socket.socket | None: Listening, once warm.
+    :property: selector: selectors.BaseSelector: The listener, sessions.
+    :property: sessions: set[socket.socket]: The sessions connected.
+    :property: data: Any: The DataController: the dataset, its revision.
+    :property: encoded: tuple[int, bytes] | None: The dataset, encoded,
+               and its revision: encoded once, sent to every session.
+    :property: segment: str: The published segment's path.
+    :property: published: int | None: The revision published, if any.
+    :property: pending: dict[int, dict[str, Any]]: The sessions' patches,
+               not yet saved: row offset, to column, to value. Kept
+               across reloads: until a write saves their cells.
+    :property: counts: dict[str, int]: Requests served, notifications,
+               reloads, and reloads failed.
+    :property: running: bool: Until SIGTERM, or SIGINT.
+    :property: verbose: bool: Logs each request.
+    """
+    
+    IDLE: float = 1.0
+    ALL: int = -1
+    FIRST: int = 2
+    
+    path: str
+    listener: socket.socket | None
+    selector: selectors.BaseSelector
+    sessions: set[socket.socket]
+    data: Any
+    encoded: tuple[int, bytes] | None
+    segment: str
+    published: int | None
+    pending: dict[int, dict[str, Any]]
+    counts: dict[str, int]
+    running: bool
+    verbose: bool
+    
+    def __init__(self, path: str, verbose: bool = False) -> None:
+        """Starts cold: the sheet is loaded by warm.
+        
+        :param path: str: The socket's path
+        :param verbose: bool: Logs each request
+        """
+        self.path = path
+        self.listener = None
+        self.selector = selectors.DefaultSelector()
+        self.sessions = set()
+        self.data = None
+        self.encoded = None
+        self.segment = os.path.join(
+            Segment.directory(), f'{pathlib.Path(path).stem}.segment')
+        self.published = None
+        self.pending = {}
+        self.counts = {'fetched': 0, 'unchanged': 0, 'patched': 0,
+                       'written': 0, 'reloaded': 0, 'notified': 0,
+                       'failed': 0}
+        self.running = False
+        self.verbose = verbose
+    
+    def warm(self) -> float:
+        """Loads the sheet: by the backend selected, not by a server.
+        
+        :return: float: The seconds taken
+        """
+        start: float = time.perf_counter()
+        os.environ.pop(Settings.Backend.SHARED, None)
+        import controller  # pylint: disable=import-outside-toplevel
+        self.data = controller.DataController(
+            controller.Controller.load_wsheet())
+        self.publish()
+        return time.perf_counter() - start
+    
+    def dataset(self) -> bytes:
+        """The dataset, encoded: once per revision.
+        
+        :return: bytes: The encoded dataset
+        """
+        if self.encoded is None or self.encoded[0] != self.data.revision:
+            self.encoded = (self.data.revision,
+                            Codec.encode(frame=self.data.dataframe))
+        return self.encoded[1]
+    
+    def publish(self) -> bool:
+        """Publishes the dataset's revision: once: for the sessions to map.
+        
+        :return: bool: True if published: False: no shared memory left
+        """
+        if self.published == self.data.revision:
+            return True
+        try:
+            Segment.publish(path=self.segment, revision=self.data.revision,
+                            payload=self.dataset())
+        except OSError as error:
+            click.echo(f'DataServer: not published: {error}', err=True)
+            Segment.remove(path=self.segment)
+            self.published = None
+            return False
+        self.published = self.data.revision
+        return True
+    
+    def fetch(self) -> bytes:
+        """A fetch's reply: the segment's path: else the dataset itself.
+        
+        :return: bytes: The reply's frame
+        """
+        if self.publish():
+            return Codec.frame(op=Codec.FETCH, status=Codec.MAPPED,
+                               revision=self.data.revision,
+                               payload=self.segment.encode())
+        return Codec.frame(op=Codec.FETCH, revision=self.data.revision,
+                           payload=self.dataset())
+    
+    def reload(self) -> bool:
+        """Reloads the sheet: notifies the sessions, if it changed.
+        
+        The unsaved patches are applied to the sheet's data, before it
+        is swapped in: a reload neither loses, nor renotifies, them.
+        
+        :return: bool: True if the dataset changed
+        """
+        import controller  # pylint: disable=import-outside-toplevel
+        wsheet: Any = controller.Controller.load_wsheet()
+        frame: pd.DataFrame | None = \
+            controller.DataController.load_dataframe_wsheet(wsheet=wsheet)
+        self.data.fetched = time.monotonic()
+        self.counts['reloaded'] += 1
+        if frame is None:
+            return False
+        self.data.wsheet = wsheet
+        self.unsaved(frame=frame)
+        before: int = self.data.revision
+        self.data.refresh(dataframe=frame)
+        if self.data.revision == before:
+            return False
+        self.notify(change={'offset': self.ALL, 'columns': []})
+        return True
+    
+    def poll(self) -> bool:
+        """Reloads the sheet, once its time to live ends: never raises.
+        
+        A failed reload, e.g. the network, or the sheet's quota, is
+        logged: the current revision is served, and the sheet is
+        retried at the next time to live.
+        
+        :return: bool: True if the dataset changed
+        """
+        try:
+            return self.reload()
+        except Exception as error:  # pylint: disable=broad-except
+            self.data.fetched = time.monotonic()
+            self.counts['failed'] += 1
+            click.echo(f'DataServer: reload failed: {error!r}', err=True)
+            return False
+    
+    def unsaved(self, frame: pd.DataFrame) -> None:
+        """Applies the pending patches to a reloaded frame.
+        
+        A patch to a row, or a column, the sheet no longer has is dropped.
+        
+        :param frame: pd.DataFrame: The sheet's data, as reloaded
+        :return: None
+        """
+        for offset, values in list(self.pending.items()):
+            kept: dict[str, Any] = {column: value
+                                    for column, value in values.items()
+                                    if column in frame.columns}
+            if not kept or offset >= len(frame):
+                del self.pending[offset]
+                continue
+            self.pending[offset] = kept
+            for column, value in kept.items():
+                Segment.assign(frame=frame, offset=offset, column=column,
+                               value=value)
+    
+    def saved(self, request: dict[str, Any]) -> None:
+        """Drops the pending patches a write saves: moves the rest.
+        
+        :param request: dict[str, Any]: method, args: as write's
+        :return: None
+        """
+        args: dict[str, Any] = request['args']
+        if request['method'] == 'update_cells':
+            columns: list[str] = list(self.data.dataframe.columns)
+            for row, col, _ in args['cells']:
+                values: dict[str, Any] | None = \
+                    self.pending.get(row - self.FIRST)
+                if values is not None and 0 < col <= len(columns):
+                    values.pop(columns[col - 1], None)
+        elif request['method'] == 'insert_row':
+            inserted: int = args['index'] - self.FIRST
+            self.pending = {offset + int(offset >= inserted): values
+                            for offset, values in self.pending.items()}
+        elif request['method'] == 'resize' and args.get('rows') is not None:
+            self.pending = {offset: values
+                            for offset, values in self.pending.items()
+                            if offset < args['rows'] - self.FIRST + 1}
+        self.pending = {offset: values
+                        for offset, values in self.pending.items() if values}
+    
+    def listen(self) -> None:
+        """Listens on the socket: a stale one, from a crash, is replaced.
+        
+        Bound, and listening, before it is renamed into place: a session
+        that finds the socket can connect.
+        
+        :return: None
+        """
+        binding: str = f'{self.path}.binding'
+        try:
+            os.unlink(binding)
+        except FileNotFoundError:
+            pass
+        listener: socket.socket = socket.socket(socket.AF_UNIX,
+                                                socket.SOCK_STREAM)
+        listener.bind(binding)
+        os.chmod(binding, 0o600)
+        listener.listen()
+        os.replace(binding, self.path)
+        self.selector.register(listener, selectors.EVENT_READ)
+        self.listener = listener
+    
+    def serve(self) -> None:
+        """Serves until SIGTERM, or SIGINT: requests, and polls the sheet.
+        
+        :return: None
+        """
+        import controller  # pylint: disable=import-outside-toplevel
+        ttl: float = controller.configuration.Cache.DATA_TTL
+        self.running = True
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        try:
+            while self.running:
+                for key, _ in self.selector.select(timeout=self.IDLE):
+                    if key.fileobj is self.listener:
+                        self.accept()
+                    else:
+                        self.handle(session=key.fileobj)
+                if not self.data.isfresh(ttl=ttl):
+                    self.poll()
+        finally:
+            self.close()
+    
+    def stop(self, *_args: Any) -> None:
+        """Stops serving: the loop ends after its select.
+        
+        :return: None
+        """
+        self.running = False
+    
+    def accept(self) -> None:
+        """Accepts a session.
+        
+        :return: None
+        """
+        session: socket.socket
+        session, _ = self.listener.accept()  # type: ignore[union-attr]
+        self.sessions.add(session)
+        self.selector.register(session, selectors.EVENT_READ)
+    
+    def drop(self, session: socket.socket) -> None:
+        """Drops a session: it closed, or failed.
+        
+        :param session: socket.socket: The session's connection
+        :return: None
+        """
+        self.sessions.discard(session)
+        try:
+            self.selector.unregister(session)
+        except (KeyError, ValueError):
+            pass
+        session.close()
+    
+    def handle(self, session: socket.socket) -> None:
+        """Handles a session's request: replies, then notifies the rest.
+        
+        :param session: socket.socket: The session's connection
+        :return: None
+        """
+        try:
+            op, _, revision, payload = Codec.read(session)
+        except (ConnectionError, OSError):
+            self.drop(session=session)
+            return
+        change: dict[str, Any] | None = None
+        try:
+            if op == Codec.FETCH and revision == self.data.revision:
+                self.counts['unchanged'] += 1
+                reply: bytes = Codec.frame(op=op, status=Codec.UNCHANGED,
+                                           revision=self.data.revision)
+            elif op == Codec.FETCH:
+                self.counts['fetched'] += 1
+                reply = self.fetch()
+            elif op == Codec.PATCH:
+                change = self.patch(request=json.loads(payload))
+                reply = Codec.frame(op=op, revision=self.data.revision)
+            elif op == Codec.WRITE:
+                self.write(request=json.loads(payload))
+                reply = Codec.frame(op=op, revision=self.data.revision)
+            elif op == Codec.REFRESH:
+                self.reload()
+                reply = Codec.frame(op=op, revision=self.data.revision)
+            else:
+                raise ValueError(f'Unknown op: {op}')
+        except Exception as error:  # pylint: disable=broad-except
+            reply = Codec.frame(op=op, status=Codec.ERROR,
+                                payload=str(error).encode())
+        if self.verbose:
+            click.echo(f'DataServer: op {op}: revision '
+                       f'{self.data.revision}', err=True)
+        try:
+            session.sendall(reply)
+        except OSError:
+            self.drop(session=session)
+        if change is not None:
+            self.notify(change=change, skip=session)
+    
+    def patch(self, request: dict[str, Any]) -> dict[str, Any] | None:
+        """Patches a session's edit into the dataset: pending, unsaved.
+        
+        :param request: dict[str, Any]: offset, values
+        :return: dict[str, Any] | None: The change: None, if none changed
+        """
+        changed: list[str] = self.data.patch(offset=request['offset'],
+                                             values=request['values'])
+        self.counts['patched'] += 1
+        if not changed:
+            return None
+        self.pending.setdefault(request['offset'], {}).update(
+            {column: request['values'][column] for column in changed})
+        return {'offset': request['offset'], 'columns': changed}
+    
+    def write(self, request: dict[str, Any]) -> None:
+        """Writes a session's worksheet write to the sheet: then reloads.
+        
+        The patches to the cells written are saved: no longer pending.
+        
+        :param request: dict[str, Any]: method, args
+        :return: None
+        """
+        args: dict[str, Any] = request['args']
+        wsheet: Any = self.data.wsheet
+        if request['method'] == 'update_cells':
+            wsheet.update_cells(
+                [gspread.cell.Cell(row=row, col=col, value=value)
+                 for row, col, value in args['cells']],
+                value_input_option=args.get('value_input_option', 'RAW'))
+        elif request['method'] == 'insert_row':
+            wsheet.insert_row(args['values'], index=args['index'])
+        elif request['method'] == 'resize':
+            wsheet.resize(rows=args['rows'], cols=args['cols'])
+        else:
+            raise ValueError(f"Unknown write: {request['method']}")
+        self.counts['written'] += 1
+        self.saved(request=request)
+        self.reload()
+    
+    def notify(self, change: dict[str, Any],
+               skip: socket.socket | None = None) -> None:
+        """Pushes a change to the sessions: but the one that made it.
+        
+        :param change: dict[str, Any]: offset, columns
+        :param skip: socket.socket | None: The session that made it
+        :return: None
+        """
+        message: bytes = Codec.frame(op=Codec.NOTIFY,
+                                     revision=self.data.revision,
+                                     payload=Codec.dumps(change))
+        for session in list(self.sessions):
+            if session is skip:
+                continue
+            try:
+                session.sendall(message)
+                self.counts['notified'] += 1
+            except OSError:
+                self.drop(session=session)
+    
+    def close(self) -> None:
+        """Closes the sessions: stops listening: removes the socket, segment.
+        
+        :return: None
+        """
+        for session in list(self.sessions):
+            self.drop(session=session)
+        if self.listener is not None:
+            self.selector.unregister(self.listener)
+            self.listener.close()
+            self.listener = None
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+        Segment.remove(path=self.segment)
+        self.selector.close()
+
+
+@click.command(name='dataserver')
+@click.option('--socket', 'path', type=click.Path(dir_okay=False),
+              default=lambda: os.environ.get(
+                  Settings.Backend.SHARED, os.path.join(
+                      tempfile.gettempdir(), 'pycriteria-data.sock')),
+              show_default='PYCRITERIA_DATASERVER, else in the temp dir',
+              help='The Unix socket the sessions connect to.')
+@click.option('--verbose', 'verbose', is_flag=True, default=False,
+              help='Logs each request.')
+def main(path: str, verbose: bool) -> None:
+    """DataServer: one dataset, one connection, for every session."""
+    server: DataServer = DataServer(path=path, verbose=verbose)
+    took: float = server.warm()
+    server.listen()
+    click.echo(f'DataServer: {len(server.data.dataframe)} rows in '
+               f'{took:.2f}s: listening on {path}', err=True)
+    sys.stderr.flush()
+    server.serve()
+
+
+if __name__ == '__main__':
+    main()
+
+# End of DataServer Module
@@ -0,0 +1,165 @@
+#!/user/bin/env python3
+# pylint: disable=trailing-whitespace
+# ruff: noqa: ANN101, I001
+# noqa: W293 blank line contains whitespace
+"""Module: Exports: Machine readable, streamed, outputs of the data.
+
+Usage:
+-------------------------
+- Exporter: Writes a view's columns as CSV, TSV or JSON Lines, to stdout,
+            from the frame's columnar data, chunk by chunk: no rich table,
+            no cell measuring, so hundreds of thousands of rows pipe into
+            other tools. e.g. run load todo -selects All --format csv
+            - table: the default, is the rich table, as before.
+            - csv, tsv: a header line, then a line per row.
+            - jsonl: a JSON object per row, per line.
+            - Views of several tables, e.g. stats, stream one long table:
+              Table, Row, Column, Value: one header, one schema.
+
+Linting:
+-------------------------
+- pylint: disable=trailing-whitespace
+- ruff: noqa:
+      I001:     unsorted-imports
+                Import block is unsorted or unformatted
+      ANN101:   missing-type-self
+                Missing type annotation for {name} in method
+- noqa: W293
+
+Critieria:
+LO2.2: Clearly separate and identify code written for the application and
+       the code from external sources (e.g. libraries or tutorials)
+LO2.2.3: Clearly separate code from external sources
+LO2.2.4: Clearly identify code from external sources
+LO6: Use library software for building a graphical user interface,
+or command-line interface, or web application, or mathematical software
+LO6.1 Implement the use of external Python libraries
+LO6.1.1 Implement the use of external Python libraries
+      where appropriate to provide the functionality that the project requires.
+-------------------------
+Standard Libraries
+:imports: typing
+
+3rd Paty Imports
+:imports: click, pandas
+
+Custom Authored Libraries
+:imports: None
+
+:class: Exporter: Streams a view of a frame as CSV, TSV or JSON Lines.
+"""
+# 0.1 Standard Library Imports
+from typing import Callable
+
+# 0.2 Third Party Modules
+import click  # type: ignore
+import pandas as pd  # type: ignore
+
+
+class Exporter:
+    """Exporter: Streams a view's columns, a chunk of rows at a time.
+    
+    Each chunk is written by pandas' own writers, to_csv and to_json,
+    straight from the columns: memory is bounded by the chunk size.
+    
+    :property: TABLE: str: The rich table format: not streamed here.
+    :property: FORMATS: list[str]: The output formats, table first.
+    :property: CHUNK: int: The rows written per chunk.
+    :property: LONGFORM: list[str]: The columns of stacked tables.
+    """
+    
+    TABLE: str = 'table'
+    FORMATS: list[str] = [TABLE, 'csv', 'tsv', 'jsonl']
+    CHUNK: int = 10_000
+    LONGFORM: list[str] = ['Table', 'Row', 'Column', 'Value']
+    
+    @staticmethod
+    def ismachine(form: str) -> bool:
+        """Checks if the format is machine readable, i.e. not the table.
+        
+        :param form: str: The output format
+        :return: bool: True for csv, tsv, jsonl
+        """
+        return form.lower() != Exporter.TABLE
+    
+    @staticmethod
+    def delimited(separator: str) -> Callable[[pd.DataFrame, bool], str]:
+        """A writer of delimited lines: CSV or TSV.
+        
+        :param separator: str: The field separator
+        :return: Callable: chunk, first -> the chunk's lines
+        """
+        def writer(chunk: pd.DataFrame, first: bool) -> str:
+            """Writes the chunk's lines: the header line, if first."""
+            return chunk.to_csv(sep=separator,
+                                header=first,
+                                index=False,
+                                lineterminator='\n')
+        
+        return writer
+    
+    @staticmethod
+    def jsonlines(chunk: pd.DataFrame, _first: bool) -> str:
+        """Writes the chunk's JSON objects, a line per row.
+        
+        :param chunk: pd.DataFrame: The chunk's rows
+        :param _first: bool: Unused: JSON Lines has no header
+        :return: str: The chunk's lines
+        """
+        lines: str = chunk.to_json(orient='records',
+                                   lines=True,
+                                   force_ascii=False)
+        return lines if not lines or lines.endswith('\n') \
+            else f'{lines}\n'
+    
+    @staticmethod
+    def longform(tables: list[tuple[str, pd.DataFrame]]) -> pd.DataFrame:
+        """Stacks titled tables into one: a stream has one header, schema.
+        
+        Each table's first column labels its rows: its other columns are
+        melted, a line per cell: Table, Row, Column, Value.
+        
+        :param tables: list[tuple[str, pd.DataFrame]]: Title, and table
+        :return: pd.DataFrame: The long form: the LONGFORM columns
+        """
+        stacked: list[pd.DataFrame] = []
+        for title, table in tables:
+            label: str = table.columns[0]
+            melted: pd.DataFrame = table.melt(
+                id_vars=[label], var_name='Column', value_name='Value')
+            melted = melted.rename(columns={label: 'Row'})
+            melted.insert(0, 'Table', title)
+            stacked.append(melted[Exporter.LONGFORM])
+        if not stacked:
+            return pd.DataFrame(columns=Exporter.LONGFORM)
+        return pd.concat(stacked, ignore_index=True)
+    
+    @staticmethod
+    def stream(frame: pd.DataFrame,
+               headers: list[str],
+               form: str,
+               chunk: int = CHUNK) -> int:
+        """Streams the view, the frame's headers, in the format, to stdout.
+        
+        :param frame: pd.DataFrame: The data
+        :param headers: list[str]: The view's columns, in order
+        :param form: str: csv, tsv or jsonl
+        :param chunk: int: The rows per chunk
+        :return: int: The rows written
+        """
+        writers: dict[str, Callable[[pd.DataFrame, bool], str]] = {
+            'csv': Exporter.delimited(separator=','),
+            'tsv': Exporter.delimited(separator='\t'),
+            'jsonl': Exporter.jsonlines}
+        writer: Callable[[pd.DataFrame, bool], str] = writers[form.lower()]
+        columns: list[str] = [header for header in headers
+                              if header in frame.columns]
+        size: int = max(chunk, 1)
+        for start in range(0, max(len(frame), 1), size):
+            click.echo(message=writer(frame.iloc[start:start + size,
+                                      frame.columns.get_indexer(columns)],
+                                      start == 0),
+                       nl=False)
+        return len(frame)
+
+# End of Exports Module
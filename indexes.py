@@ -0,0 +1,549 @@
+#!/user/bin/env python3
+# pylint: disable=trailing-whitespace
+# ruff: noqa: ANN101, I001
+# noqa: W293 blank line contains whitespace
+"""Module: Indexes: In memory search indexes over the loaded dataset.
+
+Usage:
+-------------------------
+- FuzzyIndex: Typo tolerant lookup over the criteria text.
+              Character n-grams prune the candidate rows first,
+              then only those candidates are scored by edit distance.
+- CategoryIndex: Multi-valued, semicolon delimited, categories exploded
+              into one row bitmap per category: Topics and Groups.
+- RecordIndex: Constant time lookup of a record's row, by its keys:
+              Position and CriteriaRef, whatever the rows' order.
+
+Each index keeps the data stamp (DataController.stamp) it was built at,
+over its COLUMNS: it is rebuilt only when those columns' data changes.
+
+Linting:
+-------------------------
+- pylint: disable=trailing-whitespace
+- ruff: noqa:
+      I001:     unsorted-imports
+                Import block is unsorted or unformatted
+      ANN101:   missing-type-self
+                Missing type annotation for {name} in method
+- noqa: W293
+
+Critieria:
+LO2.2: Clearly separate and identify code written for the application and
+       the code from external sources (e.g. libraries or tutorials)
+LO2.2.3: Clearly separate code from external sources
+LO2.2.4: Clearly identify code from external sources
+LO6: Use library software for building a graphical user interface,
+or command-line interface, or web application, or mathematical software
+LO6.1 Implement the use of external Python libraries
+LO6.1.1 Implement the use of external Python libraries
+      where appropriate to provide the functionality that the project requires.
+-------------------------
+Standard Libraries
+:imports: dataclasses
+
+3rd Paty Imports
+:imports: numpy, pandas
+
+Custom Authored Libraries
+:imports: modelview.ColumnSchema
+
+:class: Match: A scored search result.
+:class: FuzzyIndex: Character n-gram index with edit distance scoring.
+:class: CategoryIndex: Category to rows bitmaps, for CriteriaTopic & Group.
+:class: RecordIndex: Position & CriteriaRef to row offsets.
+"""
+# 0.1 Standard Library Imports
+import dataclasses
+
+# 0.2 Third Party Modules
+import numpy as np
+import pandas as pd  # type: ignore
+
+# 0.3 Local imports
+from modelview import ColumnSchema
+
+
+@dataclasses.dataclass(frozen=True)
+class Match:
+    """A scored search result.
+    
+    :property: offset: int: The row offset in the indexed dataframe.
+    :property: position: int: The Position (row id) of the record.
+    :property: distance: int: Edits needed to match the query in the text.
+    :property: score: float: 1.0 is an exact match, 0.0 is no match.
+    """
+    offset: int
+    position: int
+    distance: int
+    score: float
+
+
+class FuzzyIndex:
+    """Fuzzy Index: Typo tolerant search over the criteria text.
+    
+    Build once per dataset: each row's text is split into character
+    n-grams (trigrams), and each n-gram keeps a posting array of the rows
+    that contain it. A query is answered in two steps:
+    1. Pruning: count the shared n-grams per row, with np.bincount over
+       the query's posting arrays, and keep the best candidate rows.
+    2. Scoring: the candidates only are scored by the approximate
+       substring edit distance (Myers' bit-parallel algorithm).
+    
+    :property: CANDIDATES: int: The most rows scored by edit distance.
+    :property: COLUMNS: list[str]: The columns the default index is of.
+    :property: columns: list[str]: The text columns indexed.
+    :property: source: pd.DataFrame: The indexed dataframe.
+    :property: stamp: int: The data stamp the index was built at.
+    :property: texts: list[str]: The normalised text per row.
+    :property: positions: np.ndarray: The Position value per row.
+    :property: postings: dict[int, np.ndarray]: trigram key to rows.
+    """
+    
+    CANDIDATES: int = 40
+    COLUMNS: list[str] = [ColumnSchema.Position,
+                          ColumnSchema.Topic, ColumnSchema.Criteria]
+    columns: list[str]
+    source: pd.DataFrame
+    stamp: int
+    texts: list[str]
+    positions: np.ndarray
+    postings: dict[int, np.ndarray]
+    
+    def __init__(self,
+                 frame: pd.DataFrame,
+                 columns: list[str] | None = None,
+                 stamp: int = 0) -> None:
+        """Builds the n-gram postings for the frame's text columns.
+        
+        :param frame: pd.DataFrame: The dataset to index.
+        :param columns: list[str]: The text columns to index,
+               Default: CriteriaTopic and Criteria.
+        :param stamp: int: The data stamp of the indexed columns.
+        """
+        self.columns = [ColumnSchema.Topic, ColumnSchema.Criteria] \
+            if columns is None else columns
+        self.source = frame
+        self.stamp = stamp
+        self.texts = self.normalise(frame, self.columns)
+        self.positions = frame[ColumnSchema.Position].to_numpy()
+        self.postings = self.build(self.texts)
+    
+    def __len__(self) -> int:
+        """The number of rows indexed."""
+        return len(self.texts)
+    
+    @staticmethod
+    def normalise(frame: pd.DataFrame, columns: list[str]) -> list[str]:
+        """Joins and folds the text columns, per row, for matching.
+        
+        :param frame: pd.DataFrame: The dataset to index.
+        :param columns: list[str]: The text columns to join.
+        :return: list[str]: One casefolded, single spaced text per row.
+        """
+        present: list[pd.Series] = [frame[column].fillna('').astype(str)
+                                    for column in columns
+                                    if column in frame.columns]
+        if not present:
+            return [''] * len(frame)
+        joined: pd.Series = present[0].str.cat(present[1:], sep=' ') \
+            if len(present) > 1 else present[0]
+        folded: pd.Series = joined.str.casefold() \
+            .str.replace(r'\s+', ' ', regex=True).str.strip()
+        return folded.tolist()
+    
+    @staticmethod
+    def grams(text: str) -> set[int]:
+        """Splits the text into its padded character trigrams, as int keys.
+        
+        Each trigram is packed into one int: 21 bits per code point.
+        
+        :param text: str: The normalised text.
+        :return: set[int]: The distinct trigram keys.
+        """
+        padded: str = f' {text} '
+        return {ord(padded[i]) << 42 | ord(padded[i + 1]) << 21
+                | ord(padded[i + 2]) for i in range(len(padded) - 2)}
+    
+    @staticmethod
+    def build(texts: list[str]) -> dict[int, np.ndarray]:
+        """Builds the posting arrays: trigram key to the rows containing it.
+        
+        Vectorised: all rows' code points are packed into (trigram, row)
+        pairs at once, then sorted, deduplicated and split by trigram.
+        The code points are first remapped to a dense alphabet, so that
+        a pair fits in one int64, and a plain value sort is enough.
+        
+        :param texts: list[str]: The normalised text per row.
+        :return: dict[int, np.ndarray]: Sorted row offsets per trigram key.
+        """
+        padded: list[str] = [f' {text} ' for text in texts]
+        codes: np.ndarray = np.frombuffer(''.join(padded).encode('utf-32-le'),
+                                          dtype=np.uint32)
+        span: int = len(codes) - 2
+        if span <= 0:
+            return {}
+        lengths: np.ndarray = np.fromiter(map(len, padded), dtype=np.int64,
+                                          count=len(padded))
+        owners: np.ndarray = np.repeat(np.arange(len(padded)), lengths)
+        # Dense alphabet: code point to 0..letters-1
+        alphabet: np.ndarray = np.flatnonzero(np.bincount(codes))
+        letters: int = len(alphabet)
+        dense: np.ndarray = np.searchsorted(alphabet, codes).astype(np.int64)
+        trigrams: np.ndarray = (dense[:span] * letters
+                                + dense[1:span + 1]) * letters \
+            + dense[2:span + 2]
+        # Drop the trigrams which straddle two rows
+        within: np.ndarray = owners[:span] == owners[2:span + 2]
+        pairs: np.ndarray = trigrams[within] * len(padded) \
+            + owners[:span][within]
+        pairs.sort()
+        pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))]
+        trigrams, rows = np.divmod(pairs, len(padded))
+        bounds: np.ndarray = np.flatnonzero(trigrams[1:] != trigrams[:-1]) + 1
+        starts: np.ndarray = np.concatenate(([0], bounds))
+        # Back from the dense alphabet to the code point packed keys
+        first, rest = np.divmod(trigrams[starts], letters * letters)
+        second, third = np.divmod(rest, letters)
+        keys: np.ndarray = alphabet[first].astype(np.int64) << 42 \
+            | alphabet[second].astype(np.int64) << 21 \
+            | alphabet[third].astype(np.int64)
+        return dict(zip(keys.tolist(),
+                        np.split(rows.astype(np.int32), bounds)))
+    
+    def candidates(self, query: str) -> np.ndarray:
+        """Prunes the rows to the best candidates by shared n-grams.
+        
+        :param query: str: The normalised query.
+        :return: np.ndarray: Candidate row offsets, most shared first.
+        """
+        lists: list[np.ndarray] = [self.postings[gram]
+                                   for gram in self.grams(query)
+                                   if gram in self.postings]
+        if not lists:
+            return np.empty(0, dtype=np.int32)
+        counts: np.ndarray = np.bincount(np.concatenate(lists),
+                                         minlength=len(self.texts))
+        # A third of the query's n-grams must be shared to be a candidate
+        # A single typo removes up to three trigrams from a short query.
+        floor: int = max(1, len(lists) // 3)
+        rows: np.ndarray = np.flatnonzero(counts >= floor)
+        if len(rows) > self.CANDIDATES:
+            best = np.argpartition(-counts[rows], self.CANDIDATES - 1)
+            rows = rows[best[:self.CANDIDATES]]
+        return rows[np.argsort(-counts[rows], kind='stable')]
+    
+    @staticmethod
+    def distance(pattern: str, text: str) -> int:
+        """The fewest edits to find the pattern anywhere in the text.
+        
+        Myers' (1999) bit-parallel approximate string matching, in the
+        search form: where a match may start and end anywhere in the text.
+        One pass over the text, with Python's ints as the bit vectors.
+        
+        :param pattern: str: The query.
+        :param text: str: The row's text.
+        :return: int: The edit distance of the best substring match.
+        """
+        size: int = len(pattern)
+        if size == 0:
+            return 0
+        peq: dict[str, int] = {}
+        for bit, char in enumerate(pattern):
+            peq[char] = peq.get(char, 0) | (1 << bit)
+        mask: int = (1 << size) - 1
+        last: int = 1 << (size - 1)
+        pv: int = mask
+        mv: int = 0
+        score: int = size
+        best: int = size
+        for char in text:
+            eq: int = peq.get(char, 0)
+            xv: int = eq | mv
+            xh: int = ((((eq & pv) + pv) & mask) ^ pv) | eq
+            ph: int = (mv | ~(xh | pv)) & mask
+            mh: int = pv & xh
+            if ph & last:
+                score += 1
+            elif mh & last:
+                score -= 1
+            ph = (ph << 1) & mask
+            mh = (mh << 1) & mask
+            pv = (mh | ~(xv | ph)) & mask
+            mv = ph & xv
+            best = min(best, score)
+        return best
+    
+    def search(self, query: str, limit: int = 10) -> list[Match]:
+        """Finds the rows best matching the query, allowing typos.
+        
+        :param query: str: The text to look up.
+        :param limit: int: The most results to return.
+        :return: list[Match]: Best match first. Empty if nothing matched.
+        """
+        pattern: str = ' '.join(query.casefold().split())
+        if not pattern:
+            return []
+        matches: list[Match] = []
+        scored: dict[str, int] = {}
+        for row in self.candidates(pattern).tolist():
+            text: str = self.texts[row]
+            if text not in scored:
+                scored[text] = self.distance(pattern, text)
+            edits: int = scored[text]
+            score: float = round(1 - edits / len(pattern), 3)
+            if score > 0:
+                matches.append(Match(offset=row,
+                                     position=int(self.positions[row]),
+                                     distance=edits,
+                                     score=score))
+        matches.sort(key=lambda match: (match.distance, match.offset))
+        return matches[:limit]
+
+
+class CategoryIndex:
+    """Category Index: Exploded multi-valued categories to row bitmaps.
+    
+    CriteriaTopic is multi-valued: semicolon delimited, with inconsistent
+    spacing, e.g. 'Program Build; Data Validation', 'Program Design;Code
+    Style Standards'. Built once per dataset: each column is split,
+    trimmed and folded into its distinct categories, and each category
+    keeps a boolean bitmap of the rows tagged with it.
+    Queries are bitmap operations: & for all of, | for any of.
+    
+    :property: SEPARATOR: str: The multi-value delimiter.
+    :property: COLUMNS: list[str]: The columns the default index is of.
+    :property: source: pd.DataFrame: The indexed dataframe.
+    :property: stamp: int: The data stamp the index was built at.
+    :property: labels: dict[str, list[str]]: Column to its categories.
+    :property: keys: dict[str, dict[str, int]]: Column to folded category
+               to its bitmap's row in the column's matrix.
+    :property: bitmaps: dict[str, np.ndarray]: Column to its bool matrix,
+               shape: (categories, rows).
+    """
+    
+    SEPARATOR: str = ';'
+    COLUMNS: list[str] = [ColumnSchema.Topic, ColumnSchema.Group]
+    source: pd.DataFrame
+    stamp: int
+    labels: dict[str, list[str]]
+    keys: dict[str, dict[str, int]]
+    bitmaps: dict[str, np.ndarray]
+    
+    def __init__(self,
+                 frame: pd.DataFrame,
+                 columns: list[str] | None = None,
+                 stamp: int = 0) -> None:
+        """Explodes the category columns into per category bitmaps.
+        
+        :param frame: pd.DataFrame: The dataset to index.
+        :param columns: list[str]: The category columns to index,
+               Default: CriteriaTopic and CriteriaGroup.
+        :param stamp: int: The data stamp of the indexed columns.
+        """
+        self.source = frame
+        self.stamp = stamp
+        self.labels, self.keys, self.bitmaps = {}, {}, {}
+        for column in self.COLUMNS if columns is None else columns:
+            if column in frame.columns:
+                self.explode(frame[column], column)
+    
+    def __len__(self) -> int:
+        """The number of rows indexed."""
+        return len(self.source)
+    
+    @staticmethod
+    def fold(label: str) -> str:
+        """Folds a category label into its lookup key.
+        
+        :param label: str: e.g. ' Data  validation'
+        :return: str: e.g. 'data validation'
+        """
+        return ' '.join(str(label).split()).casefold()
+    
+    def explode(self, values: pd.Series, column: str) -> None:
+        """Splits a column into its categories, and builds their bitmaps.
+        
+        The first seen spelling of a category is kept as its label.
+        
+        :param values: pd.Series: The column's values, per row.
+        :param column: str: The column's name.
+        :return: None
+        """
+        exploded: pd.Series = values.reset_index(drop=True).fillna('') \
+            .astype(str).str.split(self.SEPARATOR).explode()
+        labels: pd.Series = exploded.str.split().str.join(' ')
+        labels = labels[labels.str.len() > 0]
+        codes, uniques = pd.factorize(labels.str.casefold())
+        first: pd.Series = labels.groupby(codes, sort=True).first()
+        bitmaps: np.ndarray = np.zeros((len(uniques), len(values)), dtype=bool)
+        bitmaps[codes, labels.index.to_numpy()] = True
+        self.labels[column] = first.tolist()
+        self.keys[column] = {key: row for row, key in enumerate(uniques)}
+        self.bitmaps[column] = bitmaps
+    
+    def rows(self, column: str, label: str) -> np.ndarray:
+        """The bitmap of rows tagged with a category.
+        
+        :param column: str: The category column, e.g. CriteriaTopic.
+        :param label: str: The category, matched case/space insensitive.
+        :return: np.ndarray: bool per row. All False for unknown labels.
+        """
+        row: int | None = self.keys.get(column, {}).get(self.fold(label))
+        if row is None:
+            return np.zeros(len(self.source), dtype=bool)
+        return self.bitmaps[column][row]
+    
+    def match(self,
+              column: str,
+              labels: list[str],
+              every: bool = True) -> np.ndarray:
+        """The bitmap of rows tagged with all of, or any of, the categories.
+        
+        :param column: str: The category column, e.g. CriteriaTopic.
+        :param labels: list[str]: The categories to match.
+        :param every: bool: True: all of (intersection), False: any of.
+        :return: np.ndarray: bool per row.
+        """
+        if not labels:
+            return np.full(len(self.source), every, dtype=bool)
+        bitmaps: list[np.ndarray] = [self.rows(column, label)
+                                     for label in labels]
+        return np.logical_and.reduce(bitmaps) if every \
+            else np.logical_or.reduce(bitmaps)
+    
+    def unknown(self, column: str, labels: list[str]) -> list[str]:
+        """The categories not found in the column.
+        
+        :param column: str: The category column.
+        :param labels: list[str]: The categories to check.
+        :return: list[str]: The unknown categories, if any.
+        """
+        known: dict[str, int] = self.keys.get(column, {})
+        return [label for label in labels if self.fold(label) not in known]
+    
+    def counts(self, column: str, mask: np.ndarray | None = None) \
+        -> pd.DataFrame:  # noqa # Pep8 E125
+        """The rows per category, most tagged first.
+        
+        :param column: str: The category column, e.g. CriteriaTopic.
+        :param mask: np.ndarray | None: Count only within these rows.
+        :return: pd.DataFrame: Columns: the column's name, Records.
+        """
+        bitmaps: np.ndarray = self.bitmaps.get(
+            column, np.zeros((0, len(self.source)), dtype=bool))
+        totals: np.ndarray = bitmaps.sum(axis=1) if mask is None \
+            else (bitmaps & mask).sum(axis=1)
+        counted = pd.DataFrame({column: self.labels.get(column, []),
+                                'Records': totals})
+        return counted.sort_values(by=['Records', column],
+                                   ascending=[False, True],
+                                   ignore_index=True)
+    
+    @classmethod
+    def split(cls, labels: str | None) -> list[str]:  # noqa ANN102
+        """Splits user input, with the same delimiter as the dataset.
+        
+        :param labels: str | None: e.g. 'Program Build; Data Validation'
+        :return: list[str]: e.g. ['Program Build', 'Data Validation']
+        """
+        if not labels:
+            return []
+        return [label.strip() for label in labels.split(cls.SEPARATOR)
+                if label.strip()]
+
+
+class RecordIndex:
+    """Record Index: A record's keys to its row offset, in constant time.
+    
+    Lookups are by the record's own keys, not by the row's place:
+    so stay correct after the rows are sorted, filtered or reloaded.
+    - Position: int: The record's row id, e.g. 3
+    - CriteriaRef: str: The record's reference, e.g. 'LO2.1.1'
+    The first row wins for a duplicated key.
+    
+    :property: COLUMNS: list[str]: The key columns.
+    :property: source: pd.DataFrame: The indexed dataframe.
+    :property: stamp: int: The data stamp the index was built at.
+    :property: positions: dict[int, int]: Position to row offset.
+    :property: references: dict[str, int]: Folded CriteriaRef to row offset.
+    """
+    
+    COLUMNS: list[str] = [ColumnSchema.Position, ColumnSchema.Reference]
+    source: pd.DataFrame
+    stamp: int
+    positions: dict[int, int]
+    references: dict[str, int]
+    
+    def __init__(self, frame: pd.DataFrame, stamp: int = 0) -> None:
+        """Maps the frame's Position and CriteriaRef to row offsets.
+        
+        :param frame: pd.DataFrame: The dataset to index.
+        :param stamp: int: The data stamp of the key columns.
+        """
+        self.source = frame
+        self.stamp = stamp
+        self.positions = self.keyed(
+            pd.to_numeric(self.column(frame, ColumnSchema.Position),
+                          errors='coerce').astype('Int64'))
+        self.references = self.keyed(
+            self.column(frame, ColumnSchema.Reference)
+            .astype(str).str.strip().str.casefold())
+    
+    def __len__(self) -> int:
+        """The number of rows indexed."""
+        return len(self.source)
+    
+    @staticmethod
+    def column(frame: pd.DataFrame, column: str) -> pd.Series:
+        """The key column, or an empty one when missing.
+        
+        :param frame: pd.DataFrame: The dataset.
+        :param column: str: The key column's name.
+        :return: pd.Series: The key per row.
+        """
+        if column in frame.columns:
+            return frame[column].reset_index(drop=True)
+        return pd.Series([None] * len(frame), dtype=object)
+    
+    @staticmethod
+    def keyed(keys: pd.Series) -> dict:
+        """Maps each key to its first row offset.
+        
+        :param keys: pd.Series: The key per row, indexed by offset.
+        :return: dict: key to row offset.
+        """
+        keys = keys[keys.notna() & ~keys.duplicated()]
+        return dict(zip(keys.tolist(), keys.index.tolist()))
+    
+    def offset(self, key: int | str | None) -> int | None:
+        """The row offset of a record: by Position, else by CriteriaRef.
+        
+        :param key: int | str | None: e.g. 3, '3', 'LO2.1.1'
+        :return: int | None: The row offset, None when not found.
+        """
+        if key is None:
+            return None
+        if isinstance(key, int) and not isinstance(key, bool):
+            return self.positions.get(key)
+        text: str = str(key).strip()
+        if text.isdigit():
+            return self.positions.get(int(text))
+        return self.references.get(text.casefold())
+    
+    def offsets(self, keys: list[int | str]) -> tuple[list[int], list]:
+        """The row offsets of many records, in the keys' order.
+        
+        :param keys: list[int | str]: e.g. [3, 5, 10, 11, 12]
+        :return: tuple[list[int], list]: The offsets found, the keys not.
+        """
+        found: list[int] = []
+        missing: list = []
+        for key in keys:
+            offset: int | None = self.offset(key=key)
+            if offset is None:
+                missing.append(key)
+            else:
+                found.append(offset)
+        return found, missing
+
+# End of Indexes Module
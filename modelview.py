@@ -12,11 +12,13 @@ class Views:
     :property: View.Todo
     """
     # Views
-    Overviews: str = "Overviews"
+    Overviews: str = "Overview"
     Project: str = "Project"
     Criteria: str = "Criteria"
     Reference: str = "Reference"
     ToDos: str = "ToDo"
+    Topics: str = "Topics"
+    Stats: str = "Stats"
     #
     All: str = "All"
     Simple: str = "Simple"
@@ -27,7 +29,7 @@ class Views:
     ToDo: str = "ToDo"
     
     Load: list[str] = ["Overview", "Project", "Criteria",
-                       "ToDo", "Reference"]
+                       "ToDo", "Reference", "Topics", "Stats"]
     Todo: list[str] = ["All", "Simple", "Notes", "Done",
                        "Grade", "Review"]
     
@@ -119,6 +121,8 @@ class Headers:
     #
     NotesView: list[str] = [c.Position, c.Criteria, c.Notes]
     ReferenceView: list[str] = [c.Position, c.Reference, c.Related]
+    LocateView: list[str] = [c.Position, c.Reference, c.Topic,
+                             c.Criteria, c.Progress, c.Notes]
     ViewFilter: list[str] = ["Overview", "Criteria",
                              "Project", "ToDo", "References"]
     ToDoChoices: list[str] = ["All", "Simple", "Notes",
@@ -0,0 +1,227 @@
+#!/user/bin/env python3
+# pylint: disable=trailing-whitespace
+# ruff: noqa: ANN101, I001
+# noqa: W293 blank line contains whitespace
+"""Module: Pages: Windowed, paged, rendering of large views.
+
+Usage:
+-------------------------
+- Pager: Renders only the visible page of a view's rows, e.g. 40 rows,
+         not a table of every row. rich then measures only that page's
+         cells, and the terminal (pty/websocket) gets one page at a time.
+         - next, prev, goto: page through the last opened view.
+         - The next page is prefetched, rendered in the background,
+           while the current page is read.
+         - Pages of a keyed view are kept in the render cache.
+
+Linting:
+-------------------------
+- pylint: disable=trailing-whitespace
+- ruff: noqa:
+      I001:     unsorted-imports
+                Import block is unsorted or unformatted
+      ANN101:   missing-type-self
+                Missing type annotation for {name} in method
+- noqa: W293
+
+Critieria:
+LO2.2: Clearly separate and identify code written for the application and
+       the code from external sources (e.g. libraries or tutorials)
+LO2.2.3: Clearly separate code from external sources
+LO2.2.4: Clearly identify code from external sources
+LO6: Use library software for building a graphical user interface,
+or command-line interface, or web application, or mathematical software
+LO6.1 Implement the use of external Python libraries
+LO6.1.1 Implement the use of external Python libraries
+      where appropriate to provide the functionality that the project requires.
+-------------------------
+Standard Libraries
+:imports: concurrent.futures, typing
+
+3rd Paty Imports
+:imports: click, rich
+
+Custom Authored Libraries
+:imports: caches.RenderCache
+:imports: controller.Display, controller.WebConsole
+:imports: telemetry.Metrics, telemetry.metrics
+:imports: telemetry.Tracer, telemetry.tracer
+
+:class: Pager: The pages of a view: renders, shows, prefetches.
+"""
+# 0.1 Standard Library Imports
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Hashable, Sequence
+
+# 0.2 Third Party Modules
+import click  # type: ignore
+from rich.table import Table  # type: ignore
+
+# 0.3 Local imports
+from caches import RenderCache
+from controller import Display, WebConsole
+from telemetry import Metrics, Tracer, metrics, tracer
+
+
+class Pager:
+    """Pager: Shows a view one page at a time, prefetching the next page.
+    
+    The view's rows are kept as opened: a snapshot, as rendered by the
+    view cache. Reopen the view, e.g. load views, to page changed data.
+    
+    :property: webconsole: WebConsole: Renders, and prints, the pages.
+    :property: size: int: The rows per page.
+    :property: title: str: The view's title.
+    :property: headers: list[str]: The view's columns.
+    :property: rows: Sequence[Sequence[str]]: The view's stringified rows.
+    :property: widths: Sequence[int]: The columns' fitted widths, if any.
+    :property: page: int: The current page, from 1.
+    :property: prefetched: dict[int, Future]: Page to its rendering.
+    :property: executor: ThreadPoolExecutor: One background renderer.
+    :property: renders: RenderCache | None: Keeps keyed views' pages.
+    :property: key: Hashable | None: The view's render cache key, if any.
+    """
+    
+    webconsole: WebConsole
+    size: int
+    title: str
+    headers: list[str]
+    rows: Sequence[Sequence[str]]
+    widths: Sequence[int]
+    page: int
+    prefetched: dict[int, Future]
+    executor: ThreadPoolExecutor
+    renders: RenderCache | None
+    key: Hashable | None
+    
+    def __init__(self, webconsole: WebConsole, size: int,
+                 renders: RenderCache | None = None) -> None:
+        """Starts with no view opened.
+        
+        :param webconsole: WebConsole: The app's web console.
+        :param size: int: The rows per page.
+        :param renders: RenderCache | None: To keep keyed views' pages.
+        """
+        self.webconsole = webconsole
+        self.renders = renders
+        self.key = None
+        self.size = max(size, 1)
+        self.title = ''
+        self.headers = []
+        self.rows = ()
+        self.widths = ()
+        self.page = 0
+        self.prefetched = {}
+        self.executor = ThreadPoolExecutor(max_workers=1,
+                                           thread_name_prefix='prefetch')
+    
+    @property
+    def pages(self) -> int:
+        """The number of pages: at least one, once opened."""
+        return max(-(-len(self.rows) // self.size), 1)
+    
+    @property
+    def isopen(self) -> bool:
+        """Checks if a view is opened, to page through."""
+        return self.page > 0
+    
+    def open(self,
+             title: str,
+             headers: list[str],
+             rows: Sequence[Sequence[str]],
+             key: Hashable | None = None,
+             widths: Sequence[int] = ()) -> None:
+        """Opens a view: shows its first page.
+        
+        :param title: str: The view's title.
+        :param headers: list[str]: The view's columns.
+        :param rows: Sequence[Sequence[str]]: The view's stringified rows.
+        :param key: Hashable | None: The view's key, with its data stamp:
+               keeps its pages in the render cache. None: not kept.
+        :param widths: Sequence[int]: The columns' widths, e.g. from
+               Display.fit: the same widths for every page.
+        :return: None
+        """
+        for future in self.prefetched.values():
+            future.cancel()
+        self.title = title
+        self.headers = list(headers)
+        self.rows = rows
+        self.widths = tuple(widths)
+        self.key = key
+        self.prefetched = {}
+        self.page = 1
+        self.show(page=1)
+    
+    def render(self, page: int) -> str:
+        """Renders a page, or gets it from the render cache, if keyed.
+        
+        :param page: int: The page, from 1.
+        :return: str: The page's rendered text, with ANSI styles.
+        """
+        if self.renders is None or self.key is None:
+            return self.layout(page=page)
+        return self.renders.rendered(
+            key=(self.key, self.title, page, self.size,
+                 self.webconsole.console.width),
+            render=lambda: self.layout(page=page))
+    
+    @tracer.traced(category=Tracer.RENDER)
+    def layout(self, page: int) -> str:
+        """Lays out a page: a table of only that page's rows, and a caption.
+        
+        :param page: int: The page, from 1.
+        :return: str: The page's rendered text, with ANSI styles.
+        """
+        start: int = (page - 1) * self.size
+        stop: int = min(start + self.size, len(self.rows))
+        table: Table = Display.fill_rows(
+            rows=self.rows[start:stop],
+            consoletable=WebConsole.configure_table(headers=self.headers,
+                                                    widths=self.widths))
+        table.caption = (f'{self.title}: Page {page} of {self.pages}: '
+                         f'Rows {start + 1} to {stop} of {len(self.rows)}. '
+                         'Type: next, prev, goto')
+        return self.webconsole.render(table)
+    
+    @tracer.traced(category=Tracer.RENDER)
+    @metrics.timed(phase=Metrics.RENDER)
+    def show(self, page: int) -> int:
+        """Shows a page, then prefetches the one after it.
+        
+        :param page: int: The page, clamped to 1 to the last page.
+        :return: int: The page shown.
+        """
+        self.page = min(max(page, 1), self.pages)
+        future: Future | None = self.prefetched.pop(self.page, None)
+        text: str = future.result() if future is not None \
+            and not future.cancelled() else self.render(page=self.page)
+        click.echo(message=text, nl=False)
+        self.prefetch(page=self.page + 1)
+        return self.page
+    
+    def prefetch(self, page: int) -> None:
+        """Renders a page in the background: only the next one is kept.
+        
+        :param page: int: The page to prefetch.
+        :return: None
+        """
+        if not 1 <= page <= self.pages or page in self.prefetched:
+            return
+        for stale in [kept for kept in self.prefetched if kept != page]:
+            self.prefetched.pop(stale).cancel()
+        self.prefetched[page] = self.executor.submit(self.render, page)
+    
+    def next(self) -> int:
+        """Shows the next page: the last page stays on the last page."""
+        return self.show(page=self.page + 1)
+    
+    def prev(self) -> int:
+        """Shows the previous page: the first page stays on the first."""
+        return self.show(page=self.page - 1)
+    
+    def goto(self, page: int) -> int:
+        """Shows a page, by its number."""
+        return self.show(page=page)
+
+# End of Pages Module
@@ -0,0 +1,521 @@
+#!/user/bin/env python3
+# pylint: disable=trailing-whitespace
+# ruff: noqa: ANN101, I001
+# noqa: W293 blank line contains whitespace
+"""Module: Prefork: A warm parent: forks a ready REPL per web terminal.
+
+Usage:
+-------------------------
+- PreforkServer: The parent: imports the app, pandas, gspread, rich, once;
+                 parses the credentials, and downloads the sheet, once;
+                 then freezes its objects, gc.freeze, and listens on a
+                 Unix socket. Per connection, it forks a child: the REPL,
+                 on the connection's terminal. The children share the
+                 parent's pages, copy on write: no imports, no download,
+                 the first prompt in tens of milliseconds.
+                 Idle, it refreshes the data: once its time to live ends.
+- connect: The client: sends its terminal, stdin, stdout, stderr, to the
+           parent, by SCM_RIGHTS, then waits for the REPL's exit code.
+           Only the standard library: run with -S, no site packages.
+           No server listening: it runs app.py repl itself, as before.
+- python prefork.py serve
+- python -S prefork.py connect
+- controllers/default.js: starts the server, and connects per websocket:
+  PYCRITERIA_PREFORK: the socket's path; off: a fresh app.py repl.
+
+Linting:
+-------------------------
+- pylint: disable=trailing-whitespace
+- ruff: noqa:
+      I001:     unsorted-imports
+                Import block is unsorted or unformatted
+      ANN101:   missing-type-self
+                Missing type annotation for {name} in method
+- noqa: W293
+
+Critieria:
+LO2.2: Clearly separate and identify code written for the application and
+       the code from external sources (e.g. libraries or tutorials)
+LO2.2.3: Clearly separate code from external sources
+LO2.2.4: Clearly identify code from external sources
+LO6: Use library software for building a graphical user interface,
+or command-line interface, or web application, or mathematical software
+LO6.1 Implement the use of external Python libraries
+LO6.1.1 Implement the use of external Python libraries
+      where appropriate to provide the functionality that the project requires.
+-------------------------
+Standard Libraries
+:imports: argparse, errno, fcntl, gc, json, os, random, selectors, signal,
+          socket, sys, tempfile, termios, time, types, typing
+          Only the standard library: the client starts with -S.
+
+3rd Paty Imports
+:imports: None: the app, and its libraries, are imported by the server
+
+Custom Authored Libraries
+:imports: app: by the server, once, before it listens
+:imports: dataserver: by the server: its connection closed, per fork
+
+:class: PreforkServer: The warm parent: forks a REPL per connection.
+:function: connect: The client: its terminal to a forked REPL.
+"""
+# 0.1 Standard Library Imports
+import argparse
+import errno
+import fcntl
+import gc
+import json
+import os
+import random
+import selectors
+import signal
+import socket
+import sys
+import tempfile
+import termios
+import time
+import types
+from typing import Any, NoReturn
+
+# 0.2 Third Party Modules: none: the client imports only the stdlib
+
+# 0.3 Local imports: app: imported by the server, in PreforkServer.warm
+#     dataserver: imported by the server, in PreforkServer.freeze
+
+
+class PreforkServer:
+    """PreforkServer: A warm parent: forks a ready REPL per connection.
+    
+    The parent holds no threads, and no open connections, when it forks:
+    the sheet's HTTP sessions, and the data server's connection, with its
+    reader thread, are closed once the data is loaded.
+    
+    :property: SOURCE: str: The environment's socket path: off disables.
+    :property: SOCKET: str: The default socket path: in the temp dir.
+    :property: OFF: str: The SOURCE value that disables the server.
+    :property: STREAMS: int: The fds sent: stdin, stdout, stderr.
+    :property: MESSAGE: int: The largest request, or reply, in bytes.
+    :property: HANDSHAKE: float: Seconds a client has to send its request:
+               the loop is single threaded, a silent client blocks it.
+    :property: IDLE: float: Seconds between reaps, and refreshes.
+    :property: TERMINAL: dict[str, str]: The web terminal's defaults:
+               as controllers/default.js opens its pty.
+    :property: path: str: The socket's path.
+    :property: listener: socket.socket | None: Listening, once warm.
+    :property: selector: selectors.BaseSelector: The listener, clients.
+    :property: children: dict[int, socket.socket]: pid, its client.
+    :property: wakeup: socket.socket | None: Read: a signal, e.g. SIGCHLD,
+               wakes the select: a child's exit is sent at once.
+    :property: app: types.ModuleType | None: The app, once imported.
+    :property: forked: int: The children forked.
+    :property: running: bool: Until SIGTERM, or SIGINT.
+    """
+    
+    SOURCE: str = 'PYCRITERIA_PREFORK'
+    SOCKET: str = os.path.join(tempfile.gettempdir(),
+                               'pycriteria-prefork.sock')
+    OFF: str = 'off'
+    STREAMS: int = 3
+    MESSAGE: int = 65_536
+    HANDSHAKE: float = 1.0
+    IDLE: float = 5.0
+    TERMINAL: dict[str, str] = {'TERM': 'xterm-color', 'COLUMNS': '110',
+                                'LINES': '50', 'FORCE_COLOR': '1'}
+    
+    path: str
+    listener: socket.socket | None
+    selector: selectors.BaseSelector
+    children: dict[int, socket.socket]
+    wakeup: socket.socket | None
+    app: types.ModuleType | None
+    forked: int
+    running: bool
+    
+    def __init__(self, path: str | None = None) -> None:
+        """Starts cold: the app is imported by warm.
+        
+        :param path: str | None: The socket: None, from the environment
+        """
+        self.path = path or self.address()
+        self.listener = None
+        self.selector = selectors.DefaultSelector()
+        self.children = {}
+        self.wakeup = None
+        self.app = None
+        self.forked = 0
+        self.running = False
+    
+    @classmethod
+    def address(cls) -> str:
+        """The socket's path: PYCRITERIA_PREFORK, else the default.
+        
+        :return: str: The path: OFF, if disabled
+        """
+        return os.environ.get(cls.SOURCE, '') or cls.SOCKET
+    
+    def warm(self) -> float:
+        """Imports the app, and loads its data: then freezes its objects.
+        
+        The GC is off from the start: no holes in the pages shared, and
+        the children's collections do not touch the frozen objects.
+        
+        :return: float: The seconds taken
+        """
+        start: float = time.perf_counter()
+        gc.disable()
+        for name, value in self.TERMINAL.items():
+            os.environ.setdefault(name, value)
+        import app  # pylint: disable=import-outside-toplevel
+        self.app = app
+        app.App.recordindex()
+        self.freeze()
+        return time.perf_counter() - start
+    
+    def refresh(self) -> bool:
+        """Reloads the data, if its time to live is over: refreezes.
+        
+        :return: bool: True if reloaded
+        """
+        app: Any = self.app
+        if app is None or app.DataControl.isfresh(
+                ttl=app.configuration.Cache.DATA_TTL):
+            return False
+        app.App.data = app.DataControl.refresh(
+            dataframe=app.App.get_data())
+        app.App.recordindex()
+        self.freeze()
+        return True
+    
+    def freeze(self) -> None:
+        """Closes the sheet's connections: then freezes the objects.
+        
+        A pooled connection, shared by two children, would interleave
+        their requests: each child opens its own. The data server's
+        reader thread would not survive the fork: its connection is
+        closed too, the dataset kept: each child connects anew.
+        
+        :return: None
+        """
+        import dataserver  # pylint: disable=import-outside-toplevel
+        dataserver.SharedConnector.close()
+        app: Any = self.app
+        client: Any = getattr(app.DataControl.wsheet, 'client', None)
+        session: Any = getattr(client, 'session', None)
+        if session is not None:
+            session.close()
+        gc.collect()
+        gc.freeze()
+    
+    def listen(self) -> None:
+        """Listens on the socket: a stale one, from a crash, is replaced.
+        
+        :return: None
+        """
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        listener: socket.socket = socket.socket(socket.AF_UNIX,
+                                                socket.SOCK_STREAM)
+        listener.bind(self.path)
+        os.chmod(self.path, 0o600)
+        listener.listen()
+        self.selector.register(listener, selectors.EVENT_READ)
+        self.listener = listener
+    
+    def serve(self) -> None:
+        """Serves until SIGTERM, or SIGINT: forks, reaps, refreshes.
+        
+        :return: None
+        """
+        self.running = True
+        self.wakeup, waker = socket.socketpair()
+        for end in (self.wakeup, waker):
+            end.setblocking(False)
+        self.selector.register(self.wakeup, selectors.EVENT_READ)
+        signal.set_wakeup_fd(waker.fileno())
+        signal.signal(signal.SIGCHLD, self.woken)
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        try:
+            while self.running:
+                events: list = self.selector.select(timeout=self.IDLE)
+                for key, _ in events:
+                    if key.fileobj is self.listener:
+                        self.accept()
+                    elif key.fileobj is self.wakeup:
+                        self.drain()
+                    else:
+                        self.hangup(client=key.fileobj)
+                self.reap()
+                if not events:
+                    self.refresh()
+        finally:
+            signal.set_wakeup_fd(-1)
+            waker.close()
+            self.close()
+    
+    def woken(self, *_args: Any) -> None:
+        """A child exited: the wakeup socket wakes the select to reap it.
+        
+        :return: None
+        """
+    
+    def drain(self) -> None:
+        """Reads the wakeup socket's signal numbers: reap follows.
+        
+        :return: None
+        """
+        try:
+            while self.wakeup.recv(self.MESSAGE):  # type: ignore[union-attr]
+                pass
+        except BlockingIOError:
+            pass
+    
+    def stop(self, *_args: Any) -> None:
+        """Stops serving: the loop ends after its select.
+        
+        :return: None
+        """
+        self.running = False
+    
+    def accept(self) -> None:
+        """Accepts a client: its request, and its terminal's fds: forks.
+        
+        A client that is silent, past the HANDSHAKE, or sends a malformed
+        request, is refused: closed, and the loop serves on.
+        
+        :return: None
+        """
+        client: socket.socket
+        client, _ = self.listener.accept()  # type: ignore[union-attr]
+        client.settimeout(self.HANDSHAKE)
+        fds: list[int] = []
+        try:
+            message, fds, _, _ = socket.recv_fds(client, self.MESSAGE,
+                                                 self.STREAMS)
+            if len(fds) != self.STREAMS:
+                raise ValueError(f'{len(fds)} fds, not {self.STREAMS}')
+            request: dict[str, Any] = json.loads(message or b'{}')
+            if not isinstance(request, dict):
+                raise ValueError('The request is not a JSON object')
+        except (OSError, ValueError) as error:
+            for fd in fds:
+                os.close(fd)
+            client.close()
+            print(f'Prefork: client refused: {error!r}', file=sys.stderr)
+            return
+        client.settimeout(None)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid: int = os.fork()
+        if pid == 0:
+            self.child(fds=fds, request=request)
+        for fd in fds:
+            os.close(fd)
+        self.forked += 1
+        self.children[pid] = client
+        self.selector.register(client, selectors.EVENT_READ, data=pid)
+        try:
+            client.sendall(json.dumps({'pid': pid}).encode() + b'\n')
+        except OSError:
+            # The client is gone: its hangup is read by the next select
+            pass
+    
+    def child(self, fds: list[int], request: dict[str, Any]) -> NoReturn:
+        """The child: the REPL, on the client's terminal: never returns.
+        
+        :param fds: list[int]: The client's stdin, stdout, stderr
+        :param request: dict[str, Any]: The client's cwd, and environment
+        :return: NoReturn: exits, with the REPL's code
+        """
+        code: int = 1
+        try:
+            for key in list(self.selector.get_map().values()):
+                key.fileobj.close()  # type: ignore[union-attr]
+            self.selector.close()
+            signal.set_wakeup_fd(-1)
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            os.setsid()
+            for stream, fd in enumerate(fds):
+                os.dup2(fd, stream)
+                os.close(fd)
+            if os.isatty(0):
+                fcntl.ioctl(0, termios.TIOCSCTTY, 0)
+            os.environ.update(request.get('env', {}))
+            os.chdir(request.get('cwd') or os.getcwd())
+            sys.stdin = open(0, 'r', encoding='utf-8', closefd=False)
+            sys.stdout = open(1, 'w', buffering=1, encoding='utf-8',
+                              closefd=False)
+            sys.stderr = open(2, 'w', buffering=1, encoding='utf-8',
+                              closefd=False)
+            gc.enable()
+            random.seed()
+            app: Any = self.app
+            app.limiter.chance.seed()
+            sys.argv = [app.__file__, *request.get('args', ['repl'])]
+            app.main()
+            code = 0
+        except SystemExit as exited:
+            code = exited.code if isinstance(exited.code, int) else \
+                int(exited.code is not None)
+        except BaseException as error:  # pylint: disable=broad-except
+            print(f'Prefork: {error!r}', file=sys.stderr)
+        finally:
+            for stream in (sys.stdout, sys.stderr):
+                try:
+                    stream.flush()
+                except (OSError, ValueError):
+                    pass
+        os._exit(code)  # pylint: disable=protected-access
+    
+    def hangup(self, client: Any) -> None:
+        """The client closed, e.g. killed: hangs up its child.
+        
+        :param client: socket.socket: The client's connection
+        :return: None
+        """
+        pid: int = self.selector.get_key(client).data
+        self.selector.unregister(client)
+        try:
+            os.kill(pid, signal.SIGHUP)
+        except ProcessLookupError:
+            pass
+    
+    def reap(self) -> None:
+        """Reaps the children exited: sends each client its exit code.
+        
+        :return: None
+        """
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            client: socket.socket | None = self.children.pop(pid, None)
+            if client is None:
+                continue
+            try:
+                self.selector.unregister(client)
+            except KeyError:
+                pass
+            try:
+                client.sendall(json.dumps(
+                    {'exit': os.waitstatus_to_exitcode(status)}).encode() +
+                    b'\n')
+            except OSError:
+                pass
+            client.close()
+    
+    def close(self) -> None:
+        """Stops listening: hangs up the children: removes the socket.
+        
+        :return: None
+        """
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGHUP)
+            except ProcessLookupError:
+                pass
+        if self.listener is not None:
+            self.selector.unregister(self.listener)
+            self.listener.close()
+            self.listener = None
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+        self.selector.close()
+
+
+def replace(args: list[str]) -> NoReturn:
+    """Runs app.py itself: no server listening: as before the server.
+    
+    :param args: list[str]: The app's arguments, e.g. repl
+    :return: NoReturn: The process is replaced
+    """
+    program: str = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'app.py')
+    python: str = sys.executable or 'python3'
+    os.execv(python, [python, program, *args])
+
+
+def connect(path: str, args: list[str]) -> int:
+    """Connects the terminal to a forked REPL: waits for it to exit.
+    
+    The terminal is released, TIOCNOTTY, so the child can take it: Ctrl-C
+    is the REPL's. If the client is killed, the server hangs up the REPL.
+    
+    :param path: str: The server's socket
+    :param args: list[str]: The app's arguments, e.g. repl
+    :return: int: The REPL's exit code
+    """
+    client: socket.socket = socket.socket(socket.AF_UNIX,
+                                          socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+    except OSError as error:
+        if error.errno not in (errno.ENOENT, errno.ECONNREFUSED):
+            raise
+        client.close()
+        replace(args=args)
+    if os.isatty(0):
+        hangup: Any = signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        try:
+            fcntl.ioctl(0, termios.TIOCNOTTY)
+        except OSError:
+            pass
+        signal.signal(signal.SIGHUP, hangup)
+    request: dict[str, Any] = {
+        'cwd': os.getcwd(), 'args': args,
+        'env': {name: os.environ[name]
+                for name in ('TERM', 'COLUMNS', 'LINES', 'LANG')
+                if name in os.environ}}
+    socket.send_fds(client, [json.dumps(request).encode()],
+                    [0, 1, 2])
+    code: int = 1
+    with client.makefile('r', encoding='utf-8') as replies:
+        for line in replies:
+            reply: dict[str, Any] = json.loads(line)
+            if 'exit' in reply:
+                code = reply['exit']
+    return code
+
+
+def main() -> None:
+    """Prefork: serve: the warm parent; connect: a terminal to a REPL.
+    
+    argparse, not click: the client imports only the standard library.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog='prefork', description='A warm parent, forking a REPL per '
+                                    'web terminal.')
+    parser.add_argument('action', choices=['serve', 'connect'],
+                        help='serve: the parent; connect: a terminal.')
+    parser.add_argument('--socket', dest='path', default=None,
+                        help='The Unix socket: PYCRITERIA_PREFORK, else '
+                             f'{PreforkServer.SOCKET}.')
+    parser.add_argument('args', nargs='*', default=['repl'],
+                        help="The app's command: repl.")
+    options: argparse.Namespace = parser.parse_args()
+    path: str = options.path or PreforkServer.address()
+    if options.action == 'connect':
+        if path == PreforkServer.OFF:
+            replace(args=options.args)
+        sys.exit(connect(path=path, args=options.args))
+    server: PreforkServer = PreforkServer(path=path)
+    took: float = server.warm()
+    server.listen()
+    print(f'Prefork: warm in {took:.2f}s: listening on {server.path}',
+          file=sys.stderr, flush=True)
+    server.serve()
+
+
+if __name__ == '__main__':
+    main()
+
+# End of Prefork Module
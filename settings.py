@@ -71,11 +71,101 @@ class Settings:
         "https://www.googleapis.com/auth/drive"
         ]  # pylint: disable=C0103
     
+    @dataclasses.dataclass(frozen=True)
+    class Backend:
+        """Backend Config: The data's source: the sheet, its stand-in, a CSV.
+        
+        Selected by the environment, e.g. offline, or for benchmarks:
+        PYCRITERIA_BACKEND=local PYCRITERIA_DATA=data.csv python app.py
+        PYCRITERIA_BACKEND=standin PYCRITERIA_API=http://... python app.py
+        PYCRITERIA_DATASERVER=/tmp/pycriteria-data.sock python app.py repl
+        """
+        SHEETS: str = 'sheets'  # pylint: disable=C0103
+        LOCAL: str = 'local'  # pylint: disable=C0103
+        STANDIN: str = 'standin'  # pylint: disable=C0103
+        SOURCE: str = 'PYCRITERIA_BACKEND'  # pylint: disable=C0103
+        DATA: str = 'PYCRITERIA_DATA'  # pylint: disable=C0103
+        API: str = 'PYCRITERIA_API'  # pylint: disable=C0103
+        SHARED: str = 'PYCRITERIA_DATASERVER'  # pylint: disable=C0103
+        DATASET: str = '.docs/assets/PyCriteria - DataSet.csv'  # noqa
+    
+    @dataclasses.dataclass(frozen=True)
+    class StandIn:
+        """StandIn Config: The local Sheets API's address, and its faults.
+        
+        Faults are off by default: latency & jitter in ms, quota requests
+        per window seconds, 0 is unlimited, payload bytes, 0 is unlimited.
+        """
+        HOST: str = '127.0.0.1'  # pylint: disable=C0103
+        PORT: int = 8765  # pylint: disable=C0103
+        URL: str = 'http://127.0.0.1:8765'  # pylint: disable=C0103
+        LATENCY: float = 0.0  # pylint: disable=C0103
+        JITTER: float = 0.0  # pylint: disable=C0103
+        QUOTA: int = 0  # pylint: disable=C0103
+        WINDOW: float = 60.0  # pylint: disable=C0103
+        FAILRATE: float = 0.0  # pylint: disable=C0103
+        PAYLOAD: int = 10_485_760  # pylint: disable=C0103
+    
+    @dataclasses.dataclass(frozen=True)
+    class Quota:
+        """Quota Config: The client side quotas: requests per minute.
+        
+        Google's per user defaults: 60 reads, 60 writes, a minute: 0 is
+        unlimited. On a 429: retries, the backoff, and cap, in seconds;
+        and the seconds a read is reused, under pressure.
+        The quotas are per process: each session's, unless the data
+        server sends every session's requests. PYCRITERIA_SESSIONS=4:
+        four sessions share the user's quotas: each gets a quarter.
+        """
+        SESSIONS: str = 'PYCRITERIA_SESSIONS'  # pylint: disable=C0103
+        READS: int = 60  # pylint: disable=C0103
+        WRITES: int = 60  # pylint: disable=C0103
+        RETRIES: int = 5  # pylint: disable=C0103
+        BACKOFF: float = 1.0  # pylint: disable=C0103
+        CAP: float = 32.0  # pylint: disable=C0103
+        COALESCE: float = 2.0  # pylint: disable=C0103
+    
     @dataclasses.dataclass(frozen=True)
     class Console:
-        """Config."""
+        """Config: Size, page & pinned rows, cells' lines & width quantile."""
         WIDTH: int = 150  # pylint: disable=C0103
         HEIGHT: int = 48  # pylint: disable=C0103
+        PAGE: int = 40  # pylint: disable=C0103
+        LINES: int = 3  # pylint: disable=C0103
+        QUANTILE: float = 0.9  # pylint: disable=C0103
+        PINNED: int = 30  # pylint: disable=C0103
+    
+    @dataclasses.dataclass(frozen=True)
+    class Cache:
+        """Cache Config: Data reuse seconds, and rendered outputs kept."""
+        DATA_TTL: float = 30.0  # pylint: disable=C0103
+        RENDERS: int = 64  # pylint: disable=C0103
+    
+    @dataclasses.dataclass(frozen=True)
+    class Metrics:
+        """Metrics Config: Commands' timings kept, and the log: '' is off."""
+        HISTORY: int = 100  # pylint: disable=C0103
+        LOG: str = ''  # pylint: disable=C0103
+    
+    @dataclasses.dataclass(frozen=True)
+    class Memory:
+        """Memory Config: Budget MiB, allocation sites listed, frames kept."""
+        BUDGET: int = 512  # pylint: disable=C0103
+        TOP: int = 10  # pylint: disable=C0103
+        FRAMES: int = 1  # pylint: disable=C0103
+    
+    @dataclasses.dataclass(frozen=True)
+    class Profile:
+        """Profile Config: Dump directory, functions listed, sampling."""
+        DIRECTORY: str = '.profiles'  # pylint: disable=C0103
+        TOP: int = 15  # pylint: disable=C0103
+        SAMPLING: bool = True  # pylint: disable=C0103
+    
+    @dataclasses.dataclass(frozen=True)
+    class Trace:
+        """Trace Config: The session's trace directory, spans kept."""
+        DIRECTORY: str = '.traces'  # pylint: disable=C0103
+        EVENTS: int = 200_000  # pylint: disable=C0103
 
 # End of Settings Module
 # Ruff Checke, Pep8CI Checked, Now Dead Code, Some Passing
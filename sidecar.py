@@ -89,6 +89,7 @@ class AppValues:
         """Display Values."""
         STANDALONE: str = 'show'
         SIDEBYSIDE: str = 'compare'
+        CHANGES: str = 'changes'
         TOLAYOUT: bool = True
         TOTERMINAL: bool = False
     
@@ -100,6 +101,96 @@ class AppValues:
         welcome: str = f"Welcome to!{name}"
         confirm: str = "Start PyCriteria?"
     
+    @dataclasses.dataclass
+    class Page:
+        """Paging Actions: String Settings."""
+        next: str = "next"
+        nexthelp: str = "Show the next page of the last large view"
+        prev: str = "prev"
+        prevhelp: str = "Show the previous page of the last large view"
+        goto: str = "goto"
+        gotohelp: str = "Show a page, by number, of the last large view"
+        prompt: str = "Go to page"
+        closed: str = "No view to page through. Load a view first."
+    
+    @dataclasses.dataclass
+    class Pin:
+        """Pinning Actions: String Settings."""
+        pin: str = "pin"
+        pinhelp: str = "Pin the record card to the top of the terminal"
+        unpin: str = "unpin"
+        unpinhelp: str = "Unpin the record card: the terminal scrolls"
+        rowshelp: str = "Rows to pin, at most two thirds of the terminal"
+        pinned: str = "Record cards are pinned to the top {} rows."
+        noterminal: str = "Pinning needs a terminal, not a pipe or a file."
+        unpinned: str = ("Unpinned. Sent {} of the cards' {} characters: "
+                         "changed lines only.")
+    
+    @dataclasses.dataclass
+    class Stats:
+        """Command Timings: String Settings."""
+        stats: str = "stats"
+        statshelp: str = "Show the last commands' timings, by phase"
+        loghelp: str = "Also log each command's timings, a JSON line, here"
+        nologhelp: str = "Stop logging the commands' timings"
+        title: str = "Command Timings"
+        none: str = "No commands timed yet. Run a command, then stats."
+        logging: str = "Logging each command's timings to: {}"
+    
+    @dataclasses.dataclass
+    class Memory:
+        """Memory Profiling: String Settings."""
+        memory: str = "memory"
+        memoryhelp: str = "Profile each command's memory: on, off, show"
+        budgethelp: str = "Warn when the process' peak RSS is over, in MiB"
+        tophelp: str = "The allocation sites listed, by growth"
+        on: str = "Memory profiling is on: a report after each command."
+        off: str = "Memory profiling is off."
+        budget: str = "Memory budget: {} MiB. Peak RSS: {} MiB."
+        title: str = "Memory: Data Frames Held"
+    
+    @dataclasses.dataclass
+    class Profile:
+        """Call Profiling: String Settings."""
+        profile: str = "profile"
+        profilehelp: str = "Profile each command's calls: on, off, show"
+        dirhelp: str = "The directory the profiles are dumped to"
+        tophelp: str = "The functions listed, by cumulative time"
+        enginehelp: str = "sampling: pyinstrument, if installed; cprofile"
+        on: str = "Call profiling is on, by {}: dumped to {}"
+        off: str = "Call profiling is off."
+        nosampler: str = "No sampling profiler installed: cProfile is used."
+        last: str = "Last profile: {}"
+        none: str = "No profile dumped yet. Run profile on, then a command."
+    
+    @dataclasses.dataclass
+    class Trace:
+        """Span Tracing: String Settings."""
+        trace: str = "trace"
+        tracehelp: str = "Trace each command's spans: on, off, show"
+        outhelp: str = "The trace file: Chrome trace event JSON"
+        on: str = "Tracing is on: the session's trace is written to {}"
+        off: str = "Tracing is off: the trace is kept at {}"
+        none: str = "No command traced yet. Run trace on, then a command."
+        title: str = "Last command's spans: {}"
+    
+    @dataclasses.dataclass
+    class Quota:
+        """API Quotas: String Settings."""
+        quota: str = "quota"
+        quotahelp: str = "The API's read, and write, quotas: usage, limits"
+        readshelp: str = "Read requests per minute, this session's: " \
+                         "0 is unlimited"
+        writeshelp: str = "Write requests per minute, this session's: " \
+                          "0 is unlimited"
+        title: str = "API Quotas: Requests per Minute"
+    
+    @dataclasses.dataclass
+    class Format:
+        """Output Formats: String Settings."""
+        help: str = ("Output: a table, or csv, tsv, jsonl to pipe "
+                     "into other tools")
+    
     @dataclasses.dataclass
     class Load:
         """Load Intent: String Settings."""
@@ -142,14 +233,15 @@ class AppValues:
             default: str = "Overview"
             show: bool = True
             help: str = "Choose a option: Overview, Project, Criteria, " \
-                        "Todos, Reference"
+                        "Todos, Reference, Topics, Stats"
             prompt: str = "Choose a assignment view: "
     
     @dataclasses.dataclass
     class Find:
         """Find Settings."""
         cmd: str = "find"
-        help: str = "Available Actions: Locate by row index"
+        help: str = "Available Actions: Locate by row index, " \
+                    "Search by text, Tagged by topics"
         
         # Common Options for Locate, and Edit commands
         @dataclasses.dataclass
@@ -184,6 +276,35 @@ class AppValues:
             """Find Commands: Locate | String Settings."""
             cmd: str = "locate"
             help: str = "🔎 Search focus. Currently: by row\'s index"
+            indexhelp: str = "By Rows, e.g. 3 or 3,5,10-14, or " \
+                             "CriteriaRefs, e.g. 1.1.0: rows 1 to "
+            prompt: str = "Enter an Index, Indexes, or CriteriaRefs: " \
+                          "e.g. 3,5,10-14 or 1.1.0"
+            cards: int = 5
+            title: str = "Located Records"
+        
+        @dataclasses.dataclass
+        class Search:
+            """Find Commands: Search | String Settings."""
+            cmd: str = "search"
+            help: str = "🔎 Search criteria & topics by text. Typos allowed."
+            prompt: str = "🔎 Enter the text to search for"
+            limit: int = 10
+            limithelp: str = "The most matches to list"
+            choose: str = "☑️ Choose a match by rank to show, 0 to skip"
+        
+        @dataclasses.dataclass
+        class Tagged:
+            """Find Commands: Tagged | String Settings."""
+            cmd: str = "tagged"
+            help: str = "🏷️ List the rows tagged with topics and/or groups."
+            topicshelp: str = "Topics, ; separated, e.g. Syntax; Documentation"
+            topicsprompt: str = "🏷️ Enter the topics, ; separated, or none"
+            groupshelp: str = "Groups, ; separated, e.g. LO2; LO3"
+            groupsprompt: str = "🏷️ Enter the groups, ; separated, or none"
+            ALL: str = "all"
+            ANY: str = "any"
+            matchhelp: str = "Match rows tagged with all of, or any of, these"
     
     @dataclasses.dataclass
     class Edit:
@@ -272,9 +393,12 @@ class ProgramUtils:
     ActionType: list = ActionType  # noqa
     
     @staticmethod
-    def startmemory() -> None:
-        """Start memory tracing."""
-        tracemalloc.start()
+    def startmemory(frames: int = 1) -> None:
+        """Start memory tracing.
+        
+        :param frames: int: The frames kept per allocation's traceback
+        """
+        tracemalloc.start(frames)
     
     @staticmethod
     def stopmemory() -> None:
@@ -0,0 +1,866 @@
+#!/user/bin/env python3
+# pylint: disable=trailing-whitespace
+# ruff: noqa: ANN101, I001
+# noqa: W293 blank line contains whitespace
+"""Module: StandIn: A local Sheets & Drive API stand-in, with faults.
+
+Usage:
+-------------------------
+- SheetsStandIn: A local HTTP server of the Sheets v4, and Drive v3,
+                 endpoints gspread calls: the real gspread code paths run,
+                 with no network, and no credentials.
+                 - Drive: list files by title: open; a file's metadata.
+                 - Sheets: the spreadsheet's metadata; values get, batchGet,
+                   update, batchUpdate, append, clear, batchClear; and
+                   batchUpdate's insert, delete and resize of a sheet.
+- Faults: Injected per request: latency, jitter, 429 quota errors, per
+          window or at random, and a request payload limit: as Google's.
+- python standin.py --data data.csv --latency 80 --jitter 40 --quota 60
+- PYCRITERIA_BACKEND=standin PYCRITERIA_API=http://127.0.0.1:8765 \
+  python app.py repl
+
+Linting:
+-------------------------
+- pylint: disable=trailing-whitespace
+- ruff: noqa:
+      I001:     unsorted-imports
+                Import block is unsorted or unformatted
+      ANN101:   missing-type-self
+                Missing type annotation for {name} in method
+- noqa: W293
+
+Critieria:
+LO2.2: Clearly separate and identify code written for the application and
+       the code from external sources (e.g. libraries or tutorials)
+LO2.2.3: Clearly separate code from external sources
+LO2.2.4: Clearly identify code from external sources
+LO6: Use library software for building a graphical user interface,
+or command-line interface, or web application, or mathematical software
+LO6.1 Implement the use of external Python libraries
+LO6.1.1 Implement the use of external Python libraries
+      where appropriate to provide the functionality that the project requires.
+-------------------------
+Standard Libraries
+:imports: collections, contextlib, csv, dataclasses, datetime, http
+:imports: http.server, itertools, json, random, re, threading, time
+:imports: typing, urllib.parse
+
+3rd Paty Imports
+:imports: click, gspread.utils
+
+Custom Authored Libraries
+:imports: settings.Settings
+
+:class: Faults: The faults injected: latency, jitter, quota, payload.
+:class: Tab: A worksheet: its grid's size, and its cells, as text.
+:class: Book: A spreadsheet: its id, title, and tabs.
+:class: APIFault: An API error: its status, and Google's error body.
+:class: StandInHandler: Routes a request to its endpoint.
+:class: SheetsStandIn: The server: its books, faults, and counts.
+"""
+# 0.1 Standard Library Imports
+import collections
+import contextlib
+import csv
+import dataclasses
+import datetime
+import http
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+from urllib.parse import parse_qs, unquote, urlsplit
+
+# 0.2 Third Party Modules
+import click  # type: ignore
+from gspread.utils import (a1_range_to_grid_range,  # type: ignore
+                           absolute_range_name, numericise, rowcol_to_a1)
+
+# 0.3 Local imports
+from settings import Settings
+
+
+@dataclasses.dataclass(frozen=True)
+class Faults:
+    """The faults injected, per request: all off by default.
+    
+    :property: latency: float: Milliseconds added to each response.
+    :property: jitter: float: Up to +/- this many milliseconds more.
+    :property: quota: int: Requests allowed per window: 0 is unlimited.
+    :property: window: float: The quota's window, in seconds.
+    :property: failrate: float: The share of requests failed with 429.
+    :property: payload: int: Bytes allowed per request body: 0 unlimited.
+    """
+    latency: float = Settings.StandIn.LATENCY
+    jitter: float = Settings.StandIn.JITTER
+    quota: int = Settings.StandIn.QUOTA
+    window: float = Settings.StandIn.WINDOW
+    failrate: float = Settings.StandIn.FAILRATE
+    payload: int = Settings.StandIn.PAYLOAD
+
+
+@dataclasses.dataclass
+class Tab:
+    """A worksheet: its grid's size, and its cells, as text.
+    
+    Rows of cells may be shorter than the grid: the rest are empty.
+    
+    :property: id: int: The sheetId.
+    :property: title: str: The tab's name.
+    :property: rows: int: The grid's rows: rowCount.
+    :property: cols: int: The grid's columns: columnCount.
+    :property: cells: list[list[str]]: The cells, by row.
+    """
+    id: int
+    title: str
+    rows: int
+    cols: int
+    cells: list[list[str]]
+    
+    def properties(self, index: int) -> dict[str, Any]:
+        """The sheet's properties: as the spreadsheet's metadata lists.
+        
+        :param index: int: The tab's place in the spreadsheet
+        :return: dict[str, Any]
+        """
+        return {'sheetId': self.id, 'title': self.title, 'index': index,
+                'sheetType': 'GRID',
+                'gridProperties': {'rowCount': self.rows,
+                                   'columnCount': self.cols}}
+    
+    def bounds(self, grid: dict[str, int]) -> tuple[int, int, int, int]:
+        """A grid range's bounds: unbounded sides are the grid's edges.
+        
+        :param grid: dict[str, int]: From a1_range_to_grid_range
+        :return: tuple[int, int, int, int]: Top, bottom, left, right
+        """
+        return (grid.get('startRowIndex', 0),
+                grid.get('endRowIndex', self.rows),
+                grid.get('startColumnIndex', 0),
+                grid.get('endColumnIndex', self.cols))
+    
+    def read(self, grid: dict[str, int]) -> list[list[str]]:
+        """Reads a range: trailing empty cells, and rows, are left out.
+        
+        :param grid: dict[str, int]: The range
+        :return: list[list[str]]: The cells, by row
+        """
+        top, bottom, left, right = self.bounds(grid=grid)
+        values: list[list[str]] = []
+        for row in self.cells[top:bottom]:
+            cells: list[str] = row[left:right]
+            while cells and cells[-1] == '':
+                cells.pop()
+            values.append(cells)
+        while values and not values[-1]:
+            values.pop()
+        return values
+    
+    def write(self, top: int, left: int, values: list[list[Any]]) -> None:
+        """Writes the values, from the top left cell: within the grid.
+        
+        :param top: int: The 0 based row
+        :param left: int: The 0 based column
+        :param values: list[list[Any]]: The values, by row
+        :return: None
+        """
+        width: int = max((len(row) for row in values), default=0)
+        if top + len(values) > self.rows or left + width > self.cols:
+            raise APIFault.invalid(
+                f'Range ({self.title}!{rowcol_to_a1(top + 1, left + 1)}) '
+                'exceeds grid limits. '
+                f'Max rows: {self.rows}, max columns: {self.cols}')
+        self.cells.extend([] for _ in range(top + len(values) -
+                                            len(self.cells)))
+        for offset, row in enumerate(values):
+            cells: list[str] = self.cells[top + offset]
+            cells.extend([''] * (left + len(row) - len(cells)))
+            cells[left:left + len(row)] = [
+                '' if value is None else str(value) for value in row]
+    
+    def table(self, top: int) -> int:
+        """The row after the table from the top row: where appends go.
+        
+        The table is the rows, from the top, each with a value.
+        
+        :param top: int: The 0 based row the search starts at
+        :return: int: The 0 based row after the table's last row
+        """
+        after: int = top
+        while after < len(self.cells) and any(self.cells[after]):
+            after += 1
+        return after
+
+
+@dataclasses.dataclass
+class Book:
+    """A spreadsheet: its id, title, tabs, and Drive's times.
+    
+    :property: id: str: The spreadsheet's key.
+    :property: title: str: Its name, in Drive.
+    :property: tabs: list[Tab]: Its worksheets, in order.
+    :property: created: str: RFC 3339.
+    :property: modified: str: RFC 3339: on each write.
+    """
+    id: str
+    title: str
+    tabs: list[Tab]
+    created: str
+    modified: str
+    
+    def file(self) -> dict[str, str]:
+        """The spreadsheet, as a Drive file."""
+        return {'kind': 'drive#file', 'id': self.id, 'name': self.title,
+                'mimeType': 'application/vnd.google-apps.spreadsheet',
+                'createdTime': self.created, 'modifiedTime': self.modified}
+    
+    def metadata(self) -> dict[str, Any]:
+        """The spreadsheet's metadata: includeGridData is not served."""
+        return {'spreadsheetId': self.id,
+                'properties': {'title': self.title, 'locale': 'en_GB',
+                               'timeZone': 'Europe/London'},
+                'sheets': [{'properties': tab.properties(index=index)}
+                           for index, tab in enumerate(self.tabs)]}
+    
+    def tab(self, name: str) -> Tab:
+        """A tab, by its title: '' is the first tab.
+        
+        :param name: str: The tab's title
+        :return: Tab
+        """
+        for tab in self.tabs:
+            if not name or tab.title == name:
+                return tab
+        raise APIFault.invalid(f'Unable to parse range: {name}')
+    
+    def sheet(self, sheetid: int) -> Tab:
+        """A tab, by its sheetId.
+        
+        :param sheetid: int: The sheetId
+        :return: Tab
+        """
+        for tab in self.tabs:
+            if tab.id == sheetid:
+                return tab
+        raise APIFault.invalid(f'No grid with id: {sheetid}')
+    
+    def locate(self, a1: str) -> tuple[Tab, dict[str, int]]:
+        """A range's tab, and grid range: e.g. 'Data'!A1:M5, or Data.
+        
+        :param a1: str: The range, in A1 notation
+        :return: tuple[Tab, dict[str, int]]
+        """
+        name, _, cells = a1.rpartition('!') if '!' in a1 else (a1, '', '')
+        if name and not cells and re.fullmatch(r'[A-Z]*\d*(:[A-Z]*\d*)?',
+                                               name) and name not in \
+                [tab.title for tab in self.tabs]:  # noqa # Pep8 E125
+            name, cells = '', name
+        title: str = name[1:-1].replace("''", "'") \
+            if name.startswith("'") else name
+        try:
+            grid: dict[str, int] = a1_range_to_grid_range(cells) \
+                if cells else {}
+        except Exception as error:  # pylint: disable=broad-except
+            raise APIFault.invalid(f'Unable to parse range: {a1}') from error
+        return self.tab(name=title), grid
+    
+    def touch(self) -> None:
+        """Marks the spreadsheet as modified, now."""
+        self.modified = SheetsStandIn.now()
+
+
+class APIFault(Exception):
+    """An API error: its status, and the error body Google sends.
+    
+    :property: status: int: The HTTP status.
+    :property: body: dict: {'error': {'code', 'message', 'status'}}
+    """
+    
+    def __init__(self, status: http.HTTPStatus, reason: str,
+                 message: str) -> None:
+        """An API error.
+        
+        :param status: http.HTTPStatus: e.g. 429
+        :param reason: str: Google's status: e.g. RESOURCE_EXHAUSTED
+        :param message: str: The error's message
+        """
+        super().__init__(message)
+        self.status = int(status)
+        self.body = {'error': {'code': int(status), 'message': message,
+                               'status': reason}}
+    
+    @staticmethod
+    def invalid(message: str) -> 'APIFault':
+        """A 400: the request is invalid."""
+        return APIFault(http.HTTPStatus.BAD_REQUEST, 'INVALID_ARGUMENT',
+                        message)
+    
+    @staticmethod
+    def missing(message: str) -> 'APIFault':
+        """A 404: no such spreadsheet, file, or endpoint."""
+        return APIFault(http.HTTPStatus.NOT_FOUND, 'NOT_FOUND', message)
+    
+    @staticmethod
+    def quota() -> 'APIFault':
+        """A 429: the quota is exceeded, as the Sheets API words it."""
+        return APIFault(http.HTTPStatus.TOO_MANY_REQUESTS,
+                        'RESOURCE_EXHAUSTED',
+                        "Quota exceeded for quota metric 'Read requests' "
+                        "and limit 'Read requests per minute per user' "
+                        "of service 'sheets.googleapis.com'.")
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Routes a request to its endpoint: after the faults are injected.
+    
+    Routes: (method, path pattern, the SheetsStandIn method): the path is
+    matched before it is unquoted: gspread quotes the range's colons.
+    """
+    
+    server: 'SheetsStandIn'
+    protocol_version = 'HTTP/1.1'
+    ROUTES: list[tuple[str, re.Pattern, str]] = [
+        ('GET', re.compile(r'/drive/v3/files'), 'files'),
+        ('GET', re.compile(r'/drive/v3/files/(?P<key>[^/]+)'), 'drivefile'),
+        ('GET', re.compile(r'/v4/spreadsheets/(?P<key>[^/:]+)'), 'metadata'),
+        ('POST', re.compile(r'/v4/spreadsheets/(?P<key>[^/:]+):batchUpdate'),
+         'batchupdate'),
+        ('GET', re.compile(r'/v4/spreadsheets/(?P<key>[^/:]+)'
+                           r'/values:batchGet'), 'batchget'),
+        ('POST', re.compile(r'/v4/spreadsheets/(?P<key>[^/:]+)'
+                            r'/values:batchUpdate'), 'valuesbatchupdate'),
+        ('POST', re.compile(r'/v4/spreadsheets/(?P<key>[^/:]+)'
+                            r'/values:batchClear'), 'batchclear'),
+        ('GET', re.compile(r'/v4/spreadsheets/(?P<key>[^/:]+)'
+                           r'/values/(?P<a1>[^/:]+)'), 'valuesget'),
+        ('PUT', re.compile(r'/v4/spreadsheets/(?P<key>[^/:]+)'
+                           r'/values/(?P<a1>[^/:]+)'), 'valuesupdate'),
+        ('POST', re.compile(r'/v4/spreadsheets/(?P<key>[^/:]+)'
+                            r'/values/(?P<a1>[^/:]+):append'), 'append'),
+        ('POST', re.compile(r'/v4/spreadsheets/(?P<key>[^/:]+)'
+                            r'/values/(?P<a1>[^/:]+):clear'), 'clear')]
+    
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Serves a GET."""
+        self.serve()
+    
+    def do_PUT(self) -> None:  # pylint: disable=invalid-name
+        """Serves a PUT."""
+        self.serve()
+    
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Serves a POST."""
+        self.serve()
+    
+    def serve(self) -> None:
+        """Reads the body, injects the faults, then routes the request."""
+        length: int = int(self.headers.get('Content-Length') or 0)
+        raw: bytes = self.rfile.read(length) if length else b''
+        url = urlsplit(self.path)
+        params: dict[str, list[str]] = parse_qs(url.query)
+        try:
+            self.server.inject(size=length)
+            for method, pattern, endpoint in self.ROUTES:
+                matched: re.Match | None = pattern.fullmatch(url.path)
+                if method == self.command and matched is not None:
+                    body: dict = json.loads(raw) if raw else {}
+                    self.reply(http.HTTPStatus.OK, getattr(
+                        self.server, endpoint)(
+                            params=params, body=body,
+                            **{name: unquote(value) for name, value
+                               in matched.groupdict().items()}))
+                    return
+            raise APIFault.missing(f'No endpoint: {self.command} {url.path}')
+        except APIFault as fault:
+            self.reply(fault.status, fault.body)
+        except (ValueError, KeyError, TypeError) as error:
+            self.reply(http.HTTPStatus.BAD_REQUEST,
+                       APIFault.invalid(f'Invalid request: {error}').body)
+    
+    def reply(self, status: int, body: dict) -> None:
+        """Sends the JSON body: and counts it.
+        
+        :param status: int: The HTTP status
+        :param body: dict: The JSON body
+        :return: None
+        """
+        data: bytes = json.dumps(body).encode(Settings.ENCODE)
+        self.server.count(status=status, sent=len(data))
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format: str,  # pylint: disable=redefined-builtin
+                    *args: Any) -> None:
+        """Logs only if the server is verbose."""
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class SheetsStandIn(ThreadingHTTPServer):
+    """SheetsStandIn: Serves spreadsheets, from CSV files, as Google does.
+    
+    The books are kept in memory: writes are not saved to the files.
+    
+    :property: books: dict[str, Book]: Key to spreadsheet.
+    :property: faults: Faults: Injected per request.
+    :property: verbose: bool: Logs each request, to stderr.
+    :property: lock: threading.Lock: Guards the books, and the counts.
+    :property: served: collections.deque: The window's request times.
+    :property: counts: collections.Counter: Requests, by status, & bytes.
+    :property: chance: random.Random: Seeded: jitter and failures.
+    """
+    
+    daemon_threads = True
+    
+    books: dict[str, Book]
+    faults: Faults
+    verbose: bool
+    lock: threading.Lock
+    served: collections.deque
+    counts: collections.Counter
+    chance: random.Random
+    
+    def __init__(self,
+                 host: str = Settings.StandIn.HOST,
+                 port: int = Settings.StandIn.PORT,
+                 faults: Faults | None = None,
+                 verbose: bool = False,
+                 seed: int = 0) -> None:
+        """Binds the server: with no books, until added.
+        
+        :param host: str: The address to serve on
+        :param port: int: The port: 0 picks a free port
+        :param faults: Faults | None: The faults: None: none
+        :param verbose: bool: Logs each request
+        :param seed: int: The jitter's, and failures', seed
+        """
+        super().__init__((host, port), StandInHandler)
+        self.books = {}
+        self.faults = faults or Faults()
+        self.verbose = verbose
+        self.lock = threading.Lock()
+        self.served = collections.deque()
+        self.counts = collections.Counter()
+        self.chance = random.Random(seed)
+    
+    @property
+    def url(self) -> str:
+        """The server's base URL: for PYCRITERIA_API."""
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+    
+    @staticmethod
+    def now() -> str:
+        """Now, in RFC 3339: as Drive's times."""
+        return datetime.datetime.now(datetime.timezone.utc) \
+            .isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+    
+    def add(self, path: str, title: str = Settings.SHEET_NAME,
+            tab: str = Settings.TAB_NAME) -> Book:
+        """Adds a spreadsheet, of one tab: the CSV file's cells.
+        
+        :param path: str: The CSV file
+        :param title: str: The spreadsheet's title
+        :param tab: str: The tab's title
+        :return: Book: The spreadsheet added
+        """
+        with open(path, newline='', encoding=Settings.ENCODE) as file:
+            cells: list[list[str]] = list(csv.reader(file))
+        now: str = self.now()
+        book: Book = Book(
+            id=f'standin{len(self.books) + 1:04d}', title=title,
+            tabs=[Tab(id=0, title=tab, rows=max(len(cells), 1),
+                      cols=max((len(row) for row in cells), default=1),
+                      cells=cells)],
+            created=now, modified=now)
+        with self.lock:
+            self.books[book.id] = book
+        return book
+    
+    def book(self, key: str) -> Book:
+        """A spreadsheet, by key: else a 404, as Google's.
+        
+        :param key: str: The spreadsheet's key
+        :return: Book
+        """
+        if key not in self.books:
+            raise APIFault.missing(f'Requested entity was not found: {key}')
+        return self.books[key]
+    
+    # Faults
+    def inject(self, size: int) -> None:
+        """Injects the faults: the payload limit, the quota, then latency.
+        
+        :param size: int: The request body's bytes
+        :return: None
+        """
+        faults: Faults = self.faults
+        with self.lock:
+            self.counts['requests'] += 1
+            self.counts['received'] += size
+            delay: float = faults.latency + self.chance.uniform(
+                -faults.jitter, faults.jitter)
+            failed: bool = self.chance.random() < faults.failrate
+            now: float = time.monotonic()
+            while self.served and now - self.served[0] >= faults.window:
+                self.served.popleft()
+            exhausted: bool = 0 < faults.quota <= len(self.served)
+            if not exhausted:
+                self.served.append(now)
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if 0 < faults.payload < size:
+            raise APIFault.invalid('Request payload size exceeds the '
+                                   f'limit: {faults.payload} bytes.')
+        if exhausted or failed:
+            raise APIFault.quota()
+    
+    def count(self, status: int, sent: int) -> None:
+        """Counts a response: by its status, and its bytes.
+        
+        :param status: int: The HTTP status
+        :param sent: int: The body's bytes
+        :return: None
+        """
+        with self.lock:
+            self.counts[int(status)] += 1
+            self.counts['sent'] += sent
+    
+    # Drive v3
+    def files(self, params: dict[str, list[str]],
+              body: dict) -> dict[str, Any]:  # noqa: ARG002
+        """Lists the spreadsheets: by the query's name = "title", if any.
+        
+        :param params: dict[str, list[str]]: q, pageSize, ...
+        :param body: dict: Unused
+        :return: dict[str, Any]: {'files': [...]}
+        """
+        query: str = params.get('q', [''])[0]
+        named: re.Match | None = re.search(r'name\s*=\s*"((?:[^"\\]|\\.)*)"',
+                                           query)
+        title: str | None = named.group(1) if named else None
+        with self.lock:
+            return {'kind': 'drive#fileList',
+                    'files': [book.file() for book in self.books.values()
+                              if title is None or book.title == title]}
+    
+    def drivefile(self, params: dict[str, list[str]], body: dict,
+                  key: str) -> dict[str, str]:  # noqa: ARG002
+        """A spreadsheet's Drive metadata."""
+        with self.lock:
+            return self.book(key=key).file()
+    
+    # Sheets v4: spreadsheets
+    def metadata(self, params: dict[str, list[str]], body: dict,
+                 key: str) -> dict[str, Any]:  # noqa: ARG002
+        """A spreadsheet's metadata: its properties, and its sheets'."""
+        with self.lock:
+            return self.book(key=key).metadata()
+    
+    def batchupdate(self, params: dict[str, list[str]], body: dict,
+                    key: str) -> dict[str, Any]:  # noqa: ARG002
+        """Inserts, deletes, or resizes, rows and columns: per request.
+        
+        :param params: dict[str, list[str]]: Unused
+        :param body: dict: {'requests': [...]}
+        :param key: str: The spreadsheet's key
+        :return: dict[str, Any]: A reply per request
+        """
+        with self.lock:
+            book: Book = self.book(key=key)
+            for request in body.get('requests', []):
+                kind, detail = next(iter(request.items()))
+                if kind == 'insertDimension':
+                    self.insert(book=book, grid=detail['range'])
+                elif kind == 'deleteDimension':
+                    self.delete(book=book, grid=detail['range'])
+                elif kind == 'updateSheetProperties':
+                    self.resize(book=book, properties=detail['properties'])
+                else:
+                    raise APIFault.invalid(
+                        f'Not served by the stand-in: {kind}')
+            book.touch()
+            return {'spreadsheetId': book.id,
+                    'replies': [{} for _ in body.get('requests', [])]}
+    
+    @staticmethod
+    def insert(book: Book, grid: dict[str, Any]) -> None:
+        """Inserts empty rows, or columns, before the start index."""
+        tab: Tab = book.sheet(sheetid=grid.get('sheetId', 0))
+        start: int = grid['startIndex']
+        added: int = grid['endIndex'] - start
+        if grid['dimension'] == 'ROWS':
+            tab.cells[start:start] = [[] for _ in range(added)]
+            tab.rows += added
+        else:
+            for row in tab.cells:
+                if len(row) > start:
+                    row[start:start] = [''] * added
+            tab.cols += added
+    
+    @staticmethod
+    def delete(book: Book, grid: dict[str, Any]) -> None:
+        """Deletes rows, or columns, from the start to the end index."""
+        tab: Tab = book.sheet(sheetid=grid.get('sheetId', 0))
+        start: int = grid['startIndex']
+        end: int = grid['endIndex']
+        if grid['dimension'] == 'ROWS':
+            del tab.cells[start:end]
+            tab.rows -= min(end, tab.rows) - start
+        else:
+            for row in tab.cells:
+                del row[start:end]
+            tab.cols -= min(end, tab.cols) - start
+    
+    @staticmethod
+    def resize(book: Book, properties: dict[str, Any]) -> None:
+        """Resizes the grid: cells outside it are dropped."""
+        tab: Tab = book.sheet(sheetid=properties.get('sheetId', 0))
+        grid: dict[str, int] = properties.get('gridProperties', {})
+        tab.rows = grid.get('rowCount', tab.rows)
+        tab.cols = grid.get('columnCount', tab.cols)
+        del tab.cells[tab.rows:]
+        for row in tab.cells:
+            del row[tab.cols:]
+    
+    # Sheets v4: values
+    @staticmethod
+    def rendered(values: list[list[str]], params: dict[str, list[str]]) \
+            -> list[list[Any]]:
+        """The values, as rendered: numbers, if unformatted; by columns.
+        
+        :param values: list[list[str]]: The cells, by row
+        :param params: dict[str, list[str]]: valueRenderOption, ...
+        :return: list[list[Any]]
+        """
+        if params.get('valueRenderOption', [''])[0] == 'UNFORMATTED_VALUE':
+            values = [[numericise(cell) for cell in row] for row in values]
+        if params.get('majorDimension', ['ROWS'])[0] == 'COLUMNS':
+            values = [list(column) for column in
+                      itertools.zip_longest(*values, fillvalue='')]
+        return values
+    
+    def valuerange(self, book: Book, a1: str,
+                   params: dict[str, list[str]]) -> dict[str, Any]:
+        """A range's values, as a ValueRange: no 'values' if empty."""
+        tab, grid = book.locate(a1=a1)
+        top, bottom, left, right = tab.bounds(grid=grid)
+        ranged: dict[str, Any] = {
+            'range': absolute_range_name(
+                tab.title, f'{rowcol_to_a1(top + 1, left + 1)}:'
+                           f'{rowcol_to_a1(bottom, right)}'),
+            'majorDimension': params.get('majorDimension', ['ROWS'])[0]}
+        values: list[list[Any]] = self.rendered(values=tab.read(grid=grid),
+                                                params=params)
+        if values:
+            ranged['values'] = values
+        return ranged
+    
+    def valuesget(self, params: dict[str, list[str]], body: dict, key: str,
+                  a1: str) -> dict[str, Any]:  # noqa: ARG002
+        """A range's values."""
+        with self.lock:
+            return self.valuerange(book=self.book(key=key), a1=a1,
+                                   params=params)
+    
+    def batchget(self, params: dict[str, list[str]], body: dict,
+                 key: str) -> dict[str, Any]:  # noqa: ARG002
+        """The ranges' values."""
+        with self.lock:
+            book: Book = self.book(key=key)
+            return {'spreadsheetId': key,
+                    'valueRanges': [self.valuerange(book=book, a1=a1,
+                                                    params=params)
+                                    for a1 in params.get('ranges', [])]}
+    
+    @staticmethod
+    def update(book: Book, a1: str, values: list[list[Any]]) \
+            -> dict[str, Any]:
+        """Writes the values, from the range's top left: an UpdateValues.
+        
+        :param book: Book: The spreadsheet
+        :param a1: str: The range
+        :param values: list[list[Any]]: The values, by row
+        :return: dict[str, Any]: The updated range, rows, columns & cells
+        """
+        tab, grid = book.locate(a1=a1)
+        top, _, left, _ = tab.bounds(grid=grid)
+        tab.write(top=top, left=left, values=values)
+        book.touch()
+        width: int = max((len(row) for row in values), default=0)
+        bottom: int = top + max(len(values), 1)
+        right: int = left + max(width, 1)
+        return {'spreadsheetId': book.id,
+                'updatedRange': absolute_range_name(
+                    tab.title, f'{rowcol_to_a1(top + 1, left + 1)}:'
+                               f'{rowcol_to_a1(bottom, right)}'),
+                'updatedRows': len(values),
+                'updatedColumns': width,
+                'updatedCells': sum(len(row) for row in values)}
+    
+    def valuesupdate(self, params: dict[str, list[str]], body: dict,
+                     key: str, a1: str) -> dict[str, Any]:  # noqa: ARG002
+        """Writes a range's values."""
+        with self.lock:
+            return self.update(book=self.book(key=key), a1=a1,
+                               values=body.get('values', []))
+    
+    def valuesbatchupdate(self, params: dict[str, list[str]], body: dict,
+                          key: str) -> dict[str, Any]:  # noqa: ARG002
+        """Writes the ranges' values."""
+        with self.lock:
+            book: Book = self.book(key=key)
+            responses: list[dict[str, Any]] = [
+                self.update(book=book, a1=data['range'],
+                            values=data.get('values', []))
+                for data in body.get('data', [])]
+            return {'spreadsheetId': key,
+                    'totalUpdatedCells': sum(response['updatedCells']
+                                             for response in responses),
+                    'responses': responses}
+    
+    def append(self, params: dict[str, list[str]], body: dict, key: str,
+               a1: str) -> dict[str, Any]:
+        """Appends rows after the range's table: grows the grid to fit.
+        
+        INSERT_ROWS inserts new rows for them: else they overwrite.
+        
+        :param params: dict[str, list[str]]: insertDataOption, ...
+        :param body: dict: {'values': [...]}
+        :param key: str: The spreadsheet's key
+        :param a1: str: The range: its table is searched for
+        :return: dict[str, Any]: The table's range, and the updates
+        """
+        with self.lock:
+            book: Book = self.book(key=key)
+            tab, grid = book.locate(a1=a1)
+            values: list[list[Any]] = body.get('values', [])
+            width: int = max((len(row) for row in values), default=0)
+            left: int = grid.get('startColumnIndex', 0)
+            top: int = tab.table(top=grid.get('startRowIndex', 0))
+            if params.get('insertDataOption', [''])[0] == 'INSERT_ROWS':
+                tab.cells[top:top] = [[] for _ in values]
+                tab.rows += len(values)
+            tab.rows = max(tab.rows, top + len(values))
+            tab.cols = max(tab.cols, left + width)
+            updates: dict[str, Any] = self.update(
+                book=book, values=values,
+                a1=absolute_range_name(tab.title,
+                                       rowcol_to_a1(top + 1, left + 1)))
+            corner: str = rowcol_to_a1(max(top, 1), tab.cols)
+            return {'spreadsheetId': key,
+                    'tableRange': absolute_range_name(tab.title,
+                                                      f'A1:{corner}'),
+                    'updates': updates}
+    
+    @staticmethod
+    def erase(book: Book, a1: str) -> str:
+        """Clears a range's values: the grid keeps its size.
+        
+        :param book: Book: The spreadsheet
+        :param a1: str: The range
+        :return: str: The range cleared
+        """
+        tab, grid = book.locate(a1=a1)
+        top, bottom, left, right = tab.bounds(grid=grid)
+        for row in tab.cells[top:bottom]:
+            row[left:right] = [''] * len(row[left:right])
+        book.touch()
+        return a1
+    
+    def clear(self, params: dict[str, list[str]], body: dict, key: str,
+              a1: str) -> dict[str, Any]:  # noqa: ARG002
+        """Clears a range's values."""
+        with self.lock:
+            return {'spreadsheetId': key,
+                    'clearedRange': self.erase(book=self.book(key=key),
+                                               a1=a1)}
+    
+    def batchclear(self, params: dict[str, list[str]], body: dict,
+                   key: str) -> dict[str, Any]:  # noqa: ARG002
+        """Clears the ranges' values."""
+        with self.lock:
+            book: Book = self.book(key=key)
+            return {'spreadsheetId': key,
+                    'clearedRanges': [self.erase(book=book, a1=a1)
+                                      for a1 in body.get('ranges', [])]}
+    
+    @contextlib.contextmanager
+    def running(self) -> Iterator['SheetsStandIn']:
+        """Serves in a background thread: stopped, and closed, on exit.
+        
+        :return: Iterator[SheetsStandIn]: The server, serving
+        """
+        thread: threading.Thread = threading.Thread(
+            target=self.serve_forever, name='standin', daemon=True)
+        thread.start()
+        try:
+            yield self
+        finally:
+            self.shutdown()
+            self.server_close()
+            thread.join()
+
+
+@click.command(name='standin')
+@click.option('--data', 'data', type=click.Path(exists=True, dir_okay=False),
+              default=Settings.Backend.DATASET, show_default=True,
+              help='The CSV file: served as the spreadsheet\'s tab.')
+@click.option('--host', 'host', default=Settings.StandIn.HOST,
+              show_default=True, help='The address to serve on.')
+@click.option('--port', 'port', type=click.IntRange(min=0),
+              default=Settings.StandIn.PORT, show_default=True,
+              help='The port to serve on.')
+@click.option('--latency', 'latency', type=click.FloatRange(min=0),
+              default=Settings.StandIn.LATENCY, show_default=True,
+              help='Milliseconds added to each response.')
+@click.option('--jitter', 'jitter', type=click.FloatRange(min=0),
+              default=Settings.StandIn.JITTER, show_default=True,
+              help='Up to +/- this many milliseconds more.')
+@click.option('--quota', 'quota', type=click.IntRange(min=0),
+              default=Settings.StandIn.QUOTA, show_default=True,
+              help='Requests per window, then 429s: 0 is unlimited.')
+@click.option('--window', 'window', type=click.FloatRange(min=0),
+              default=Settings.StandIn.WINDOW, show_default=True,
+              help='The quota\'s window, in seconds.')
+@click.option('--failrate', 'failrate', type=click.FloatRange(0, 1),
+              default=Settings.StandIn.FAILRATE, show_default=True,
+              help='The share of requests failed with 429, at random.')
+@click.option('--payload', 'payload', type=click.IntRange(min=0),
+              default=Settings.StandIn.PAYLOAD, show_default=True,
+              help='Bytes allowed per request body: 0 is unlimited.')
+@click.option('--verbose', 'verbose', is_flag=True, default=False,
+              help='Logs each request.')
+def main(data: str, host: str, port: int, latency: float, jitter: float,
+         quota: int, window: float, failrate: float, payload: int,
+         verbose: bool) -> None:
+    """StandIn: serve the Sheets & Drive APIs locally, with faults."""
+    server: SheetsStandIn = SheetsStandIn(
+        host=host, port=port, verbose=verbose,
+        faults=Faults(latency=latency, jitter=jitter, quota=quota,
+                      window=window, failrate=failrate, payload=payload))
+    book: Book = server.add(path=data)
+    click.echo(f'Serving {book.title}!{book.tabs[0].title} on {server.url}',
+               err=True)
+    click.echo(f'{Settings.Backend.SOURCE}={Settings.Backend.STANDIN} '
+               f'{Settings.Backend.API}={server.url}', err=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        click.echo(f'Served: {dict(server.counts)}', err=True)
+
+
+if __name__ == '__main__':
+    main()
+
+# End of StandIn Module
@@ -0,0 +1,1191 @@
+#!/user/bin/env python3
+# pylint: disable=trailing-whitespace
+# ruff: noqa: ANN101, I001
+# noqa: W293 blank line contains whitespace
+"""Module: Telemetry: Per command timings, by phase, and remote API calls.
+
+Usage:
+-------------------------
+- Metrics: Times each command, e.g. load todo, find locate, edit note,
+           split into its phases: where a slow command spends its time.
+           - auth: connecting, authorising, opening the sheet.
+           - fetch: getting the records from the remote.
+           - parse: records to a dataframe, swapped into the app data.
+           - render: tables, cards and panels, to the console.
+           - save: committing an edit to the remote.
+           - other: the rest, e.g. prompts, the user's typing.
+           The remote API calls, and their bytes, are counted per command,
+           by a response hook on the client's session.
+- MemoryProfiler: Snapshots tracemalloc before and after each command:
+                  reports the allocation sites that grew the most, the
+                  traced peak, and the process' peak RSS. Warns once the
+                  session's peak RSS is over the memory budget.
+- CallProfiler: Profiles each command's calls: by a sampling profiler,
+                pyinstrument, if installed, else cProfile. Dumps a profile
+                per command, to a directory, and prints the functions with
+                the most cumulative time: e.g. for a slow edit note, or
+                record card, in the web terminal's own session.
+- Tracer: Spans around the Google connector's calls, the data loads, the
+          results' lookups, the editor's operations, the rendering, and
+          the remote's HTTP calls: parent and child, per command. The
+          session's spans are written as Chrome trace event JSON: open it
+          in a trace viewer, e.g. Perfetto, or chrome://tracing. trace
+          show breaks the last command down: e.g. how much of edit
+          progress is Editor.save re-downloading the sheet.
+- MeteredGroup: The click group that times, profiles, and traces, each
+                command, and buffers its output.
+- Opt in: run stats: the last commands' timings.
+          run stats --log metrics.jsonl: also a JSON line per command.
+          run memory on --budget 256: a memory report per command.
+          run memory show: the data frames held, e.g. App.data.
+          run profile on --top 20: a call profile per command, dumped.
+          run trace on: the session's spans, as a Chrome trace.
+- Forks: A forked child, e.g. a prefork REPL, starts its own telemetry:
+         its own trace file and pid, no parent's commands or reports.
+
+Linting:
+-------------------------
+- pylint: disable=trailing-whitespace
+- ruff: noqa:
+      I001:     unsorted-imports
+                Import block is unsorted or unformatted
+      ANN101:   missing-type-self
+                Missing type annotation for {name} in method
+- noqa: W293
+
+Critieria:
+LO2.2: Clearly separate and identify code written for the application and
+       the code from external sources (e.g. libraries or tutorials)
+LO2.2.3: Clearly separate code from external sources
+LO2.2.4: Clearly identify code from external sources
+LO6: Use library software for building a graphical user interface,
+or command-line interface, or web application, or mathematical software
+LO6.1 Implement the use of external Python libraries
+LO6.1.1 Implement the use of external Python libraries
+      where appropriate to provide the functionality that the project requires.
+-------------------------
+Standard Libraries
+:imports: collections, contextlib, cProfile, dataclasses, functools,
+          json, os, pathlib, pstats, re, sys, threading, time,
+          tracemalloc, typing
+:imports: resource: peak RSS: not on Windows
+
+3rd Paty Imports
+:imports: click, pandas
+:imports: pyinstrument: optional: the sampling profiler
+
+Custom Authored Libraries
+:imports: settings.Settings
+:imports: sidecar.ProgramUtils
+:imports: terminal.BufferedGroup
+
+:class: Timing: A command's wall time, phases, API calls and bytes.
+:class: Metrics: Times commands and phases, counts API calls: keeps them.
+:class: MemoryUse: A command's traced growth, top sites, peak RSS.
+:class: MemoryProfiler: Snapshot diffs per command, and the memory budget.
+:class: CallProfiler: A call profile per command: dumped, top printed.
+:class: Tracer: Spans per command: parent, child: Chrome trace JSON.
+:class: MeteredGroup: A click group: times, profiles, traces, buffers.
+:var: metrics: Metrics: The app's metrics.
+:var: profiler: MemoryProfiler: The app's memory profiler: off by default.
+:var: callprofiler: CallProfiler: The app's call profiler: off by default.
+:var: tracer: Tracer: The app's tracer: off by default.
+:function: forked: A forked child's telemetry: reset, after os.fork.
+"""
+# 0.1 Standard Library Imports
+import collections
+import contextlib
+import cProfile
+import dataclasses
+import functools
+import json
+import os
+import pathlib
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, ContextManager, Iterator
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage, no peak RSS
+    resource = None
+
+# 0.2 Third Party Modules
+import click  # type: ignore
+import pandas as pd  # type: ignore
+
+try:
+    import pyinstrument  # type: ignore
+except ImportError:  # Optional: the sampling profiler: else cProfile
+    pyinstrument = None
+
+# 0.3 Local imports
+from settings import Settings
+from sidecar import ProgramUtils as utils
+from terminal import BufferedGroup
+
+
+@dataclasses.dataclass
+class Timing:
+    """A command's timings: wall and phase seconds, API calls and bytes.
+    
+    :property: command: str: The command, e.g. load todo
+    :property: started: float: The start, in seconds since the epoch
+    :property: wall: float: The command's seconds, start to end
+    :property: phases: dict[str, float]: The seconds per phase
+    :property: calls: int: The remote API calls
+    :property: sent: int: The bytes sent, requests' bodies
+    :property: received: int: The bytes received, responses' bodies
+    """
+    command: str
+    started: float
+    wall: float = 0.0
+    phases: dict[str, float] = dataclasses.field(default_factory=dict)
+    calls: int = 0
+    sent: int = 0
+    received: int = 0
+    
+    @property
+    def other(self) -> float:
+        """The seconds in no phase: e.g. prompts, the user's typing."""
+        return max(self.wall - sum(self.phases.values()), 0.0)
+    
+    def add(self, phase: str, seconds: float) -> None:
+        """Adds the seconds to the phase.
+        
+        :param phase: str: e.g. fetch
+        :param seconds: float: The seconds spent
+        :return: None
+        """
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+    
+    def record(self) -> dict[str, Any]:
+        """The timing as a JSON object: a line of the log."""
+        return {'command': self.command,
+                'started': round(self.started, 3),
+                'wall': round(self.wall, 6),
+                'phases': {phase: round(seconds, 6)
+                           for phase, seconds in self.phases.items()},
+                'other': round(self.other, 6),
+                'calls': self.calls,
+                'sent': self.sent,
+                'received': self.received}
+
+
+class Metrics:
+    """Metrics: Times commands, and their phases: counts remote API calls.
+    
+    Phases are exclusive: a phase in a phase, e.g. auth in save, pauses
+    the outer phase. Outside of a command, nothing is timed or counted.
+    
+    :property: AUTH: str: Connecting, authorising, opening the sheet.
+    :property: FETCH: str: Getting the records from the remote.
+    :property: PARSE: str: Records to a dataframe, into the app data.
+    :property: RENDER: str: Tables, cards, panels to the console.
+    :property: SAVE: str: Committing an edit to the remote.
+    :property: PHASES: list[str]: The phases, in a command's order.
+    :property: history: collections.deque[Timing]: The last commands.
+    :property: current: Timing | None: The command being timed.
+    :property: stack: list[str]: The phases entered, innermost last.
+    :property: mark: float: When the innermost phase was last charged.
+    :property: log: str: The JSON Lines log's path: '' is no log.
+    """
+    
+    AUTH: str = 'auth'
+    FETCH: str = 'fetch'
+    PARSE: str = 'parse'
+    RENDER: str = 'render'
+    SAVE: str = 'save'
+    PHASES: list[str] = [AUTH, FETCH, PARSE, RENDER, SAVE]
+    
+    history: collections.deque
+    current: Timing | None
+    stack: list[str]
+    mark: float
+    log: str
+    
+    def __init__(self, history: int, log: str = '') -> None:
+        """Starts with no commands timed.
+        
+        :param history: int: The last commands kept
+        :param log: str: The JSON Lines log's path: '' is no log
+        """
+        self.history = collections.deque(maxlen=max(history, 1))
+        self.current = None
+        self.stack = []
+        self.mark = 0.0
+        self.log = log
+    
+    @contextlib.contextmanager
+    def command(self, name: str) -> Iterator[Timing | None]:
+        """Times a command: kept, and logged, when it ends.
+        
+        A command in a command is timed as part of the outer command.
+        
+        :param name: str: The command, e.g. load todo
+        :return: Iterator[Timing | None]: The timing: None, if nested
+        """
+        if self.current is not None:
+            yield None
+            return
+        timing: Timing = Timing(command=name, started=time.time())
+        self.current = timing
+        self.stack = []
+        start: float = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.wall = time.perf_counter() - start
+            self.current = None
+            self.history.append(timing)
+            self.write(timing=timing)
+    
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times a phase of the current command: pauses the outer phase.
+        
+        :param name: str: The phase, e.g. Metrics.FETCH
+        :return: Iterator[None]
+        """
+        timing: Timing | None = self.current
+        if timing is None:
+            yield
+            return
+        now: float = time.perf_counter()
+        if self.stack:
+            timing.add(phase=self.stack[-1], seconds=now - self.mark)
+        self.stack.append(name)
+        self.mark = now
+        try:
+            with tracer.span(name=name, category=Tracer.PHASE):
+                yield
+        finally:
+            now = time.perf_counter()
+            timing.add(phase=name, seconds=now - self.mark)
+            self.stack.pop()
+            self.mark = now
+    
+    def timed(self, phase: str) -> Callable[[Callable], Callable]:
+        """Decorates a function: its calls are timed as the phase.
+        
+        :param phase: str: The phase, e.g. Metrics.RENDER
+        :return: Callable: The decorator
+        """
+        def decorator(function: Callable) -> Callable:
+            """Wraps the function in the phase."""
+            @functools.wraps(function)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                """Calls the function, timed."""
+                with self.phase(name=phase):
+                    return function(*args, **kwargs)
+            
+            return wrapper
+        
+        return decorator
+    
+    def hook(self, client: Any) -> bool:
+        """Counts the client's API calls: a hook on its session.
+        
+        :param client: Any: gspread's HTTPClient, or Client: its session
+        :return: bool: True if hooked, or already hooked
+        """
+        session: Any = getattr(client, 'session', None)
+        hooks: dict | None = getattr(session, 'hooks', None)
+        if hooks is None:
+            return False
+        responses: list = hooks.setdefault('response', [])
+        if self.response not in responses:
+            responses.append(self.response)
+        return True
+    
+    def response(self, response: Any, *_args: Any, **_kwargs: Any) -> Any:
+        """Counts an API call: the request's and response's bodies.
+        
+        :param response: requests.Response: The remote's response
+        :return: Any: The response, unchanged
+        """
+        timing: Timing | None = self.current
+        if timing is not None:
+            body: Any = getattr(response.request, 'body', None)
+            timing.calls += 1
+            timing.sent += len(body) if body else 0
+            timing.received += len(response.content or b'')
+        return response
+    
+    def write(self, timing: Timing) -> None:
+        """Appends the timing to the log, as a JSON line, if logging.
+        
+        :param timing: Timing: The command's timing
+        :return: None
+        """
+        if not self.log:
+            return
+        try:
+            with open(self.log, 'a', encoding=Settings.ENCODE) as logged:
+                logged.write(json.dumps(timing.record()) + '\n')
+        except OSError as error:
+            click.echo(f'Metrics log: {error}', err=True)
+            self.log = ''
+    
+    def forked(self) -> None:
+        """A forked child's metrics: none of its parent's commands.
+        
+        :return: None
+        """
+        self.history.clear()
+        self.current = None
+        self.stack = []
+        self.mark = 0.0
+    
+    def frame(self) -> pd.DataFrame:
+        """The last commands' timings, in milliseconds, oldest first.
+        
+        :return: pd.DataFrame: A row per command
+        """
+        def ms(seconds: float) -> float:
+            """Seconds to milliseconds, to 0.1 ms."""
+            return round(seconds * 1000, 1)
+        
+        return pd.DataFrame(
+            [{'Command': timing.command,
+              'Wall ms': ms(timing.wall)} |
+             {phase.capitalize(): ms(timing.phases.get(phase, 0.0))
+              for phase in self.PHASES} |
+             {'Other': ms(timing.other),
+              'Calls': timing.calls,
+              'Sent KiB': round(timing.sent / 1024, 1),
+              'Received KiB': round(timing.received / 1024, 1)}
+             for timing in self.history],
+            columns=['Command', 'Wall ms'] +
+            [phase.capitalize() for phase in self.PHASES] +
+            ['Other', 'Calls', 'Sent KiB', 'Received KiB'])
+
+
+metrics: Metrics = Metrics(history=Settings.Metrics.HISTORY,
+                           log=Settings.Metrics.LOG)
+
+
+@dataclasses.dataclass
+class MemoryUse:
+    """A command's memory: traced growth, and peaks: its top growth sites.
+    
+    :property: command: str: The command, e.g. edit note
+    :property: growth: int: The traced bytes grown, after less before
+    :property: traced: int: The traced bytes held, after the command
+    :property: peak: int: The traced bytes' peak, during the command
+    :property: rss: int: The process' peak RSS bytes, so far: 0 if unknown
+    :property: sites: list[tuple[str, int, int]]: file:line, bytes, blocks
+    """
+    command: str
+    growth: int
+    traced: int
+    peak: int
+    rss: int
+    sites: list[tuple[str, int, int]]
+
+
+class MemoryProfiler:
+    """MemoryProfiler: tracemalloc snapshot diffs, per command.
+    
+    Off by default: tracing slows every allocation. The budget is
+    checked after every command, on or off: getrusage is cheap.
+    
+    :property: MIB: int: Bytes per MiB.
+    :property: IGNORED: tuple[tracemalloc.Filter, ...]: Not reported:
+               tracemalloc's own, and the import system's, allocations:
+               nor the call profilers', nor telemetry's own.
+    :property: on: bool: Snapshots are taken around each command.
+    :property: budget: int: The peak RSS, in MiB, to warn over: 0 is none.
+    :property: top: int: The allocation sites reported, by growth.
+    :property: frames: int: The frames traced per allocation.
+    :property: last: MemoryUse | None: The last command's memory.
+    :property: warned: bool: The budget's warning is shown, once.
+    """
+    
+    MIB: int = 1 << 20
+    IGNORED: tuple[tracemalloc.Filter, ...] = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        tracemalloc.Filter(False, '<unknown>'),
+        tracemalloc.Filter(False, cProfile.__file__),
+        tracemalloc.Filter(False, f'*{os.sep}pyinstrument{os.sep}*'),
+        tracemalloc.Filter(False, __file__))
+    
+    on: bool
+    budget: int
+    top: int
+    frames: int
+    last: MemoryUse | None
+    warned: bool
+    
+    def __init__(self, budget: int, top: int, frames: int = 1) -> None:
+        """Starts off: not tracing.
+        
+        :param budget: int: The peak RSS, in MiB, to warn over: 0 is none
+        :param top: int: The allocation sites reported, by growth
+        :param frames: int: The frames traced per allocation
+        """
+        self.on = False
+        self.budget = budget
+        self.top = top
+        self.frames = frames
+        self.last = None
+        self.warned = False
+    
+    def start(self) -> None:
+        """Starts tracing: each command is then snapshotted, and reported.
+        
+        :return: None
+        """
+        if not tracemalloc.is_tracing():
+            utils.startmemory(frames=self.frames)
+        self.on = True
+    
+    def stop(self) -> None:
+        """Stops tracing: frees its traces.
+        
+        :return: None
+        """
+        self.on = False
+        if tracemalloc.is_tracing():
+            utils.stopmemory()
+    
+    def forked(self) -> None:
+        """A forked child's memory: none of its parent's reports.
+        
+        :return: None
+        """
+        self.last = None
+        self.warned = False
+    
+    @staticmethod
+    def peakrss() -> int:
+        """The process' peak resident set size, in bytes: 0 if unknown.
+        
+        :return: int: ru_maxrss: KiB on Linux, bytes on macOS
+        """
+        if resource is None:
+            return 0
+        maxrss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == 'darwin' else maxrss * 1024
+    
+    def snapshot(self) -> tracemalloc.Snapshot:
+        """A snapshot of the traced allocations: less the ignored ones."""
+        return tracemalloc.take_snapshot().filter_traces(self.IGNORED)
+    
+    @contextlib.contextmanager
+    def command(self, name: str) -> Iterator[None]:
+        """Profiles a command, if on: reports it, then checks the budget.
+        
+        :param name: str: The command, e.g. edit note
+        :return: Iterator[None]
+        """
+        before: tracemalloc.Snapshot | None = None
+        if self.on and tracemalloc.is_tracing():
+            before = self.snapshot()
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            if before is not None and tracemalloc.is_tracing():
+                self.last = self.compare(name=name, before=before,
+                                         after=self.snapshot())
+                self.report(use=self.last)
+            self.check()
+    
+    def compare(self, name: str,
+                before: tracemalloc.Snapshot,
+                after: tracemalloc.Snapshot) -> MemoryUse:
+        """Compares the snapshots: the sites that grew the most, first.
+        
+        :param name: str: The command
+        :param before: tracemalloc.Snapshot: Before the command
+        :param after: tracemalloc.Snapshot: After the command
+        :return: MemoryUse: The command's memory
+        """
+        stats: list[tracemalloc.StatisticDiff] = \
+            after.compare_to(before, 'lineno')
+        grown: list[tracemalloc.StatisticDiff] = sorted(
+            (stat for stat in stats if stat.size_diff > 0),
+            key=lambda stat: stat.size_diff, reverse=True)
+        traced, peak = tracemalloc.get_traced_memory()
+        return MemoryUse(command=name,
+                         growth=sum(stat.size_diff for stat in stats),
+                         traced=traced,
+                         peak=peak,
+                         rss=self.peakrss(),
+                         sites=[(self.site(frame=stat.traceback[0]),
+                                 stat.size_diff, stat.count_diff)
+                                for stat in grown[:self.top]])
+    
+    @staticmethod
+    def site(frame: tracemalloc.Frame) -> str:
+        """An allocation's site, file:line: from the package, or the app."""
+        return f'{MemoryProfiler.shorten(filename=frame.filename)}:' \
+               f'{frame.lineno}'
+    
+    @staticmethod
+    def shorten(filename: str) -> str:
+        """A file's path: from its package, or relative to the app's."""
+        filename = filename.rsplit(f'site-packages{os.sep}', 1)[-1]
+        if os.path.isabs(filename) and filename.startswith(os.getcwd()):
+            filename = os.path.relpath(filename)
+        return filename
+    
+    @staticmethod
+    def size(count: int) -> str:
+        """Bytes, signed, as KiB or MiB: e.g. +1.5 MiB."""
+        if abs(count) >= MemoryProfiler.MIB:
+            return f'{count / MemoryProfiler.MIB:+.1f} MiB'
+        return f'{count / 1024:+.1f} KiB'
+    
+    def report(self, use: MemoryUse) -> None:
+        """Reports the command's memory, to stderr: not to piped data.
+        
+        :param use: MemoryUse: The command's memory
+        :return: None
+        """
+        click.secho(f'Memory: {use.command}: {self.size(use.growth)} traced, '
+                    f'{use.traced / self.MIB:.1f} MiB held, '
+                    f'{use.peak / self.MIB:.1f} MiB peak. '
+                    f'Peak RSS: {use.rss / self.MIB:.1f} MiB.',
+                    fg='cyan', err=True)
+        for site, grown, blocks in use.sites:
+            click.echo(f'  {self.size(grown):>12} {blocks:+8d} blocks  '
+                       f'{site}', err=True)
+    
+    def check(self) -> bool:
+        """Checks the session's peak RSS against the budget: warns once.
+        
+        :return: bool: True if over the budget
+        """
+        rss: int = self.peakrss()
+        over: bool = 0 < self.budget * self.MIB < rss
+        if over and not self.warned:
+            self.warned = True
+            click.secho(f'Memory: peak RSS {rss / self.MIB:.1f} MiB is over '
+                        f'the {self.budget} MiB budget.',
+                        fg='bright_yellow', bold=True, err=True)
+        return over
+    
+    @staticmethod
+    def held(frames: dict[str, Any]) -> pd.DataFrame:
+        """The data frames held, by name: their rows and deep sizes.
+        
+        The same frame held by many names is sized once, and marked.
+        
+        :param frames: dict[str, pd.DataFrame | None]: e.g. App.data
+        :return: pd.DataFrame: A row per name
+        """
+        first: dict[int, str] = {}
+        rows: list[dict[str, Any]] = []
+        for name, frame in frames.items():
+            if not isinstance(frame, pd.DataFrame):
+                continue
+            shared: str | None = first.setdefault(id(frame), name)
+            rows.append({'Frame': name,
+                         'Rows': len(frame),
+                         'MiB': 0.0 if shared != name else round(
+                             frame.memory_usage(deep=True).sum() /
+                             MemoryProfiler.MIB, 2),
+                         'Same As': '' if shared == name else shared})
+        return pd.DataFrame(rows, columns=['Frame', 'Rows', 'MiB', 'Same As'])
+
+
+profiler: MemoryProfiler = MemoryProfiler(budget=Settings.Memory.BUDGET,
+                                          top=Settings.Memory.TOP,
+                                          frames=Settings.Memory.FRAMES)
+
+
+class CallProfiler:
+    """CallProfiler: A call profile per command: dumped, its top printed.
+    
+    Off by default: cProfile slows every call. Only the command's own,
+    main, thread is profiled: not the pager's prefetching thread.
+    
+    :property: CPROFILE: str: The deterministic profiler: stdlib.
+    :property: SAMPLING: str: The sampling profiler: pyinstrument.
+    :property: IGNORED: tuple[str, ...]: Not printed: the click, and
+               context manager, frames every command is called through.
+    :property: on: bool: Each command is profiled.
+    :property: directory: pathlib.Path: Where the profiles are dumped.
+    :property: top: int: The functions printed, by cumulative time.
+    :property: sampling: bool: Prefers the sampling profiler, if installed.
+    :property: last: pathlib.Path | None: The last profile dumped.
+    :property: dumped: int: The profiles dumped, this session.
+    """
+    
+    CPROFILE: str = 'cprofile'
+    SAMPLING: str = 'sampling'
+    IGNORED: tuple[str, ...] = (f'{os.sep}click{os.sep}',
+                                f'{os.sep}contextlib.py',
+                                f'{os.sep}terminal.py',
+                                f'{os.sep}telemetry.py')
+    
+    on: bool
+    directory: pathlib.Path
+    top: int
+    sampling: bool
+    last: pathlib.Path | None
+    dumped: int
+    
+    def __init__(self, directory: str, top: int,
+                 sampling: bool = True) -> None:
+        """Starts off: not profiling.
+        
+        :param directory: str: Where the profiles are dumped
+        :param top: int: The functions printed, by cumulative time
+        :param sampling: bool: Prefers the sampling profiler, if installed
+        """
+        self.on = False
+        self.directory = pathlib.Path(directory)
+        self.top = top
+        self.sampling = sampling
+        self.last = None
+        self.dumped = 0
+    
+    @property
+    def engine(self) -> str:
+        """The profiler used: sampling, if preferred, and installed."""
+        return self.SAMPLING if self.sampling and pyinstrument is not None \
+            else self.CPROFILE
+    
+    def start(self) -> None:
+        """Starts profiling each command: makes the dump directory.
+        
+        :return: None
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.on = True
+    
+    def stop(self) -> None:
+        """Stops profiling: the dumped profiles are kept.
+        
+        :return: None
+        """
+        self.on = False
+    
+    def path(self, name: str, suffix: str) -> pathlib.Path:
+        """The command's dump: timestamped, numbered, and named.
+        
+        :param name: str: The command, e.g. edit note
+        :param suffix: str: e.g. .prof
+        :return: pathlib.Path: e.g.
+            .profiles/20260101T120000-4242-0001-edit-note
+        """
+        self.dumped += 1
+        slug: str = re.sub(r'[^A-Za-z0-9]+', '-', name).strip('-') or 'run'
+        return self.directory / (f'{time.strftime("%Y%m%dT%H%M%S")}-'
+                                 f'{os.getpid()}-{self.dumped:04d}-'
+                                 f'{slug}{suffix}')
+    
+    def forked(self) -> None:
+        """A forked child's profiles: numbered from one, by its pid.
+        
+        :return: None
+        """
+        self.last = None
+        self.dumped = 0
+    
+    @contextlib.contextmanager
+    def command(self, name: str) -> Iterator[None]:
+        """Profiles a command, if on: dumps it, then prints its top.
+        
+        :param name: str: The command, e.g. edit note
+        :return: Iterator[None]
+        """
+        if not self.on:
+            yield
+            return
+        if self.engine == self.SAMPLING:
+            with self.sampled(name=name):
+                yield
+            return
+        profile: cProfile.Profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self.last = self.path(name=name, suffix='.prof')
+            stats: pstats.Stats = pstats.Stats(profile)
+            stats.dump_stats(self.last)
+            self.report(name=name, rows=self.cumulative(stats=stats))
+    
+    @contextlib.contextmanager
+    def sampled(self, name: str) -> Iterator[None]:
+        """Samples a command: pyinstrument's session, and its call tree.
+        
+        :param name: str: The command
+        :return: Iterator[None]
+        """
+        sampler = pyinstrument.Profiler()
+        sampler.start()
+        try:
+            yield
+        finally:
+            session = sampler.stop()
+            self.last = self.path(name=name, suffix='.pyisession')
+            session.save(str(self.last))
+            click.secho(f'Profile: {name}: {self.last}', fg='cyan', err=True)
+            tree: list[str] = sampler.output_text(
+                unicode=False, color=False).splitlines()
+            click.echo('\n'.join(tree[:self.top * 2]), err=True)
+    
+    def cumulative(self, stats: pstats.Stats) \
+            -> list[tuple[str, int, float, float]]:
+        """The functions with the most cumulative time: the top ones.
+        
+        :param stats: pstats.Stats: The command's profile
+        :return: list[tuple[str, int, float, float]]: Function, calls,
+            cumulative and own seconds
+        """
+        rows: list[tuple[str, int, float, float]] = []
+        for (filename, line, function), (_, calls, own, cumulative, _) \
+                in stats.stats.items():  # type: ignore[attr-defined]
+            if any(ignored in filename for ignored in self.IGNORED):
+                continue
+            site: str = function if filename == '~' else \
+                f'{MemoryProfiler.shorten(filename=filename)}:' \
+                f'{line}({function})'
+            rows.append((site, calls, cumulative, own))
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows[:self.top]
+    
+    def report(self, name: str,
+               rows: list[tuple[str, int, float, float]]) -> None:
+        """Prints the top functions, to stderr: not to piped data.
+        
+        :param name: str: The command
+        :param rows: list[tuple[str, int, float, float]]: The functions
+        :return: None
+        """
+        click.secho(f'Profile: {name}: {self.last}', fg='cyan', err=True)
+        click.echo(f'  {"cumulative s":>12} {"own s":>9} {"calls":>8}  '
+                   'function', err=True)
+        for site, calls, cumulative, own in rows:
+            click.echo(f'  {cumulative:>12.4f} {own:>9.4f} {calls:>8d}  '
+                       f'{site}', err=True)
+
+
+callprofiler: CallProfiler = CallProfiler(
+    directory=Settings.Profile.DIRECTORY,
+    top=Settings.Profile.TOP,
+    sampling=Settings.Profile.SAMPLING)
+
+
+class Tracer:
+    """Tracer: Spans, per command, exported as Chrome trace events.
+    
+    A span is a call: the Google connector's, the data controller's loads,
+    the results' lookups, the editor's operations, the rendering, and the
+    remote's HTTP calls. Spans nest per thread: a span's parent is the
+    span it was entered in, e.g. edit progress > Editor.modifyprogress >
+    Editor.save > Controller.load_wsheet > GET values. Off by default:
+    the spans are kept, and the session's trace rewritten, per command.
+    
+    :property: COMMAND: str: The command's span: the root.
+    :property: GOOGLE: str: The Google connector's calls.
+    :property: DATA: str: The data controller's loads, and sends.
+    :property: RESULTS: str: The results' lookups.
+    :property: EDITOR: str: The editor's operations.
+    :property: RENDER: str: Tables, cards, panels, pages.
+    :property: PHASE: str: The metrics' phases: auth, fetch, parse, ...
+    :property: HTTP: str: The remote API's calls: from the response hook.
+    :property: on: bool: Each command's spans are kept, and exported.
+    :property: path: pathlib.Path: The session's trace: Chrome JSON.
+    :property: events: collections.deque: The spans: the last, if capped.
+    :property: origin: int: The trace's zero: perf_counter_ns.
+    :property: pid: int: The process: the trace's pid.
+    :property: threads: dict[int, str]: The threads seen: tid, name.
+    :property: local: threading.local: Each thread's open spans.
+    :property: last: list[dict[str, Any]]: The last command's spans.
+    :property: recording: bool: A command is being traced.
+    :property: lock: threading.Lock: Guards the events: the pager's thread.
+    """
+    
+    COMMAND: str = 'command'
+    GOOGLE: str = 'google'
+    DATA: str = 'data'
+    RESULTS: str = 'results'
+    EDITOR: str = 'editor'
+    RENDER: str = 'render'
+    PHASE: str = 'phase'
+    HTTP: str = 'http'
+    
+    on: bool
+    path: pathlib.Path
+    events: collections.deque
+    origin: int
+    pid: int
+    threads: dict[int, str]
+    local: threading.local
+    last: list[dict[str, Any]]
+    recording: bool
+    lock: threading.Lock
+    
+    def __init__(self, directory: str, events: int) -> None:
+        """Starts off: the session's trace is named, not yet written.
+        
+        :param directory: str: Where the session's trace is written
+        :param events: int: The spans kept: the oldest dropped
+        """
+        self.on = False
+        self.path = self.session(directory=pathlib.Path(directory))
+        self.events = collections.deque(maxlen=max(events, 1))
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.threads = {}
+        self.local = threading.local()
+        self.last = []
+        self.recording = False
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def session(directory: pathlib.Path) -> pathlib.Path:
+        """The session's trace: timestamped, and by the process' pid.
+        
+        :param directory: pathlib.Path: Where the trace is written
+        :return: pathlib.Path: e.g. .traces/trace-20260101T120000-4242.json
+        """
+        return directory / \
+            f'trace-{time.strftime("%Y%m%dT%H%M%S")}-{os.getpid()}.json'
+    
+    def forked(self) -> None:
+        """A forked child's trace: its own file, pid, and spans.
+        
+        The parent's lock, and thread locals, may be held by a thread
+        the child has not got: both are new.
+        
+        :return: None
+        """
+        self.path = self.session(directory=self.path.parent)
+        self.events.clear()
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.threads = {}
+        self.local = threading.local()
+        self.last = []
+        self.recording = False
+        self.lock = threading.Lock()
+    
+    def start(self, path: str | None = None) -> None:
+        """Starts tracing each command: to the session's, or a, trace.
+        
+        :param path: str | None: The trace's file: None, the session's
+        :return: None
+        """
+        if path is not None:
+            self.path = pathlib.Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.on = True
+    
+    def stop(self) -> None:
+        """Stops tracing: the trace written is kept.
+        
+        :return: None
+        """
+        self.on = False
+    
+    def micros(self, nanos: int) -> float:
+        """A perf_counter_ns time, as the trace's microseconds.
+        
+        :param nanos: int: perf_counter_ns
+        :return: float: Microseconds since the trace's origin
+        """
+        return round((nanos - self.origin) / 1000, 3)
+    
+    @property
+    def stack(self) -> list[dict[str, Any]]:
+        """The current thread's open spans: innermost last."""
+        stack: list[dict[str, Any]] | None = getattr(self.local, 'stack',
+                                                     None)
+        if stack is None:
+            stack = self.local.stack = []
+        return stack
+    
+    def record(self, name: str, category: str, start: int, end: int,
+               args: dict[str, Any]) -> dict[str, Any]:
+        """Records a complete span: a Chrome 'X' event, on this thread.
+        
+        :param name: str: The span, e.g. Editor.save
+        :param category: str: e.g. Tracer.EDITOR
+        :param start: int: perf_counter_ns
+        :param end: int: perf_counter_ns
+        :param args: dict[str, Any]: Shown in the viewer: e.g. the parent
+        :return: dict[str, Any]: The event
+        """
+        thread: threading.Thread = threading.current_thread()
+        event: dict[str, Any] = {
+            'name': name, 'cat': category, 'ph': 'X',
+            'ts': self.micros(nanos=start),
+            'dur': round((end - start) / 1000, 3),
+            'pid': self.pid, 'tid': thread.ident or 0, 'args': args}
+        with self.lock:
+            self.threads.setdefault(event['tid'], thread.name)
+            self.events.append(event)
+            self.last.append(event)
+        return event
+    
+    @contextlib.contextmanager
+    def span(self, name: str, category: str,
+             **args: Any) -> Iterator[None]:
+        """Traces a span: a child of this thread's innermost open span.
+        
+        Outside of a traced command, nothing is recorded.
+        
+        :param name: str: The span, e.g. Results.getrowdata
+        :param category: str: e.g. Tracer.RESULTS
+        :param args: Any: Shown in the viewer: e.g. the row's index
+        :return: Iterator[None]
+        """
+        if not self.recording:
+            yield
+            return
+        stack: list[dict[str, Any]] = self.stack
+        if stack:
+            args['parent'] = stack[-1]['name']
+        stack.append({'name': name})
+        start: int = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            stack.pop()
+            self.record(name=name, category=category, start=start,
+                        end=time.perf_counter_ns(), args=args)
+    
+    def traced(self, category: str,
+               name: str | None = None) -> Callable[[Callable], Callable]:
+        """Decorates a function: its calls are traced as spans.
+        
+        :param category: str: e.g. Tracer.GOOGLE
+        :param name: str | None: The span: None, the function's qualname
+        :return: Callable: The decorator
+        """
+        def decorator(function: Callable) -> Callable:
+            """Wraps the function in a span."""
+            spanned: str = name or function.__qualname__
+            
+            @functools.wraps(function)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                """Calls the function, traced, if a command is."""
+                if not self.recording:
+                    return function(*args, **kwargs)
+                with self.span(name=spanned, category=category):
+                    return function(*args, **kwargs)
+            
+            return wrapper
+        
+        return decorator
+    
+    def hook(self, client: Any) -> bool:
+        """Traces the client's API calls: a hook on its session.
+        
+        :param client: Any: gspread's HTTPClient, or Client: its session
+        :return: bool: True if hooked, or already hooked
+        """
+        session: Any = getattr(client, 'session', None)
+        hooks: dict | None = getattr(session, 'hooks', None)
+        if hooks is None:
+            return False
+        responses: list = hooks.setdefault('response', [])
+        if self.response not in responses:
+            responses.append(self.response)
+        return True
+    
+    def response(self, response: Any, *_args: Any, **_kwargs: Any) -> Any:
+        """Traces an API call: ends now, began its elapsed time ago.
+        
+        :param response: requests.Response: The remote's response
+        :return: Any: The response, unchanged
+        """
+        if self.recording:
+            end: int = time.perf_counter_ns()
+            elapsed: Any = getattr(response, 'elapsed', None)
+            took: int = int(elapsed.total_seconds() * 1e9) if elapsed else 0
+            request: Any = response.request
+            path: str = request.path_url.split('?', 1)[0] \
+                if request is not None else ''
+            args: dict[str, Any] = {'status': response.status_code,
+                                    'bytes': len(response.content or b'')}
+            if self.stack:
+                args['parent'] = self.stack[-1]['name']
+            self.record(name=f'{getattr(request, "method", "")} {path}',
+                        category=self.HTTP, start=end - took, end=end,
+                        args=args)
+        return response
+    
+    @contextlib.contextmanager
+    def command(self, name: str) -> Iterator[None]:
+        """Traces a command, if on: the root span: writes the trace.
+        
+        A command in a command is a span of the outer command.
+        
+        :param name: str: The command, e.g. edit progress
+        :return: Iterator[None]
+        """
+        if not self.on or self.recording:
+            with self.span(name=name, category=self.COMMAND):
+                yield
+            return
+        with self.lock:
+            self.last = []
+        self.recording = True
+        try:
+            with self.span(name=name, category=self.COMMAND):
+                yield
+        finally:
+            self.recording = False
+            self.write()
+    
+    def trace(self) -> dict[str, Any]:
+        """The session's trace: Chrome's trace event format, JSON object.
+        
+        :return: dict[str, Any]: traceEvents: the threads' names, spans
+        """
+        with self.lock:
+            spans: list[dict[str, Any]] = list(self.events)
+            threads: dict[int, str] = dict(self.threads)
+        named: list[dict[str, Any]] = [
+            {'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': 0,
+             'args': {'name': 'PyCriteria'}}] + [
+            {'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid,
+             'args': {'name': thread}} for tid, thread in threads.items()]
+        return {'traceEvents': named + spans, 'displayTimeUnit': 'ms'}
+    
+    def write(self) -> None:
+        """Rewrites the session's trace: atomically, a viewer may read it.
+        
+        :return: None
+        """
+        partial: pathlib.Path = self.path.with_suffix('.part')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(partial, 'w', encoding=Settings.ENCODE) as traced:
+                json.dump(self.trace(), traced)
+            os.replace(partial, self.path)
+        except OSError as error:
+            click.echo(f'Trace: {error}', err=True)
+            self.on = False
+    
+    def breakdown(self) -> pd.DataFrame:
+        """The last command's spans: a causal tree, by time, on the thread.
+        
+        Each span's total, and own, time: its total less its children's;
+        and its share of the command: e.g. Editor.save's of edit progress.
+        
+        :return: pd.DataFrame: A row per span, indented by its depth
+        """
+        with self.lock:
+            spans: list[dict[str, Any]] = sorted(
+                self.last, key=lambda span: (span['tid'], span['ts'],
+                                             -span['dur']))
+        rows: list[dict[str, Any]] = []
+        open_: list[dict[str, Any]] = []
+        for span in spans:
+            end: float = span['ts'] + span['dur']
+            while open_ and (open_[-1]['tid'] != span['tid'] or
+                             open_[-1]['end'] < end):
+                open_.pop()
+            row: dict[str, Any] = {'span': span, 'end': end,
+                                   'tid': span['tid'], 'depth': len(open_),
+                                   'children': 0.0}
+            if open_:
+                open_[-1]['children'] += span['dur']
+            open_.append(row)
+            rows.append(row)
+        whole: float = max((span['dur'] for span in spans
+                            if span['cat'] == self.COMMAND), default=0.0)
+        return pd.DataFrame(
+            [{'Span': '  ' * row['depth'] + row['span']['name'],
+              'Category': row['span']['cat'],
+              'Total ms': round(row['span']['dur'] / 1000, 1),
+              'Own ms': round(max(row['span']['dur'] - row['children'],
+                                  0.0) / 1000, 1),
+              '% Command': round(100 * row['span']['dur'] / whole, 1)
+              if whole else 0.0} for row in rows],
+            columns=['Span', 'Category', 'Total ms', 'Own ms', '% Command'])
+
+
+tracer: Tracer = Tracer(directory=Settings.Trace.DIRECTORY,
+                        events=Settings.Trace.EVENTS)
+
+
+def forked() -> None:
+    """A forked child's telemetry: its own, none of its parent's.
+    
+    Called in the child, after os.fork: e.g. by the prefork server.
+    
+    :return: None
+    """
+    metrics.forked()
+    profiler.forked()
+    callprofiler.forked()
+    tracer.forked()
+
+
+os.register_at_fork(after_in_child=forked)
+
+
+class MeteredGroup(BufferedGroup):
+    """MeteredGroup: Times, profiles, traces, each command: buffers output.
+    
+    :property: UNMETERED: frozenset[str]: Commands not timed, or traced.
+    """
+    
+    UNMETERED: frozenset[str] = frozenset({'repl', 'stats', 'memory',
+                                           'profile', 'trace', 'quota'})
+    
+    @staticmethod
+    def commandname(ctx: click.Context, name: str,
+                    command: click.Command, args: list[str]) -> str:
+        """The command's full name: its groups' and its own, e.g. load todo.
+        
+        :param ctx: click.Context: The group's context
+        :param name: str: The command's name, resolved: e.g. load
+        :param command: click.Command: The command, resolved
+        :param args: list[str]: The command's args: e.g. todo -selects All
+        :return: str: The command's names, space separated
+        """
+        names: list[str] = [name]
+        for arg in args:
+            if not isinstance(command, click.Group):
+                break
+            command = command.get_command(ctx, arg)
+            if command is None:
+                break
+            names.append(arg)
+        return ' '.join(names)
+    
+    def scopes(self, ctx: click.Context, name: str,
+               command: click.Command, args: list[str]) \
+            -> list[ContextManager[Any]]:  # noqa # Pep8 E125
+        """The command's scopes: timed, profiled, traced, unless unmetered.
+        
+        Innermost, the timing, then the trace: neither includes the
+        profilers' snapshots, or dumps. The memory profiler ignores the
+        call profiler's allocations: its snapshots are not profiled.
+        The buffer is innermost of all.
+        
+        :param ctx: click.Context: The group's context
+        :param name: str: The command's name
+        :param command: click.Command: The command, resolved
+        :param args: list[str]: The command's args
+        :return: list[ContextManager]: The meters, then the buffer
+        """
+        buffered: list[ContextManager[Any]] = super().scopes(
+            ctx=ctx, name=name, command=command, args=args)
+        if name in self.UNMETERED:
+            return buffered
+        full: str = self.commandname(ctx=ctx, name=name, command=command,
+                                     args=args)
+        return [profiler.command(name=full), callprofiler.command(name=full),
+                tracer.command(name=full), metrics.command(name=full),
+                *buffered]
+
+# End of Telemetry Module
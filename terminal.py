@@ -0,0 +1,449 @@
+#!/user/bin/env python3
+# pylint: disable=trailing-whitespace
+# ruff: noqa: ANN101, I001
+# noqa: W293 blank line contains whitespace
+"""Module: Terminal: Pinned screen regions, updated by changed lines only.
+
+Usage:
+-------------------------
+- Screen: Pins regions, e.g. the record card, to the top of the terminal.
+          The rows below the regions are the scroll region (DECSTBM):
+          prompts and messages scroll there, under the pinned regions.
+          A region keeps its last emitted frame: an update re-sends only
+          the changed lines, each cursor addressed (CUP) and cleared (EL),
+          e.g. after a note is edited, its lines and the Viewed time.
+          - pin: pin a region, of rows, below the pinned ones.
+          - update: draw a region's new frame: only its changed lines.
+          - unpin: release all the rows: the whole screen scrolls again.
+- Opt in: run pin --rows 30; run unpin. xterm/xterm.js clients.
+- Buffered: Collects a command's output, stdout and the same tty's stderr,
+            and writes it in one write, when the command ends: one pty
+            read, one websocket message, not one per printed line.
+            - Prompts drain it first: click's prompt functions are
+              wrapped, as click allows, while it is installed.
+            - A partial line, e.g. progress, is written at once.
+            - Over LIMIT characters, the collected output is written:
+              long exports stream, bounded.
+- BufferedGroup: The click group that buffers each of its commands:
+                 one shot, or each line of the REPL, not the REPL itself.
+
+Linting:
+-------------------------
+- pylint: disable=trailing-whitespace
+- ruff: noqa:
+      I001:     unsorted-imports
+                Import block is unsorted or unformatted
+      ANN101:   missing-type-self
+                Missing type annotation for {name} in method
+- noqa: W293
+
+Critieria:
+LO2.2: Clearly separate and identify code written for the application and
+       the code from external sources (e.g. libraries or tutorials)
+LO2.2.3: Clearly separate code from external sources
+LO2.2.4: Clearly identify code from external sources
+LO6: Use library software for building a graphical user interface,
+or command-line interface, or web application, or mathematical software
+LO6.1 Implement the use of external Python libraries
+LO6.1.1 Implement the use of external Python libraries
+      where appropriate to provide the functionality that the project requires.
+-------------------------
+Standard Libraries
+:imports: contextlib, dataclasses, io, os, sys, typing
+
+3rd Paty Imports
+:imports: click
+
+Custom Authored Libraries
+:imports: None
+
+:class: Region: A pinned region's rows, and its last emitted frame.
+:class: Screen: The pinned regions, and the scroll region below them.
+:class: Buffered: A text stream that writes a command's output in one write.
+:class: BufferedGroup: A click group: buffers the output of each command.
+"""
+# 0.1 Standard Library Imports
+import contextlib
+import dataclasses
+import io
+import os
+import sys
+from typing import Any, Callable, ContextManager, Iterator, TextIO
+
+# 0.2 Third Party Modules
+import click  # type: ignore
+
+
+@dataclasses.dataclass
+class Region:
+    """A pinned region: its rows on screen, and its last emitted frame.
+    
+    :property: name: str: The region's name, e.g. record
+    :property: top: int: The region's first row, from 0
+    :property: rows: int: The region's rows
+    :property: lines: list[str]: The last emitted frame, a line per row
+    """
+    name: str
+    top: int
+    rows: int
+    lines: list[str] = dataclasses.field(default_factory=list)
+
+
+class Screen:
+    """Screen: Pinned regions, and the scroll region below them.
+    
+    :property: ESC: str: The escape: control sequences start with it.
+    :property: SAVE: str: DECSC: saves the cursor.
+    :property: RESTORE: str: DECRC: restores the cursor.
+    :property: CLEAR: str: EL: clears the cursor's line.
+    :property: MORE: str: The last row of a frame too long for its rows.
+    :property: RECORD: str: The record card's region.
+    :property: height: int: The terminal's rows.
+    :property: regions: dict[str, Region]: The pinned regions, top first.
+    :property: sent: int: The characters sent, by updates.
+    :property: full: int: The characters of the updates' whole frames.
+    """
+    
+    ESC: str = '\x1b'
+    SAVE: str = f'{ESC}7'
+    RESTORE: str = f'{ESC}8'
+    CLEAR: str = f'{ESC}[2K'
+    MORE: str = '… {} more lines'
+    RECORD: str = 'record'
+    
+    height: int
+    regions: dict[str, Region]
+    sent: int
+    full: int
+    
+    def __init__(self, height: int) -> None:
+        """Starts with no pinned regions: the whole screen scrolls.
+        
+        :param height: int: The terminal's rows
+        """
+        self.height = height
+        self.regions = {}
+        self.sent = 0
+        self.full = 0
+    
+    @property
+    def pinned(self) -> int:
+        """The rows pinned, by all the regions."""
+        return sum(region.rows for region in self.regions.values())
+    
+    def ispinned(self, name: str) -> bool:
+        """Checks if the region is pinned.
+        
+        :param name: str: The region's name
+        :return: bool: True: updates draw on its rows, not scroll
+        """
+        return name in self.regions
+    
+    @staticmethod
+    def moveto(row: int) -> str:
+        """CUP: moves the cursor to the row, from 0, first column.
+        
+        :param row: int: The screen's row, from 0
+        :return: str: The control sequence
+        """
+        return f'{Screen.ESC}[{row + 1};1H'
+    
+    def scrolling(self) -> str:
+        """DECSTBM: the scroll region, the rows below the pinned regions.
+        
+        Setting the scroll region homes the cursor: it is moved back to the
+        scroll region's last row, where the next output continues.
+        
+        :return: str: The control sequences
+        """
+        if not self.regions:
+            return f'{self.ESC}[r{self.moveto(row=self.height - 1)}'
+        return f'{self.ESC}[{self.pinned + 1};{self.height}r' \
+               f'{self.moveto(row=self.height - 1)}'
+    
+    def pin(self, name: str, rows: int) -> Region:
+        """Pins a region, of rows, below the pinned ones: cleared.
+        
+        At least a third of the screen is left to scroll.
+        
+        :param name: str: The region's name
+        :param rows: int: The rows wanted
+        :return: Region: The pinned region
+        """
+        if name in self.regions:
+            return self.regions[name]
+        rows = max(min(rows, self.height * 2 // 3 - self.pinned), 1)
+        region: Region = Region(name=name, top=self.pinned, rows=rows)
+        self.regions[name] = region
+        click.echo(message=''.join(
+            [self.SAVE] + [f'{self.moveto(row=region.top + row)}{self.CLEAR}'
+                           for row in range(rows)] +
+            [self.RESTORE, self.scrolling()]), nl=False)
+        return region
+    
+    def unpin(self) -> None:
+        """Unpins all the regions: the whole screen scrolls again.
+        
+        :return: None
+        """
+        self.regions = {}
+        click.echo(message=self.scrolling(), nl=False)
+    
+    def frame(self, name: str, text: str) -> str:
+        """The control sequences to draw the text's changed lines only.
+        
+        :param name: str: The pinned region's name
+        :param text: str: The new frame, rendered, e.g. by WebConsole.render
+        :return: str: Cursor addressed, cleared, changed lines: or ''
+        """
+        region: Region = self.regions[name]
+        lines: list[str] = text.rstrip('\n').split('\n')
+        if len(lines) > region.rows:
+            lines = lines[:region.rows - 1] + \
+                [self.MORE.format(len(lines) - region.rows + 1)]
+        lines += [''] * (region.rows - len(lines))
+        last: list[str] = region.lines or [''] * region.rows
+        changed: list[str] = [
+            f'{self.moveto(row=region.top + row)}{self.CLEAR}{line}'
+            for row, (line, old) in enumerate(zip(lines, last))
+            if line != old]
+        region.lines = lines
+        if not changed:
+            return ''
+        return ''.join([self.SAVE] + changed + [self.RESTORE])
+    
+    def update(self, name: str, text: str) -> int:
+        """Draws the region's new frame: sends only its changed lines.
+        
+        :param name: str: The pinned region's name
+        :param text: str: The new frame, rendered, e.g. by WebConsole.render
+        :return: int: The characters sent
+        """
+        changes: str = self.frame(name=name, text=text)
+        self.full += len(text)
+        self.sent += len(changes)
+        if changes:
+            click.echo(message=changes, nl=False)
+        return len(changes)
+
+
+class Buffered(io.TextIOBase):
+    """Buffered: Collects the text written, and writes it in one write.
+    
+    rich and click.echo flush after every print: here flush() is soft,
+    it only writes a pending partial line. drain() writes all that is
+    collected: before a prompt, as input() writes its prompt to the tty
+    directly, and when the command ends.
+    
+    :property: LIMIT: int: The characters collected before a drain.
+    :property: stream: TextIO: The wrapped stream, e.g. sys.stdout.
+    :property: chunks: list[str]: The text collected, not yet written.
+    :property: size: int: The characters collected.
+    :property: writes: int: The text written to it, by the app.
+    :property: drains: int: The writes to the wrapped stream.
+    """
+    
+    LIMIT: int = 1 << 16
+    
+    stream: TextIO
+    chunks: list[str]
+    size: int
+    writes: int
+    drains: int
+    
+    def __init__(self, stream: TextIO) -> None:
+        """Wraps the stream: nothing collected yet.
+        
+        :param stream: TextIO: The stream to write to, e.g. sys.stdout
+        """
+        super().__init__()
+        self.stream = stream
+        self.chunks = []
+        self.size = 0
+        self.writes = 0
+        self.drains = 0
+    
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        """The wrapped stream's encoding."""
+        return getattr(self.stream, 'encoding', None) or 'utf-8'
+    
+    @property
+    def errors(self) -> str | None:  # type: ignore[override]
+        """The wrapped stream's encoding error handler."""
+        return getattr(self.stream, 'errors', None)
+    
+    def writable(self) -> bool:
+        """Text is writable."""
+        return True
+    
+    def isatty(self) -> bool:
+        """The wrapped stream's terminal: rich and click style for it."""
+        return self.stream.isatty()
+    
+    def fileno(self) -> int:
+        """The wrapped stream's file descriptor: input() reads the tty."""
+        return self.stream.fileno()
+    
+    def write(self, text: str) -> int:  # type: ignore[override]
+        """Collects the text: drains when over the limit.
+        
+        :param text: str: The text
+        :return: int: The characters collected
+        """
+        if not isinstance(text, str):
+            raise TypeError(f'write() argument must be str, '
+                            f'not {type(text).__name__}')
+        if text:
+            self.chunks.append(text)
+            self.size += len(text)
+            self.writes += 1
+            if self.size >= self.LIMIT:
+                self.drain()
+        return len(text)
+    
+    def flush(self) -> None:
+        """Soft: writes the collected text only if it ends a partial line.
+        
+        :return: None
+        """
+        if self.chunks and not self.chunks[-1].endswith('\n'):
+            self.drain()
+    
+    def drain(self) -> None:
+        """Writes the collected text, in one write, and flushes it.
+        
+        :return: None
+        """
+        if self.chunks:
+            text: str = ''.join(self.chunks)
+            self.chunks = []
+            self.size = 0
+            self.drains += 1
+            self.stream.write(text)
+        self.stream.flush()
+    
+    @staticmethod
+    def sametty(stream: TextIO, other: TextIO) -> bool:
+        """Checks if both streams write the same terminal, e.g. the pty.
+        
+        :param stream: TextIO: e.g. sys.stdout
+        :param other: TextIO: e.g. sys.stderr
+        :return: bool: True: their order is kept by one buffer
+        """
+        try:
+            return stream.isatty() and other.isatty() \
+                and os.ttyname(stream.fileno()) == \
+                os.ttyname(other.fileno())
+        except (AttributeError, OSError, ValueError):
+            return False
+    
+    def prompter(self, prompt: Callable[[str], str]) -> Callable[[str], str]:
+        """Wraps a click prompt function: drains, then prompts.
+        
+        :param prompt: Callable[[str], str]: e.g. input, getpass
+        :return: Callable[[str], str]: The draining prompt function
+        """
+        def drained(text: str) -> str:
+            """Drains the collected output, then prompts."""
+            self.drain()
+            return prompt(text)
+        
+        return drained
+    
+    @staticmethod
+    @contextlib.contextmanager
+    def installed() -> Iterator['Buffered']:
+        """Buffers sys.stdout, and sys.stderr on the same tty, till exit.
+        
+        Nested, e.g. a command in a command, reuses the installed buffer.
+        click's prompt functions drain it first, while it is installed.
+        Drains on exit, also on errors: a command's output is never lost.
+        
+        :return: Iterator[Buffered]: The installed buffer
+        """
+        if isinstance(sys.stdout, Buffered):
+            yield sys.stdout
+            return
+        stdout: TextIO = sys.stdout
+        stderr: TextIO = sys.stderr
+        buffered: Buffered = Buffered(stream=stdout)
+        prompts: tuple[Callable[[str], str], Callable[[str], str]] = \
+            (click.termui.visible_prompt_func,
+             click.termui.hidden_prompt_func)
+        try:
+            sys.stdout = buffered
+            if Buffered.sametty(stream=stdout, other=stderr):
+                sys.stderr = buffered
+            click.termui.visible_prompt_func = buffered.prompter(prompts[0])
+            click.termui.hidden_prompt_func = buffered.prompter(prompts[1])
+            yield buffered
+        finally:
+            sys.stdout = stdout
+            sys.stderr = stderr
+            click.termui.visible_prompt_func, \
+                click.termui.hidden_prompt_func = prompts
+            buffered.drain()
+
+
+class BufferedGroup(click.Group):
+    """BufferedGroup: Buffers each command's output: one write per command.
+    
+    click_repl invokes the group for each line: each line is buffered.
+    The REPL itself is not: its prompt session keeps the real stdout.
+    The command is known once click resolves it: resolve_command enters
+    the command's scopes, on a stack that invoke exits, per invocation.
+    
+    :property: UNBUFFERED: frozenset[str]: Commands written through.
+    :property: SCOPES: str: ctx.meta's key of the invocation's stack.
+    """
+    
+    UNBUFFERED: frozenset[str] = frozenset({'repl'})
+    SCOPES: str = 'terminal.scopes'
+    
+    def scopes(self, ctx: click.Context, name: str,
+               command: click.Command, args: list[str]) \
+            -> list[ContextManager[Any]]:  # noqa # Pep8 E125
+        """The contexts to invoke the command in: outermost first.
+        
+        :param ctx: click.Context: The group's context
+        :param name: str: The command's name
+        :param command: click.Command: The command, resolved
+        :param args: list[str]: The command's args
+        :return: list[ContextManager]: The buffer, unless unbuffered
+        """
+        return [] if name in self.UNBUFFERED else [Buffered.installed()]
+    
+    def resolve_command(self, ctx: click.Context, args: list[str]) \
+            -> tuple[str | None, click.Command | None, list[str]]:
+        """Resolves the command: then enters its scopes, if invoking.
+        
+        Also called for shell completion: no stack, no scopes entered.
+        
+        :param ctx: click.Context: The group's context
+        :param args: list[str]: The command's name, then its args
+        :return: tuple: The command's name, the command, its args
+        """
+        name, command, rest = super().resolve_command(ctx, args)
+        stack: contextlib.ExitStack | None = ctx.meta.get(self.SCOPES)
+        if stack is not None and name is not None and command is not None:
+            for scope in self.scopes(ctx=ctx, name=name, command=command,
+                                     args=rest):
+                stack.enter_context(scope)
+        return name, command, rest
+    
+    def invoke(self, ctx: click.Context) -> Any:
+        """Invokes the command, in its scopes: exited once it returns.
+        
+        :param ctx: click.Context: The group's context
+        :return: Any: The command's result
+        """
+        outer: contextlib.ExitStack | None = ctx.meta.get(self.SCOPES)
+        with contextlib.ExitStack() as stack:
+            ctx.meta[self.SCOPES] = stack
+            try:
+                return super().invoke(ctx)
+            finally:
+                ctx.meta[self.SCOPES] = outer
+
+# End of Terminal Module
@@ -0,0 +1,6 @@
+"""Tests: the app's modules, imported from the repository's root."""
+# 0.1 Standard Library Imports
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
@@ -0,0 +1,123 @@
+"""Tests: app: the commands, as typed: on the local backend's dataset."""
+# 0.1 Standard Library Imports
+import io
+import os
+import pathlib
+import shutil
+import sys
+
+# 0.2 Third Party Modules
+import click
+import pandas as pd
+import pytest
+from click.testing import CliRunner, Result
+
+# 0.3 Local imports: the app loads its data as it is imported
+from caches import StatsCube
+from connections import LocalWorksheet
+from controller import DataController
+from settings import Settings
+
+os.environ.setdefault(Settings.Backend.SOURCE, Settings.Backend.LOCAL)
+import app  # noqa: E402 # pylint: disable=wrong-import-position
+
+
+def test_piped_csv_starts_with_header(
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    """The introduction is on stderr: stdout is only the CSV."""
+    monkeypatch.setattr(sys, 'argv', ['app.py', 'load', 'views',
+                                      '-selects', 'Criteria',
+                                      '--format', 'csv'])
+    with CliRunner().isolation() as (stdout, stderr, _):
+        with pytest.raises(SystemExit):
+            app.main()
+    lines: list[str] = stdout.getvalue().decode().splitlines()
+    assert lines[0] == 'Position,CriteriaTopic,CriteriaRef,Criteria,Notes'
+    assert len(lines) > 1
+    assert 'GETTING STARTED' in stderr.getvalue().decode()
+
+
+def test_overview_view_renders() -> None:
+    """The default view, Overview, is dispatched: it renders its data."""
+    result: Result = CliRunner().invoke(
+        app.run, ['load', 'views', '-selects', 'Overview',
+                  '--format', 'csv'])
+    assert result.exit_code == 0
+    assert 'No data viewable' not in result.output
+    assert result.stdout.splitlines()[0].startswith('Position,')
+
+
+@pytest.mark.parametrize('match', ['all', 'any'])
+def test_find_tagged_match(match: str) -> None:
+    """Tagged rows have all of, or any of, the topics: and only those."""
+    topics: set[str] = {'program build', 'data validation'}
+    result: Result = CliRunner().invoke(
+        app.run, ['find', 'tagged', '--topics', 'Program Build;Data '
+                  'Validation', '--groups', '', '--match', match,
+                  '--format', 'csv'])
+    assert result.exit_code == 0
+    frame: pd.DataFrame = pd.read_csv(io.StringIO(result.stdout))
+    tagged: list[set[str]] = [
+        {topic.strip().casefold() for topic in value.split(';')}
+        for value in frame['CriteriaTopic']]
+    expected: list[set[str]] = [
+        {topic.strip().casefold() for topic in value.split(';')}
+        for value in app.App.data['CriteriaTopic']]
+    within = set.issubset if match == 'all' else set.intersection
+    assert tagged == [tags for tags in expected if within(topics, tags)]
+    assert tagged
+
+
+def test_edit_patches_current_stats(tmp_path: pathlib.Path) -> None:
+    """An edited record's Progress patches the stats: not a recount."""
+    data: pathlib.Path = tmp_path / 'data.csv'
+    shutil.copy(pathlib.Path(app.__file__).parent / Settings.Backend.DATASET,
+                data)
+    criteria: app.CriteriaApp = app.CriteriaApp(
+        applicationdata=DataController(LocalWorksheet(path=data)))
+    cube: StatsCube = criteria.statscube()
+    edited: pd.Series = criteria.data.iloc[0].copy()
+    edited['Progress'] = 'Done' if edited['Progress'] != 'Done' else 'WIP'
+    assert criteria.update_record(edited=edited) == ['Progress']
+    assert criteria.statscube() is cube
+    pd.testing.assert_frame_equal(
+        cube.totals(column='Progress'),
+        StatsCube(criteria.data).totals(column='Progress'))
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('3', [3]), (' 3 , 5,10-12 ', [3, 5, 10, 11, 12]), ('5,4-6', [5, 4, 6]),
+    (7, [7]), ([2, 9], [2, 9]), ('1.1.0, 4', ['1.1.0', 4]),
+    ('LO2.1.1,2-3', ['LO2.1.1', 2, 3])])
+def test_index_ranges(value: object, expected: list[int]) -> None:
+    """Indexes and ranges convert to the rows' indexes, in order, once."""
+    assert app.IndexRanges().convert(value, None, None) == expected
+
+
+@pytest.mark.parametrize('value', ['3-', '-3', '3-x', '1,,2', '', '6-4',
+                                   '0', '1-0', '200', '2-200', '1.', 'LO'])
+def test_index_ranges_rejected(value: str) -> None:
+    """A dangling dash, a downward range, or out of range: all rejected."""
+    assert app.App.get_range < 200
+    with pytest.raises(click.BadParameter):
+        app.IndexRanges().convert(value, None, None)
+
+
+def test_locate_out_of_range_is_usage_error() -> None:
+    """locate --index out of range exits as a usage error: no record."""
+    result: Result = CliRunner().invoke(
+        app.run, ['find', 'locate', '--index', '200', '--axis', 'index'])
+    assert result.exit_code == 2
+    assert 'out of range' in result.output
+
+
+def test_locate_by_reference() -> None:
+    """locate --index takes CriteriaRefs: their records, in that order."""
+    result: Result = CliRunner().invoke(
+        app.run, ['find', 'locate', '--index', '1.1.0,1.0.0',
+                  '--axis', 'index', '--format', 'csv'])
+    assert result.exit_code == 0
+    located: pd.DataFrame = pd.read_csv(io.StringIO(result.stdout),
+                                        dtype=str)
+    assert located['CriteriaRef'].tolist() == ['1.1.0', '1.0.0']
+    assert located['Position'].tolist() == ['2', '1']
@@ -0,0 +1,67 @@
+"""Tests: caches: StatsCube: counts, cross tabs, patched edits."""
+# 0.2 Third Party Modules
+import numpy as np
+import pandas as pd
+
+# 0.3 Local imports
+from caches import StatsCube
+
+
+def frame() -> pd.DataFrame:
+    """Records of every counted column: a blank, and a group 'Total'."""
+    return pd.DataFrame({
+        'Progress': ['TODO', 'TODO', 'WIP', 'Done', ' WIP '],
+        'DoD': ['Planned', 'Planned', 'Started', 'Finished', None],
+        'Performance': ['Pass', 'Merit', 'Pass', 'Pass', 'Merit'],
+        'CriteriaGroup': ['LO1', 'LO2', 'LO1', 'Total', 'LO2']})
+
+
+def test_totals_per_label() -> None:
+    """The records per label, most first: blanks counted as '-'."""
+    cube: StatsCube = StatsCube(frame())
+    assert len(cube) == 5
+    assert cube.totals(column='Progress').values.tolist() == \
+        [['TODO', 2], ['WIP', 2], ['Done', 1]]
+    assert ['-', 1] in cube.totals(column='DoD').values.tolist()
+
+
+def test_crosstab_totals() -> None:
+    """A cross tab has a Total column, and a Total row, of its counts."""
+    table: pd.DataFrame = StatsCube(frame()).crosstab(
+        rows='Progress', columns='Performance')
+    assert list(table.columns) == ['Progress x Performance',
+                                   'Merit', 'Pass', 'Total']
+    assert table.values.tolist() == [['Done', 0, 1, 1],
+                                     ['TODO', 1, 1, 2],
+                                     ['WIP', 1, 1, 2],
+                                     ['Total', 2, 3, 5]]
+
+
+def test_crosstab_total_category_kept() -> None:
+    """A category named 'Total' keeps its counts: the totals are starred."""
+    table: pd.DataFrame = StatsCube(frame()).crosstab(
+        rows='CriteriaGroup', columns='Progress').set_index(
+            'CriteriaGroup x Progress')
+    assert table.loc['Total'].tolist() == [1, 0, 0, 1]
+    assert table.loc['Total*'].tolist() == [1, 2, 2, 5]
+    assert list(table.columns) == ['Done', 'TODO', 'WIP', 'Total*']
+
+
+def test_patch_matches_recount() -> None:
+    """An edit moves its record between cells: as if all were recounted."""
+    data: pd.DataFrame = frame()
+    cube: StatsCube = StatsCube(data, stamp=1)
+    data.loc[0, ['Progress', 'DoD']] = ['Done', 'Finished']
+    cube.patch(offset=0, values={'Progress': 'Done', 'DoD': 'Finished'},
+               stamp=2)
+    data.loc[1, 'Performance'] = 'Distinction'
+    cube.patch(offset=1, values={'Performance': 'Distinction'}, stamp=3)
+    recounted: StatsCube = StatsCube(data)
+    assert cube.stamp == 3
+    for column in StatsCube.DIMENSIONS:
+        pd.testing.assert_frame_equal(cube.totals(column=column),
+                                      recounted.totals(column=column))
+    pd.testing.assert_frame_equal(
+        cube.crosstab(rows='Progress', columns='Performance'),
+        recounted.crosstab(rows='Progress', columns='Performance'))
+    assert np.all(cube.counts >= 0)
@@ -0,0 +1,191 @@
+"""Tests: connections: the token buckets, and the rate limiter."""
+# 0.1 Standard Library Imports
+import threading
+from http import HTTPStatus
+
+# 0.2 Third Party Modules
+import pytest
+import requests
+
+# 0.3 Local imports
+import connections
+from connections import RateLimiter, TokenBucket
+from settings import Settings
+
+
+class Clock:
+    """A fake clock: sleeping moves it on, at once."""
+
+    def __init__(self) -> None:
+        """Starts at 1000 seconds."""
+        self.now: float = 1000.0
+        self.slept: list[float] = []
+
+    def monotonic(self) -> float:
+        """The fake time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Moves the fake time on."""
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(name='clock')
+def fixture_clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """The connections module's clock: fake."""
+    fake: Clock = Clock()
+    monkeypatch.setattr(connections, 'time', fake)
+    return fake
+
+
+class Remote:
+    """A fake adapter's send: replies with the statuses given, in turn."""
+
+    def __init__(self, statuses: list[int] | None = None,
+                 headers: dict[str, str] | None = None) -> None:
+        """Replies 200, once the statuses given are used up."""
+        self.statuses: list[int] = list(statuses or [])
+        self.headers: dict[str, str] = headers or {}
+        self.sent: list[str] = []
+        self.gate: threading.Event | None = None
+
+    def send(self, request: requests.PreparedRequest,
+             **_kwargs: object) -> requests.Response:
+        """Replies: after the gate opens, if there is one."""
+        self.sent.append(request.url)
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        response: requests.Response = requests.Response()
+        response.status_code = self.statuses.pop(0) if self.statuses \
+            else HTTPStatus.OK
+        response.headers.update(self.headers)
+        response._content = request.url.encode()  # pylint: disable=W0212
+        response._content_consumed = True  # pylint: disable=W0212
+        return response
+
+
+def get(url: str) -> requests.PreparedRequest:
+    """A read: a GET."""
+    return requests.Request('GET', url).prepare()
+
+
+def limiter(reads: int = 60, writes: int = 60,
+            retries: int = 2) -> RateLimiter:
+    """A limiter: a 1 second backoff, a 2 second reuse."""
+    return RateLimiter(reads=reads, writes=writes, retries=retries,
+                       backoff=1.0, cap=8.0, coalesce=2.0)
+
+
+def test_bucket_bursts_then_waits(clock: Clock) -> None:
+    """Full, a minute's quota at once: then one per 60/quota seconds."""
+    bucket: TokenBucket = TokenBucket(quota=60)
+    assert [bucket.acquire() for _ in range(60)] == [0.0] * 60
+    assert bucket.acquire() == pytest.approx(1.0)
+    clock.now += 30
+    assert bucket.available()
+    assert bucket.refill() == pytest.approx(30.0)
+
+
+def test_bucket_unlimited_drain_and_resize(clock: Clock) -> None:
+    """0 is unlimited: a drain empties it: a resize keeps its tokens."""
+    unlimited: TokenBucket = TokenBucket(quota=0)
+    assert unlimited.acquire() == 0.0 and unlimited.available()
+    bucket: TokenBucket = TokenBucket(quota=30)
+    bucket.drain()
+    assert not bucket.available()
+    assert bucket.acquire() == pytest.approx(2.0)
+    bucket.resize(quota=10)
+    assert bucket.quota == 10 and bucket.refill() < 1
+    assert clock.slept == [pytest.approx(2.0)]
+
+
+def test_reads_queue_for_their_quota(clock: Clock) -> None:
+    """Past the quota, a read waits for its token: counted as queued."""
+    limited: RateLimiter = limiter(reads=2)
+    remote: Remote = Remote()
+    for page in range(3):
+        limited.send(remote.send, get(f'https://sheets/{page}'))
+    assert len(remote.sent) == 3
+    assert limited.counts[(RateLimiter.READ, 'queued')] == 1
+    assert limited.waited[RateLimiter.READ] == pytest.approx(30.0)
+    assert clock.now == pytest.approx(1030.0)
+
+
+def test_throttled_retries_after_retry_after(clock: Clock) -> None:
+    """A 429: the bucket is drained: retried after the Retry-After."""
+    limited: RateLimiter = limiter()
+    remote: Remote = Remote(statuses=[HTTPStatus.TOO_MANY_REQUESTS],
+                            headers={'Retry-After': '3'})
+    response: requests.Response = limited.send(
+        remote.send, requests.Request('POST', 'https://sheets/x',
+                                      data='{}').prepare())
+    assert response.status_code == HTTPStatus.OK
+    assert limited.counts[(RateLimiter.WRITE, 'throttled')] == 1
+    assert limited.counts[(RateLimiter.WRITE, 'retried')] == 1
+    assert clock.slept[0] == 3.0
+
+
+def test_throttled_fails_after_retries(clock: Clock) -> None:
+    """Still a 429 after the retries: the last 429 is returned."""
+    limited: RateLimiter = limiter(retries=1)
+    remote: Remote = Remote(statuses=[HTTPStatus.TOO_MANY_REQUESTS] * 2)
+    response: requests.Response = limited.send(remote.send,
+                                               get('https://sheets/x'))
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert limited.counts[(RateLimiter.READ, 'failed')] == 1
+    assert len(remote.sent) == 2
+    assert 0.5 <= clock.slept[0] <= 1.0
+
+
+def test_identical_reads_in_flight_are_coalesced() -> None:
+    """A read, while the same read is in flight, shares its response."""
+    limited: RateLimiter = limiter()
+    remote: Remote = Remote()
+    remote.gate = threading.Event()
+    bodies: list[bytes] = []
+    
+    def read() -> None:
+        bodies.append(limited.send(remote.send,
+                                   get('https://sheets/x')).content)
+    
+    first: threading.Thread = threading.Thread(target=read)
+    first.start()
+    while not remote.sent:
+        threading.Event().wait(0.01)
+    second: threading.Thread = threading.Thread(target=read)
+    second.start()
+    threading.Event().wait(0.1)  # The second read waits on the first's
+    remote.gate.set()
+    first.join(timeout=5)
+    second.join(timeout=5)
+    assert len(remote.sent) == 1
+    assert bodies == [b'https://sheets/x'] * 2
+    assert limited.counts[(RateLimiter.READ, 'coalesced')] == 1
+
+
+def test_recent_read_reused_under_pressure(clock: Clock) -> None:
+    """No token left: a recent identical read is reused, until a write."""
+    limited: RateLimiter = limiter(reads=1)
+    remote: Remote = Remote()
+    limited.send(remote.send, get('https://sheets/x'))
+    clock.now += 1
+    reused: requests.Response = limited.send(remote.send,
+                                             get('https://sheets/x'))
+    assert reused.content == b'https://sheets/x'
+    assert len(remote.sent) == 1
+    limited.send(remote.send, requests.Request(
+        'POST', 'https://sheets/x:clear').prepare())
+    limited.send(remote.send, get('https://sheets/x'))
+    assert len(remote.sent) == 3
+
+
+def test_sessions_share_the_quota(monkeypatch: pytest.MonkeyPatch) -> None:
+    """PYCRITERIA_SESSIONS divides the quotas: at least one each."""
+    monkeypatch.setenv(Settings.Quota.SESSIONS, '4')
+    shared: RateLimiter = RateLimiter.configured()
+    assert shared.buckets[RateLimiter.READ].quota == \
+        Settings.Quota.READS // 4
+    monkeypatch.setenv(Settings.Quota.SESSIONS, 'many')
+    assert RateLimiter.configured().buckets[RateLimiter.WRITE].quota == \
+        Settings.Quota.WRITES
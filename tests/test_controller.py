@@ -0,0 +1,84 @@
+"""Tests: controller: DataController, Editor."""
+# 0.1 Standard Library Imports
+import pathlib
+
+# 0.2 Third Party Modules
+import numpy as np
+import pandas as pd
+import pytest
+
+# 0.3 Local imports
+from connections import LocalWorksheet
+from controller import DataController, Editor, Record
+from settings import Settings
+
+
+@pytest.fixture
+def data(tmp_path: pathlib.Path) -> DataController:
+    """A DataController of a small CSV: an empty number, an empty note."""
+    path: pathlib.Path = tmp_path / 'data.csv'
+    path.write_text('Position,Score,Notes\n1,,first\n2,5,\n',
+                    encoding='utf-8')
+    return DataController(LocalWorksheet(path=path))
+
+
+def test_patch_empty_number_unchanged(data: DataController) -> None:
+    """An empty cell patched with an empty value is not a change."""
+    data.dataframe['Score'] = pd.Series([np.nan, 5.0])
+    revision: int = data.revision
+    assert data.patch(offset=0, values={'Score': np.nan}) == []
+    assert data.revision == revision
+
+
+def test_patch_changed_values(data: DataController) -> None:
+    """A changed value, or a filled empty cell, is a change."""
+    data.dataframe['Score'] = pd.Series([np.nan, 5.0])
+    assert data.patch(offset=0, values={'Score': 3.0, 'Notes': 'first'}) \
+        == ['Score']
+    assert data.patch(offset=1, values={'Score': np.nan}) == ['Score']
+    assert data.revision == 2
+
+
+@pytest.mark.parametrize('old, new, expected', [
+    (np.nan, np.nan, False), (pd.NA, None, False), (np.nan, 1.0, True),
+    (pd.NA, 'x', True), ('x', 'x', False), (1, 2, True)])
+def test_differs(old: object, new: object, expected: bool) -> None:
+    """Missing values are equal to each other: and differ from values."""
+    assert DataController.differs(old, new) is expected
+
+
+def editor() -> Editor:
+    """An editor of the dataset's first record: its Notes empty."""
+    dataset: pathlib.Path = pathlib.Path(__file__).resolve().parents[1] / \
+        Settings.Backend.DATASET
+    series: pd.Series = pd.read_csv(dataset).iloc[0]
+    series['Notes'] = np.nan
+    return Editor(currentrecord=Record(series=series))
+
+
+def test_changes_missing_fields_are_text() -> None:
+    """Changes compare text: a missing field is 'nan', not a float."""
+    edit: Editor = editor()
+    series: pd.Series = edit.oldresultseries.copy()
+    series['Notes'] = 'Done it'
+    edit.newresultseries = series
+    changed: list = [change for change in edit.changes(context=0)]
+    assert [(change.field, change.old, change.new) for change in changed] \
+        == [('Notes', 'nan', 'Done it')]
+
+
+def test_changes_per_edit_not_per_series() -> None:
+    """An in-place edit, set again, is compared again: not cached."""
+    edit: Editor = editor()
+    series: pd.Series = edit.oldresultseries.copy()
+    series['Progress'] = 'WIP'
+    edit.newresultseries = series
+    assert [change.field for change in edit.changes(context=0)] \
+        == ['Progress']
+    series['Progress'] = 'TODO'
+    series['Notes'] = 'Later'
+    edit.newresultseries = series
+    assert [change.field for change in edit.changes(context=0)] \
+        == ['Notes']
+    assert [change.field for change in edit.changes(context=1)] \
+        == ['Progress', 'Notes', 'LinkedRef']
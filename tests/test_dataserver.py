@@ -0,0 +1,214 @@
+"""Tests: dataserver: the codec, segments, notifications, pending edits."""
+# 0.1 Standard Library Imports
+import pathlib
+import shutil
+import socket
+import threading
+import time
+from typing import Any, Iterator
+
+# 0.2 Third Party Modules
+import numpy as np
+import pandas as pd
+import pytest
+
+# 0.3 Local imports
+import controller
+import dataserver
+from dataserver import Codec, DataClient, DataServer, Segment
+from settings import Settings
+
+ROOT: pathlib.Path = pathlib.Path(__file__).resolve().parents[1]
+
+
+def frame() -> pd.DataFrame:
+    """A frame of every column kind: numbers, text, repeats, mixed."""
+    return pd.DataFrame({
+        'Position': [1, 2, 3, 4],
+        'Score': [1.5, np.nan, -2.0, 0.0],
+        'Done': [True, False, False, True],
+        'Criteria': ['LO1', 'LO1.1 é', '', 'LO2'],
+        'Progress': ['TODO', 'TODO', 'WIP', 'TODO'],
+        'Notes': pd.Series(['first', None, 3, 'fourth'], dtype=object)})
+
+
+def test_codec_round_trip() -> None:
+    """Decoding an encoded frame gives back its columns, and values."""
+    original: pd.DataFrame = frame()
+    decoded: pd.DataFrame = Codec.decode(payload=Codec.encode(original))
+    assert list(decoded.columns) == list(original.columns)
+    assert decoded['Position'].tolist() == [1, 2, 3, 4]
+    np.testing.assert_array_equal(decoded['Score'], original['Score'])
+    assert decoded['Done'].tolist() == [True, False, False, True]
+    assert decoded['Criteria'].tolist() == ['LO1', 'LO1.1 é', '', 'LO2']
+    assert decoded['Progress'].tolist() == ['TODO', 'TODO', 'WIP', 'TODO']
+    assert decoded['Notes'].tolist() == ['first', None, 3, 'fourth']
+
+
+def test_codec_column_kinds() -> None:
+    """Repeated text is a dictionary: mixed values are JSON."""
+    kinds: dict[str, str] = {name: Codec.column(series=series)[0]
+                             for name, series in frame().items()}
+    assert kinds == {'Position': 'i', 'Score': 'f', 'Done': 'b',
+                     'Criteria': 's', 'Progress': 'd', 'Notes': 'j'}
+
+
+def test_segment_assign_copies_read_only_column(
+        tmp_path: pathlib.Path) -> None:
+    """A mapped column is copied on assign: the segment is unchanged."""
+    path: str = str(tmp_path / 'data.segment')
+    Segment.publish(path=path, revision=3,
+                    payload=Codec.encode(frame()))
+    revision, view = Segment.map(path=path)
+    mapped: pd.DataFrame = Codec.decode(payload=view)
+    Segment.assign(frame=mapped, offset=1, column='Score', value=9.5)
+    Segment.assign(frame=mapped, offset=0, column='Progress', value='WIP')
+    assert revision == 3
+    assert mapped.at[1, 'Score'] == 9.5
+    assert mapped.at[0, 'Progress'] == 'WIP'
+    _, again = Segment.map(path=path)
+    assert np.isnan(Codec.decode(payload=again).at[1, 'Score'])
+
+
+class FakeServer:
+    """A server that reads one request: then sends its frames, in order."""
+
+    def __init__(self, path: str, frames: list[bytes]) -> None:
+        """Listens on the path: the frames are sent once asked."""
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(path)
+        self.listener.listen()
+        self.frames = frames
+        self.session: socket.socket | None = None
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def serve(self) -> None:
+        """Accepts a client: replies to its first request, then idles."""
+        self.session, _ = self.listener.accept()
+        Codec.read(self.session)
+        for sent in self.frames:
+            self.session.sendall(sent)
+
+    def close(self) -> None:
+        """Closes the session, and the listener."""
+        if self.session is not None:
+            self.session.close()
+        self.listener.close()
+
+
+def test_reply_does_not_rewind_notified_revision(
+        tmp_path: pathlib.Path) -> None:
+    """A notification read before an older reply: latest stays newer."""
+    path: str = str(tmp_path / 'data.sock')
+    server: FakeServer = FakeServer(path=path, frames=[
+        Codec.frame(op=Codec.NOTIFY, revision=7,
+                    payload=Codec.dumps({'offset': 0, 'columns': []})),
+        Codec.frame(op=Codec.PATCH, revision=6)])
+    client: DataClient = DataClient(path=path)
+    try:
+        _, replied, _ = client.request(op=Codec.PATCH)
+        assert replied == 6
+        assert client.latest == 7
+        assert client.changes == [{'offset': 0, 'columns': []}]
+    finally:
+        client.close()
+        server.close()
+
+
+def test_no_reply_marks_client_dead(tmp_path: pathlib.Path) -> None:
+    """A reply not in time: a ConnectionError, then every request fails."""
+    path: str = str(tmp_path / 'data.sock')
+    server: FakeServer = FakeServer(path=path, frames=[])
+    client: DataClient = DataClient(path=path)
+    client.TIMEOUT = 0.2
+    try:
+        with pytest.raises(ConnectionError, match='no reply'):
+            client.request(op=Codec.FETCH)
+        assert client.dead
+        with pytest.raises(ConnectionError, match='disconnected'):
+            client.request(op=Codec.FETCH)
+    finally:
+        server.close()
+
+
+@pytest.fixture(name='server')
+def fixture_server(tmp_path: pathlib.Path,
+                   monkeypatch: pytest.MonkeyPatch) -> Iterator[DataServer]:
+    """A warm server, on a copy of the dataset: not listening."""
+    data: pathlib.Path = tmp_path / 'data.csv'
+    shutil.copy(ROOT / Settings.Backend.DATASET, data)
+    monkeypatch.setenv(Settings.Backend.SOURCE, Settings.Backend.LOCAL)
+    monkeypatch.setenv(Settings.Backend.DATA, str(data))
+    warm: DataServer = DataServer(path=str(tmp_path / 'data.sock'))
+    warm.warm()
+    yield warm
+    warm.close()
+
+
+def test_pending_patch_survives_reload(server: DataServer) -> None:
+    """An unsaved patch is kept, and not renotified, on a reload."""
+    change: dict | None = server.patch(
+        request={'offset': 0, 'values': {'Notes': 'Pending'}})
+    assert change == {'offset': 0, 'columns': ['Notes']}
+    revision: int = server.data.revision
+    assert server.reload() is False
+    assert server.data.dataframe.at[0, 'Notes'] == 'Pending'
+    assert server.data.revision == revision
+    assert server.pending == {0: {'Notes': 'Pending'}}
+
+
+def test_saved_patch_is_no_longer_pending(server: DataServer) -> None:
+    """A write of the patched cell saves it: it is no longer pending."""
+    server.patch(request={'offset': 0, 'values': {'Notes': 'Saved'}})
+    server.patch(request={'offset': 1, 'values': {'Notes': 'Unsaved'}})
+    column: int = list(server.data.dataframe.columns).index('Notes') + 1
+    server.write(request={'method': 'update_cells', 'args': {
+        'cells': [[DataServer.FIRST, column, 'Saved']]}})
+    assert server.pending == {1: {'Notes': 'Unsaved'}}
+    assert server.data.dataframe.at[0, 'Notes'] == 'Saved'
+    assert server.data.dataframe.at[1, 'Notes'] == 'Unsaved'
+
+
+def test_stale_socket_falls_back_to_backend(
+        server: DataServer, tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    """A socket with no server listening: the backend is loaded."""
+    stale: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(tmp_path / 'stale.sock'))
+    stale.close()
+    monkeypatch.setenv(Settings.Backend.SHARED, str(tmp_path / 'stale.sock'))
+    monkeypatch.setattr(dataserver.SharedConnector, 'client', None)
+    monkeypatch.setattr(dataserver.SharedConnector, 'closed', None)
+    assert dataserver.SharedConnector.isshared()
+    wsheet: Any = controller.Controller.load_wsheet()
+    assert not isinstance(wsheet, dataserver.SharedWorksheet)
+    assert len(controller.DataController(wsheet).dataframe) == \
+        len(server.data.dataframe)
+
+
+def test_failed_poll_keeps_serving(server: DataServer,
+                                   monkeypatch: pytest.MonkeyPatch) -> None:
+    """A reload that raises is logged: the dataset is still served."""
+    def unreachable() -> Any:
+        raise FileNotFoundError('The sheet is gone.')
+    
+    monkeypatch.setattr(controller.Controller, 'load_wsheet', unreachable)
+    monkeypatch.setattr(DataServer, 'IDLE', 0.05)
+    server.listen()
+    server.data.fetched = float('-inf')
+    fetched: list[int] = []
+    
+    def session() -> None:
+        deadline: float = time.monotonic() + 10.0
+        while not server.counts['failed'] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        client: DataClient = DataClient(path=server.path)
+        fetched.append(len(client.fetch()))
+        client.close()
+        server.stop()
+    
+    threading.Thread(target=session, daemon=True).start()
+    server.serve()
+    assert server.counts['failed'] == 1
+    assert fetched == [len(server.data.dataframe)]
@@ -0,0 +1,64 @@
+"""Tests: controller: Display: stringified, fitted, rendered, rows."""
+# 0.2 Third Party Modules
+import numpy as np
+import pandas as pd
+from rich.console import Console
+from rich.table import Table
+
+# 0.3 Local imports
+from controller import Display
+
+
+def frame() -> pd.DataFrame:
+    """A frame with a missing cell in a text, and a number, column."""
+    return pd.DataFrame({'Position': [1, 2],
+                         'Score': [1.5, np.nan],
+                         'Notes': pd.Series(['first', None])})
+
+
+def test_project_missing_cells_are_text() -> None:
+    """Every projected cell is a str: a missing cell is 'nan'."""
+    rows: list[list[str]] = Display.project(
+        dataframe=frame(), headers=['Notes', 'Score'])
+    assert rows == [['first', '1.5'], ['nan', 'nan']]
+    assert all(isinstance(cell, str) for row in rows for cell in row)
+
+
+def test_display_rows_with_missing_cell() -> None:
+    """A projected NaN cell renders: rich is given text, not a float."""
+    console: Console = Console(width=60, record=True)
+    table: Table = Table('Position', 'Score', 'Notes')
+    Display.display_rows(
+        rows=Display.project(dataframe=frame(),
+                             headers=['Position', 'Score', 'Notes']),
+        consoleholder=console, consoletable=table)
+    assert 'first' in console.export_text()
+
+
+def test_fit_missing_cells_are_text() -> None:
+    """Fitted rows are text: a missing cell is measured as 'nan'."""
+    rows, widths = Display.fit(dataframe=frame(),
+                               headers=['Position', 'Score', 'Notes'],
+                               width=60)
+    assert rows[1] == ['2', 'nan', 'nan']
+    assert all(isinstance(cell, str) for row in rows for cell in row)
+    assert len(widths) == 3
+
+
+def test_fill_rows_renders_as_add_row() -> None:
+    """Rows filled in bulk render as rows added one by one, by add_row."""
+    assert Display.BULKCELLS
+    rows: list[list[str]] = Display.project(
+        dataframe=frame(), headers=['Position', 'Score', 'Notes'])
+    expected: Table = Table('Position', 'Score', 'Notes')
+    for row in rows:
+        expected.add_row(*row)
+    rendered: list[str] = []
+    for table in (Display.fill_rows(rows=iter(rows),
+                                    consoletable=Table('Position', 'Score',
+                                                       'Notes')), expected):
+        console: Console = Console(width=60, record=True)
+        console.print(table)
+        rendered.append(console.export_text())
+    assert rendered[0] == rendered[1]
+    assert 'first' in rendered[0]
@@ -0,0 +1,27 @@
+"""Tests: exports: Exporter: machine readable outputs."""
+# 0.2 Third Party Modules
+import pandas as pd
+
+# 0.3 Local imports
+from exports import Exporter
+
+
+def test_longform_one_schema() -> None:
+    """Tables of different columns stack into one: Table, Row, Column."""
+    totals: pd.DataFrame = pd.DataFrame({'Progress': ['TODO', 'Done'],
+                                         'Records': [3, 1]})
+    crosstab: pd.DataFrame = pd.DataFrame({'Progress x DoD': ['TODO'],
+                                           'Planned': [2], 'Total': [3]})
+    long: pd.DataFrame = Exporter.longform(
+        tables=[('Stats: Progress', totals), ('Stats: x', crosstab)])
+    assert list(long.columns) == Exporter.LONGFORM
+    assert long.values.tolist() == [
+        ['Stats: Progress', 'TODO', 'Records', 3],
+        ['Stats: Progress', 'Done', 'Records', 1],
+        ['Stats: x', 'TODO', 'Planned', 2],
+        ['Stats: x', 'TODO', 'Total', 3]]
+
+
+def test_longform_empty() -> None:
+    """No tables: an empty long table, with its columns."""
+    assert list(Exporter.longform(tables=[]).columns) == Exporter.LONGFORM
@@ -0,0 +1,120 @@
+"""Tests: indexes: fuzzy search, category bitmaps, record lookups."""
+# 0.2 Third Party Modules
+import numpy as np
+import pandas as pd
+import pytest
+
+# 0.3 Local imports
+from controller import Results
+from indexes import CategoryIndex, FuzzyIndex, Match, RecordIndex
+
+
+def frame() -> pd.DataFrame:
+    """A frame of criteria: topics multi-valued, unevenly spaced."""
+    return pd.DataFrame({
+        'Position': [1, 2, 3, 4],
+        'CriteriaGroup': ['LO1', 'LO1', 'LO2', 'LO2'],
+        'CriteriaTopic': ['Program Design', 'Program Build; Code Style',
+                          'Data Validation;program build', 'Testing'],
+        'CriteriaRef': ['1.0.0', '1.1.0', '2.1.0', '2.2.0'],
+        'Criteria': ['Implement a given algorithm',
+                     'Write Python code with no significant issues',
+                     'Validate the input data',
+                     'Test the deployed program']})
+
+
+def test_fuzzy_exact_match() -> None:
+    """An exact phrase scores 1.0, with no edits: it is ranked first."""
+    matches: list[Match] = FuzzyIndex(frame()).search(
+        query='Implement a given algorithm')
+    assert matches[0] == Match(offset=0, position=1, distance=0, score=1.0)
+
+
+def test_fuzzy_one_typo_match() -> None:
+    """A mistyped letter is one edit: the record is still found, first."""
+    matches: list[Match] = FuzzyIndex(frame()).search(query='Pythun code')
+    assert matches[0].position == 2
+    assert matches[0].distance == 1
+    assert matches[0].score == round(1 - 1 / len('pythun code'), 3)
+
+
+def test_fuzzy_no_match() -> None:
+    """A query sharing no trigrams has no candidates: nothing matches."""
+    index: FuzzyIndex = FuzzyIndex(frame())
+    assert index.candidates('qzxv wkjy').size == 0
+    assert not index.search(query='qzxv wkjy')
+    assert not index.search(query='   ')
+
+
+def test_fuzzy_candidates_ranked_by_shared_trigrams() -> None:
+    """Candidates are the rows sharing most trigrams: matches by edits."""
+    index: FuzzyIndex = FuzzyIndex(frame())
+    pattern: str = 'program build'
+    shared: list[int] = [len(FuzzyIndex.grams(pattern)
+                             & FuzzyIndex.grams(text))
+                         for text in index.texts]
+    candidates: list[int] = index.candidates(pattern).tolist()
+    assert candidates[:2] == [1, 2]
+    assert [shared[row] for row in candidates] == \
+        sorted((shared[row] for row in candidates), reverse=True)
+    assert [match.position for match in index.search(query=pattern)][:2] \
+        == [2, 3]
+
+
+def test_fuzzy_candidates_are_capped(
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    """No more than CANDIDATES rows are scored by edit distance."""
+    monkeypatch.setattr(FuzzyIndex, 'CANDIDATES', 2)
+    index: FuzzyIndex = FuzzyIndex(pd.concat([frame()] * 5,
+                                             ignore_index=True))
+    assert len(index.candidates('program build')) == 2
+    assert np.all(np.isin(index.candidates('program build') % 4, [1, 2]))
+
+
+def test_category_match_all() -> None:
+    """All of: only rows tagged with every category, however spelt."""
+    index: CategoryIndex = CategoryIndex(frame())
+    rows: np.ndarray = index.match(column='CriteriaTopic',
+                                   labels=['program  BUILD', 'Code Style'])
+    assert rows.tolist() == [False, True, False, False]
+
+
+def test_category_match_any() -> None:
+    """Any of: rows tagged with at least one of the categories."""
+    index: CategoryIndex = CategoryIndex(frame())
+    rows: np.ndarray = index.match(column='CriteriaTopic',
+                                   labels=['Testing', 'Program Build'],
+                                   every=False)
+    assert rows.tolist() == [False, True, True, True]
+
+
+def test_category_labels_unknown_and_counts() -> None:
+    """The first spelling is the label: unknown tags match no rows."""
+    index: CategoryIndex = CategoryIndex(frame())
+    assert index.labels['CriteriaGroup'] == ['LO1', 'LO2']
+    assert index.unknown(column='CriteriaTopic',
+                         labels=['testing', 'Deployment']) == ['Deployment']
+    assert not index.rows(column='CriteriaTopic', label='Deployment').any()
+    counts: pd.DataFrame = index.counts(column='CriteriaTopic')
+    assert counts.iloc[0].tolist() == ['Program Build', 2]
+
+
+def test_record_lookup_by_reference_after_sort() -> None:
+    """A CriteriaRef, or a Position, finds its record in any row order."""
+    data: pd.DataFrame = frame().iloc[::-1].reset_index(drop=True)
+    index: RecordIndex = RecordIndex(data)
+    assert index.offset(key='2.1.0') == 1
+    assert index.offset(key=' 2.1.0 ') == 1
+    assert index.offset(key=4) == index.offset(key='4') == 0
+    assert index.offsets(keys=['1.0.0', 2, '9.9.9', 7]) == \
+        ([3, 2], ['9.9.9', 7])
+
+
+def test_getrowdata_by_reference() -> None:
+    """Results.getrowdata, by the record index: a CriteriaRef's row."""
+    data: pd.DataFrame = frame().sort_values(by='Criteria')
+    record = Results.getrowdata(data=data, ix='1.1.0',
+                                records=RecordIndex(data))
+    assert record['Position'] == 2
+    assert Results.getrowdata(data=data, ix='9.9.9',
+                              records=RecordIndex(data)) is None
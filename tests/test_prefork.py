@@ -0,0 +1,72 @@
+"""Tests: prefork: a bad client is refused: the server serves on."""
+# 0.1 Standard Library Imports
+import os
+import pathlib
+import socket
+import time
+from typing import Iterator
+
+# 0.2 Third Party Modules
+import pytest
+
+# 0.3 Local imports
+from prefork import PreforkServer
+
+
+@pytest.fixture(name='server')
+def fixture_server(tmp_path: pathlib.Path,
+                   monkeypatch: pytest.MonkeyPatch) -> Iterator[PreforkServer]:
+    """A cold server, listening: no app, so nothing is forked."""
+    monkeypatch.setattr(PreforkServer, 'HANDSHAKE', 0.2)
+    listening: PreforkServer = PreforkServer(path=str(tmp_path / 'p.sock'))
+    listening.listen()
+    yield listening
+    listening.close()
+
+
+def connected(server: PreforkServer) -> socket.socket:
+    """A client, connected to the server's socket."""
+    client: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(server.path)
+    return client
+
+
+def refused(client: socket.socket) -> bool:
+    """The server closed the client's connection: nothing was sent."""
+    client.settimeout(1.0)
+    closed: bool = client.recv(1) == b''
+    client.close()
+    return closed
+
+
+def test_silent_client_times_out(server: PreforkServer) -> None:
+    """A client that sends nothing: refused after the HANDSHAKE."""
+    client: socket.socket = connected(server)
+    start: float = time.monotonic()
+    server.accept()
+    assert time.monotonic() - start < 1.0
+    assert refused(client)
+    assert server.forked == 0
+
+
+@pytest.mark.parametrize('message', [b'{not json', b'[1, 2]', b'\xff\xfe'])
+def test_malformed_request_refused(server: PreforkServer,
+                                   message: bytes) -> None:
+    """Not a JSON object: refused, its fds closed, no fork, no raise."""
+    client: socket.socket = connected(server)
+    read, write = os.pipe()
+    socket.send_fds(client, [message], [read, write, write])
+    server.accept()
+    assert refused(client)
+    assert server.forked == 0 and not server.children
+    os.close(read)
+    os.close(write)
+
+
+def test_missing_fds_refused(server: PreforkServer) -> None:
+    """A request without the terminal's three fds: refused."""
+    client: socket.socket = connected(server)
+    client.sendall(b'{}')
+    server.accept()
+    assert refused(client)
+    assert server.forked == 0
@@ -0,0 +1,123 @@
+"""Tests: telemetry: a forked child's telemetry is its own."""
+# 0.1 Standard Library Imports
+import contextlib
+import json
+import os
+import pathlib
+import time
+from typing import Iterator
+
+# 0.2 Third Party Modules
+import click
+import pytest
+from click.testing import CliRunner, Result
+
+# 0.3 Local imports
+import telemetry
+from telemetry import metrics, tracer
+
+
+def test_forked_child_resets_telemetry() -> None:
+    """The child has its own trace file, pid, spans, and commands."""
+    with metrics.command(name='warm up'):
+        pass
+    tracer.events.append({'name': 'parent'})
+    parent: dict = {'path': str(tracer.path), 'pid': tracer.pid}
+    read, write = os.pipe()
+    pid: int = os.fork()
+    if pid == 0:
+        os.close(read)
+        state: dict = {'path': str(tracer.path), 'pid': tracer.pid,
+                       'spans': len(tracer.events),
+                       'commands': len(metrics.history),
+                       'getpid': os.getpid()}
+        os.write(write, json.dumps(state).encode())
+        os._exit(0)  # pylint: disable=protected-access
+    os.close(write)
+    with os.fdopen(read, 'rb') as piped:
+        child: dict = json.loads(piped.read())
+    os.waitpid(pid, 0)
+    assert child['pid'] == child['getpid'] != parent['pid']
+    assert child['path'] != parent['path']
+    assert str(child['pid']) in child['path']
+    assert child['spans'] == 0 and child['commands'] == 0
+    assert tracer.pid == parent['pid'] and len(metrics.history) >= 1
+    tracer.events.clear()
+    metrics.history.clear()
+
+
+def test_profile_dumps_are_named_by_pid() -> None:
+    """Sibling children's profiles, in the same second, do not collide."""
+    profiler: telemetry.CallProfiler = telemetry.CallProfiler(
+        directory='.profiles', top=5)
+    assert f'-{os.getpid()}-0001-edit-note' in \
+        profiler.path(name='edit note', suffix='.prof').name
+
+
+def test_wall_time_excludes_profilers(
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    """A command's wall time is its own: not the profilers' dumps."""
+    @contextlib.contextmanager
+    def slow(name: str) -> Iterator[None]:
+        yield
+        time.sleep(0.2)
+    
+    monkeypatch.setattr(telemetry.callprofiler, 'command', slow)
+    monkeypatch.setattr(telemetry.profiler, 'command', slow)
+    
+    @click.group(cls=telemetry.MeteredGroup)
+    def group() -> None:
+        """A metered group."""
+    
+    @group.command(name='quick')
+    def quick() -> None:
+        """A command that does nothing."""
+    
+    result: Result = CliRunner().invoke(group, ['quick'])
+    assert result.exit_code == 0
+    assert metrics.history[-1].command == 'quick'
+    assert metrics.history[-1].wall < 0.1
+    metrics.history.clear()
+
+
+def test_growth_sites_exclude_profilers(tmp_path: pathlib.Path) -> None:
+    """With both profilers on, the growth sites are the command's own."""
+    memory: telemetry.MemoryProfiler = telemetry.MemoryProfiler(
+        budget=0, top=50)
+    calls: telemetry.CallProfiler = telemetry.CallProfiler(
+        directory=str(tmp_path), top=5, sampling=False)
+    memory.start()
+    calls.start()
+    try:
+        with memory.command(name='grow'), calls.command(name='grow'):
+            grown: list[bytes] = [bytes(1000) for _ in range(1000)]
+    finally:
+        calls.stop()
+        memory.stop()
+    sites: list[str] = [site for site, _, _ in memory.last.sites]
+    assert len(grown) == 1000
+    assert any('test_telemetry.py' in site for site in sites)
+    assert not [site for site in sites
+                if 'cProfile.py' in site or site.startswith('telemetry.py:')]
+
+
+def test_metered_names_nested_command() -> None:
+    """The metered name is the groups' and the command's: not its args."""
+    @click.group(cls=telemetry.MeteredGroup)
+    def group() -> None:
+        """A metered group."""
+    
+    @group.group(name='load')
+    def load() -> None:
+        """A sub group."""
+    
+    @load.command(name='todo')
+    @click.option('--select', 'select', default='All')
+    def todo(select: str) -> None:
+        """A nested command."""
+    
+    result: Result = CliRunner().invoke(group,
+                                        ['load', 'todo', '--select', 'All'])
+    assert result.exit_code == 0
+    assert metrics.history[-1].command == 'load todo'
+    metrics.history.clear()
@@ -0,0 +1,52 @@
+"""Tests: terminal: buffered output, its prompts, per command."""
+# 0.1 Standard Library Imports
+import sys
+
+# 0.2 Third Party Modules
+import click
+import pytest
+from click.testing import CliRunner, Result
+
+# 0.3 Local imports
+from terminal import Buffered, BufferedGroup
+
+
+def test_installed_restores_on_error() -> None:
+    """An error in the command: stdout and click's prompts are restored."""
+    stdout = sys.stdout
+    prompts = (click.termui.visible_prompt_func,
+               click.termui.hidden_prompt_func)
+    with pytest.raises(RuntimeError):
+        with Buffered.installed():
+            assert isinstance(sys.stdout, Buffered)
+            assert click.termui.visible_prompt_func is not prompts[0]
+            raise RuntimeError('The command failed.')
+    assert sys.stdout is stdout
+    assert (click.termui.visible_prompt_func,
+            click.termui.hidden_prompt_func) == prompts
+
+
+def test_group_buffers_resolved_command() -> None:
+    """The resolved command is buffered: an unbuffered one is not."""
+    seen: dict[str, bool] = {}
+    
+    @click.group(cls=BufferedGroup)
+    def group() -> None:
+        """A buffered group."""
+    
+    @group.command(name='show')
+    def show() -> None:
+        """Buffered."""
+        seen['show'] = isinstance(sys.stdout, Buffered)
+        click.echo('shown')
+    
+    @group.command(name='repl')
+    def repl() -> None:
+        """Written through."""
+        seen['repl'] = isinstance(sys.stdout, Buffered)
+    
+    for name in ('show', 'repl'):
+        result: Result = CliRunner().invoke(group, [name])
+        assert result.exit_code == 0
+    assert seen == {'show': True, 'repl': False}
+    assert not isinstance(sys.stdout, Buffered)